@@ -165,7 +165,7 @@ EVENTS: List[EventDefinition] = [
             not getattr(gs, 'office_cat_adoption_offered', False) and
             not getattr(gs, 'office_cat_adopted', False)
         ),
-        "effect": trigger_office_cat_adoption
+        "effect": lambda gs: gs._trigger_stray_cat_adoption()
     },
     # Enhanced Personnel System Events
     {
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 from src.services.deterministic_rng import get_rng
 import json
 import os
-import pygame
+import sys
 
 from typing import Tuple, Dict, Any, Optional, List, Union, Callable, TYPE_CHECKING
 
@@ -10,7 +12,6 @@ from src.core.upgrades import UPGRADES
 from src.core.events import EVENTS
 from src.services.game_logger import GameLogger
 from src.services.game_run_logger import GameRunLogger, LoggingLevel, init_game_logger
-from src.services.sound_manager import SoundManager
 from src.services.game_clock import GameClock
 from src.services.deterministic_rng import init_deterministic_rng, get_rng
 from src.services.verbose_logging import init_verbose_logging, LogLevel
@@ -18,8 +19,6 @@ from src.services.leaderboard import init_leaderboard_system
 from src.core.opponents import create_default_opponents
 from src.features.event_system import DeferredEventQueue, EventType, EventAction, Event
 from src.features.onboarding import onboarding
-from src.features.achievements_endgame import achievements_endgame_system
-from src.ui.overlay_manager import OverlayManager
 from src.services.error_tracker import ErrorTracker
 from src.services.config_manager import get_current_config
 from src.core.productive_actions import (get_employee_category, get_available_actions, 
@@ -33,12 +32,6 @@ from src.core.game_constants import (
     DEFAULT_STAFF_MAINTENANCE, HIGH_REPUTATION_THRESHOLD, LOW_REPUTATION_THRESHOLD,
     HIGH_TRUST_VALUE, LOW_TRUST_VALUE, DEFAULT_ACTION_POINTS
 )
-from src.core.ui_utils import (
-    get_action_rects, get_upgrade_rects, get_upgrade_icon_rect, get_context_window_top,
-    get_endturn_rect, get_mute_button_rect, get_activity_log_minimize_button_rect,
-    get_activity_log_expand_button_rect, get_activity_log_rect, get_activity_log_base_position,
-    get_activity_log_current_position, validate_rect
-)
 from src.core.verbose_logging import (
     create_verbose_money_message, create_verbose_staff_message, 
     create_verbose_reputation_message, create_verbose_compute_message
@@ -47,19 +40,75 @@ from src.core.employee_management import (
     reset_employee_productivity, separate_employees_and_managers,
     apply_management_assignments, calculate_compute_per_employee
 )
-from src.core.dialog_systems import (
-    DialogManager, FundraisingDialogBuilder, ResearchDialogBuilder, DialogValidator
-)
-from src.core.input_manager import InputManager
-from src.core.employee_blob_manager import EmployeeBlobManager
-from src.core.ui_transition_manager import UITransitionManager
 from src.core.deterministic_event_manager import DeterministicEventManager
 from src.core.utility_functions import (
     is_upgrade_available, check_point_in_rect, process_achievements_and_warnings_complete,
     filter_available_upgrades, get_milestone_check_functions
 )
+from src.lazy_imports import lazy_module
+
+# Only needed for UI layout, dialogs and end-of-turn achievements; loading them on
+# first use keeps `import src.core.game_state` cheap for headless batch runs.
+ui_utils = lazy_module('src.core.ui_utils')
+dialog_systems = lazy_module('src.core.dialog_systems')
+achievements_endgame = lazy_module('src.features.achievements_endgame')
+
+if TYPE_CHECKING:
+    import pygame
+
+
+class _DeferredManager:
+    '''
+    Build a GameState collaborator on first attribute access.
+    
+    Non-data descriptor: the built object is stored in the instance __dict__,
+    so later lookups (and plain assignments) bypass the descriptor entirely.
+    Keeps pygame-only UI modules out of the import and construction path of
+    headless games.
+    '''
+    
+    def __init__(self, factory: Callable[['GameState'], Any]) -> None:
+        self.factory = factory
+        self.name = ''
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance: Optional['GameState'], owner: type) -> Any:
+        if instance is None:
+            return self
+        value = self.factory(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _create_input_manager(game_state: 'GameState') -> Any:
+    from src.core.input_manager import InputManager
+    return InputManager(game_state)
+
+
+def _create_employee_blob_manager(game_state: 'GameState') -> Any:
+    from src.core.employee_blob_manager import EmployeeBlobManager
+    return EmployeeBlobManager(game_state)
+
+
+def _create_ui_transition_manager(game_state: 'GameState') -> Any:
+    from src.core.ui_transition_manager import UITransitionManager
+    return UITransitionManager(game_state)
+
+
+def _create_overlay_manager(game_state: 'GameState') -> Any:
+    from src.ui.overlay_manager import OverlayManager
+    return OverlayManager()
+
 
 class GameState:
+    # UI collaborators are built on first use (see _DeferredManager)
+    input_manager = _DeferredManager(_create_input_manager)
+    employee_blob_manager = _DeferredManager(_create_employee_blob_manager)
+    ui_transition_manager = _DeferredManager(_create_ui_transition_manager)
+    overlay_manager = _DeferredManager(_create_overlay_manager)
+    
     def _get_action_cost(self, action: Dict[str, Any]) -> int:
         """
         Helper method to evaluate action cost, handling both static costs and callable costs.
@@ -201,7 +250,17 @@ class GameState:
 
 # In __init__, initialize:
 
-    def __init__(self, seed: str) -> None:
+    def __init__(self, seed: str, headless: bool = False) -> None:
+        """
+        Create a new game.
+        
+        headless=True is the construction profile for simulations and batch
+        tools: no audio. Synthesising the sound effects is almost all of what
+        a full GameState costs to build; with headless=True pygame is never
+        imported unless a UI method is called.
+        """
+        self.headless = headless
+        
         # Get current configuration with safe defaults
         config = get_current_config()
         
@@ -289,7 +348,8 @@ class GameState:
 
         # Employee blob system
         self.employee_blobs = []  # List of employee blob objects with positions and states
-        self.sound_manager = SoundManager()  # Sound system
+        from src.services.sound_manager import SoundManager
+        self.sound_manager = SoundManager(audio=not headless)  # Sound system
         
         # Game clock system - tracks game time and advances weekly
         self.game_clock = GameClock()  # Initialize game clock starting at first Monday in April 2016
@@ -361,12 +421,8 @@ class GameState:
         self.activity_log_drag_offset = (0, 0)  # Offset from mouse to log position when dragging starts
         self.activity_log_position = (0, 0)  # Custom position offset for activity log (default 0,0 means original position)
         
-        # Input management system
-        self.input_manager = InputManager(self)
-        self.employee_blob_manager = EmployeeBlobManager(self)
-        
-        # UI transition system for smooth visual feedback
-        self.ui_transition_manager = UITransitionManager(self)
+        # Input, employee blob and UI transition managers are class-level
+        # _DeferredManager attributes, built on first use
         
         # Deterministic event system for competitive gameplay
         self.deterministic_event_manager = DeterministicEventManager(self)
@@ -440,8 +496,7 @@ class GameState:
         # Enable by default for alpha testing - collect comprehensive strategy data
         self.run_logger = init_game_logger(LoggingLevel.STANDARD, enabled_by_default=True)
         
-        # Initialize UI overlay management system
-        self.overlay_manager = OverlayManager()
+        # UI overlay management system is deferred (see overlay_manager)
         
         # Initialize error tracking system (replaces duplicate error tracking logic)
         self.error_tracker = ErrorTracker(
@@ -465,8 +520,9 @@ class GameState:
         # Turn Processing Manager (extracted from monolithic end_turn method)
         self.turn_manager = TurnManager(self)
         
-        # Initialize employee blobs for starting staff
-        self.employee_blob_manager.initialize_employee_blobs()
+        # Initialize employee blobs for starting staff (without building the blob manager)
+        from src.core.employee_management import initialize_employee_blobs
+        self.employee_blobs = initialize_employee_blobs(self.staff, ui_utils.calculate_blob_position)
         
         # Office Cat System - Enhanced interactive pet mechanics for dev engagement
         self.office_cat_adopted = False  # Whether any cats have been adopted
@@ -1641,13 +1697,13 @@ class GameState:
         out = [None] * len(self.upgrades)
         for j, (original_idx, upgrade) in enumerate(purchased): 
             rect = purchased_rects[j]
-            if validate_rect(rect, f"purchased upgrade {original_idx}"):
+            if ui_utils.validate_rect(rect, f"purchased upgrade {original_idx}"):
                 out[original_idx] = rect
             else:
                 out[original_idx] = None
         for k, (original_idx, upgrade) in enumerate(not_purchased): 
             rect = not_purchased_rects[k]
-            if validate_rect(rect, f"unpurchased upgrade {original_idx}"):
+            if ui_utils.validate_rect(rect, f"unpurchased upgrade {original_idx}"):
                 out[original_idx] = rect
             else:
                 out[original_idx] = None
@@ -1693,10 +1749,10 @@ class GameState:
         return (x, y, icon_w, icon_h)
 
     def _get_endturn_rect(self, w: int, h: int) -> Tuple[int, int, int, int]:
-        return get_endturn_rect(w, h)
+        return ui_utils.get_endturn_rect(w, h)
 
     def _get_mute_button_rect(self, w: int, h: int) -> Tuple[int, int, int, int]:
-        return get_mute_button_rect(w, h)
+        return ui_utils.get_mute_button_rect(w, h)
 
     def _get_activity_log_minimize_button_rect(self, w: int, h: int) -> Tuple[int, int, int, int]:
         """Get rectangle for the activity log minimize button (only when scrollable log is enabled)"""
@@ -2005,7 +2061,7 @@ class GameState:
         self.messages.append(f"Week of {formatted_date} (Mon)")
         
         # Issue #195: Check for achievements and critical warnings at start of new turn
-        process_achievements_and_warnings_complete(self, achievements_endgame_system)
+        process_achievements_and_warnings_complete(self, achievements_endgame.achievements_endgame_system)
         
         # Reset Action Points for new turn (Phase 2: Staff-Based AP Scaling)
         self.max_action_points = self.calculate_max_ap()
@@ -2222,10 +2278,12 @@ class GameState:
             
             if score > prev_score:
                 # Save both score and lab name for pseudonymous leaderboard
+                pygame = sys.modules.get('pygame')
                 data[self.seed] = {
                     'score': score,
                     'lab_name': getattr(self, 'lab_name', 'Unknown Labs'),
-                    'timestamp': pygame.time.get_ticks()  # For sorting by recency if needed
+                    # For sorting by recency if needed; 0 when pygame never loaded (headless)
+                    'timestamp': pygame.time.get_ticks() if pygame is not None else 0
                 }
                 with open(SCORE_FILE, "w") as f:
                     json.dump(data, f)
@@ -3432,7 +3490,7 @@ class GameState:
             return
         
         # Set up the hiring dialog state using dialog manager
-        self.pending_hiring_dialog = DialogManager.create_hiring_dialog_state(available_subtypes, complexity_level)
+        self.pending_hiring_dialog = dialog_systems.DialogManager.create_hiring_dialog_state(available_subtypes, complexity_level)
     
     def select_employee_subtype(self, subtype_id: str) -> Tuple[bool, str]:
         """Handle player selection of an employee subtype."""
@@ -3548,11 +3606,12 @@ class GameState:
             element_id: ID of the UI element
             details: Additional details about the interaction
         """
+        pygame = sys.modules.get('pygame')
         log_data = {
             'type': interaction_type,
             'element': element_id,
             'turn': self.turn,
-            'timestamp': getattr(pygame.time, 'get_ticks', lambda: 0)()
+            'timestamp': pygame.time.get_ticks() if pygame is not None else 0
         }
         
         if details:
@@ -4452,12 +4511,12 @@ class GameState:
             return
         
         # Set up the fundraising dialog state using dialog manager
-        self.pending_fundraising_dialog = DialogManager.create_fundraising_dialog_state(available_options)
+        self.pending_fundraising_dialog = dialog_systems.DialogManager.create_fundraising_dialog_state(available_options)
     
     def _get_available_fundraising_options(self) -> List[Dict[str, Any]]:
         """Get available fundraising options based on current game state."""
         advanced_funding_unlocked = hasattr(self, 'advanced_funding_unlocked') and self.advanced_funding_unlocked
-        return FundraisingDialogBuilder.build_fundraising_options(
+        return dialog_systems.FundraisingDialogBuilder.build_fundraising_options(
             self.economic_config, self.reputation, advanced_funding_unlocked
         )
     
@@ -4597,7 +4656,7 @@ class GameState:
         available_options = self._get_available_research_options()
         
         # Create research dialog state using dialog manager
-        self.pending_research_dialog = DialogManager.create_research_dialog_state(available_options)
+        self.pending_research_dialog = dialog_systems.DialogManager.create_research_dialog_state(available_options)
         
         # Ensure research quality system is also unlocked for quality settings
         if not self.research_quality_unlocked:
@@ -4608,7 +4667,7 @@ class GameState:
     
     def _get_available_research_options(self) -> List[Dict[str, Any]]:
         """Get available research options based on current game state."""
-        return ResearchDialogBuilder.build_research_options(self.money, self.reputation)
+        return dialog_systems.ResearchDialogBuilder.build_research_options(self.money, self.reputation)
     
     def dismiss_research_dialog(self) -> None:
         """Dismiss the research dialog."""
@@ -5,10 +5,14 @@ easing functions, particle effects, and visual transitions. Extracted from
 the main GameState monolith for better separation of concerns.
 '''
 
-from typing import Dict, Any, List, Tuple
-import pygame
+from __future__ import annotations
+
+from typing import Dict, Any, List, Tuple, TYPE_CHECKING
 from src.services.deterministic_rng import get_rng
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class UITransitionManager:
     '''Manages UI transition animations and visual effects.
@@ -4,14 +4,23 @@ UI positioning utilities extracted from game_state.py
 This module contains all the UI rectangle calculation and positioning methods
 that were cluttering the main GameState class. These are pure functions that
 calculate screen positions and sizes based on screen dimensions.
+
+pygame is only imported by the helpers that build pygame.Rect objects, so the
+pure layout math stays importable in headless runs.
 '''
 
-from typing import List, Optional, Tuple, Any
-import pygame
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
 
 
 def get_action_rects(w: int, h: int) -> List[pygame.Rect]:
     '''Calculate action button rectangles based on screen dimensions.'''
+    import pygame
+    
     action_rects = []
     actions_per_column = 9
     action_start_x = int(w * 0.15)
@@ -31,6 +40,8 @@ def get_action_rects(w: int, h: int) -> List[pygame.Rect]:
 
 def get_upgrade_rects(w: int, h: int) -> List[Optional[pygame.Rect]]:
     '''Calculate upgrade button rectangles based on screen dimensions.'''
+    import pygame
+    
     upgrade_rects = []
     upgrade_width = int(w * 0.028)
     upgrade_height = int(h * 0.05)
@@ -5,10 +5,12 @@ This module contains pure utility functions for validation, upgrade availability
 checking, and achievements processing that have minimal game state dependencies.
 '''
 
+from __future__ import annotations
+
 from typing import Dict, Any, List, Tuple, Union, TYPE_CHECKING
-import pygame
 
 if TYPE_CHECKING:
+    import pygame
     from src.core.game_state import GameState
 
 
@@ -37,7 +39,7 @@ def check_point_in_rect(pt: Tuple[int, int], rect: Union[Tuple[int, int, int, in
     
     try:
         x, y = pt
-        if isinstance(rect, pygame.Rect):
+        if hasattr(rect, 'collidepoint'):  # pygame.Rect
             return rect.collidepoint(x, y)
         else:
             rx, ry, rw, rh = rect
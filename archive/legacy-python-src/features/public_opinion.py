@@ -4,14 +4,25 @@ Public Opinion System - Track public sentiment and media coverage in P(Doom).
 This module implements dynamic public opinion tracking that responds to player actions,
 competitor actions, and external events. It integrates with the existing reputation
 system while providing more nuanced public sentiment mechanics.
+
+Per-turn cost is independent of game length: history lives in fixed-size ring
+buffers, modifiers and stories expire through heaps ordered by expiry, and the
+four opinion categories are stepped together as one small vector.
 '''
 
+import heapq
+import itertools
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 from enum import Enum
 from src.services.deterministic_rng import get_rng
 
 
+# Turns of opinion history kept per category
+HISTORY_LENGTH = 20
+
+
 
 class OpinionCategory(Enum):
     '''Categories of public opinion that can be tracked.'''
@@ -31,6 +42,70 @@ class MediaStoryType(Enum):
     INDUSTRY_NEWS = 'industry_news'
 
 
+# Fixed category order for the opinion vector; values double as attribute names
+OPINION_FIELDS: Tuple[str, ...] = tuple(category.value for category in OpinionCategory)
+
+# Natural decay per category: (neutral target, multiple of decay_rate)
+_DECAY_RULES: Tuple[Tuple[float, float], ...] = (
+    (50.0, 1.0),  # general_sentiment drifts toward neutral
+    (50.0, 1.0),  # trust_in_player drifts toward neutral
+    (0.0, 0.5),   # ai_safety_awareness fades unless safety stories are running
+    (0.0, 2.0),   # media_attention naturally decreases
+)
+_AWARENESS_INDEX = OPINION_FIELDS.index(OpinionCategory.AI_SAFETY_AWARENESS.value)
+
+
+class OpinionHistory:
+    '''
+    Fixed-capacity ring buffer of opinion values.
+    
+    Appends are O(1) and never reallocate; indexing (including negative
+    indices) is O(1), so trend queries do not copy or slice the history.
+    '''
+    
+    def __init__(self, values: Iterable[float] = (), capacity: int = HISTORY_LENGTH):
+        '''Create a buffer seeded with the most recent `capacity` values.'''
+        self.capacity = capacity
+        self._data = array('d', [0.0] * capacity)
+        self._start = 0
+        self._size = 0
+        for value in values:
+            self.append(value)
+    
+    def append(self, value: float):
+        '''Record a value, overwriting the oldest once full.'''
+        if self._size < self.capacity:
+            self._data[(self._start + self._size) % self.capacity] = value
+            self._size += 1
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('opinion history index out of range')
+        return self._data[(self._start + index) % self.capacity]
+    
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._data[(self._start + i) % self.capacity]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (OpinionHistory, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f'OpinionHistory({list(self)!r}, capacity={self.capacity})'
+
+
 @dataclass
 class OpinionModifier:
     '''Represents a modifier to public opinion metrics.'''
@@ -87,8 +162,8 @@ class PublicOpinion:
     ai_safety_awareness: float = 20.0  # How much public cares about AI safety
     media_attention: float = 0.0     # How much media is watching AI sector
     
-    # Historical tracking
-    opinion_history: Dict[str, List[float]] = field(default_factory=dict)
+    # Historical tracking (plain lists passed in are wrapped by __post_init__)
+    opinion_history: Dict[str, OpinionHistory] = field(default_factory=dict)
     
     # Active modifiers and stories
     active_modifiers: List[OpinionModifier] = field(default_factory=list)
@@ -99,46 +174,59 @@ class PublicOpinion:
     volatility: float = 1.0  # Multiplier for opinion changes
     
     def __post_init__(self):
-        '''Initialize history tracking if not provided.'''
+        '''Initialize history tracking and the expiry indexes.'''
         if not self.opinion_history:
-            self.opinion_history = {
-                'general_sentiment': [self.general_sentiment],
-                'trust_in_player': [self.trust_in_player],
-                'ai_safety_awareness': [self.ai_safety_awareness],
-                'media_attention': [self.media_attention]
-            }
+            self.opinion_history = {name: [getattr(self, name)] for name in OPINION_FIELDS}
+        self.opinion_history = {
+            name: OpinionHistory(values) for name, values in self.opinion_history.items()
+        }
+        
+        # Expiry-ordered heaps of (expires_at, sequence, item); the sequence
+        # keeps ordering stable without comparing the dataclasses themselves
+        self._sequence = itertools.count()
+        self._modifier_heap: List[Tuple[int, int, OpinionModifier]] = []
+        self._story_heap: List[Tuple[int, int, MediaStory]] = []
+        
+        # Modifier turns are counted in update_turn calls, since modifiers
+        # are added without turn information
+        self._modifier_clock = 0
+        self._modifier_totals = array('d', [0.0] * len(OPINION_FIELDS))
+        self._safety_story_count = 0
+        
+        for modifier in self.active_modifiers:
+            self._track_modifier(modifier)
+        for story in self.active_stories:
+            self._track_story(story)
     
     def get_opinion(self, category: OpinionCategory) -> float:
         '''Get the current value for an opinion category.'''
-        if category == OpinionCategory.GENERAL_SENTIMENT:
-            return self.general_sentiment
-        elif category == OpinionCategory.TRUST_IN_PLAYER:
-            return self.trust_in_player
-        elif category == OpinionCategory.AI_SAFETY_AWARENESS:
-            return self.ai_safety_awareness
-        elif category == OpinionCategory.MEDIA_ATTENTION:
-            return self.media_attention
-        else:
+        if not isinstance(category, OpinionCategory):
             raise ValueError(f'Unknown opinion category: {category}')
+        return getattr(self, category.value)
     
     def set_opinion(self, category: OpinionCategory, value: float):
         '''Set the value for an opinion category.'''
-        value = max(0.0, min(100.0, value))
-        
-        if category == OpinionCategory.GENERAL_SENTIMENT:
-            self.general_sentiment = value
-        elif category == OpinionCategory.TRUST_IN_PLAYER:
-            self.trust_in_player = value
-        elif category == OpinionCategory.AI_SAFETY_AWARENESS:
-            self.ai_safety_awareness = value
-        elif category == OpinionCategory.MEDIA_ATTENTION:
-            self.media_attention = value
-        else:
+        if not isinstance(category, OpinionCategory):
             raise ValueError(f'Unknown opinion category: {category}')
+        setattr(self, category.value, max(0.0, min(100.0, value)))
+    
+    def _track_modifier(self, modifier: OpinionModifier):
+        '''Index a modifier by the update on which it expires.'''
+        expires_at = self._modifier_clock + max(1, modifier.duration)
+        heapq.heappush(self._modifier_heap, (expires_at, next(self._sequence), modifier))
+        self._modifier_totals[OPINION_FIELDS.index(modifier.category.value)] += modifier.change
+    
+    def _track_story(self, story: MediaStory):
+        '''Index a story by the turn on which it expires.'''
+        expires_at = story.created_turn + story.duration
+        heapq.heappush(self._story_heap, (expires_at, next(self._sequence), story))
+        if story.story_type == MediaStoryType.SAFETY_CONCERN:
+            self._safety_story_count += 1
     
     def add_modifier(self, modifier: OpinionModifier):
         '''Add a temporary modifier to public opinion.'''
         self.active_modifiers.append(modifier)
+        self._track_modifier(modifier)
         # Note: GameLogger requires a turn parameter, but we don't have access to it here
         # This is fine since the add_modifier method is typically called during game actions
         # where turn information isn't always available
@@ -146,6 +234,7 @@ class PublicOpinion:
     def add_media_story(self, story: MediaStory):
         '''Add a new media story.'''
         self.active_stories.append(story)
+        self._track_story(story)
         
         # Apply initial sentiment impact
         for category, impact in story.sentiment_impact.items():
@@ -159,75 +248,81 @@ class PublicOpinion:
         # Note: We would log here if we had access to turn information
     
     def update_turn(self, current_turn: int):
-        '''Update public opinion for a new turn.'''
-        # Apply active modifiers
-        for modifier in self.active_modifiers[:]:  # Copy list to allow removal during iteration
-            current = self.get_opinion(modifier.category)
-            new_value = modifier.apply(current)
-            self.set_opinion(modifier.category, new_value)
-            
-            modifier.duration -= 1
-            if modifier.duration <= 0:
-                self.active_modifiers.remove(modifier)
+        '''
+        Update public opinion for a new turn.
+        
+        Active modifiers are applied as a single per-category total, which is
+        kept current as modifiers are added and expire.
+        '''
+        self._modifier_clock += 1
+        values = [getattr(self, name) for name in OPINION_FIELDS]
+        totals = self._modifier_totals
+        if self._modifier_heap:
+            values = [max(0.0, min(100.0, v + t)) for v, t in zip(values, totals)]
+        
+        # Expire modifiers that have now run for their full duration
+        expired_modifiers = False
+        while self._modifier_heap and self._modifier_heap[0][0] <= self._modifier_clock:
+            _, _, modifier = heapq.heappop(self._modifier_heap)
+            totals[OPINION_FIELDS.index(modifier.category.value)] -= modifier.change
+            expired_modifiers = True
+        if expired_modifiers:
+            live = {id(entry[2]) for entry in self._modifier_heap}
+            self.active_modifiers[:] = [m for m in self.active_modifiers if id(m) in live]
+        if not self._modifier_heap:
+            # Reset accumulated float error once nothing is active
+            totals[:] = array('d', [0.0] * len(OPINION_FIELDS))
         
         # Remove expired stories
-        expired_stories = [story for story in self.active_stories if story.is_expired(current_turn)]
-        for story in expired_stories:
-            self.active_stories.remove(story)
+        expired_stories = False
+        while self._story_heap and self._story_heap[0][0] <= current_turn:
+            _, _, story = heapq.heappop(self._story_heap)
+            if story.story_type == MediaStoryType.SAFETY_CONCERN:
+                self._safety_story_count -= 1
+            expired_stories = True
             # Note: We would log story expiration here if needed
+        if expired_stories:
+            live = {id(entry[2]) for entry in self._story_heap}
+            self.active_stories[:] = [s for s in self.active_stories if id(s) in live]
         
         # Apply natural decay toward neutral values
-        self._apply_natural_decay()
+        self._apply_natural_decay(values)
         
         # Record history
         self._record_history()
     
-    def _apply_natural_decay(self):
+    def _apply_natural_decay(self, values: Optional[List[float]] = None):
         '''Apply natural decay to bring extreme values toward neutral.'''
-        # General sentiment drifts toward 50 (neutral)
-        if self.general_sentiment > 50:
-            self.general_sentiment = max(50, self.general_sentiment - self.decay_rate)
-        elif self.general_sentiment < 50:
-            self.general_sentiment = min(50, self.general_sentiment + self.decay_rate)
-        
-        # Trust in player drifts toward 50 (neutral)
-        if self.trust_in_player > 50:
-            self.trust_in_player = max(50, self.trust_in_player - self.decay_rate)
-        elif self.trust_in_player < 50:
-            self.trust_in_player = min(50, self.trust_in_player + self.decay_rate)
-        
-        # Media attention naturally decreases
-        self.media_attention = max(0, self.media_attention - self.decay_rate * 2)
+        if values is None:
+            values = [getattr(self, name) for name in OPINION_FIELDS]
         
-        # AI safety awareness slowly decreases if no events
-        if not any(story.story_type == MediaStoryType.SAFETY_CONCERN for story in self.active_stories):
-            self.ai_safety_awareness = max(0, self.ai_safety_awareness - self.decay_rate * 0.5)
+        for index, (value, (target, rate)) in enumerate(zip(values, _DECAY_RULES)):
+            step = self.decay_rate * rate
+            # AI safety awareness only fades while no safety story is running
+            if index == _AWARENESS_INDEX and self._safety_story_count > 0:
+                step = 0.0
+            if value > target:
+                value = max(target, value - step)
+            elif value < target:
+                value = min(target, value + step)
+            setattr(self, OPINION_FIELDS[index], value)
     
     def _record_history(self):
         '''Record current values in history.'''
-        self.opinion_history['general_sentiment'].append(self.general_sentiment)
-        self.opinion_history['trust_in_player'].append(self.trust_in_player)
-        self.opinion_history['ai_safety_awareness'].append(self.ai_safety_awareness)
-        self.opinion_history['media_attention'].append(self.media_attention)
-        
-        # Keep only last 20 turns of history to prevent memory bloat
-        for key in self.opinion_history:
-            if len(self.opinion_history[key]) > 20:
-                self.opinion_history[key] = self.opinion_history[key][-20:]
+        for name in OPINION_FIELDS:
+            history = self.opinion_history.get(name)
+            if not isinstance(history, OpinionHistory):
+                history = self.opinion_history[name] = OpinionHistory(history or ())
+            history.append(getattr(self, name))
     
     def get_trend(self, category: OpinionCategory, turns: int = 3) -> str:
         '''Get trend direction for an opinion category.'''
-        history_key = category.value
-        if history_key not in self.opinion_history or len(self.opinion_history[history_key]) < 2:
-            return 'stable'
-        
-        recent_values = self.opinion_history[history_key][-min(turns + 1, len(self.opinion_history[history_key])):]
-        
-        if len(recent_values) < 2:
+        history = self.opinion_history.get(category.value)
+        if history is None or len(history) < 2:
             return 'stable'
         
-        # Calculate average change over the period
-        total_change = recent_values[-1] - recent_values[0]
+        # Compare the newest value with the one `turns` entries back
+        total_change = history[-1] - history[-min(turns + 1, len(history))]
         
         if total_change > 2:
             return 'rising'
@@ -252,7 +347,7 @@ class PublicOpinion:
             'trust_in_player': self.trust_in_player,
             'ai_safety_awareness': self.ai_safety_awareness,
             'media_attention': self.media_attention,
-            'opinion_history': self.opinion_history,
+            'opinion_history': {name: list(values) for name, values in self.opinion_history.items()},
             'active_stories': [
                 {
                     'headline': story.headline,
@@ -297,7 +392,9 @@ class PublicOpinion:
                 created_turn=story_data['created_turn'],
                 source_lab=story_data.get('source_lab')
             )
+            # Impact was already applied before serialization
             opinion.active_stories.append(story)
+            opinion._track_story(story)
         
         return opinion
 
@@ -0,0 +1,43 @@
+'''
+Deferred module loading for the simulation package.
+
+lazy_module(name) returns a module object whose import runs on first
+attribute access (importlib.util.LazyLoader). It keeps cold imports cheap for
+batch tools and tests, which often import src.core.game_state only to build
+headless games: use it for heavy dependencies that only some code paths touch,
+e.g. dialog builders or UI layout helpers.
+
+See src/testing/import_report.py for the import-time report and budget.
+'''
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str) -> ModuleType:
+    '''
+    Return module `name`, deferring its execution until an attribute is read.
+
+    An already-imported module is returned as-is. Import errors surface on
+    first attribute access rather than here, except for a missing module.
+    '''
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f'No module named {name!r}', name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # Bind on the parent package, as a normal import would
+    parent, _, child = name.rpartition('.')
+    if parent and parent in sys.modules:
+        setattr(sys.modules[parent], child, module)
+    return module
+
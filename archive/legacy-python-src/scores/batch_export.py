@@ -0,0 +1,481 @@
+'''
+Batch Export - Incremental Weekly Data Batches for the Website Pipeline
+
+Turns the local leaderboards and the compacted session archive into the
+weekly batches described by DataBatchService (docs/shared/
+data-batch-integration.py), and serves them over a local stand-in for its
+/batches endpoints.
+
+Batches:
+- leaderboards_<monday>: every board entry dated in that ISO week, ranked.
+  Rows carry a salted player_id (the salt is <output>/player_salt, made on
+  the first export and never published) and the game_version resolved from
+  the session archive's partitions; usernames are only included on request
+- analytics_<monday>: per (seed, game_version, economic_model) session
+  aggregates for games started in that week
+
+Incremental by design:
+- A watermark records each board's snapshot/journal stat and each session
+  segment's row count and time range at the last export; only boards and
+  segments that changed since are read again
+- Every output document is written once to objects/<sha256>.json, so an
+  unchanged batch keeps its file (and its ETag) across exports
+- index.json maps batch ids to their current object and is only rewritten
+  when a batch actually changed
+
+Usage:
+    python -m src.scores.batch_export export --leaderboards leaderboards --output batch_export
+    python -m src.scores.batch_export export --include-usernames
+    python -m src.scores.batch_export serve --output batch_export --port 8765
+'''
+
+import argparse
+import hashlib
+import json
+import os
+import secrets
+import sys
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.scores.leaderboard_catalog import LeaderboardCatalog, config_hash
+from src.scores.local_store import LocalLeaderboard
+from src.scores.session_archive import PARTITION_COLUMNS, SessionArchive
+from src.scores.session_text import read_session_file
+
+
+SCHEMA_VERSION = '1.0.0'
+UNKNOWN_VERSION = 'unknown'  # game_version of a board no session record matches
+ANALYTICS_METRICS = ('final_score', 'final_doom', 'duration_minutes')
+
+
+def week_start(moment: Any) -> date:
+    '''Monday of the ISO week containing a datetime, date or ISO string.'''
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment)
+    if isinstance(moment, datetime):
+        moment = moment.date()
+    return moment - timedelta(days=moment.weekday())
+
+
+def weeks_between(first: Any, last: Any) -> List[date]:
+    '''Mondays of every week from first to last inclusive.'''
+    monday, end = week_start(first), week_start(last)
+    weeks = []
+    while monday <= end:
+        weeks.append(monday)
+        monday += timedelta(days=7)
+    return weeks
+
+
+def _encode(document: Any) -> bytes:
+    return json.dumps(document, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _anonymize(player_name: str, salt: bytes) -> str:
+    return 'player_' + hashlib.sha256(salt + player_name.encode('utf-8')).hexdigest()[:12]
+
+
+class BatchExporter:
+    '''
+    Incremental exporter from a leaderboard directory to content-addressed batches.
+
+    State lives in <output>/index.json: the current object of each batch,
+    the per-board and per-week part objects, and the watermarks.
+    '''
+
+    INDEX_FILENAME = 'index.json'
+    OBJECT_DIR = 'objects'
+    SALT_FILENAME = 'player_salt'
+
+    def __init__(self, leaderboard_dir: Path, output_dir: Path, include_usernames: bool = False):
+        '''
+        Initialize the exporter.
+
+        Args:
+            leaderboard_dir: Directory with leaderboard_*.json and sessions/
+            output_dir: Directory for index.json, objects/ and player_salt
+            include_usernames: Publish each entry's player name beside its player_id
+        '''
+        self.leaderboard_dir = Path(leaderboard_dir)
+        self.output_dir = Path(output_dir)
+        self.object_dir = self.output_dir / self.OBJECT_DIR
+        self.index_file = self.output_dir / self.INDEX_FILENAME
+        self.include_usernames = include_usernames
+        self.index = self._load_index()
+        self.objects_written = 0
+        self._salt: Optional[bytes] = None
+
+    @property
+    def salt(self) -> bytes:
+        '''Per-export-directory secret for player ids, created on first use.'''
+        if self._salt is None:
+            salt_file = self.output_dir / self.SALT_FILENAME
+            try:
+                self._salt = bytes.fromhex(salt_file.read_text(encoding='utf-8').strip())
+            except (OSError, ValueError):
+                self._salt = b''
+            if len(self._salt) < 16:
+                self._salt = secrets.token_bytes(16)
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                salt_file.write_text(self._salt.hex(), encoding='utf-8')
+        return self._salt
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == SCHEMA_VERSION:
+                return index
+        except (json.JSONDecodeError, OSError):
+            pass
+        return {
+            'version': SCHEMA_VERSION,
+            'batches': {},
+            'board_parts': {},
+            'watermark': {'boards': {}, 'sessions': {}}
+        }
+
+    def put_object(self, document: Any) -> str:
+        '''Store a document under its content hash; existing objects are never rewritten.'''
+        data = _encode(document)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_dir / f'{digest}.json'
+        if not path.exists():
+            self.object_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = path.with_suffix('.tmp')
+            temp_file.write_bytes(data)
+            os.replace(temp_file, path)
+            self.objects_written += 1
+        return digest
+
+    def get_object(self, digest: str) -> Any:
+        with open(self.object_dir / f'{digest}.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def export(self) -> Dict[str, Any]:
+        '''
+        Bring every batch up to date with the leaderboards and sessions.
+
+        Returns:
+            Report with the boards and session sources re-read and the batch
+            ids whose content changed
+        '''
+        self.objects_written = 0
+        before = dict(self.index['batches'])
+
+        boards, board_weeks = self._export_board_parts(self._board_versions())
+        for week in sorted(board_weeks):
+            self._build_leaderboard_batch(week)
+
+        sources, session_weeks = self._changed_session_weeks()
+        if session_weeks:
+            archive = SessionArchive(self.leaderboard_dir / 'sessions')
+            for week in sorted(session_weeks):
+                self._build_analytics_batch(archive, week)
+
+        changed = sorted(batch_id for batch_id, info in self.index['batches'].items()
+                         if before.get(batch_id, {}).get('object') != info['object'])
+        changed += sorted(set(before) - set(self.index['batches']))
+        if boards or sources or changed:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_suffix('.tmp')
+            temp_file.write_bytes(_encode(self.index))
+            os.replace(temp_file, self.index_file)
+
+        return {
+            'boards_read': boards,
+            'session_sources_read': sources,
+            'changed_batches': changed,
+            'objects_written': self.objects_written
+        }
+
+    def _board_versions(self) -> Dict[Tuple[str, str], str]:
+        '''(seed, config_hash) -> game_version, from the session archive's partitions.'''
+        archive = SessionArchive(self.leaderboard_dir / 'sessions')
+        partitions = [tuple(info['partition'].get(c) for c in PARTITION_COLUMNS)
+                      for info in archive.manifest['segments'].values()]
+        for path in archive.pending_files():
+            record = read_session_file(path)
+            if record:
+                partitions.append(SessionArchive.partition_of(record))
+        return {(seed, config_hash(str(model), str(version))): str(version)
+                for seed, version, model in partitions}
+
+    def _row_options(self) -> Dict[str, Any]:
+        '''What, besides the boards, decides a row's content; a change re-reads every board.'''
+        return {'usernames': self.include_usernames,
+                'salt': hashlib.sha256(self.salt).hexdigest()[:16]}
+
+    def _export_board_parts(self, versions: Dict[Tuple[str, str], str]) -> Tuple[List[str], Set[str]]:
+        '''Re-split changed boards into per-week part objects; returns (boards, weeks touched).'''
+        catalog = LeaderboardCatalog(self.leaderboard_dir)
+        catalog.refresh()
+        watermarks = self.index['watermark']['boards']
+        board_versions = self.index['watermark'].setdefault('board_versions', {})
+        parts = self.index['board_parts']
+        if self.index.get('row_options') != self._row_options():
+            watermarks.clear()
+            self.index['row_options'] = self._row_options()
+
+        boards_read: List[str] = []
+        weeks: Set[str] = set()
+        for name in sorted(set(catalog.boards) | set(parts)):
+            board = catalog.boards.get(name)
+            if board is not None:
+                game_version = versions.get((board['seed'], board['config_hash']), UNKNOWN_VERSION)
+                if watermarks.get(name) == board['stat'] and board_versions.get(name) == game_version:
+                    continue
+
+            old_parts = parts.pop(name, {})
+            weeks.update(old_parts)
+            watermarks.pop(name, None)
+            board_versions.pop(name, None)
+            if board is None:
+                continue
+
+            leaderboard = LocalLeaderboard(leaderboard_file=self.leaderboard_dir / name)
+            by_week: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in leaderboard.entries:
+                row = {
+                    'player_id': _anonymize(entry.player_name, self.salt),
+                    'score': entry.score,
+                    'game_version': game_version,
+                    'seed': board['seed'],
+                    'config_hash': board['config_hash'],
+                    'completion_date': entry.date.isoformat(),
+                    'game_mode': entry.game_mode,
+                    'level_reached': entry.level_reached,
+                    'session_duration_minutes': round(entry.duration_seconds / 60, 2),
+                    'entry_uuid': entry.entry_uuid
+                }
+                if self.include_usernames:
+                    row['username'] = entry.player_name
+                by_week.setdefault(week_start(entry.date).isoformat(), []).append(row)
+            parts[name] = {week: self.put_object(rows) for week, rows in by_week.items()}
+            weeks.update(parts[name])
+            # Stat after loading: loading may have compacted the board's journal
+            watermarks[name] = catalog.board_stat(self.leaderboard_dir / name)
+            board_versions[name] = game_version
+            boards_read.append(name)
+        return boards_read, weeks
+
+    def _set_batch(self, batch_type: str, week: str, data: List[Dict[str, Any]]) -> None:
+        batch_id = f'{batch_type}_{week}'
+        if not data:
+            self.index['batches'].pop(batch_id, None)
+            return
+        document = {
+            'batch_metadata': {
+                'batch_id': batch_id,
+                'batch_type': batch_type,
+                'version': SCHEMA_VERSION,
+                'batch_date': week,
+                'status': 'active',
+                'record_count': len(data),
+                'schema_version': SCHEMA_VERSION
+            },
+            'data': data
+        }
+        self.index['batches'][batch_id] = {
+            'batch_type': batch_type,
+            'batch_date': week,
+            'record_count': len(data),
+            'object': self.put_object(document)
+        }
+
+    def _build_leaderboard_batch(self, week: str) -> None:
+        '''Merge every board's part for a week into one ranked batch.'''
+        rows = []
+        for name in sorted(self.index['board_parts']):
+            digest = self.index['board_parts'][name].get(week)
+            if digest:
+                rows.extend(self.get_object(digest))
+        rows.sort(key=lambda row: (-row['score'], row['completion_date'], row['entry_uuid']))
+        self._set_batch('leaderboards', week, [dict(row, rank=rank) for rank, row in enumerate(rows, 1)])
+
+    def _changed_session_weeks(self) -> Tuple[List[str], Set[str]]:
+        '''
+        Weeks whose analytics may have changed since the last export.
+
+        Segments are compared by row count and start_time range from the
+        archive manifest (no segment is opened); loose session files by stat.
+        '''
+        sessions_dir = self.leaderboard_dir / 'sessions'
+        archive = SessionArchive(sessions_dir)
+        current: Dict[str, Any] = {}
+        for name, info in archive.manifest['segments'].items():
+            current[name] = {'rows': info['rows'], 'start_time': info['stats'].get('start_time')}
+        for path in archive.pending_files():
+            stat = path.stat()
+            record = read_session_file(path) or {}
+            started = record.get('start_time')
+            current[path.name] = {'stat': [stat.st_mtime_ns, stat.st_size],
+                                  'start_time': [started, started] if started else None}
+
+        previous = self.index['watermark']['sessions']
+        changed = sorted(n for n in set(current) | set(previous) if current.get(n) != previous.get(n))
+        weeks: Set[str] = set()
+        for name in changed:
+            for mark in (current.get(name), previous.get(name)):
+                if mark and mark['start_time']:
+                    try:
+                        weeks.update(w.isoformat() for w in weeks_between(*mark['start_time']))
+                    except (TypeError, ValueError):
+                        print(f'Warning: {name} has an unreadable start_time; skipped')
+        self.index['watermark']['sessions'] = current
+        return changed, weeks
+
+    def _build_analytics_batch(self, archive: SessionArchive, week: str) -> None:
+        '''Aggregate sessions started in a week; the time range prunes segments.'''
+        start = date.fromisoformat(week)
+        window = [start.isoformat(), (start + timedelta(days=7)).isoformat()]
+        rows = archive.query(where={'start_time': ('between', window)},
+                             group_by=list(PARTITION_COLUMNS), metrics=list(ANALYTICS_METRICS))
+        for row in rows:
+            row['sessions'] = row.pop('count')
+        self._set_batch('analytics', week, rows)
+
+
+class BatchRequestHandler(BaseHTTPRequestHandler):
+    '''
+    Local stand-in for the DataBatchAPI endpoints, reading an export directory.
+
+    GET /v1/batches                       index of batch ids with their ETags
+    GET /v1/batches/<type>/<batch_date>   one batch document
+    GET /v1/batches/<batch_id>/status     batch status
+    GET /v1/objects/<sha256>              any stored object (immutable)
+
+    Every response carries an ETag and honours If-None-Match with a 304, so
+    a rebuild only downloads batches whose ETag changed.
+    '''
+
+    export_dir: Path = Path('batch_export')
+    server_version = 'PDoomBatchStandIn/1.0'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.export_dir / BatchExporter.INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {'batches': {}}
+
+    def _send(self, status: int, body: bytes = b'', etag: Optional[str] = None,
+              immutable: bool = False) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', f'"{etag}"')
+            self.send_header('Cache-Control',
+                             'public, max-age=31536000, immutable' if immutable else 'no-cache')
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_etagged(self, body_or_digest: Any, etag: str, immutable: bool = False) -> None:
+        '''Answer 304 when the client already has this ETag, else send the body.'''
+        client_tags = [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]
+        if f'"{etag}"' in client_tags or '*' in client_tags:
+            self._send(304, etag=etag, immutable=immutable)
+            return
+        if isinstance(body_or_digest, bytes):
+            body = body_or_digest
+        else:
+            body = (self.export_dir / BatchExporter.OBJECT_DIR / f'{body_or_digest}.json').read_bytes()
+        self._send(200, body, etag=etag, immutable=immutable)
+
+    def _error(self, status: int, message: str) -> None:
+        self._send(status, _encode({'error': message}))
+
+    def do_GET(self) -> None:
+        parts = [p for p in self.path.split('?', 1)[0].split('/') if p]
+        if parts[:1] != ['v1']:
+            return self._error(404, 'not found')
+        parts = parts[1:]
+
+        if len(parts) == 2 and parts[0] == 'objects':
+            digest = parts[1]
+            if not all(c in '0123456789abcdef' for c in digest) or len(digest) != 64:
+                return self._error(404, 'unknown object')
+            if not (self.export_dir / BatchExporter.OBJECT_DIR / f'{digest}.json').exists():
+                return self._error(404, 'unknown object')
+            return self._send_etagged(digest, digest, immutable=True)
+
+        if parts[:1] != ['batches']:
+            return self._error(404, 'not found')
+        batches = self._load_index().get('batches', {})
+
+        if len(parts) == 1:
+            listing = {batch_id: {'etag': info['object'], 'batch_type': info['batch_type'],
+                                  'batch_date': info['batch_date'], 'record_count': info['record_count']}
+                       for batch_id, info in batches.items()}
+            body = _encode({'batches': listing})
+            return self._send_etagged(body, hashlib.sha256(body).hexdigest())
+
+        if len(parts) == 3 and parts[2] == 'status':
+            info = batches.get(parts[1])
+            if info is None:
+                return self._error(404, 'unknown batch')
+            body = _encode({'batch_id': parts[1], 'status': 'active', 'etag': info['object'],
+                            'record_count': info['record_count']})
+            return self._send_etagged(body, info['object'])
+
+        if len(parts) == 3:
+            info = batches.get(f'{parts[1]}_{parts[2]}')
+            if info is None:
+                return self._error(404, 'unknown batch')
+            return self._send_etagged(info['object'], info['object'])
+
+        return self._error(404, 'not found')
+
+
+def make_server(export_dir: Path, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    '''HTTP server for an export directory (port 0 picks a free port).'''
+    handler = type('BoundBatchRequestHandler', (BatchRequestHandler,), {'export_dir': Path(export_dir)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    '''Command-line entry point: export batches or serve an export directory.'''
+    parser = argparse.ArgumentParser(description='Export and serve weekly leaderboard batches')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    export_parser = subparsers.add_parser('export', help='Update batches from the leaderboards')
+    export_parser.add_argument('--leaderboards', type=Path, default=Path('leaderboards'))
+    export_parser.add_argument('--output', type=Path, default=Path('batch_export'))
+    export_parser.add_argument('--include-usernames', action='store_true',
+                               help='publish player names beside the salted player ids')
+    serve_parser = subparsers.add_parser('serve', help='Serve an export directory with ETags')
+    serve_parser.add_argument('--output', type=Path, default=Path('batch_export'))
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if args.command == 'export':
+        report = BatchExporter(args.leaderboards, args.output, args.include_usernames).export()
+        print(f'Read {len(report["boards_read"])} board(s) and '
+              f'{len(report["session_sources_read"])} session source(s); '
+              f'{len(report["changed_batches"])} batch(es) changed, '
+              f'{report["objects_written"]} object(s) written')
+        for batch_id in report['changed_batches']:
+            print(f'  {batch_id}')
+        return 0
+
+    server = make_server(args.output, args.host, args.port)
+    print(f'Serving {args.output} on http://{args.host}:{server.server_address[1]}/v1/batches')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,12 +6,13 @@ comprehensive game metadata tracking for the bootstrap economic system.
 '''
 
 import json
-import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from src.scores.local_store import LocalLeaderboard, ScoreEntry
+from src.scores.leaderboard_catalog import LeaderboardCatalog, config_hash
+from src.scores.session_archive import SessionArchive
 from src.services.version import get_display_version
 
 
@@ -70,8 +71,7 @@ class GameSession:
     
     def get_config_hash(self) -> str:
         '''Generate hash of game configuration for leaderboard segregation.'''
-        config_string = f'{self.economic_model}_{self.game_version}'
-        return hashlib.md5(config_string.encode()).hexdigest()[:8]
+        return config_hash(self.economic_model, self.game_version)
 
 
 class EnhancedLeaderboardManager:
@@ -97,6 +97,9 @@ class EnhancedLeaderboardManager:
         # Cache of loaded leaderboards by seed+config hash
         self._leaderboard_cache: Dict[str, LocalLeaderboard] = {}
         
+        # Per-board summaries, updated as boards change
+        self.catalog = LeaderboardCatalog(self.base_path)
+        
         # Session tracking
         self.current_session: Optional[GameSession] = None
         self.session_start_time: Optional[datetime] = None
@@ -241,7 +244,8 @@ class EnhancedLeaderboardManager:
             # Create leaderboard
             self._leaderboard_cache[leaderboard_key] = LocalLeaderboard(
                 leaderboard_file=leaderboard_path,
-                max_entries=self.DEFAULT_MAX_ENTRIES
+                max_entries=self.DEFAULT_MAX_ENTRIES,
+                catalog=self.catalog
             )
         
         return self._leaderboard_cache[leaderboard_key]
@@ -262,6 +266,10 @@ class EnhancedLeaderboardManager:
         with open(session_path, 'w', encoding='utf-8') as f:
             json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
     
+    def get_session_archive(self) -> SessionArchive:
+        '''Get the compactable, queryable archive of saved session metadata.'''
+        return SessionArchive(self.base_path / 'sessions')
+    
     def get_leaderboard_for_seed(self, seed: str, economic_model: str = 'Bootstrap_v0.4.1') -> LocalLeaderboard:
         '''Get leaderboard for specific seed and economic model.'''
         # Create temporary session for hash calculation
@@ -281,33 +289,23 @@ class EnhancedLeaderboardManager:
         
         return self._get_leaderboard_for_session(temp_session)
     
-    def get_all_leaderboards(self) -> Dict[str, Dict[str, Any]]:
-        '''Get summary of all existing leaderboards.'''
-        leaderboards = {}
+    def get_all_leaderboards(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        '''
+        Get summary of all existing leaderboards from the catalog.
         
-        for file_path in self.base_path.glob('leaderboard_*.json'):
-            try:
-                # Parse filename to extract seed and config hash
-                filename = file_path.stem
-                parts = filename.replace('leaderboard_', '').split('_')
-                if len(parts) >= 2:
-                    seed = '_'.join(parts[:-1])
-                    config_hash = parts[-1]
-                    
-                    # Load leaderboard
-                    leaderboard = LocalLeaderboard(leaderboard_file=file_path)
-                    
-                    leaderboards[seed] = {
-                        'config_hash': config_hash,
-                        'entry_count': len(leaderboard.entries),
-                        'top_score': leaderboard.entries[0].score if leaderboard.entries else 0,
-                        'file_path': str(file_path)
-                    }
-                    
-            except Exception as e:
-                print(f'Warning: Could not load leaderboard {file_path}: {e}')
+        Without refresh this is a catalog read, plus a rescan only when the
+        directory's mtime shows a board file was added, replaced or removed.
         
-        return leaderboards
+        Args:
+            refresh: Also check every board file for changes made outside this
+                manager, such as journal appends (a stat per board; only
+                changed boards are loaded)
+        '''
+        if refresh:
+            self.catalog.refresh()
+        else:
+            self.catalog.refresh_if_changed()
+        return self.catalog.summaries()
     
     def migrate_legacy_scores(self) -> int:
         '''Migrate scores from legacy local_highscore.json format.'''
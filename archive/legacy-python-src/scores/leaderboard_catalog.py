@@ -0,0 +1,212 @@
+'''
+Leaderboard catalog for PDoom1.
+
+Keeps a single catalog.json beside the seed leaderboards with a summary of
+each board (seed, config hash, entry count, top score) and the size and mtime
+of its snapshot and journal files. Boards record themselves on every change,
+and refresh() only reloads boards whose files changed since they were last
+catalogued, so listing leaderboards no longer loads every board.
+
+Recording is cheap: the catalog file is rewritten at most once per
+SAVE_INTERVAL_S (flush() writes what is pending). An update lost to a crash
+heals itself, because the board's stat no longer matches and the next
+refresh() reloads it. refresh_if_changed() skips even the per-board stats
+while the directory's mtime says no board file was added, replaced or removed.
+'''
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.scores.local_store import LocalLeaderboard
+
+
+def config_hash(economic_model: str, game_version: str) -> str:
+    '''The config hash in a board's filename: which economic model and game version it ranks.'''
+    return hashlib.md5(f'{economic_model}_{game_version}'.encode()).hexdigest()[:8]
+
+
+class LeaderboardCatalog:
+    '''
+    Maintained index of the leaderboard_*.json files in a directory.
+
+    Catalog entries are keyed by board filename and hold:
+    - seed, config_hash: parsed from the filename
+    - entry_count, top_score: board summary
+    - stat: (mtime_ns, size) of the snapshot and of its journal, if any
+    '''
+
+    CURRENT_VERSION = '1.0.0'
+    CATALOG_FILENAME = 'catalog.json'
+    BOARD_PATTERN = 'leaderboard_*.json'
+    SAVE_INTERVAL_S = 5.0
+    RACY_MTIME_NS = 2_000_000_000  # a directory mtime this close to its check is not trusted
+
+    def __init__(self, base_path: Path):
+        '''
+        Initialize the catalog for a leaderboard directory.
+
+        Args:
+            base_path: Directory holding the leaderboard files
+        '''
+        self.base_path = Path(base_path)
+        self.catalog_file = self.base_path / self.CATALOG_FILENAME
+        self.boards: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._last_save = float('-inf')
+        self._dir_mtime: Optional[int] = None  # directory mtime as of the last refresh
+        self._dir_checked_ns = 0
+        self._load()
+
+    def _load(self) -> None:
+        '''Load the catalog file; a missing or unreadable one starts empty.'''
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.CURRENT_VERSION:
+                self.boards = data.get('boards', {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            self.boards = {}
+
+    def save(self) -> None:
+        '''Atomically write the catalog file.'''
+        # Our own write moves the directory mtime; absorb it if nothing else had
+        absorb = self._dir_mtime is not None and self._directory_mtime() == self._dir_mtime
+        catalog_data = {
+            'version': self.CURRENT_VERSION,
+            'updated': datetime.now().isoformat(),
+            'boards': self.boards
+        }
+        temp_file = self.catalog_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(catalog_data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, self.catalog_file)
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if absorb:
+            self._dir_mtime, self._dir_checked_ns = self._directory_mtime(), time.time_ns()
+
+    def flush(self) -> None:
+        '''Write the catalog file if a recorded change is not on disk yet.'''
+        if self._dirty:
+            self.save()
+
+    def _directory_mtime(self) -> Optional[int]:
+        try:
+            return self.base_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def parse_filename(file_path: Path) -> Optional[Dict[str, str]]:
+        '''Split leaderboard_<seed>_<config_hash>.json into seed and config hash.'''
+        parts = file_path.stem.replace('leaderboard_', '', 1).split('_')
+        if len(parts) < 2:
+            return None
+        return {'seed': '_'.join(parts[:-1]), 'config_hash': parts[-1]}
+
+    @staticmethod
+    def _file_stat(file_path: Path) -> Optional[list]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def board_stat(self, file_path: Path) -> Dict[str, Optional[list]]:
+        journal_file = file_path.with_name(file_path.name + '.journal')
+        return {'snapshot': self._file_stat(file_path), 'journal': self._file_stat(journal_file)}
+
+    def record(self, leaderboard: 'LocalLeaderboard', save: bool = True) -> None:
+        '''
+        Update the catalog entry for a board from its in-memory state.
+
+        Args:
+            leaderboard: Board that just changed (or was loaded)
+            save: Write the catalog file, unless it was written in the last
+                SAVE_INTERVAL_S (then the change waits for the next save or flush())
+        '''
+        file_path = Path(leaderboard.leaderboard_file)
+        names = self.parse_filename(file_path)
+        if names is None or file_path.parent.resolve() != self.base_path.resolve():
+            return
+
+        entries = leaderboard.entries
+        self.boards[file_path.name] = {
+            **names,
+            'entry_count': len(entries),
+            'top_score': entries[0].score if entries else 0,
+            'stat': self.board_stat(file_path)
+        }
+        self._dirty = True
+        if save and time.monotonic() - self._last_save >= self.SAVE_INTERVAL_S:
+            self.save()
+
+    def refresh(self) -> bool:
+        '''
+        Bring the catalog up to date with the directory.
+
+        Only boards whose snapshot or journal changed size or mtime since they
+        were catalogued are loaded; boards whose files are gone are dropped.
+
+        Returns:
+            True if the catalog changed (and was saved)
+        '''
+        from src.scores.local_store import LocalLeaderboard
+
+        # Taken before the glob, so a board added during it shows up next time
+        self._dir_mtime, self._dir_checked_ns = self._directory_mtime(), time.time_ns()
+        changed = False
+        seen = set()
+        for file_path in self.base_path.glob(self.BOARD_PATTERN):
+            if self.parse_filename(file_path) is None:
+                continue
+            seen.add(file_path.name)
+
+            cached = self.boards.get(file_path.name)
+            if cached and cached.get('stat') == self.board_stat(file_path):
+                continue
+
+            try:
+                self.record(LocalLeaderboard(leaderboard_file=file_path), save=False)
+                changed = True
+            except Exception as e:
+                print(f'Warning: Could not load leaderboard {file_path}: {e}')
+
+        for name in set(self.boards) - seen:
+            del self.boards[name]
+            changed = True
+
+        if changed or self._dirty:
+            self.save()
+        return changed
+
+    def refresh_if_changed(self) -> bool:
+        '''
+        refresh() only if a board file may have been added, replaced or removed.
+
+        Journal appends by another process do not move the directory mtime;
+        call refresh() to pick those up.
+        '''
+        mtime = self._directory_mtime()
+        if (self._dir_mtime is not None and mtime == self._dir_mtime
+                and self._dir_checked_ns - mtime > self.RACY_MTIME_NS):
+            return False
+        return self.refresh()
+
+    def summaries(self) -> Dict[str, Dict[str, Any]]:
+        '''Board summaries keyed by seed, in the get_all_leaderboards format.'''
+        return {
+            board['seed']: {
+                'config_hash': board['config_hash'],
+                'entry_count': board['entry_count'],
+                'top_score': board['top_score'],
+                'file_path': str(self.base_path / name)
+            }
+            for name, board in sorted(self.boards.items())
+        }
@@ -3,15 +3,26 @@ Local leaderboard storage for PDoom1.
 
 Provides versioned JSON leaderboard with atomic writes and score sorting.
 Maintains top scores locally with optional player names.
+
+Entries are kept in score order with bisect, alongside per-game-mode and
+per-player indexes, so adding a score and ranking are O(log n) searches rather
+than full re-sorts and scans. Saves are journaled: each change appends one
+line to `<file>.journal`, and the snapshot file is only rewritten when the
+journal grows past a threshold (or on clear).
 '''
 
+import bisect
 import json
 import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from src.services.data_paths import get_leaderboard_file
+from src.scores.session_text import parse_session_text
+
+if TYPE_CHECKING:
+    from src.scores.leaderboard_catalog import LeaderboardCatalog
 
 
 class ScoreEntry:
@@ -79,64 +90,187 @@ class ScoreEntry:
         return self.score > other.score
 
 
+class _RankIndex:
+    '''
+    Entries in leaderboard order (highest score first) with parallel sort keys.
+
+    Keys are (-score, seq); seq is the insertion order, so equal scores keep
+    the order they arrived in, as the stable list.sort() used to.
+    '''
+
+    def __init__(self) -> None:
+        self.keys: List[Tuple[Any, int]] = []
+        self.entries: List[ScoreEntry] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def insert(self, key: Tuple[Any, int], entry: ScoreEntry) -> int:
+        '''Insert and return the 0-based position.'''
+        index = bisect.bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.entries.insert(index, entry)
+        return index
+
+    def remove(self, key: Tuple[Any, int]) -> None:
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.entries[index]
+
+    def count_above(self, score: Any) -> int:
+        '''Number of entries with a strictly higher score.'''
+        return bisect.bisect_left(self.keys, (-score,))
+
+
 class LocalLeaderboard:
     '''
     Local leaderboard with persistent JSON storage.
     
     Features:
     - Versioned JSON schema for forward compatibility
-    - Atomic writes to prevent corruption
+    - Atomic snapshot writes plus an append-only journal of changes
     - Configurable maximum number of entries
-    - Score sorting and ranking
-    - Game mode filtering
+    - Score sorting and ranking via bisect
+    - Game mode and player indexes
     '''
     
     CURRENT_VERSION = '1.0.0'
     DEFAULT_MAX_ENTRIES = 100
     
+    # Rewrite the snapshot once the journal holds this many changes, or as many
+    # as the board has entries if that is more (keeps compaction amortized O(1))
+    JOURNAL_COMPACT_THRESHOLD = 500
+    
     def __init__(self, 
                  leaderboard_file: Optional[Path] = None,
-                 max_entries: int = DEFAULT_MAX_ENTRIES):
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 catalog: Optional['LeaderboardCatalog'] = None):
         '''
         Initialize local leaderboard.
         
         Args:
             leaderboard_file: Custom path to leaderboard file
             max_entries: Maximum number of entries to keep
+            catalog: Catalog to keep informed of every change to this board
         '''
         self.leaderboard_file = leaderboard_file or get_leaderboard_file()
+        self.catalog = catalog
+        self.journal_file = self.leaderboard_file.with_name(self.leaderboard_file.name + '.journal')
         self.max_entries = max_entries
-        self.entries: List[ScoreEntry] = []
+        self._reset_indexes()
+        self._journal_length = 0
         
         self._load_leaderboard()
     
+    @property
+    def entries(self) -> List[ScoreEntry]:
+        '''All entries, highest score first.'''
+        return self._all.entries
+    
+    @entries.setter
+    def entries(self, entries: List[ScoreEntry]) -> None:
+        self._reset_indexes()
+        for entry in sorted(entries):
+            self._index(entry)
+    
+    def _reset_indexes(self) -> None:
+        self._all = _RankIndex()
+        self._by_mode: Dict[str, _RankIndex] = {}
+        self._by_player: Dict[str, _RankIndex] = {}
+        self._keys_by_uuid: Dict[str, Tuple[Any, int]] = {}
+        self._score_total = 0
+        self._seq = 0
+    
+    def _index(self, entry: ScoreEntry) -> int:
+        '''Add an entry to every index; returns its 0-based overall position.'''
+        key = (-entry.score, self._seq)
+        self._seq += 1
+        self._keys_by_uuid[entry.entry_uuid] = key
+        self._by_mode.setdefault(entry.game_mode, _RankIndex()).insert(key, entry)
+        self._by_player.setdefault(entry.player_name, _RankIndex()).insert(key, entry)
+        self._score_total += entry.score
+        return self._all.insert(key, entry)
+    
+    def _unindex(self, entry: ScoreEntry) -> None:
+        key = self._keys_by_uuid.pop(entry.entry_uuid)
+        self._all.remove(key)
+        for indexes, name in ((self._by_mode, entry.game_mode), (self._by_player, entry.player_name)):
+            index = indexes[name]
+            index.remove(key)
+            if not index:
+                del indexes[name]
+        self._score_total -= entry.score
+    
+    def _filtered(self, game_mode: Optional[str]) -> _RankIndex:
+        if game_mode:
+            return self._by_mode.get(game_mode) or _RankIndex()
+        return self._all
+    
     def _load_leaderboard(self) -> None:
-        '''Load leaderboard from file or create empty one.'''
+        '''Load leaderboard from file or create empty one, then replay the journal.'''
         if not self.leaderboard_file.exists():
             self._create_empty_leaderboard()
             return
         
         try:
+            # Older builds saved boards as single-quoted pseudo-JSON; read those too
+            # rather than replacing them with an empty board
             with open(self.leaderboard_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_session_text(f.read())
+            if data is None:
+                raise ValueError('not a JSON object')
             
             # Validate version
             version = data.get('version', '0.0.0')
             if version != self.CURRENT_VERSION:
                 data = self._migrate_leaderboard(data)
             
-            # Load entries
+            # Load entries, sorted by score (highest first)
             self.entries = [
                 ScoreEntry.from_dict(entry_data)
                 for entry_data in data.get('entries', [])
             ]
             
-            # Sort by score (highest first)
-            self.entries.sort()
-            
         except (json.JSONDecodeError, KeyError, ValueError, IOError) as e:
             print(f'Warning: Invalid leaderboard file, creating new one. Error: {e}')
             self._create_empty_leaderboard()
+            return
+        
+        self._replay_journal()
+        if self._journal_length >= self._compact_threshold():
+            self._save_leaderboard()
+    
+    def _replay_journal(self) -> None:
+        '''Apply journaled changes made since the last snapshot.'''
+        if not self.journal_file.exists():
+            return
+        
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if record['op'] == 'add':
+                        self._apply_add(ScoreEntry.from_dict(record['entry']))
+                    elif record['op'] == 'remove':
+                        self._apply_remove(record['entry_uuid'])
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                    # A torn last line from an interrupted write; the snapshot still holds
+                    continue
+                self._journal_length += 1
+    
+    def _compact_threshold(self) -> int:
+        return max(self.JOURNAL_COMPACT_THRESHOLD, len(self.entries))
+    
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        '''Record one change; compacts into the snapshot once the journal is long.'''
+        if self._journal_length + 1 >= self._compact_threshold():
+            self._save_leaderboard()
+            return
+        
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._journal_length += 1
     
     def _create_empty_leaderboard(self) -> None:
         '''Create an empty leaderboard.'''
@@ -150,7 +284,7 @@ class LocalLeaderboard:
         return data
     
     def _save_leaderboard(self) -> None:
-        '''Atomically save leaderboard to file.'''
+        '''Atomically save a full snapshot and drop the journal it now covers.'''
         leaderboard_data = {
             'version': self.CURRENT_VERSION,
             'created': datetime.now().isoformat(),
@@ -163,21 +297,57 @@ class LocalLeaderboard:
         
         try:
             with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(leaderboard_data, f, indent=2, ensure_ascii=False)
+                json.dump(leaderboard_data, f, ensure_ascii=False, separators=(',', ':'))
             
-            # Atomic move (platform-specific)
-            if os.name == 'nt':  # Windows
-                if self.leaderboard_file.exists():
-                    os.remove(self.leaderboard_file)
-                os.rename(temp_file, self.leaderboard_file)
-            else:  # Unix-like systems
-                os.rename(temp_file, self.leaderboard_file)
+            # Atomic move (os.replace overwrites on Windows too)
+            os.replace(temp_file, self.leaderboard_file)
                 
         except Exception as e:
             # Clean up temp file on error
             if temp_file.exists():
                 os.remove(temp_file)
             raise e
+        
+        if self.journal_file.exists():
+            os.remove(self.journal_file)
+        self._journal_length = 0
+    
+    def _notify_catalog(self) -> None:
+        if self.catalog is not None:
+            self.catalog.record(self)
+    
+    def compact(self) -> None:
+        '''Fold the journal into the snapshot file now.'''
+        self._save_leaderboard()
+    
+    def _apply_add(self, score_entry: ScoreEntry) -> Tuple[bool, int]:
+        '''
+        Index an entry and enforce max_entries.
+        
+        Returns (added, rank): rank is 1-based, 0 if the entry was dropped. An
+        entry whose uuid is already on the board (a retried submission, or a
+        journal replay after a snapshot) is not added again; its existing rank
+        is returned with added=False.
+        '''
+        key = self._keys_by_uuid.get(score_entry.entry_uuid)
+        if key is not None:
+            return False, bisect.bisect_left(self._all.keys, key) + 1
+        
+        rank = self._index(score_entry) + 1
+        
+        # Limit to max entries
+        while len(self.entries) > self.max_entries:
+            self._unindex(self.entries[-1])
+        
+        return rank <= self.max_entries, rank if rank <= self.max_entries else 0
+    
+    def _apply_remove(self, entry_uuid: str) -> bool:
+        key = self._keys_by_uuid.get(entry_uuid)
+        if key is None:
+            return False
+        index = bisect.bisect_left(self._all.keys, key)
+        self._unindex(self._all.entries[index])
+        return True
     
     def add_score(self, score_entry: ScoreEntry) -> Tuple[bool, int]:
         '''
@@ -187,31 +357,15 @@ class LocalLeaderboard:
             score_entry: ScoreEntry to add
             
         Returns:
-            Tuple of (was_added, rank) where rank is 1-based (0 if not added)
+            Tuple of (was_added, rank) where rank is 1-based (0 if not added).
+            An entry already on the board returns (False, its current rank).
         '''
-        # Add the entry
-        self.entries.append(score_entry)
+        added, rank = self._apply_add(score_entry)
+        if not added:
+            return False, rank
         
-        # Sort by score (highest first)
-        self.entries.sort()
-        
-        # Find the rank (1-based)
-        try:
-            rank = self.entries.index(score_entry) + 1
-        except ValueError:
-            rank = 0
-        
-        # Limit to max entries
-        if len(self.entries) > self.max_entries:
-            removed_entries = self.entries[self.max_entries:]
-            self.entries = self.entries[:self.max_entries]
-            
-            # Check if the new entry was removed
-            if score_entry in removed_entries:
-                return False, 0
-        
-        # Save to file
-        self._save_leaderboard()
+        self._append_journal({'op': 'add', 'entry': score_entry.to_dict()})
+        self._notify_catalog()
         
         return True, rank
     
@@ -226,15 +380,7 @@ class LocalLeaderboard:
         Returns:
             List of top ScoreEntry objects
         '''
-        filtered_entries = self.entries
-        
-        if game_mode:
-            filtered_entries = [
-                entry for entry in self.entries 
-                if entry.game_mode == game_mode
-            ]
-        
-        return filtered_entries[:count]
+        return self._filtered(game_mode).entries[:count]
     
     def get_rank(self, score: int, game_mode: Optional[str] = None) -> int:
         '''
@@ -247,19 +393,10 @@ class LocalLeaderboard:
         Returns:
             Rank (1-based, 0 if wouldn't make the leaderboard)
         '''
-        filtered_entries = self.entries
-        
-        if game_mode:
-            filtered_entries = [
-                entry for entry in self.entries 
-                if entry.game_mode == game_mode
-            ]
+        filtered_entries = self._filtered(game_mode)
         
-        # Count how many scores are higher
-        higher_scores = sum(1 for entry in filtered_entries if entry.score > score)
-        
-        # Rank is position + 1 (if it would make the leaderboard)
-        rank = higher_scores + 1
+        # Rank is the number of higher scores + 1
+        rank = filtered_entries.count_above(score) + 1
         
         # Check if it would make the leaderboard
         if len(filtered_entries) >= self.max_entries and rank > self.max_entries:
@@ -291,18 +428,14 @@ class LocalLeaderboard:
         Returns:
             Best ScoreEntry for the player, or None if not found
         '''
-        player_entries = [
-            entry for entry in self.entries 
-            if entry.player_name == player_name
-        ]
+        player_entries = self._by_player.get(player_name)
+        if not player_entries:
+            return None
         
         if game_mode:
-            player_entries = [
-                entry for entry in player_entries 
-                if entry.game_mode == game_mode
-            ]
+            return next((entry for entry in player_entries.entries if entry.game_mode == game_mode), None)
         
-        return player_entries[0] if player_entries else None
+        return player_entries.entries[0]
     
     def get_statistics(self) -> Dict[str, Any]:
         '''Get leaderboard statistics.'''
@@ -315,17 +448,13 @@ class LocalLeaderboard:
                 'game_modes': []
             }
         
-        scores = [entry.score for entry in self.entries]
-        players = {entry.player_name for entry in self.entries}
-        game_modes = {entry.game_mode for entry in self.entries}
-        
         return {
             'total_entries': len(self.entries),
-            'highest_score': max(scores),
-            'lowest_score': min(scores),
-            'average_score': sum(scores) / len(scores),
-            'unique_players': len(players),
-            'game_modes': sorted(list(game_modes))
+            'highest_score': self.entries[0].score,
+            'lowest_score': self.entries[-1].score,
+            'average_score': self._score_total / len(self.entries),
+            'unique_players': len(self._by_player),
+            'game_modes': sorted(self._by_mode)
         }
     
     def clear_leaderboard(self) -> int:
@@ -338,6 +467,7 @@ class LocalLeaderboard:
         count = len(self.entries)
         self.entries = []
         self._save_leaderboard()
+        self._notify_catalog()
         return count
     
     def remove_entry(self, entry_uuid: str) -> bool:
@@ -350,9 +480,8 @@ class LocalLeaderboard:
         Returns:
             True if entry was found and removed
         '''
-        for i, entry in enumerate(self.entries):
-            if entry.entry_uuid == entry_uuid:
-                del self.entries[i]
-                self._save_leaderboard()
-                return True
-        return False
\ No newline at end of file
+        if not self._apply_remove(entry_uuid):
+            return False
+        self._append_journal({'op': 'remove', 'entry_uuid': entry_uuid})
+        self._notify_catalog()
+        return True
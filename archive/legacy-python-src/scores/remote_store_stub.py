@@ -101,7 +101,7 @@ class RemoteLeaderboard:
         Returns:
             Mock response with no rank found
         '''
-        print(f'STUB: Would fetch rank for player '{player_name}' (mode={game_mode})')
+        print(f"STUB: Would fetch rank for player '{player_name}' (mode={game_mode})")
         
         return {
             'success': False,
@@ -0,0 +1,416 @@
+'''
+Session Archive - Compacted, Queryable Game Session Metadata
+
+EnhancedLeaderboardManager writes one small JSON file per finished game into
+leaderboards/sessions/. This module folds those files into columnar segments,
+one per (seed, game_version, economic_model) partition, and answers filter /
+group-by / percentile queries over them without opening every session file.
+
+Layout under leaderboards/sessions/segments/:
+- manifest.json: every segment's partition, row count and per-column
+  min/max, so queries skip segments before reading them
+- <partition>.json: {'partition': {...}, 'rows': n,
+  'columns': {column: [values...]}}
+
+Compaction is crash-safe: the manifest is the commit point. Segments are
+written first, but only the manifest's row count of each segment is ever
+read, so rows appended by a run that died before updating the manifest are
+dropped and re-appended from their still-pending session files. The manifest
+then lists the session files it absorbed until they are deleted, so an
+interrupted run finishes the deletes next time instead of counting the same
+sessions twice. Session files that cannot be parsed are left in place.
+
+Older builds wrote session files as single-quoted pseudo-JSON (Python dict
+literals); read_session_file() from session_text accepts both.
+'''
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.scores.session_text import read_session_file
+
+
+PARTITION_COLUMNS = ('seed', 'game_version', 'economic_model')
+SESSION_PATTERN = 'session_*.json'
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a is not None and a < b,
+    '<=': lambda a, b: a is not None and a <= b,
+    '>': lambda a, b: a is not None and a > b,
+    '>=': lambda a, b: a is not None and a >= b,
+    'in': lambda a, b: a in b,
+    'between': lambda a, b: a is not None and b[0] <= a < b[1],
+}
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    '''Percentile (0-100) of pre-sorted values with linear interpolation.'''
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _normalize_where(where: Optional[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+    '''Turn {column: value | (op, value)} into (column, op, value) predicates.'''
+    predicates = []
+    for column, condition in (where or {}).items():
+        if isinstance(condition, tuple) and len(condition) == 2 and condition[0] in _OPERATORS:
+            op, value = condition
+        else:
+            op, value = '==', condition
+        predicates.append((column, op, value))
+    return predicates
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _column_stats(values: List[Any]) -> Optional[List[Any]]:
+    '''[min, max] of a column when all its values are numbers or all strings.'''
+    present = [v for v in values if v is not None]
+    if not present:
+        return None
+    if all(_is_number(v) for v in present) or all(isinstance(v, str) for v in present):
+        return [min(present), max(present)]
+    return None
+
+
+def _may_match(stats: Optional[List[Any]], op: str, value: Any) -> bool:
+    '''Whether a segment with column range stats can hold a row matching the predicate.'''
+    if stats is None:
+        return True
+    low, high = stats
+    try:
+        if op == '==':
+            return low <= value <= high
+        if op == '<':
+            return low < value
+        if op == '<=':
+            return low <= value
+        if op == '>':
+            return high > value
+        if op == '>=':
+            return high >= value
+        if op == 'in':
+            return any(low <= v <= high for v in value)
+        if op == 'between':
+            return low < value[1] and high >= value[0]
+    except TypeError:
+        return True
+    return True
+
+
+class SessionArchive:
+    '''
+    Columnar archive of the session metadata in one leaderboards/sessions directory.
+
+    Queries read compacted segments, pruned by partition and column stats,
+    plus any session files not yet compacted.
+    '''
+
+    CURRENT_VERSION = '1.0.0'
+    SEGMENT_DIR = 'segments'
+    MANIFEST_FILENAME = 'manifest.json'
+
+    def __init__(self, sessions_dir: Path):
+        '''
+        Initialize the archive for a sessions directory.
+
+        Args:
+            sessions_dir: Directory holding session_*.json files
+        '''
+        self.sessions_dir = Path(sessions_dir)
+        self.segment_dir = self.sessions_dir / self.SEGMENT_DIR
+        self.manifest_file = self.segment_dir / self.MANIFEST_FILENAME
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        '''Load the manifest; a missing or unreadable one means no segments yet.'''
+        empty = {'version': self.CURRENT_VERSION, 'segments': {}, 'pending_deletes': []}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return empty
+        if data.get('version') != self.CURRENT_VERSION:
+            return empty
+        return data
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        '''Atomically replace a JSON file.'''
+        temp_file = path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, path)
+
+    @staticmethod
+    def partition_of(record: Dict[str, Any]) -> Tuple[str, ...]:
+        '''The (seed, game_version, economic_model) partition of a session record.'''
+        return tuple(str(record.get(column, '')) for column in PARTITION_COLUMNS)
+
+    @staticmethod
+    def segment_name(partition: Tuple[str, ...]) -> str:
+        '''Filesystem-safe segment filename for a partition (hash-suffixed, so unique).'''
+        safe = [''.join(c if c.isalnum() or c in '.-' else '_' for c in part)[:50] or '_'
+                for part in partition]
+        digest = hashlib.sha256('\0'.join(partition).encode('utf-8')).hexdigest()[:8]
+        return '__'.join(safe) + f'__{digest}.json'
+
+    def pending_files(self) -> List[Path]:
+        '''Session files not yet folded into a segment.'''
+        absorbed = set(self.manifest['pending_deletes'])
+        return sorted(p for p in self.sessions_dir.glob(SESSION_PATTERN) if p.name not in absorbed)
+
+    def _read_segment(self, name: str) -> Dict[str, Any]:
+        with open(self.segment_dir / name, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _finish_deletes(self) -> None:
+        '''Delete session files already absorbed into segments, then clear the list.'''
+        if not self.manifest['pending_deletes']:
+            return
+        for name in self.manifest['pending_deletes']:
+            try:
+                (self.sessions_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+        self.manifest['pending_deletes'] = []
+        self._write_json(self.manifest_file, self.manifest)
+
+    def compact(self) -> Dict[str, Any]:
+        '''
+        Fold pending session files into their partition segments.
+
+        Returns:
+            Report with counts of compacted and unreadable files and the
+            partitions rewritten
+        '''
+        self._finish_deletes()
+
+        new_rows: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        absorbed: List[str] = []
+        unreadable: List[str] = []
+        for path in self.pending_files():
+            record = read_session_file(path)
+            if record is None:
+                unreadable.append(path.name)
+                continue
+            new_rows.setdefault(self.partition_of(record), []).append(record)
+            absorbed.append(path.name)
+
+        if absorbed:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+        for partition, records in new_rows.items():
+            name = self.segment_name(partition)
+            if name in self.manifest['segments']:
+                segment = self._read_segment(name)
+                columns = list(segment['columns'])
+                rows = [dict(zip(columns, values)) for values in zip(*segment['columns'].values())]
+                # Rows past the manifest's count were appended by a run that
+                # crashed before committing; their session files are still pending
+                rows = rows[:self.manifest['segments'][name]['rows']]
+            else:
+                rows = []
+            rows.extend(records)
+            self._write_segment(name, partition, rows)
+
+        if absorbed:
+            self.manifest['pending_deletes'] = absorbed
+            self._write_json(self.manifest_file, self.manifest)
+            self._finish_deletes()
+
+        return {
+            'compacted': len(absorbed),
+            'unreadable': unreadable,
+            'partitions': sorted(self.segment_name(p) for p in new_rows)
+        }
+
+    def _write_segment(self, name: str, partition: Tuple[str, ...],
+                       rows: List[Dict[str, Any]]) -> None:
+        '''Write a partition's rows as columns and update its manifest entry.'''
+        column_names: List[str] = []
+        for row in rows:
+            column_names.extend(c for c in row if c not in column_names)
+        columns = {c: [row.get(c) for row in rows] for c in column_names}
+
+        self._write_json(self.segment_dir / name, {
+            'partition': dict(zip(PARTITION_COLUMNS, partition)),
+            'rows': len(rows),
+            'columns': columns
+        })
+        self.manifest['segments'][name] = {
+            'partition': dict(zip(PARTITION_COLUMNS, partition)),
+            'rows': len(rows),
+            'stats': {c: s for c, s in ((c, _column_stats(v)) for c, v in columns.items()) if s}
+        }
+
+    def _candidate_segments(self, predicates: List[Tuple[str, str, Any]]) -> List[str]:
+        '''Segments whose partition values and column ranges can satisfy every predicate.'''
+        names = []
+        for name, info in sorted(self.manifest['segments'].items()):
+            keep = True
+            for column, op, value in predicates:
+                if column in info['partition']:
+                    keep = _OPERATORS[op](info['partition'][column], value)
+                else:
+                    keep = _may_match(info['stats'].get(column), op, value)
+                if not keep:
+                    break
+            if keep:
+                names.append(name)
+        return names
+
+    def select(self, where: Optional[Dict[str, Any]] = None,
+               columns: Optional[Iterable[str]] = None,
+               include_pending: bool = True) -> Iterator[Dict[str, Any]]:
+        '''
+        Yield session rows matching every filter.
+
+        Args:
+            where: {column: value} for equality or {column: (op, value)} with
+                op one of ==, !=, <, <=, >, >=, in, or between (value is a
+                [low, high) pair)
+            columns: Columns to return (default: all)
+            include_pending: Also scan session files not yet compacted
+        '''
+        predicates = _normalize_where(where)
+        for column, op, value in predicates:
+            if op not in _OPERATORS:
+                raise ValueError(f'Unsupported operator {op!r} for column {column!r}')
+        wanted = list(columns) if columns is not None else None
+
+        for name in self._candidate_segments(predicates):
+            segment_columns = self._read_segment(name)['columns']
+            row_count = self.manifest['segments'][name]['rows']
+
+            # Evaluate filters column by column, narrowing the surviving rows
+            indices = range(row_count)
+            for column, op, value in predicates:
+                values = segment_columns.get(column, [None] * row_count)
+                indices = [i for i in indices if _OPERATORS[op](values[i], value)]
+                if not indices:
+                    break
+
+            output = wanted if wanted is not None else list(segment_columns)
+            for i in indices:
+                yield {c: segment_columns[c][i] if c in segment_columns else None for c in output}
+
+        if include_pending:
+            for path in self.pending_files():
+                record = read_session_file(path)
+                if record is None:
+                    continue
+                if all(_OPERATORS[op](record.get(column), value) for column, op, value in predicates):
+                    yield {c: record.get(c) for c in wanted} if wanted is not None else record
+
+    def query(self, where: Optional[Dict[str, Any]] = None,
+              group_by: Sequence[str] = (),
+              metrics: Sequence[str] = ('final_score',),
+              percentiles: Sequence[float] = (50, 90),
+              include_pending: bool = True) -> List[Dict[str, Any]]:
+        '''
+        Aggregate numeric metrics over matching sessions.
+
+        Example:
+            archive.query(where={'seed': '202540', 'game_version': 'v0.4.1'},
+                          group_by=['economic_model'], metrics=['final_doom'])
+
+        Returns:
+            One row per group with the group_by values, 'count', and for
+            each metric <metric>_mean, _min, _max and _p<N> per percentile
+        '''
+        groups: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+        for row in self.select(where, list(group_by) + list(metrics), include_pending):
+            groups.setdefault(tuple(row[c] for c in group_by), []).append(row)
+
+        results = []
+        for key in sorted(groups, key=lambda k: tuple(str(v) for v in k)):
+            rows = groups[key]
+            result: Dict[str, Any] = dict(zip(group_by, key))
+            result['count'] = len(rows)
+            for metric in metrics:
+                values = sorted(row[metric] for row in rows if _is_number(row[metric]))
+                result[f'{metric}_mean'] = sum(values) / len(values) if values else None
+                result[f'{metric}_min'] = values[0] if values else None
+                result[f'{metric}_max'] = values[-1] if values else None
+                for pct in percentiles:
+                    result[f'{metric}_p{pct:g}'] = percentile(values, pct)
+            results.append(result)
+        return results
+
+
+def _parse_where(items: List[str]) -> Dict[str, Any]:
+    '''
+    Parse CLI filters like seed=202540 or final_doom>=50.
+
+    Equality filters with numeric-looking values match either the string or
+    the number, since the CLI cannot tell seed '202540' from score 11.
+    '''
+    where: Dict[str, Any] = {}
+    for item in items:
+        for op in ('>=', '<=', '!=', '==', '>', '<', '='):
+            column, found, raw = item.partition(op)
+            if found:
+                break
+        else:
+            raise ValueError(f'Cannot parse filter {item!r}')
+        op = '==' if op == '=' else op
+        try:
+            number: Any = int(raw)
+        except ValueError:
+            try:
+                number = float(raw)
+            except ValueError:
+                number = None
+        if op == '==' and number is not None:
+            where[column.strip()] = ('in', [raw, number])
+        else:
+            where[column.strip()] = (op, raw if number is None else number)
+    return where
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    '''Command-line entry point: compact or query a sessions directory.'''
+    parser = argparse.ArgumentParser(description='Compact and query leaderboard session metadata')
+    parser.add_argument('--sessions-dir', type=Path, default=Path('leaderboards') / 'sessions')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('compact', help='Fold session files into partition segments')
+    query_parser = subparsers.add_parser('query', help='Aggregate sessions')
+    query_parser.add_argument('--where', action='append', default=[],
+                              help='Filter such as seed=202540 or final_doom>=50 (repeatable)')
+    query_parser.add_argument('--group-by', action='append', default=[])
+    query_parser.add_argument('--metric', action='append', default=[])
+    query_parser.add_argument('--percentile', type=float, action='append', default=[])
+    args = parser.parse_args(argv)
+
+    archive = SessionArchive(args.sessions_dir)
+    if args.command == 'compact':
+        report = archive.compact()
+        print(f'Compacted {report["compacted"]} session file(s) into '
+              f'{len(report["partitions"])} partition(s)')
+        for name in report['unreadable']:
+            print(f'Warning: could not parse {name}; left in place')
+        return 0
+
+    results = archive.query(_parse_where(args.where), args.group_by,
+                            args.metric or ['final_score'], args.percentile or [50, 90])
+    for row in results:
+        print(json.dumps(row, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
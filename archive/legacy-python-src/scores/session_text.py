@@ -0,0 +1,57 @@
+'''
+Tolerant reader for session records and leaderboard files.
+
+Older builds saved both as single-quoted pseudo-JSON (Python dict literals,
+sometimes with JSON true/false/null mixed in). The leaderboard store and the
+session archive both read such files, so the parser lives here rather than in
+either of them.
+'''
+
+import ast
+import io
+import json
+import tokenize
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+_JSON_LITERALS = {'true': 'True', 'false': 'False', 'null': 'None'}
+
+
+def _pythonize_literals(text: str) -> str:
+    '''Rewrite bare true/false/null tokens (never inside strings) as Python literals.'''
+    tokens = []
+    for token in tokenize.generate_tokens(io.StringIO(text).readline):
+        if token.type == tokenize.NAME and token.string in _JSON_LITERALS:
+            token = token._replace(string=_JSON_LITERALS[token.string])
+        tokens.append(token)
+    return tokenize.untokenize(tokens)
+
+
+def parse_session_text(text: str) -> Optional[Dict[str, Any]]:
+    '''
+    Parse a session record (or leaderboard file) written as JSON or as legacy
+    single-quoted pseudo-JSON.
+
+    Returns:
+        The record dict, or None if the text is neither
+    '''
+    try:
+        data = json.loads(text)
+    except ValueError:
+        try:
+            data = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            try:
+                data = ast.literal_eval(_pythonize_literals(text))
+            except (ValueError, SyntaxError, tokenize.TokenError):
+                return None
+    return data if isinstance(data, dict) else None
+
+
+def read_session_file(path: Path) -> Optional[Dict[str, Any]]:
+    '''Read one session file with parse_session_text(); None if unreadable.'''
+    try:
+        return parse_session_text(Path(path).read_text(encoding='utf-8'))
+    except (OSError, UnicodeDecodeError):
+        return None
@@ -0,0 +1,228 @@
+'''
+Columnar Run Log - Streaming, Append-Only Game Run Storage
+
+Writes game run records as one columnar record batch per turn into an
+append-only JSON-lines file, instead of accumulating every row in memory and
+dumping a single nested JSON blob at the end of the session.
+
+File layout (one JSON object per line):
+- Batch lines: {'batch': n, 'turn': t, 'rows': {table: count},
+  'columns': {table: {column: [values...]}}}
+- Trailer line (written on close): {'trailer': {'batches': n, 'rows': {...},
+  'checksum': '...'}}
+
+Key Design Principles:
+- Bounded memory: only the rows of the current turn are buffered
+- Incremental integrity: a running SHA-256 over the exact bytes written, so
+  the session checksum never needs a full re-serialization (and reading it
+  mid-turn never forces the turn's batch out early)
+- Sealed on close: once the trailer is written the file is never appended
+  to again, by this writer or a new one
+- Cheap analytics: readers pull whole columns per table without walking
+  nested per-row dicts
+'''
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+
+CHECKSUM_LENGTH = 16
+
+
+def _encode(obj: Dict[str, Any]) -> bytes:
+    '''Canonical single-line encoding shared by writer and verifier.'''
+    line = json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str)
+    return (line + '\n').encode('utf-8')
+
+
+class ColumnarRunWriter:
+    '''
+    Streaming columnar writer with a running checksum.
+
+    Rows are buffered per table until the turn changes (or flush() is
+    called), then written as a single record batch. With path=None the
+    writer only maintains counters and the checksum, which keeps the
+    integrity hash available when file export is disabled.
+    '''
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        '''Initialize writer; the file is opened lazily on the first batch.'''
+        self.path = Path(path) if path is not None else None
+        self._file = None
+        self._hash = hashlib.sha256()
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_turn: Optional[int] = None
+        self.batch_count = 0
+        self.row_counts: Dict[str, int] = {}
+        self.closed = False
+
+    def append(self, table: str, row: Dict[str, Any], turn: Optional[int] = None) -> None:
+        '''
+        Buffer a row for a table.
+
+        A row for a different turn than the pending batch flushes that batch
+        first, so each turn lands in exactly one record batch.
+        '''
+        if self.closed:
+            raise ValueError('Cannot append to a closed run log')
+        if turn is None:
+            turn = row.get('turn', self._pending_turn)
+        if self._pending and turn != self._pending_turn:
+            self.flush()
+        self._pending_turn = turn
+        self._pending.setdefault(table, []).append(row)
+        self.row_counts[table] = self.row_counts.get(table, 0) + 1
+
+    @property
+    def pending_turn(self) -> Optional[int]:
+        '''Turn of the buffered batch, or None when nothing is pending.'''
+        return self._pending_turn if self._pending else None
+
+    def _pending_line(self) -> bytes:
+        '''Encoded record batch for the pending rows, exactly as flush() writes it.'''
+        columns = {}
+        rows = {}
+        for table, table_rows in self._pending.items():
+            names: List[str] = []
+            seen = set()
+            for row in table_rows:
+                for name in row:
+                    if name not in seen:
+                        seen.add(name)
+                        names.append(name)
+            columns[table] = {name: [row.get(name) for row in table_rows] for name in names}
+            rows[table] = len(table_rows)
+
+        return _encode({
+            'batch': self.batch_count,
+            'turn': self._pending_turn,
+            'rows': rows,
+            'columns': columns
+        })
+
+    def _open(self) -> None:
+        '''Open the file for appending; a log that already has a trailer is sealed.'''
+        if self.path.exists() and read_trailer(self.path) is not None:
+            raise ValueError(f'Run log {self.path} is already closed')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+
+    def flush(self) -> None:
+        '''Write the pending rows as one record batch.'''
+        if not self._pending:
+            return
+
+        line = self._pending_line()
+        if self.path is not None:
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            self._file.flush()
+        self._hash.update(line)
+
+        self.batch_count += 1
+        self._pending = {}
+
+    @property
+    def checksum(self) -> str:
+        '''
+        Running checksum over every row appended so far.
+
+        The pending turn is hashed as the batch flush() will write, on a copy
+        of the running hash, so reading the checksum mid-turn does not split
+        the turn across two batches.
+        '''
+        if not self._pending:
+            return self._hash.hexdigest()[:CHECKSUM_LENGTH]
+        digest = self._hash.copy()
+        digest.update(self._pending_line())
+        return digest.hexdigest()[:CHECKSUM_LENGTH]
+
+    def close(self) -> str:
+        '''Flush, write the trailer and close the file. Returns the checksum.'''
+        if self.closed:
+            return self.checksum
+
+        self.flush()
+        if self.path is not None and self.batch_count:
+            if self._file is None:
+                self._open()
+            self._file.write(_encode({'trailer': {
+                'batches': self.batch_count,
+                'rows': self.row_counts,
+                'checksum': self.checksum
+            }}))
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.closed = True
+        return self.checksum
+
+
+def iter_batches(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    '''Yield record batches from a run log, skipping the trailer.'''
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'trailer' in record:
+                continue
+            yield record
+
+
+def read_trailer(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    '''Return the trailer of a closed run log, or None if the run never closed.'''
+    trailer = None
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b'{"trailer"'):
+                trailer = json.loads(line)['trailer']
+    return trailer
+
+
+def read_table(path: Union[str, Path], table: str,
+               columns: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+    '''
+    Concatenate one table's columns across all batches of a run log.
+
+    Columns absent from a batch are padded with None so every returned
+    column has the same length.
+    '''
+    result: Dict[str, List[Any]] = {}
+    total = 0
+    for batch in iter_batches(path):
+        block = batch['columns'].get(table)
+        if not block:
+            continue
+        count = batch['rows'][table]
+        names = columns if columns is not None else list(block)
+        for name in names:
+            if name not in result:
+                result[name] = [None] * total
+            result[name].extend(block.get(name, [None] * count))
+        for name in result:
+            if name not in names:
+                result[name].extend([None] * count)
+        total += count
+    if columns is not None:
+        for name in columns:
+            result.setdefault(name, [])
+    return result
+
+
+def verify_run_log(path: Union[str, Path]) -> bool:
+    '''Recompute the running checksum of a closed run log and compare.'''
+    digest = hashlib.sha256()
+    trailer = None
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b'{"trailer"'):
+                trailer = json.loads(line)['trailer']
+            elif line.strip():
+                digest.update(line)
+    if trailer is None:
+        return False
+    return digest.hexdigest()[:CHECKSUM_LENGTH] == trailer['checksum']
@@ -10,10 +10,22 @@ This module provides a centralized error tracking system that handles:
 This refactors the duplicate error tracking logic from OverlayManager and GameState.
 '''
 
-import pygame
+import sys
+import time
 from typing import List, Tuple, Optional
 
 
+_START_TIME = time.monotonic()
+
+
+def _get_ticks() -> int:
+    '''pygame.time.get_ticks() when pygame is loaded, else ms since import (headless).'''
+    pygame = sys.modules.get('pygame')
+    if pygame is not None:
+        return pygame.time.get_ticks()
+    return int((time.monotonic() - _START_TIME) * 1000)
+
+
 class ErrorTracker:
     '''
     Centralized error tracking system for easter egg detection and feedback.
@@ -54,7 +66,7 @@ class ErrorTracker:
         Returns:
             bool: True if this triggered the easter egg (beep was played)
         '''
-        current_time_ms = pygame.time.get_ticks()
+        current_time_ms = _get_ticks()
         
         if timestamp is None:
             timestamp = current_time_ms // (1000 // 30)  # Convert to frame count
@@ -10,6 +10,9 @@ Key Design Principles:
 - Local-first: Data stored locally, cloud submission optional
 - Anonymized: No personally identifiable information
 - Performance: Minimal impact on game performance
+- Streaming: Actions and resource changes go to a columnar run log
+  (one record batch per turn), so memory stays bounded in long sessions;
+  rows logged after finalize_session() are dropped
 
 Architecture Goals:
 - Reduce GameState monolith by extracting logging concerns
@@ -25,6 +28,8 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
+from src.services.columnar_log import ColumnarRunWriter
+
 
 class SimplePrivacyManager:
     '''Simple privacy manager for UI compatibility.'''
@@ -96,23 +101,15 @@ class GameRunLogger:
         # Simple privacy manager simulation for UI compatibility
         self.privacy_manager = SimplePrivacyManager()
         
-        # Modular data storage - each aspect separated for clarity
-        self.run_data = {
-            'session_info': {
-                'session_id': self.session_id,
-                'start_time': self.start_time,
-                'logging_level': logging_level.value
-            },
-            'actions': [],           # Player decision tracking
-            'state_changes': [],     # Resource flow analysis  
-            'milestones': [],        # Progress markers
-            'performance': [],       # Technical metrics
-            'metadata': {}           # Game configuration data
-        }
-        
         # Ensure logging directory exists
         self.log_dir = Path('game_logs')
         self.log_dir.mkdir(exist_ok=True)
+        
+        # Modular data storage - each aspect separated for clarity.
+        # High-volume tables ('actions', 'state_changes') are streamed to the
+        # columnar run log rather than held in run_data.
+        self.run_log: Optional[ColumnarRunWriter] = None
+        self.clear_session_data()
     
     def _generate_session_id(self) -> str:
         '''Generate unique session identifier.'''
@@ -160,7 +157,7 @@ class GameRunLogger:
         if self.should_log(LoggingLevel.VERBOSE) and alternatives:
             action_data['alternatives'] = alternatives
             
-        self.run_data['actions'].append(action_data)
+        self._stream_row('actions', action_data, turn)
     
     def log_state_change(self, resource: str, old_value: Union[int, float], 
                         new_value: Union[int, float], cause: str, turn: int = 0) -> None:
@@ -183,7 +180,7 @@ class GameRunLogger:
             'cause': cause
         }
         
-        self.run_data['state_changes'].append(change_data)
+        self._stream_row('state_changes', change_data, turn)
     
     def log_milestone(self, milestone_type: str, turn: int, details: Optional[Dict] = None) -> None:
         '''
@@ -225,6 +222,26 @@ class GameRunLogger:
             
         self.run_data['metadata'][key] = value
     
+    def _get_run_log(self) -> ColumnarRunWriter:
+        '''Get the run log writer, creating the file lazily on first use.'''
+        if self.run_log is None:
+            self.run_log = ColumnarRunWriter(self.log_dir / f'{self.session_id}.runlog.jsonl')
+        return self.run_log
+    
+    def _stream_row(self, table: str, row: Dict[str, Any], turn: int) -> None:
+        '''Append a row to the run log; a new turn flushes the previous batch.'''
+        run_log = self._get_run_log()
+        if run_log.closed:
+            # finalize_session() sealed the log with its checksum trailer
+            return
+        run_log.append(table, row, turn)
+        self.run_data['session_info']['row_counts'][table] += 1
+    
+    def flush_turn(self) -> None:
+        '''Write the current turn's rows as a record batch.'''
+        if self.run_log is not None:
+            self.run_log.flush()
+    
     def finalize_session(self, outcome: str, final_stats: Optional[Dict] = None) -> str:
         '''
         Finalize and save session data.
@@ -244,6 +261,11 @@ class GameRunLogger:
             'final_stats': final_stats or {}
         })
         
+        # Close the run log; the session file references it by name
+        if self.run_log is not None and not self.run_log.closed:
+            self.run_data['session_info']['run_log'] = self.run_log.path.name
+            self.run_data['session_info']['checksum'] = self.run_log.close()
+        
         # Save to file
         filename = f'{self.session_id}_{outcome.lower()}.json'
         filepath = self.log_dir / filename
@@ -271,8 +293,8 @@ class GameRunLogger:
             'logging_level': self.logging_level.display_name,
             'session_duration': time.time() - self.start_time,
             'data_points': {
-                'actions': len(self.run_data['actions']),
-                'state_changes': len(self.run_data['state_changes']),
+                'actions': self.run_data['session_info']['row_counts']['actions'],
+                'state_changes': self.run_data['session_info']['row_counts']['state_changes'],
                 'milestones': len(self.run_data['milestones']),
                 'performance_metrics': len(self.run_data['performance'])
             },
@@ -283,17 +305,23 @@ class GameRunLogger:
     
     def clear_session_data(self) -> None:
         '''Clear current session data for privacy.'''
+        if self.run_log is not None:
+            path = self.run_log.path
+            self.run_log.close()
+            self.run_log = None
+            if path is not None and path.exists():
+                path.unlink()
+        
         self.run_data = {
             'session_info': {
                 'session_id': self.session_id,
                 'start_time': self.start_time,
-                'logging_level': self.logging_level.value
+                'logging_level': self.logging_level.value,
+                'row_counts': {'actions': 0, 'state_changes': 0}
             },
-            'actions': [],
-            'state_changes': [],
-            'milestones': [],
-            'performance': [],
-            'metadata': {}
+            'milestones': [],        # Progress markers
+            'performance': [],       # Technical metrics
+            'metadata': {}           # Game configuration data
         }
     
     def configure_logging_level(self, level: LoggingLevel) -> None:
@@ -319,8 +347,7 @@ class GameRunLogger:
             'disk_usage_mb': storage_info['total_size_bytes'] / (1024 * 1024),
             'retention_days': 90,  # Default retention period
             'current_session_data_points': sum([
-                len(self.run_data['actions']),
-                len(self.run_data['state_changes']),
+                sum(self.run_data['session_info']['row_counts'].values()),
                 len(self.run_data['milestones']),
                 len(self.run_data['performance'])
             ])
@@ -337,43 +364,50 @@ class GameRunLogger:
         if not self.should_log(LoggingLevel.STANDARD):
             return
             
-        self.run_data['actions'].append({
+        self._stream_row('actions', {
             'type': 'event',
             'name': event_name,
             'description': description,
             'turn': turn,
             'timestamp': time.time() - self.start_time
-        })
+        }, turn)
     
     def log_upgrade(self, upgrade_name: str, cost: int, turn: int) -> None:
         '''Log an upgrade purchase (GameLogger compatibility).'''
         if not self.should_log(LoggingLevel.STANDARD):
             return
             
-        self.run_data['actions'].append({
+        self._stream_row('actions', {
             'type': 'upgrade',
             'name': upgrade_name,
             'cost': cost,
             'turn': turn,
             'timestamp': time.time() - self.start_time
-        })
+        }, turn)
     
     def log_turn_summary(self, turn: int, money: int, staff: int, reputation: int, doom: int) -> None:
-        '''Log end-of-turn resource summary (GameLogger compatibility).'''
+        '''
+        Log end-of-turn resource summary (GameLogger compatibility).
+        
+        The row goes to the state_changes table with money, staff, reputation
+        and doom as flat columns; before the columnar run log it carried them
+        in a nested 'resources' dict.
+        '''
         if not self.should_log(LoggingLevel.MINIMAL):
             return
             
-        self.run_data['state_changes'].append({
+        self._stream_row('state_changes', {
             'type': 'turn_summary',
             'turn': turn,
-            'resources': {
-                'money': money,
-                'staff': staff, 
-                'reputation': reputation,
-                'doom': doom
-            },
+            'money': money,
+            'staff': staff,
+            'reputation': reputation,
+            'doom': doom,
             'timestamp': time.time() - self.start_time
-        })
+        }, turn)
+        
+        # End of turn: commit this turn's record batch
+        self.flush_turn()
     
     def log_game_end(self, victory: bool, reason: str, final_stats: Dict[str, Any]) -> None:
         '''Log game end conditions (GameLogger compatibility).'''
@@ -404,7 +438,7 @@ class GameRunLogger:
     
     def get_log_filename(self) -> str:
         '''Get log filename (GameLogger compatibility).'''
-        return f'game_run_{self.session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json'
+        return f'game_run_{self.session_id}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
     
     def get_log_summary(self) -> Dict[str, Any]:
         '''Get log summary (GameLogger compatibility).'''
@@ -451,6 +485,12 @@ def get_game_logger() -> Optional[GameRunLogger]:
     return _global_logger
 
 
+def _iter_log_files(log_dir: Path):
+    '''Session summaries (*.json) plus their columnar run logs (*.jsonl).'''
+    yield from log_dir.glob('*.json')
+    yield from log_dir.glob('*.jsonl')
+
+
 def delete_all_game_logs() -> int:
     '''
     Delete all stored game logs for privacy.
@@ -464,7 +504,7 @@ def delete_all_game_logs() -> int:
         
     deleted_count = 0
     try:
-        for log_file in log_dir.glob('*.json'):
+        for log_file in _iter_log_files(log_dir):
             log_file.unlink()
             deleted_count += 1
     except Exception as e:
@@ -488,7 +528,7 @@ def get_log_storage_info() -> Dict[str, Any]:
             'storage_location': str(log_dir)
         }
     
-    log_files = list(log_dir.glob('*.json'))
+    log_files = list(_iter_log_files(log_dir))
     total_size = sum(f.stat().st_size for f in log_files)
     
     return {
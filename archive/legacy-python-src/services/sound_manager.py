@@ -1,21 +1,32 @@
 import math
 import array
+import importlib.util
 from pathlib import Path
 
-# Try to import pygame, but gracefully handle if it's not available
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
-    pygame = None
+# pygame is imported by the first SoundManager that wants audio, so importing
+# this module stays cheap for headless games; a missing pygame is tolerated
+PYGAME_AVAILABLE = importlib.util.find_spec('pygame') is not None
+pygame = None
+
+
+def _import_pygame():
+    '''Import pygame on first use; returns False when it is not installed.'''
+    global pygame, PYGAME_AVAILABLE
+    if pygame is None and PYGAME_AVAILABLE:
+        try:
+            import pygame as _pygame
+            pygame = _pygame
+        except ImportError:
+            PYGAME_AVAILABLE = False
+    return pygame is not None
 
 class SoundManager:
     '''Manages sound effects and music for the game'''
     
-    def __init__(self):
+    def __init__(self, audio=True):
+        '''audio=False gives a silent manager that never touches pygame (headless games).'''
         self.enabled = True  # User preference - start enabled
-        self.audio_available = PYGAME_AVAILABLE  # Hardware capability
+        self.audio_available = audio and _import_pygame()  # Hardware capability
         self.sounds = {}
         # Individual sound toggles for granular control
         self.sound_toggles = {
@@ -32,7 +43,7 @@ class SoundManager:
             'success': True,
             'research_complete': True
         }
-        if PYGAME_AVAILABLE:
+        if self.audio_available:
             self._initialize_pygame_mixer()
             self._create_blob_sound()
             # Always try to create popup sounds, even if blob sound creation failed
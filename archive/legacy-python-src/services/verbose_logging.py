@@ -3,6 +3,9 @@ Verbose Logging System for P(Doom)
 
 Provides comprehensive logging for debugging, balancing, and competitive verification.
 All game actions, decisions, and state changes are logged for transparency.
+
+Records are streamed to a columnar run log (one record batch per turn, see
+services/columnar_log.py); only the current turn is held in memory.
 '''
 
 import json
@@ -13,6 +16,8 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from src.services.columnar_log import ColumnarRunWriter, read_table
+
 
 class LogLevel(Enum):
     '''Logging detail levels.'''
@@ -68,6 +73,7 @@ class VerboseLogger:
     - Configurable verbosity levels
     - Privacy-respecting data collection
     - Competitive verification support
+    - Bounded memory: the *_log lists hold only the current, unflushed turn
     '''
     
     def __init__(self, 
@@ -85,10 +91,17 @@ class VerboseLogger:
         self.logs_dir = 'logs'
         os.makedirs(self.logs_dir, exist_ok=True)
         
-        # Initialize log storage
+        # Current-turn buffers; flushed to the run log on turn change
         self.actions_log: List[GameAction] = []
         self.resource_changes_log: List[ResourceChange] = []
         self.random_events_log: List[RandomEvent] = []
+        
+        # Running aggregates so summaries never rescan the session
+        self._total_actions = 0
+        self._total_rng_calls = 0
+        self._max_turn = 0
+        self._action_breakdown: Dict[str, int] = {}
+        self._resource_summary: Dict[str, Dict[str, int]] = {}
         self.game_metadata = {
             'game_seed': game_seed,
             'log_level': log_level.value,
@@ -100,6 +113,12 @@ class VerboseLogger:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.log_filename = f'game_{game_seed}_{timestamp}'
         
+        # Columnar run log; with JSON export disabled only the checksum is kept
+        run_log_path = None
+        if enable_json_export:
+            run_log_path = os.path.join(self.logs_dir, f'{self.log_filename}.runlog.jsonl')
+        self.run_log = ColumnarRunWriter(run_log_path)
+        
         if enable_human_readable:
             self._setup_human_readable_logger()
     
@@ -152,7 +171,11 @@ class VerboseLogger:
             rng_context=rng_context
         )
         
-        self.actions_log.append(action)
+        if not self._record('actions', action, self.actions_log):
+            return
+        self._total_actions += 1
+        self._max_turn = max(self._max_turn, turn)
+        self._action_breakdown[action_name] = self._action_breakdown.get(action_name, 0) + 1
         
         if self.enable_human_readable and self.log_level.value in ['standard', 'verbose', 'debug']:
             self.logger.info(
@@ -177,7 +200,12 @@ class VerboseLogger:
             timestamp=datetime.now().isoformat()
         )
         
-        self.resource_changes_log.append(change)
+        if not self._record('resource_changes', change, self.resource_changes_log):
+            return
+        resource_totals = self._resource_summary.setdefault(
+            resource, {'total_change': 0, 'transactions': 0})
+        resource_totals['total_change'] += change.change
+        resource_totals['transactions'] += 1
         
         if self.enable_human_readable and self.log_level.value in ['verbose', 'debug']:
             change_str = f'+{change.change}' if change.change >= 0 else str(change.change)
@@ -204,7 +232,9 @@ class VerboseLogger:
             timestamp=datetime.now().isoformat()
         )
         
-        self.random_events_log.append(event)
+        if not self._record('random_events', event, self.random_events_log):
+            return
+        self._total_rng_calls += 1
         
         if self.enable_human_readable and self.log_level.value in ['debug']:
             self.logger.debug(
@@ -212,6 +242,24 @@ class VerboseLogger:
                 extra={'turn': turn}
             )
     
+    def _record(self, table: str, record: Any, buffer: List[Any]) -> bool:
+        '''Stream a record; a new turn flushes the previous turn's batch.'''
+        if self.run_log.closed:
+            # close() sealed the log with its checksum trailer; like GameRunLogger, drop the row
+            return False
+        if self.run_log.pending_turn is not None and record.turn != self.run_log.pending_turn:
+            self.flush_turn()
+        self.run_log.append(table, asdict(record), record.turn)
+        buffer.append(record)
+        return True
+    
+    def flush_turn(self):
+        '''Write the current turn as one record batch and release its buffers.'''
+        self.run_log.flush()
+        self.actions_log.clear()
+        self.resource_changes_log.clear()
+        self.random_events_log.clear()
+    
     def log_game_event(self, turn: int, level: str, message: str, data: Dict[str, Any] = None):
         '''Log a general game event.'''
         if not self.enable_human_readable:
@@ -234,16 +282,24 @@ class VerboseLogger:
         self.logger.log(log_level, message, extra={'turn': turn})
     
     def export_json_logs(self) -> str:
-        '''Export all logs as JSON for analysis.'''
+        '''
+        Export all logs as JSON for analysis.
+        
+        Rebuilt from the columnar run log; prefer reading the run log
+        directly (columnar_log.read_table) for long sessions.
+        '''
         if not self.enable_json_export:
             return ''
-            
-        export_data = {
-            'metadata': self.game_metadata,
-            'actions': [asdict(action) for action in self.actions_log],
-            'resource_changes': [asdict(change) for change in self.resource_changes_log],
-            'random_events': [asdict(event) for event in self.random_events_log]
-        }
+        
+        self.flush_turn()
+        export_data = {'metadata': self.game_metadata}
+        for table in ('actions', 'resource_changes', 'random_events'):
+            columns = read_table(self.run_log.path, table) if self.run_log.batch_count else {}
+            names = list(columns)
+            rows = len(columns[names[0]]) if names else 0
+            export_data[table] = [
+                {name: columns[name][i] for name in names} for i in range(rows)
+            ]
         
         json_file = os.path.join(self.logs_dir, f'{self.log_filename}.json')
         
@@ -256,47 +312,37 @@ class VerboseLogger:
         '''Generate summary statistics for competitive verification.'''
         return {
             'seed': self.game_seed,
-            'total_actions': len(self.actions_log),
-            'total_turns': max((a.turn for a in self.actions_log), default=0),
+            'total_actions': self._total_actions,
+            'total_turns': self._max_turn,
             'action_breakdown': self._get_action_breakdown(),
             'resource_summary': self._get_resource_summary(),
-            'rng_calls': len(self.random_events_log),
+            'rng_calls': self._total_rng_calls,
             'log_checksum': self._calculate_log_checksum()
         }
     
     def _get_action_breakdown(self) -> Dict[str, int]:
         '''Get count of each action type.'''
-        breakdown = {}
-        for action in self.actions_log:
-            breakdown[action.action_name] = breakdown.get(action.action_name, 0) + 1
-        return breakdown
+        return dict(self._action_breakdown)
     
     def _get_resource_summary(self) -> Dict[str, Dict[str, int]]:
         '''Get resource change summary.'''
-        summary = {}
-        for change in self.resource_changes_log:
-            if change.resource not in summary:
-                summary[change.resource] = {'total_change': 0, 'transactions': 0}
-            summary[change.resource]['total_change'] += change.change
-            summary[change.resource]['transactions'] += 1
-        return summary
+        return {resource: dict(totals) for resource, totals in self._resource_summary.items()}
     
     def _calculate_log_checksum(self) -> str:
-        '''Calculate checksum for log integrity verification.'''
-        import hashlib
-        
-        # Create deterministic string representation of logs
-        log_string = json.dumps({
-            'actions': [asdict(a) for a in self.actions_log],
-            'resources': [asdict(r) for r in self.resource_changes_log],
-            'rng': [asdict(e) for e in self.random_events_log]
-        }, sort_keys=True)
+        '''
+        Calculate checksum for log integrity verification.
         
-        return hashlib.sha256(log_string.encode()).hexdigest()[:16]
+        Running hash over every logged record, including the current turn's
+        unflushed rows, without writing that turn out early.
+        '''
+        return self.run_log.checksum
 
     def close(self):
         '''Close all file handlers properly.'''
         try:
+            # Seal the run log with its trailer checksum
+            self.run_log.close()
+            
             # Close all file handlers
             for handler in self.logger.handlers[:]:
                 if hasattr(handler, 'close'):
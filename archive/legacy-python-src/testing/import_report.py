@@ -0,0 +1,102 @@
+'''
+Import-Time Report
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+lists the slowest modules in the import graph, so regressions in the cold
+start of src.core.game_state show up by name rather than as a vague slowdown.
+
+Usage:
+    python -m src.testing.import_report
+    python -m src.testing.import_report --module src.core.game_state --top 15 --sort self
+    python -m src.testing.import_report --budget-ms 400
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+DEFAULT_MODULE = 'src.core.game_state'
+
+# Cold-import budget for DEFAULT_MODULE; PDOOM_IMPORT_BUDGET_MS overrides it
+DEFAULT_BUDGET_MS = 500.0
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    '''
+    Parse `-X importtime` output into rows of module, self_ms, cumulative_ms, depth.
+
+    Lines look like `import time:       123 |        456 |   package.module`,
+    with the module name indented two spaces per nesting level.
+    '''
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip(' ')
+        rows.append({
+            'module': stripped,
+            'self_ms': int(fields[0]) / 1000,
+            'cumulative_ms': int(fields[1]) / 1000,
+            'depth': (len(name) - len(stripped) - 1) // 2
+        })
+    return rows
+
+
+def measure_import(module: str = DEFAULT_MODULE, cwd: Optional[str] = None) -> Dict[str, Any]:
+    '''Import `module` in a subprocess and return its import rows and total time.'''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        # The traceback follows the importtime lines; keep only the traceback
+        error = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        raise ImportError(f'import {module} failed:\n' + '\n'.join(error))
+
+    rows = parse_importtime(result.stderr)
+    top = next((r for r in reversed(rows) if r['module'] == module), None)
+    return {
+        'module': module,
+        'total_ms': top['cumulative_ms'] if top else 0.0,
+        'modules': rows
+    }
+
+
+def get_budget_ms() -> float:
+    '''Return the cold-import budget, honouring PDOOM_IMPORT_BUDGET_MS.'''
+    return float(os.environ.get('PDOOM_IMPORT_BUDGET_MS', DEFAULT_BUDGET_MS))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Report the slowest imports under a module')
+    parser.add_argument('--module', default=DEFAULT_MODULE, help='Module to import cold')
+    parser.add_argument('--top', type=int, default=20, help='Rows to show')
+    parser.add_argument('--sort', choices=['self', 'cumulative'], default='cumulative')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Exit non-zero if the total exceeds this (default: no check)')
+    args = parser.parse_args(argv)
+
+    report = measure_import(args.module)
+    key = f'{args.sort}_ms'
+    rows = sorted(report['modules'], key=lambda r: r[key], reverse=True)[:args.top]
+
+    print(f'import {report["module"]}: {report["total_ms"]:.1f} ms total, '
+          f'{len(report["modules"])} modules')
+    print(f'{"self ms":>9} {"cumul ms":>9}  module')
+    for row in rows:
+        print(f'{row["self_ms"]:9.1f} {row["cumulative_ms"]:9.1f}  {row["module"]}')
+
+    if args.budget_ms is not None and report['total_ms'] > args.budget_ms:
+        print(f'over budget: {report["total_ms"]:.1f} ms > {args.budget_ms:.1f} ms')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
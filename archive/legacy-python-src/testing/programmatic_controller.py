@@ -46,7 +46,7 @@ try:
     from src.services.version import get_display_version
 except ImportError as e:
     print(f'Warning: Could not import game components: {e}')
-    print('Ensure you're running from project root and all dependencies are available')
+    print("Ensure you're running from project root and all dependencies are available")
 
 
 @dataclass
@@ -169,14 +169,15 @@ class ProgrammaticGameController:
         '''
         Create GameState instance for programmatic control.
         
-        Note: This may need adjustment based on GameState constructor requirements.
+        Headless controllers use the headless construction profile (no audio,
+        blob layout, tutorial or UI managers), which keeps batch runs cheap.
         '''
         try:
             if seed:
-                return GameState(seed)
+                return GameState(seed, headless=self.headless)
             else:
                 # Use default seed when none provided
-                return GameState("programmatic-default")
+                return GameState("programmatic-default", headless=self.headless)
         except Exception as e:
             raise RuntimeError(f'Failed to create GameState: {e}')
     
@@ -568,7 +569,7 @@ if __name__ == '__main__':
         
         # Test performance
         summary = controller.get_execution_summary()
-        print(f'PASS Performance: {summary['actions_per_second']:.2f} actions/second')
+        print(f'PASS Performance: {summary["actions_per_second"]:.2f} actions/second')
         
         print('\n[SUCCESS] Programmatic controller is functional!')
         
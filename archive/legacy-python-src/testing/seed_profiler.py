@@ -0,0 +1,322 @@
+'''
+Seed Difficulty Profiler for Challenge Seeds
+
+Before a seed is published as a weekly challenge (see
+src.services.deterministic_rng.create_challenge_seed) we want to know how it
+plays. This tool runs a bank of reference bot policies against a candidate seed
+across a process pool, records the survival-score distribution (score is the
+final turn, as in EnhancedLeaderboardManager), and flags degenerate seeds:
+
+- turn1_game_over: some policy loses on the first turn
+- trivial_win: the do-nothing policy survives to the turn cap
+
+Profiles are cached by (seed, game version) so re-checking a seed is instant;
+changing the policy bank or turn cap invalidates the cached entry.
+
+Usage:
+    python -m src.testing.seed_profiler my-seed other-seed
+    python -m src.testing.seed_profiler --challenge 5 --workers 4
+    python -m src.testing.seed_profiler my-seed --refresh --json
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.services.version import get_display_version
+
+DEFAULT_MAX_TURNS = 100
+DEFAULT_RANDOM_RUNS = 5
+
+# end_turn can refuse while a popup is pending; give up on a game after this many refusals
+MAX_STALLED_TURNS = 10
+
+
+def _actions_named(gs, names: Iterable[str]) -> List[int]:
+    wanted = set(names)
+    return [i for i, action in enumerate(gs.gameplay_actions) if action['name'] in wanted]
+
+
+def idle_policy(gs, rng: random.Random) -> List[int]:
+    '''Select nothing and just end turns; the baseline for trivial wins.'''
+    return []
+
+
+def safety_policy(gs, rng: random.Random) -> List[int]:
+    '''Spend every turn on safety work and community growth.'''
+    return _actions_named(gs, ('Safety Research', 'Safety Audit', 'Grow Community'))
+
+
+def growth_policy(gs, rng: random.Random) -> List[int]:
+    '''Grow the lab and team without dedicated safety work.'''
+    return _actions_named(gs, ('Grow Community', 'Team Building', 'Search'))
+
+
+def random_policy(gs, rng: random.Random) -> List[int]:
+    '''Try a few actions at random; seeded per run so results are reproducible.'''
+    indexes = list(range(len(gs.gameplay_actions)))
+    return rng.sample(indexes, min(3, len(indexes)))
+
+
+# Reference policies; each returns the action indexes to attempt this turn
+POLICIES: Dict[str, Callable[[Any, random.Random], List[int]]] = {
+    'idle': idle_policy,
+    'safety': safety_policy,
+    'growth': growth_policy,
+    'random': random_policy
+}
+
+# Policies whose choices depend on their own RNG and so get several runs per seed
+STOCHASTIC_POLICIES = frozenset({'random'})
+
+
+def play_game(seed: str, policy: str, run: int = 0, max_turns: int = DEFAULT_MAX_TURNS) -> Dict[str, Any]:
+    '''Play one headless game of `seed` with a reference policy and return its outcome.'''
+    from src.core.game_state import GameState
+
+    choose = POLICIES[policy]
+    rng = random.Random(f'{seed}:{policy}:{run}')
+    stalled = 0
+
+    # The game narrates to stdout; keep worker output to the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        gs = GameState(seed, headless=True)
+        while not gs.game_over and gs.turn < max_turns:
+            for index in choose(gs, rng):
+                gs.execute_gameplay_action_with_delegation(index)
+            if not gs.end_turn():
+                stalled += 1
+                if stalled >= MAX_STALLED_TURNS:
+                    break
+
+    return {
+        'policy': policy,
+        'run': run,
+        'score': gs.turn,
+        'game_over': gs.game_over,
+        'doom': gs.doom,
+        'stalled': stalled >= MAX_STALLED_TURNS
+    }
+
+
+def _play_task(task: Tuple[str, str, int, int]) -> Dict[str, Any]:
+    seed, policy, run, max_turns = task
+    result = play_game(seed, policy, run, max_turns)
+    result['seed'] = seed
+    return result
+
+
+def _init_worker(scratch_dir: str) -> None:
+    # Games write highscores, leaderboards and logs relative to cwd; keep
+    # profiling runs out of the player's real leaderboards
+    os.chdir(scratch_dir)
+
+
+@dataclass
+class SeedProfile:
+    '''Score distribution and degeneracy flags for one seed.'''
+    seed: str
+    version: str
+    max_turns: int
+    policies: List[str]
+    runs: List[Dict[str, Any]]
+    flags: List[str] = field(default_factory=list)
+
+    @property
+    def scores(self) -> List[int]:
+        return [run['score'] for run in self.runs]
+
+    @property
+    def is_degenerate(self) -> bool:
+        return bool(self.flags)
+
+    def summary(self) -> Dict[str, Any]:
+        '''Distribution of scores overall and per policy.'''
+        scores = sorted(self.scores)
+        by_policy: Dict[str, List[int]] = {}
+        for run in self.runs:
+            by_policy.setdefault(run['policy'], []).append(run['score'])
+        return {
+            'min': scores[0],
+            'max': scores[-1],
+            'mean': statistics.mean(scores),
+            'median': statistics.median(scores),
+            'stdev': statistics.pstdev(scores),
+            'game_over_rate': sum(run['game_over'] for run in self.runs) / len(self.runs),
+            'by_policy': {name: statistics.mean(values) for name, values in by_policy.items()}
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''Convert to dictionary for JSON serialization.'''
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SeedProfile':
+        '''Create from dictionary.'''
+        return cls(**data)
+
+
+def detect_degenerate(runs: List[Dict[str, Any]], max_turns: int) -> List[str]:
+    '''Return the degeneracy flags for a seed's runs.'''
+    flags = []
+    if any(run['game_over'] and run['score'] <= 1 for run in runs):
+        flags.append('turn1_game_over')
+    if any(run['policy'] == 'idle' and not run['game_over'] and run['score'] >= max_turns
+           for run in runs):
+        flags.append('trivial_win')
+    return flags
+
+
+class SeedProfiler:
+    '''
+    Profiles candidate challenge seeds with the reference policy bank.
+
+    Profiles are cached in a JSON file keyed by game version and seed.
+    workers=0 plays games in this process, which is handy for tests.
+    '''
+
+    def __init__(self, cache_path: Optional[Path] = None, max_turns: int = DEFAULT_MAX_TURNS,
+                 random_runs: int = DEFAULT_RANDOM_RUNS, policies: Optional[List[str]] = None,
+                 workers: Optional[int] = None):
+        self.cache_path = cache_path or Path.cwd() / 'leaderboards' / 'seed_profiles.json'
+        self.max_turns = max_turns
+        self.random_runs = random_runs
+        self.policies = list(policies or POLICIES)
+        self.workers = workers
+        self.version = get_display_version()
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+        unknown = set(self.policies) - set(POLICIES)
+        if unknown:
+            raise ValueError(f'Unknown policies: {sorted(unknown)}')
+
+    def _cache_key(self, seed: str) -> str:
+        return f'{self.version}:{seed}'
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._cache is None:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._load_cache(), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def get_cached(self, seed: str) -> Optional[SeedProfile]:
+        '''Return the cached profile for `seed` if it matches the current settings.'''
+        data = self._load_cache().get(self._cache_key(seed))
+        if not data:
+            return None
+        profile = SeedProfile.from_dict(data)
+        if (profile.max_turns != self.max_turns or profile.policies != self.policies or
+                len(profile.runs) != len(self._tasks(seed))):
+            return None
+        return profile
+
+    def _tasks(self, seed: str) -> List[Tuple[str, str, int, int]]:
+        tasks = []
+        for policy in self.policies:
+            runs = self.random_runs if policy in STOCHASTIC_POLICIES else 1
+            tasks.extend((seed, policy, run, self.max_turns) for run in range(runs))
+        return tasks
+
+    def _play(self, tasks: List[Tuple[str, str, int, int]]) -> List[Dict[str, Any]]:
+        with tempfile.TemporaryDirectory(prefix='seed-profiler-') as scratch_dir:
+            if self.workers == 0:
+                original_cwd = os.getcwd()
+                _init_worker(scratch_dir)
+                try:
+                    return [_play_task(task) for task in tasks]
+                finally:
+                    os.chdir(original_cwd)
+
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(scratch_dir,)) as executor:
+                return list(executor.map(_play_task, tasks, chunksize=4))
+
+    def profile_many(self, seeds: Iterable[str], refresh: bool = False) -> List[SeedProfile]:
+        '''Profile seeds, sharing one process pool across all uncached seeds.'''
+        seeds = list(dict.fromkeys(seeds))
+        profiles = {} if refresh else {s: p for s in seeds if (p := self.get_cached(s))}
+
+        pending = [seed for seed in seeds if seed not in profiles]
+        if pending:
+            runs_by_seed: Dict[str, List[Dict[str, Any]]] = {seed: [] for seed in pending}
+            for run in self._play([task for seed in pending for task in self._tasks(seed)]):
+                runs_by_seed[run.pop('seed')].append(run)
+
+            cache = self._load_cache()
+            for seed, runs in runs_by_seed.items():
+                profile = SeedProfile(seed=seed, version=self.version, max_turns=self.max_turns,
+                                      policies=self.policies, runs=runs,
+                                      flags=detect_degenerate(runs, self.max_turns))
+                profiles[seed] = profile
+                cache[self._cache_key(seed)] = profile.to_dict()
+            self._save_cache()
+
+        return [profiles[seed] for seed in seeds]
+
+    def profile(self, seed: str, refresh: bool = False) -> SeedProfile:
+        '''Profile a single seed, using the cache unless `refresh` is set.'''
+        return self.profile_many([seed], refresh)[0]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Profile challenge seeds with reference bot policies')
+    parser.add_argument('seeds', nargs='*', help='Candidate seeds to profile')
+    parser.add_argument('--challenge', type=int, default=0,
+                        help='Also mint and profile this many new challenge seeds')
+    parser.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument('--random-runs', type=int, default=DEFAULT_RANDOM_RUNS,
+                        help='Runs of each stochastic policy per seed')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (0 = inline)')
+    parser.add_argument('--cache', type=Path, default=None, help='Profile cache file')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached profiles')
+    parser.add_argument('--json', action='store_true', help='Print profiles as JSON')
+    args = parser.parse_args(argv)
+
+    seeds = list(args.seeds)
+    if args.challenge:
+        from src.services.deterministic_rng import create_challenge_seed
+        # Minted seeds are timestamp-based, so candidates minted together would
+        # collide; number them off a single base name instead
+        base = create_challenge_seed()
+        seeds.extend(f'{base}-{i}' for i in range(1, args.challenge + 1))
+    if not seeds:
+        parser.error('give at least one seed or --challenge N')
+
+    profiler = SeedProfiler(args.cache, args.max_turns, args.random_runs, workers=args.workers)
+    profiles = profiler.profile_many(seeds, refresh=args.refresh)
+
+    if args.json:
+        print(json.dumps([dict(p.to_dict(), summary=p.summary()) for p in profiles], indent=2))
+    else:
+        for p in profiles:
+            s = p.summary()
+            by_policy = ', '.join(f'{name} {mean:.1f}' for name, mean in s['by_policy'].items())
+            print(f'{p.seed}: score {s["min"]}-{s["max"]} (median {s["median"]}, mean {s["mean"]:.1f}), '
+                  f'game over {s["game_over_rate"]:.0%}; {by_policy}'
+                  f'{"  DEGENERATE: " + ", ".join(p.flags) if p.flags else ""}')
+
+    return 1 if any(p.is_degenerate for p in profiles) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
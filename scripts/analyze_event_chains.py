@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""Reachability of every event once the extension chains and triggers are applied.
+
+Layer: OBSERVE
+Invoked by: human
+
+WHY THIS EXISTS. godot/data/events/extensions/ holds event_chains.json (one
+event unlocking another after a delay, with a probability), triggers.json
+(conditional min_turn / probability rules) and scenarios.json (per-scenario
+exclude_events). Nothing checked what those do to the timeline. A chain
+hanging off a 2024 event with a 150-turn delay lands past turn 229, where no
+observed run has ever been, and an exclude_events entry can quietly strand a
+whole chain. This script builds the dependency DAG over the compiled
+catalogue (scripts/compile_event_catalogue.py) plus the extensions. For each
+event it computes the earliest turn it can fire and the probability that it
+has fired by a given turn. A Monte-Carlo run over many seeds cross-checks the
+analytic numbers.
+
+THE MODEL (what one event's fire time T is):
+
+  * catalogue row: turn_exact fires on trigger_turn; random rolls its
+    probability every turn from eligibility_start until it fires (the game
+    keeps random events eligible past eligibility_end, see events.gd
+    should_trigger()).
+  * triggers.json rule: another per-turn roll from min_turn. `requires` is game
+    state and is ASSUMED MET -- such events are marked "conditional" and their
+    numbers are upper bounds.
+  * chain edge: when trigger_event fires at t, the unlocked event fires at
+    t + delay_turns with the edge's probability.
+  * T is the first of those sources to fire. An event excluded by the scenario
+    never fires, and neither do chains hanging off it.
+
+The analytic pass treats the sources of one event as independent. When two
+chains share an ancestor that is only approximately true, and the Monte-Carlo
+column shows by how much. The per-turn event cap (events.max_new_events_per_turn)
+and repeatable events are not modelled.
+
+The observed run band comes from the _retime_2026_08 note in
+events/balancing/rarity_curves.json (deaths turn 14-229). An event whose
+earliest turn is past its end fires in no observed run.
+
+Usage:
+    python scripts/analyze_event_chains.py                      # report
+    python scripts/analyze_event_chains.py --scenario crisis    # apply that scenario's exclude_events
+    python scripts/analyze_event_chains.py --seeds 20000 --jobs 8
+    python scripts/analyze_event_chains.py --json               # machine-readable
+    python scripts/analyze_event_chains.py --check              # exit 1 on unreachable / late events
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import compile_event_catalogue
+
+ROOT = Path(__file__).resolve().parents[1]
+EXTENSIONS_DIR = ROOT / "godot" / "data" / "events" / "extensions"
+CHAINS_PATH = EXTENSIONS_DIR / "event_chains.json"
+TRIGGERS_PATH = EXTENSIONS_DIR / "triggers.json"
+SCENARIOS_PATH = EXTENSIONS_DIR / "scenarios.json"
+
+# Deaths observed between these turns (rarity_curves.json, _retime_2026_08).
+RUN_BAND = (14, 229)
+DEFAULT_SCENARIO = "bootstrap"
+DEFAULT_SEEDS = 2000
+PARALLEL_MIN_SEEDS = 4000  # below this a process pool costs more than it saves
+NEVER = math.inf
+
+
+def _load(path: Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8")) if Path(path).exists() else {}
+
+
+class EventGraph:
+    """Fire-time sources of every event, and the chain DAG between them, in topological order."""
+
+    def __init__(self, catalogue, chains=(), triggers=None, excluded=(), band=RUN_BAND):
+        self.band = band
+        self.errors = []
+        self.warnings = []
+        self.base = {}  # id -> ("exact", turn) | ("random", start, p)
+        for event in catalogue.events:
+            if event["trigger_type"] == "turn_exact":
+                self.base[event["id"]] = ("exact", event["trigger_turn"])
+            else:
+                self.base[event["id"]] = (
+                    "random",
+                    event["eligibility_start"],
+                    event["probability"],
+                )
+        self.order = list(self.base)
+        known = set(self.order)
+
+        def resolve(raw_id, where):
+            raw_id = str(raw_id)
+            for candidate in (raw_id, f"hist_{raw_id}"):
+                if candidate in known:
+                    return candidate
+            if raw_id not in self.extra:
+                self.extra.append(raw_id)
+                self.warnings.append(
+                    f"{where}: '{raw_id}' is not in the event catalogue (extension-only event)"
+                )
+            return raw_id
+
+        self.extra = []
+        self._involved = None
+        self.rules = {}  # id -> (min_turn, p, conditional)
+        for raw_id, rule in sorted((triggers or {}).items()):
+            if raw_id.startswith("_") or not isinstance(rule, dict):
+                continue
+            event_id = resolve(rule.get("event_id", raw_id), "triggers.json")
+            probability = rule.get("probability", 0.1)
+            if not 0 <= probability <= 1:
+                self.errors.append(
+                    f"triggers.json '{raw_id}': probability {probability} is outside 0..1"
+                )
+            self.rules[event_id] = (
+                max(1, int(rule.get("min_turn", 1))),
+                probability,
+                bool(rule.get("requires")),
+            )
+
+        self.edges = []  # (parent, child, delay, p)
+        for index, chain in enumerate(chains):
+            where = f"event_chains.json chain {index}"
+            if not isinstance(chain, dict) or "trigger_event" not in chain:
+                self.errors.append(f"{where}: needs a trigger_event")
+                continue
+            parent = resolve(chain["trigger_event"], where)
+            delay, probability = int(chain.get("delay_turns", 0)), chain.get("probability", 1.0)
+            if delay < 0 or not 0 <= probability <= 1:
+                self.errors.append(f"{where}: delay_turns must be >= 0 and probability within 0..1")
+            for child in chain.get("unlocks", []):
+                self.edges.append((parent, resolve(child, where), delay, probability))
+
+        self.excluded = set()
+        for raw_id in excluded:
+            self.excluded.add(resolve(raw_id, "scenarios.json exclude_events"))
+        self.parents = {}
+        for edge in self.edges:
+            self.parents.setdefault(edge[1], []).append(edge)
+        self.order = self._topological(self.order + sorted(self.extra))
+        reach = {}  # longest total delay of a chain path ending at each event
+        for event_id in self.order:
+            for parent, _child, delay, _p in self.parents.get(event_id, ()):
+                reach[event_id] = max(reach.get(event_id, 0), reach.get(parent, 0) + delay)
+        longest = max(reach.values(), default=0)
+        last_start = max(
+            [s[1] for s in self.base.values()] + [r[0] for r in self.rules.values()] + [0]
+        )
+        self.horizon = max(band[1], last_start) + longest + 1
+
+    def _topological(self, nodes):
+        """Kahn's algorithm, ties broken by catalogue (RNG) order; a cycle is an error."""
+        rank = {node: i for i, node in enumerate(nodes)}
+        pending = {node: 0 for node in nodes}
+        children = {}
+        for parent, child, *_ in self.edges:
+            pending[child] += 1
+            children.setdefault(parent, []).append(child)
+        ready = [rank[node] for node, n in pending.items() if n == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            node = nodes[heapq.heappop(ready)]
+            order.append(node)
+            for child in children.get(node, ()):
+                pending[child] -= 1
+                if pending[child] == 0:
+                    heapq.heappush(ready, rank[child])
+        if len(order) < len(nodes):
+            stuck = sorted(node for node, n in pending.items() if n > 0)
+            self.errors.append(f"event_chains.json: cycle through {', '.join(stuck)}")
+            order += stuck
+        return order
+
+    def involved(self):
+        """Events touched by a chain, a trigger rule or an exclusion, in topological order."""
+        if self._involved is None:
+            touched = set(self.rules) | self.excluded
+            for parent, child, *_ in self.edges:
+                touched.update((parent, child))
+            self._involved = [event_id for event_id in self.order if event_id in touched]
+        return self._involved
+
+
+def _roll_cdf(start, probability, horizon):
+    """P(fired by turn t) for a per-turn roll from start, t = 0..horizon."""
+    miss = 1.0 - probability
+    return [0.0 if t < start else 1.0 - miss ** (t - start + 1) for t in range(horizon + 1)]
+
+
+def analytic(graph: EventGraph) -> dict:
+    """Per event: cdf[t] = P(fired by turn t), t = 0..horizon."""
+    horizon = graph.horizon
+    cdfs = {}
+    for event_id in graph.order:
+        survive = [1.0] * (horizon + 1)
+        sources = []
+        if event_id in graph.excluded:
+            cdfs[event_id] = [0.0] * (horizon + 1)
+            continue
+        base = graph.base.get(event_id)
+        if base and base[0] == "exact":
+            sources.append([0.0 if t < base[1] else 1.0 for t in range(horizon + 1)])
+        elif base:
+            sources.append(_roll_cdf(base[1], base[2], horizon))
+        if event_id in graph.rules:
+            min_turn, probability, _conditional = graph.rules[event_id]
+            sources.append(_roll_cdf(min_turn, probability, horizon))
+        for parent, _child, delay, probability in graph.parents.get(event_id, ()):
+            parent_cdf = cdfs.get(parent)  # missing only inside a reported cycle
+            if parent_cdf is None:
+                continue
+            sources.append(
+                [
+                    0.0 if t < delay else probability * parent_cdf[t - delay]
+                    for t in range(horizon + 1)
+                ]
+            )
+        for cdf in sources:
+            survive = [s * (1.0 - c) for s, c in zip(survive, cdf)]
+        cdfs[event_id] = [1.0 - s for s in survive]
+    return cdfs
+
+
+def _roll(rng, start, probability):
+    if probability <= 0:
+        return NEVER
+    if probability >= 1:
+        return start
+    return start + int(math.log(1.0 - rng.random()) / math.log(1.0 - probability))
+
+
+def simulate(graph: EventGraph, seed: int) -> dict:
+    """One run over the involved events: event id -> fire turn (NEVER if it does not fire).
+
+    Events no chain, rule or exclusion touches are independent rolls whose
+    numbers the analytic pass already gets exactly, so they are not simulated.
+    """
+    rng = random.Random(seed)
+    fired = {}
+    for event_id in graph.involved():
+        if event_id in graph.excluded:
+            fired[event_id] = NEVER
+            continue
+        turn = NEVER
+        base = graph.base.get(event_id)
+        if base and base[0] == "exact":
+            turn = base[1]
+        elif base:
+            turn = _roll(rng, base[1], base[2])
+        if event_id in graph.rules:
+            min_turn, probability, _conditional = graph.rules[event_id]
+            turn = min(turn, _roll(rng, min_turn, probability))
+        for parent, _child, delay, probability in graph.parents.get(event_id, ()):
+            if fired.get(parent, NEVER) < NEVER and rng.random() < probability:
+                turn = min(turn, fired[parent] + delay)
+        fired[event_id] = turn
+    return fired
+
+
+def _simulate_range(graph: EventGraph, seeds: range) -> dict:
+    """Per event: [runs fired by the horizon, runs fired by the band end, earliest turn seen]."""
+    tally = {event_id: [0, 0, NEVER] for event_id in graph.involved()}
+    for seed in seeds:
+        for event_id, turn in simulate(graph, seed).items():
+            if turn <= graph.horizon:
+                counts = tally[event_id]
+                counts[0] += 1
+                counts[1] += turn <= graph.band[1]
+                counts[2] = min(counts[2], turn)
+    return tally
+
+
+def monte_carlo(graph: EventGraph, seeds: int, jobs: int = 0) -> dict:
+    """Tally simulate() over seeds 0..seeds-1, split across a process pool when it pays."""
+    workers = min(jobs or os.cpu_count() or 1, max(1, seeds // 1000))
+    if seeds < PARALLEL_MIN_SEEDS or workers <= 1:
+        return _simulate_range(graph, range(seeds))
+    step = -(-seeds // workers)
+    ranges = [range(lo, min(lo + step, seeds)) for lo in range(0, seeds, step)]
+    total = {event_id: [0, 0, NEVER] for event_id in graph.involved()}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for tally in pool.map(_simulate_range, [graph] * len(ranges), ranges):
+            for event_id, (by_horizon, by_band, earliest) in tally.items():
+                counts = total[event_id]
+                counts[0] += by_horizon
+                counts[1] += by_band
+                counts[2] = min(counts[2], earliest)
+    return total
+
+
+def analyze(graph: EventGraph, seeds: int = DEFAULT_SEEDS, jobs: int = 0) -> dict:
+    cdfs = analytic(graph)
+    tally = monte_carlo(graph, seeds, jobs) if seeds else {}
+    band_end = graph.band[1]
+    events = {}
+    for event_id in graph.order:
+        cdf = cdfs[event_id]
+        earliest = next((t for t, p in enumerate(cdf) if p > 0), None)
+        row = {
+            "earliest_turn": earliest,
+            "p_by_band_end": round(cdf[min(band_end, graph.horizon)], 4),
+            "p_by_horizon": round(cdf[-1], 4),
+            "conditional": graph.rules.get(event_id, (0, 0, False))[2],
+            "excluded": event_id in graph.excluded,
+        }
+        if event_id in tally:
+            by_horizon, by_band, seen = tally[event_id]
+            row["mc_by_band_end"] = round(by_band / seeds, 4)
+            row["mc_by_horizon"] = round(by_horizon / seeds, 4)
+            row["mc_earliest_turn"] = None if seen == NEVER else seen
+        events[event_id] = row
+
+    unreachable = [
+        e for e in graph.order if events[e]["earliest_turn"] is None and not events[e]["excluded"]
+    ]
+    late = [e for e in graph.order if (events[e]["earliest_turn"] or 0) > band_end]
+    edges = []
+    for parent, child, delay, probability in graph.edges:
+        parent_earliest = events[parent]["earliest_turn"]
+        edges.append(
+            {
+                "trigger_event": parent,
+                "unlocks": child,
+                "delay_turns": delay,
+                "probability": probability,
+                "earliest_turn": None if parent_earliest is None else parent_earliest + delay,
+            }
+        )
+    return {
+        "band": list(graph.band),
+        "horizon": graph.horizon,
+        "seeds": seeds,
+        "errors": graph.errors,
+        "warnings": graph.warnings,
+        "unreachable": unreachable,
+        "late": late,
+        "chains": edges,
+        "involved": graph.involved(),
+        "events": events,
+    }
+
+
+def load_graph(
+    scenario: str = DEFAULT_SCENARIO,
+    catalogue=None,
+    chains_path: Path = CHAINS_PATH,
+    triggers_path: Path = TRIGGERS_PATH,
+    scenarios_path: Path = SCENARIOS_PATH,
+) -> EventGraph:
+    catalogue = catalogue or compile_event_catalogue.EventCatalogue.load()
+    scenarios = _load(scenarios_path).get("scenarios", {})
+    if scenarios and scenario not in scenarios:
+        raise SystemExit(
+            f"ERROR: unknown scenario '{scenario}' (have: {', '.join(sorted(scenarios))})"
+        )
+    settings = scenarios.get(scenario, {})
+    graph = EventGraph(
+        catalogue,
+        chains=_load(chains_path).get("chains", []),
+        triggers=_load(triggers_path).get("triggers", {}),
+        excluded=settings.get("exclude_events", []),
+    )
+    if settings.get("event_filter", "all") != "all":
+        graph.warnings.append(
+            f"scenario '{scenario}': event_filter '{settings['event_filter']}' is not modelled"
+        )
+    return graph
+
+
+def _turn(value):
+    return "never" if value is None else str(value)
+
+
+def print_report(report: dict, scenario: str) -> None:
+    band = "%d-%d" % tuple(report["band"])
+    print(
+        f"[analyze_event_chains] scenario {scenario}: {len(report['events'])} events, "
+        f"{len(report['chains'])} chain edges, horizon turn {report['horizon']}, run band {band}, "
+        f"{report['seeds']} Monte-Carlo seeds"
+    )
+    for message in report["errors"]:
+        print(f"  ERROR {message}")
+    for message in report["warnings"]:
+        print(f"  warn  {message}")
+    for edge in report["chains"]:
+        flag = "  LATE" if (edge["earliest_turn"] or 0) > report["band"][1] else ""
+        print(
+            f"  chain {edge['trigger_event']} -> {edge['unlocks']} (+{edge['delay_turns']} turns, "
+            f"p={edge['probability']}): earliest {_turn(edge['earliest_turn'])}{flag}"
+        )
+    if report["involved"]:
+        print(
+            f"  {'event':<48} earliest  P(by {report['band'][1]})  P(by {report['horizon']})  MC(by {report['band'][1]})"
+        )
+    for event_id in report["involved"]:
+        row = report["events"][event_id]
+        note = " excluded" if row["excluded"] else " conditional" if row["conditional"] else ""
+        mc = f"{row['mc_by_band_end']:.3f}" if "mc_by_band_end" in row else "-"
+        print(
+            f"  {event_id:<48} {_turn(row['earliest_turn']):>8}  {row['p_by_band_end']:>9.3f}  "
+            f"{row['p_by_horizon']:>9.3f}  {mc:>9}{note}"
+        )
+    for event_id in report["unreachable"]:
+        print(f"  UNREACHABLE {event_id}")
+    for event_id in report["late"]:
+        print(
+            f"  LATE {event_id}: earliest turn {report['events'][event_id]['earliest_turn']}, "
+            f"past the run band ({band})"
+        )
+    if not (report["chains"] or report["involved"] or report["unreachable"] or report["late"]):
+        print(
+            "  no chains, trigger rules or exclusions defined; every catalogue event is reachable in the band"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Reachability of events under the extension chains and triggers"
+    )
+    parser.add_argument("--scenario", default=DEFAULT_SCENARIO)
+    parser.add_argument(
+        "--seeds", type=int, default=DEFAULT_SEEDS, help="Monte-Carlo runs (0 = analytic only)"
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument("--check", action="store_true", help="exit 1 on unreachable or late events")
+    args = parser.parse_args(argv)
+
+    report = analyze(load_graph(args.scenario), seeds=args.seeds, jobs=args.jobs)
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print_report(report, args.scenario)
+    if report["errors"] or (args.check and (report["unreachable"] or report["late"])):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,9 @@ This hook is BLOCKING (exit 1 on any violation). It replaces the old
 non-blocking, auto-fix-oriented Unicode handling in enforce_standards.py, which
 let a coffee emoji ship.
 
+The four rules run in one pass over godot/ through scripts/lint_engine.py, so
+unchanged files are not even re-read (results are cached by content hash).
+
 Usage:
     python scripts/check_no_emoji.py          # scan the tree, exit 1 on violations
 """
@@ -29,6 +32,8 @@ import re
 import sys
 from pathlib import Path
 
+import lint_engine
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 GODOT = PROJECT_ROOT / "godot"
 
@@ -59,45 +64,24 @@ def is_emoji(cp: int) -> bool:
     )
 
 
-def _rel(p: Path) -> str:
-    return p.relative_to(PROJECT_ROOT).as_posix()
-
-
-def _iter(base: Path, suffix: str):
-    for p in base.rglob("*" + suffix):
-        yield p
-
-
-def scan_ascii(base: Path, suffix: str, skip_addons: bool):
-    """Yield (relpath, line, col, cp) for every codepoint > U+007F."""
-    for p in _iter(base, suffix):
-        rel = _rel(p)
-        if skip_addons and "/addons/" in rel:
-            continue
-        try:
-            text = p.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            continue
-        for ln, line in enumerate(text.splitlines(), 1):
-            for col, ch in enumerate(line, 1):
-                if ord(ch) > 0x7F:
-                    yield rel, ln, col, ord(ch)
+def ascii_violations(rel: str, text: str):
+    """(relpath, line, col, cp) for every codepoint > U+007F."""
+    return [
+        (rel, ln, col, ord(ch))
+        for ln, line in enumerate(text.splitlines(), 1)
+        for col, ch in enumerate(line, 1)
+        if ord(ch) > 0x7F
+    ]
 
 
-def scan_emoji(base: Path, suffix: str, exclude: set):
-    """Yield (relpath, line, col, cp) for every emoji codepoint."""
-    for p in _iter(base, suffix):
-        rel = _rel(p)
-        if rel in exclude:
-            continue
-        try:
-            text = p.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            continue
-        for ln, line in enumerate(text.splitlines(), 1):
-            for col, ch in enumerate(line, 1):
-                if is_emoji(ord(ch)):
-                    yield rel, ln, col, ord(ch)
+def emoji_violations(rel: str, text: str):
+    """(relpath, line, col, cp) for every emoji codepoint."""
+    return [
+        (rel, ln, col, ord(ch))
+        for ln, line in enumerate(text.splitlines(), 1)
+        for col, ch in enumerate(line, 1)
+        if is_emoji(ord(ch))
+    ]
 
 
 # Opening line of an authored .tscn string property we enforce ASCII on.
@@ -121,8 +105,8 @@ def _unescaped_quote_count(s: str) -> int:
     return n
 
 
-def scan_tscn_authored_ascii(base: Path, suffix: str, exclude: set):
-    """Yield (relpath, line, col, cp) for non-ASCII inside AUTHORED .tscn string
+def tscn_authored_violations(rel: str, text: str):
+    """(relpath, line, col, cp) for non-ASCII inside AUTHORED .tscn string
     properties (text / tooltip_text / placeholder_text), issue #1035.
 
     The emoji-only rule for .tscn exists to protect engine-serialized unicode;
@@ -130,34 +114,44 @@ def scan_tscn_authored_ascii(base: Path, suffix: str, exclude: set):
     ASCII rule. Multiline strings (odd quote count on the opening line) are
     followed until the closing quote so wrapped prose is covered too.
     """
-    for p in _iter(base, suffix):
-        rel = _rel(p)
-        if rel in exclude:
-            continue
-        try:
-            text = p.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            continue
-        in_string = False
-        for ln, line in enumerate(text.splitlines(), 1):
-            if not in_string:
-                if not TSCN_AUTHORED_RE.match(line):
-                    continue
-                in_string = _unescaped_quote_count(line) % 2 == 1
-            else:
-                in_string = _unescaped_quote_count(line) % 2 == 0
-            for col, ch in enumerate(line, 1):
-                if ord(ch) > 0x7F:
-                    yield rel, ln, col, ord(ch)
+    hits = []
+    in_string = False
+    for ln, line in enumerate(text.splitlines(), 1):
+        if not in_string:
+            if not TSCN_AUTHORED_RE.match(line):
+                continue
+            in_string = _unescaped_quote_count(line) % 2 == 1
+        else:
+            in_string = _unescaped_quote_count(line) % 2 == 0
+        for col, ch in enumerate(line, 1):
+            if ord(ch) > 0x7F:
+                hits.append((rel, ln, col, ord(ch)))
+    return hits
 
 
-def main() -> int:
-    violations = []
-    violations += list(scan_ascii(GODOT, ".gd", skip_addons=True))
-    violations += list(scan_ascii(GODOT / "data", ".json", skip_addons=False))
-    violations += list(scan_emoji(GODOT, ".tscn", TSCN_EXCLUDE))
-    violations += list(scan_tscn_authored_ascii(GODOT, ".tscn", TSCN_EXCLUDE))
+def _gd_source(rel: str) -> bool:
+    return rel.startswith("godot/") and "/addons/" not in rel
+
+
+def _godot_data(rel: str) -> bool:
+    return rel.startswith("godot/data/")
+
+
+def _scene(rel: str) -> bool:
+    return rel.startswith("godot/") and rel not in TSCN_EXCLUDE
+
 
+# One pass over godot/ (scripts/lint_engine.py); reported in this order.
+RULES = [
+    lint_engine.Rule("no-emoji/ascii-gd", (".gd",), ascii_violations, _gd_source),
+    lint_engine.Rule("no-emoji/ascii-json", (".json",), ascii_violations, _godot_data),
+    lint_engine.Rule("no-emoji/emoji-tscn", (".tscn",), emoji_violations, _scene),
+    lint_engine.Rule("no-emoji/tscn-authored", (".tscn",), tscn_authored_violations, _scene),
+]
+
+
+def report(results: dict) -> int:
+    violations = [v for rule in RULES for v in results[rule.name]]
     if not violations:
         print("[no-emoji] OK: godot .gd/.json are pure ASCII, .tscn are emoji-free")
         return 0
@@ -173,5 +167,9 @@ def main() -> int:
     return 1
 
 
+def main() -> int:
+    return report(lint_engine.scan(RULES, base=GODOT))
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""Compile the historical-event sources into one precomputed event catalogue.
+
+Layer: GENERATE
+
+WHY THIS EXISTS. At every start-up EventService (godot/autoload/event_service.gd)
+parses godot/data/historical_events.json (1,194 records, 1.2 MB), merges every
+file in events/overrides/, resolves the timescale dial in
+events/balancing/rarity_curves.json, maps impacts through
+events/balancing/variable_mapping.json and then transforms each record. Every
+turn, Events.check_triggered_events() walks the whole transformed list to find
+the handful that can fire. None of that depends on game state, so this script
+does it once, at build time, and writes godot/data/events/compiled/event_catalogue.json.
+
+WHAT IT REPRODUCES, rule for rule from event_service.gd (keep them in step):
+
+  * overrides: every non-`_` key of every *.json in events/overrides/, files in
+    sorted name order, a later file REPLACING an earlier file's entry;
+    dictionaries merge one level, arrays and scalars replace. An `id` key
+    renames the event (the game id is hist_<new id>).
+  * timing: _resolve_timescale() applies the active `timescale` variant, then
+    base_turn = max(1, (year - base_year) * turns_per_year + 1); legendary
+    fires at base_turn + legendary_month_offset -- (year-2017)*12+7 under
+    month_per_turn; rare is a window centred on base_turn + rare_spread_turns;
+    common opens at max(min_turn, base_turn).
+  * effects: _calculate_base_effects() -- impacts mapped through `mapping`
+    (falling back to ResourceAccessor.map_external_name), times `scale_factors`,
+    summed per game variable; rarity `default_effects` when there is no impacts array.
+  * significance: `significance` if set, else _calculate_significance().
+  * the arxiv / technical_research_breakthrough flavour demotion (channel "flavour").
+
+Option generation stays in EventService: it is a pure function of category,
+significance, effects and the two reactions, all of which are in each row.
+
+ARTIFACT FORMAT (JSON so Godot can read it natively):
+
+    strings   every string value, interned once; rows refer to them by index
+    fields    column names of an event row
+    events    one row per event, in corpus order (which is also the RNG order
+              the game rolls random events in); effects are a flat
+              [name index, amount, ...] list
+    schedule  horizon, exact[turn] (turn_exact events firing that turn) and
+              opens[turn] (random events whose min_turn is that turn); the
+              candidates for turn t are exact[t] plus every random event opened
+              at or before t -- past the horizon, all random events
+    sources   sha256 of each source file, so a consumer can detect a stale build
+
+Usage:
+    python scripts/compile_event_catalogue.py          # (re)write the catalogue
+    python scripts/compile_event_catalogue.py --check  # exit 1 if it is stale
+"""
+
+import bisect
+import copy
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / "godot" / "data"
+EVENTS_PATH = DATA_DIR / "historical_events.json"
+OVERRIDES_DIR = DATA_DIR / "events" / "overrides"
+RARITY_CURVES_PATH = DATA_DIR / "events" / "balancing" / "rarity_curves.json"
+VARIABLE_MAPPING_PATH = DATA_DIR / "events" / "balancing" / "variable_mapping.json"
+OUT = DATA_DIR / "events" / "compiled" / "event_catalogue.json"
+
+FORMAT = "pdoom-event-catalogue"
+FORMAT_VERSION = 1
+
+FIELDS = (
+    "id",
+    "source_id",
+    "name",
+    "description",
+    "year",
+    "category",
+    "rarity",
+    "trigger_mode",
+    "trigger_type",
+    "trigger_turn",
+    "eligibility_start",
+    "eligibility_end",
+    "significance",
+    "probability",
+    "cooldown_turns",
+    "channel",
+    "effects",
+    "safety_researcher_reaction",
+    "media_reaction",
+)
+STRING_FIELDS = frozenset(
+    (
+        "id",
+        "source_id",
+        "name",
+        "description",
+        "category",
+        "rarity",
+        "trigger_mode",
+        "trigger_type",
+        "channel",
+        "safety_researcher_reaction",
+        "media_reaction",
+    )
+)
+
+# event_service.gd _get_rarity_settings() fallbacks, used when a tier is missing
+RARITY_FALLBACKS = {
+    "legendary": {
+        "base_probability": 1.0,
+        "min_turn": 1,
+        "cooldown_turns": 0,
+        "trigger_mode": "deterministic",
+    },
+    "rare": {
+        "base_probability": 0.06,
+        "min_turn": 20,
+        "cooldown_turns": 15,
+        "eligibility_window_turns": 26,
+        "trigger_mode": "probabilistic_window",
+    },
+    "common": {
+        "base_probability": 0.12,
+        "min_turn": 10,
+        "cooldown_turns": 8,
+        "trigger_mode": "random_after_eligible",
+    },
+}
+
+# resource_accessor.gd map_external_name(), the fallback for unmapped variables
+EXTERNAL_NAMES = {
+    "cash": "money",
+    "money": "money",
+    "funding": "money",
+    "stress": "doom",
+    "burnout_risk": "doom",
+    "vibey_doom": "doom",
+    "reputation": "reputation",
+    "public_opinion": "reputation",
+    "research": "research",
+    "papers": "research",
+    "compute": "compute",
+}
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _number(value):
+    """JSON numbers the way Godot hands them to GDScript, minus the float noise."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def load_overrides(overrides_dir: Path) -> dict:
+    """_load_overrides(): later files replace earlier entries for the same id."""
+    overrides = {}
+    for path in sorted(overrides_dir.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            continue
+        for event_id, override in data.items():
+            if not event_id.startswith("_"):
+                overrides[event_id] = override
+    return overrides
+
+
+def apply_override(raw: dict, override: dict) -> dict:
+    """_apply_overrides(): dictionaries merge one level, everything else replaces."""
+    result = copy.deepcopy(raw)
+    for key, value in override.items():
+        if key.startswith("_"):
+            continue
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key].update(value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+def resolve_timescale(curves: dict) -> dict:
+    """_resolve_timescale(): apply the active variant onto year_trigger and the rare window."""
+    curves = copy.deepcopy(curves)
+    scales = curves.get("timescales", {})
+    active = str(curves.get("timescale", ""))
+    if not active or not isinstance(scales, dict) or not isinstance(scales.get(active), dict):
+        return curves
+    scale = scales[active]
+    year_trigger = curves.setdefault("year_trigger", {})
+    for key in ("turns_per_year", "legendary_month_offset", "rare_spread_turns"):
+        if key in scale:
+            year_trigger[key] = scale[key]
+    if "rare_eligibility_window_turns" in scale and isinstance(curves.get("rare"), dict):
+        curves["rare"]["eligibility_window_turns"] = scale["rare_eligibility_window_turns"]
+    return curves
+
+
+def rarity_settings(curves: dict, rarity: str) -> dict:
+    if rarity in curves:
+        return curves[rarity]
+    return RARITY_FALLBACKS.get(rarity, RARITY_FALLBACKS["common"])
+
+
+def significance_of(raw: dict) -> int:
+    """_calculate_significance(): total |change| of the impacts on a 2..10 scale."""
+    if "significance" in raw:
+        return _number(raw["significance"])
+    impacts = raw.get("impacts")
+    if not isinstance(impacts, list):
+        return 5
+    total = sum(abs(int(i["change"])) for i in impacts if isinstance(i, dict) and "change" in i)
+    for threshold, value in (
+        (100, 10),
+        (75, 9),
+        (50, 8),
+        (35, 7),
+        (25, 6),
+        (15, 5),
+        (10, 4),
+        (5, 3),
+    ):
+        if total >= threshold:
+            return value
+    return 2
+
+
+def base_effects(raw: dict, mapping: dict) -> dict:
+    """_calculate_base_effects(): impacts pre-mapped onto game variables and scaled."""
+    impacts = raw.get("impacts")
+    if not isinstance(impacts, list):
+        return dict(mapping.get("default_effects", {}).get(raw.get("rarity", "common"), {}))
+    variables = mapping.get("mapping", {})
+    scale_factors = mapping.get("scale_factors", {})
+    effects = {}
+    for impact in impacts:
+        if not isinstance(impact, dict) or "variable" not in impact or "change" not in impact:
+            continue
+        name = impact["variable"]
+        game_var = variables[name] if name in variables else EXTERNAL_NAMES.get(name, "")
+        if not game_var:
+            continue
+        effects[game_var] = effects.get(game_var, 0) + _number(
+            int(impact["change"]) * scale_factors.get(game_var, 1)
+        )
+    return effects
+
+
+def is_flavour(raw: dict, category: str) -> bool:
+    """_is_flavour_event(): the arxiv / research-breakthrough stream goes to the feed."""
+    return category.lower() == "technical_research_breakthrough" or str(
+        raw.get("id", "")
+    ).startswith("arxiv")
+
+
+def compile_event(raw: dict, curves: dict, mapping: dict, source_id: str):
+    """_transform_event() minus option generation; None for records the game drops."""
+    if "id" not in raw or "title" not in raw:
+        return None
+    category = raw.get("category", "general")
+    rarity = raw.get("rarity", "common")
+    year = (
+        int(raw["year"]) if "year" in raw else int(str(raw.get("date", "2017-01-01"))[:4] or 2017)
+    )
+    settings = rarity_settings(curves, rarity)
+    trigger_mode = settings.get("trigger_mode", "random_after_eligible")
+
+    year_config = curves.get("year_trigger", {})
+    base_turn = max(
+        1, (year - year_config.get("base_year", 2017)) * year_config.get("turns_per_year", 12) + 1
+    )
+    if trigger_mode == "deterministic":
+        trigger_turn = base_turn + year_config.get("legendary_month_offset", 26)
+        trigger_type, start, end = "turn_exact", trigger_turn, trigger_turn
+    elif trigger_mode == "probabilistic_window":
+        window = settings.get("eligibility_window_turns", 26)
+        trigger_turn = base_turn + year_config.get("rare_spread_turns", 13)
+        trigger_type = "random"
+        start, end = max(1, trigger_turn - window // 2), trigger_turn + window // 2
+    else:
+        trigger_turn = max(settings.get("min_turn", 10), base_turn)
+        trigger_type, start, end = "random", trigger_turn, 9999
+
+    return {
+        "id": f"hist_{raw['id']}",
+        "source_id": source_id,
+        "name": raw.get("title", "Historical Event"),
+        "description": raw.get("description", "A significant event in AI safety history."),
+        "year": year,
+        "category": category,
+        "rarity": rarity,
+        "trigger_mode": trigger_mode,
+        "trigger_type": trigger_type,
+        "trigger_turn": trigger_turn,
+        "eligibility_start": start,
+        "eligibility_end": end,
+        "significance": significance_of(raw),
+        "probability": settings.get("base_probability", 0.1),
+        "cooldown_turns": settings.get("cooldown_turns", 20),
+        "channel": "flavour" if is_flavour(raw, category) else "",
+        "effects": base_effects(raw, mapping),
+        "safety_researcher_reaction": raw.get("safety_researcher_reaction"),
+        "media_reaction": raw.get("media_reaction"),
+    }
+
+
+def load_records(data) -> list:
+    """_load_bundled_data(): id-keyed export, {"events": [...]} wrapper, or a bare list."""
+    if isinstance(data, dict):
+        if isinstance(data.get("events"), list):
+            return [e for e in data["events"] if isinstance(e, dict)]
+        records = []
+        for event_id, event in data.items():
+            if event_id.startswith("_") or not isinstance(event, dict):
+                continue
+            records.append(event if "id" in event else dict(event, id=event_id))
+        return records
+    return [e for e in data if isinstance(e, dict)] if isinstance(data, list) else []
+
+
+def source_paths(
+    events_path: Path = EVENTS_PATH,
+    overrides_dir: Path = OVERRIDES_DIR,
+    curves_path: Path = RARITY_CURVES_PATH,
+    mapping_path: Path = VARIABLE_MAPPING_PATH,
+) -> list:
+    return [events_path, curves_path, mapping_path] + sorted(overrides_dir.glob("*.json"))
+
+
+def compile_catalogue(
+    events_path: Path = EVENTS_PATH,
+    overrides_dir: Path = OVERRIDES_DIR,
+    curves_path: Path = RARITY_CURVES_PATH,
+    mapping_path: Path = VARIABLE_MAPPING_PATH,
+) -> dict:
+    """Build the catalogue dict (see the module docstring for its layout)."""
+    curves = resolve_timescale(json.loads(curves_path.read_text(encoding="utf-8")))
+    mapping = json.loads(mapping_path.read_text(encoding="utf-8"))
+    overrides = load_overrides(overrides_dir)
+
+    strings, string_index = [], {}
+
+    def intern(value):
+        if value is None:
+            return None
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    rows, exact, opens = [], {}, {}
+    for raw in load_records(json.loads(events_path.read_text(encoding="utf-8"))):
+        source_id = str(raw.get("id", ""))
+        if source_id in overrides:
+            raw = apply_override(raw, overrides[source_id])
+        event = compile_event(raw, curves, mapping, source_id)
+        if event is None:
+            continue
+        index = len(rows)
+        if event["trigger_type"] == "turn_exact":
+            exact.setdefault(event["trigger_turn"], []).append(index)
+        else:
+            opens.setdefault(event["eligibility_start"], []).append(index)
+        event["effects"] = [
+            item for name, amount in event["effects"].items() for item in (intern(name), amount)
+        ]
+        rows.append([intern(event[f]) if f in STRING_FIELDS else event[f] for f in FIELDS])
+
+    horizon = max(list(exact) + list(opens) + [0])
+    return {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "timescale": curves.get("timescale", "flat"),
+        "sources": {
+            _rel(p): hashlib.sha256(p.read_bytes()).hexdigest()
+            for p in source_paths(events_path, overrides_dir, curves_path, mapping_path)
+        },
+        "fields": list(FIELDS),
+        "strings": strings,
+        "events": rows,
+        "schedule": {
+            "horizon": horizon,
+            "exact": [exact.get(t, []) for t in range(horizon + 1)],
+            "opens": [opens.get(t, []) for t in range(horizon + 1)],
+        },
+    }
+
+
+def render(catalogue: dict) -> str:
+    """One event row per line: diffable, and still a single json.loads."""
+    head = {k: v for k, v in catalogue.items() if k not in ("strings", "events")}
+    lines = ["{"]
+    for key, value in head.items():
+        lines.append(f"{json.dumps(key)}: {json.dumps(value, separators=(',', ':'))},")
+    lines.append('"strings": [')
+    lines.append(",\n".join(json.dumps(s) for s in catalogue["strings"]))
+    lines.append("],")
+    lines.append('"events": [')
+    lines.append(",\n".join(json.dumps(row, separators=(",", ":")) for row in catalogue["events"]))
+    lines.append("]")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+class EventCatalogue:
+    """Reader for a compiled catalogue: decoded events plus per-turn candidate lookups."""
+
+    def __init__(self, catalogue: dict):
+        if catalogue.get("format") != FORMAT or catalogue.get("version") != FORMAT_VERSION:
+            raise ValueError(f"not a {FORMAT} v{FORMAT_VERSION} file")
+        strings, fields = catalogue["strings"], catalogue["fields"]
+        self.events = []
+        for row in catalogue["events"]:
+            event = {}
+            for field, value in zip(fields, row):
+                if field == "effects":
+                    value = {strings[value[i]]: value[i + 1] for i in range(0, len(value), 2)}
+                elif field in STRING_FIELDS and value is not None:
+                    value = strings[value]
+                event[field] = value
+            self.events.append(event)
+        self.by_id = {event["id"]: event for event in self.events}
+
+        schedule = catalogue["schedule"]
+        self.horizon = schedule["horizon"]
+        self._exact = schedule["exact"]
+        self._candidates = []
+        opened = []
+        for turn in range(self.horizon + 1):
+            for index in schedule["opens"][turn]:
+                bisect.insort(opened, index)
+            self._candidates.append(tuple(sorted(opened + self._exact[turn])))
+        self._all_random = tuple(opened)
+
+    @classmethod
+    def load(cls, path: Path = OUT) -> "EventCatalogue":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def candidate_indices(self, turn: int) -> tuple:
+        """Indices of the events that can fire on this turn, in corpus (RNG) order."""
+        if turn < 0:
+            return ()
+        return self._candidates[turn] if turn <= self.horizon else self._all_random
+
+    def candidates(self, turn: int) -> list:
+        return [self.events[i] for i in self.candidate_indices(turn)]
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    text = render(compile_catalogue())
+    if "--check" in argv:
+        if not OUT.exists() or OUT.read_text(encoding="utf-8") != text:
+            print(
+                f"[compile_event_catalogue] {_rel(OUT)} is stale; run python scripts/compile_event_catalogue.py"
+            )
+            return 1
+        print(f"[compile_event_catalogue] {_rel(OUT)} is up to date")
+        return 0
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    OUT.write_text(text, encoding="utf-8", newline="\n")
+    catalogue = json.loads(text)
+    print(
+        f"[compile_event_catalogue] wrote {_rel(OUT)}: {len(catalogue['events'])} events, "
+        f"{len(catalogue['strings'])} strings, horizon turn {catalogue['schedule']['horizon']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
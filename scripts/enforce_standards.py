@@ -18,10 +18,58 @@ import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import lint_engine
+
 # Project root detection
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Files checked for non-ASCII content, and directories left out of that check.
+UNICODE_SUFFIXES = (".py", ".md", ".txt", ".json", ".yaml", ".yml", ".toml", ".cfg", ".sh")
+UNICODE_EXCLUDE_DIRS = {
+    ".git",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "node_modules",
+    ".pytest_cache",
+    "archive",
+    "legacy",
+    "tools",
+}
+
+
+def first_non_ascii_per_line(rel: str, text: str) -> List[Tuple[str, int, str]]:
+    """(path, line, char) for the first non-ASCII character of each line; one per line is enough."""
+    issues = []
+    for line_num, line in enumerate(text.splitlines(), 1):
+        for char in line:
+            if ord(char) > 127:
+                issues.append((rel, line_num, char))
+                break
+    return issues
+
+
+def _unicode_checked(rel: str) -> bool:
+    return not UNICODE_EXCLUDE_DIRS.intersection(rel.split("/")[:-1])
+
+
+UNICODE_RULE = lint_engine.Rule(
+    "unicode", UNICODE_SUFFIXES, first_non_ascii_per_line, _unicode_checked
+)
+RULES = [UNICODE_RULE]
+
+
+def report(results: dict) -> int:
+    """One-pass summary for scripts/lint_engine.py; non-blocking, like check_ascii_compliance."""
+    files = {path for path, _line, _char in results[UNICODE_RULE.name]}
+    if files:
+        print(f"[WARNING] Found {len(files)} files with Unicode content")
+        print(
+            "  python scripts/intelligent_ascii_converter.py  # dry run: what --apply would change"
+        )
+    return 0
+
 
 class StandardsEnforcer:
     """Enforces P(Doom) development standards and quality gates."""
@@ -431,50 +479,8 @@ class StandardsEnforcer:
         return []  # Placeholder
 
     def _find_unicode_content(self) -> List[Tuple[str, int, str]]:
-        """Find non-ASCII content in files."""
-        unicode_issues = []
-
-        # File patterns to check
-        patterns = ["*.py", "*.md", "*.txt", "*.json", "*.yaml", "*.yml", "*.toml", "*.cfg", "*.sh"]
-        exclude_dirs = {
-            ".git",
-            "__pycache__",
-            ".venv",
-            "venv",
-            "node_modules",
-            ".pytest_cache",
-            "archive",
-            "legacy",
-            "tools",
-        }
-
-        for pattern in patterns:
-            for file_path in self.project_root.rglob(pattern):
-                # Skip files in excluded directories
-                if any(excluded in file_path.parts for excluded in exclude_dirs):
-                    continue
-
-                # Skip if it's actually a directory (edge case)
-                if file_path.is_dir():
-                    continue
-
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        for line_num, line in enumerate(f, 1):
-                            for char in line:
-                                if ord(char) > 127:  # Non-ASCII
-                                    unicode_issues.append(
-                                        (
-                                            str(file_path.relative_to(self.project_root)),
-                                            line_num,
-                                            char,
-                                        )
-                                    )
-                                    break  # One per line is enough
-                except (UnicodeDecodeError, PermissionError):
-                    continue
-
-        return unicode_issues
+        """Find non-ASCII content in files (one pass, cached -- see scripts/lint_engine.py)."""
+        return lint_engine.scan(RULES, base=self.project_root)[UNICODE_RULE.name]
 
     def _check_python_syntax(self) -> bool:
         """Check Python syntax for all .py files."""
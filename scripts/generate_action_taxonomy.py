@@ -59,6 +59,8 @@ import re
 import sys
 from pathlib import Path
 
+import godot_data
+
 ROOT = Path(__file__).resolve().parents[1]
 ACTIONS_DIR = ROOT / "godot" / "data" / "actions"
 OUT = ROOT / "docs" / "ACTION_TAXONOMY.md"
@@ -284,41 +286,43 @@ def load_actions() -> tuple:
 
     records = []
     notes = []
-    for path in sorted(ACTIONS_DIR.glob("*.json")):
-        data = json.loads(path.read_text(encoding="utf-8"))
-        if path.name in NON_ACTION_FILES:
+    for entry in godot_data.load(ACTIONS_DIR.parent).under(ACTIONS_DIR.name):
+        if entry.error is not None:
+            raise SystemExit("ERROR: %s is not valid JSON: %s" % (entry.name, entry.error))
+        data = entry.data
+        if entry.name in NON_ACTION_FILES:
             if data.get("actions"):
                 raise SystemExit(
                     "ERROR: %s is declared a non-action file (NON_ACTION_FILES) but "
-                    "now carries an 'actions' array. Remove it from that set." % path.name
+                    "now carries an 'actions' array. Remove it from that set." % entry.name
                 )
             notes.append(
                 "`%s` carries ZERO actions and is excluded from the count "
                 "(it is a lookup table, not an action list). The commission's "
-                "earlier inventory credited it with 2." % path.name
+                "earlier inventory credited it with 2." % entry.name
             )
             continue
         actions = data.get("actions")
         if not isinstance(actions, list):
             raise SystemExit(
                 "ERROR: %s has no 'actions' array. Every file in godot/data/actions/ "
-                "is either an action list or declared in NON_ACTION_FILES." % path.name
+                "is either an action list or declared in NON_ACTION_FILES." % entry.name
             )
         for index, action in enumerate(actions):
             if not isinstance(action, dict):
-                raise SystemExit("ERROR: %s entry %d is not an object" % (path.name, index))
+                raise SystemExit("ERROR: %s entry %d is not an object" % (entry.name, index))
             action_id = action.get("id")
             if not action_id:
                 raise SystemExit(
                     "ERROR: %s entry %d has no 'id'. A blank id is worse than a wrong "
-                    "one -- it cannot be queued, iconed, or replayed." % (path.name, index)
+                    "one -- it cannot be queued, iconed, or replayed." % (entry.name, index)
                 )
             records.append(
                 {
                     "id": action_id,
                     "name": to_ascii(action.get("name", "")),
-                    "domain": path.stem,
-                    "file": path.name,
+                    "domain": entry.stem,
+                    "file": entry.name,
                     "category": action.get("category"),
                     "is_submenu": bool(action.get("is_submenu", False)),
                     "index": index,
@@ -7,18 +7,29 @@ Layer: GENERATE
 Extracts game values, constants, and mechanics from GDScript files and generates
 up-to-date markdown documentation for the website.
 
+Per-file extraction results are cached in .cache/mechanics_extract.json
+(gitignored), keyed by git blob id, so --check only re-scans the .gd files
+that changed since the last run. The stat rules and the JSON round-trip are
+tool_cache's, shared with godot_data and search_index.
+
 Usage:
     python scripts/generate_mechanics_docs.py [--check] [--output docs/mechanics/]
+    python scripts/generate_mechanics_docs.py --diff v0.9.0 HEAD   # constants changed between two refs
 """
 
 import argparse
+import hashlib
 import json
 import re
+import subprocess
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import tool_cache
+
 
 @dataclass
 class GameConstant:
@@ -43,12 +54,179 @@ class MechanicData:
     last_updated: str
 
 
+VAR_PATTERN = re.compile(r"^var\s+(\w+):\s*(\w+)\s*=\s*([^#]+)(?:#\s*(.+))?")
+CONST_PATTERN = re.compile(r"^const\s+(\w+):\s*(\w+)?\s*=\s*([^#]+)(?:#\s*(.+))?")
+EXTRACT_CACHE_VERSION = 1
+
+
+def parse_value(value: str) -> Any:
+    """Numeric literals become int/float; anything else stays the stripped source text."""
+    value = value.strip()
+    try:
+        if "." in value:
+            return float(value)
+        if value.isdigit():
+            return int(value)
+    except ValueError:
+        pass
+    return value
+
+
+def blob_id(raw: bytes) -> str:
+    """The git blob id of some content, so working-tree files and git objects share cache entries."""
+    return hashlib.sha1(b"blob %d\0" % len(raw) + raw).hexdigest()
+
+
+def scan_declarations(text: str) -> Dict[str, List[list]]:
+    """Every var / const declaration in a GDScript source, in line order.
+
+    Each entry is [name, type, value, line_number, comment, top_level]. The
+    patterns match stripped lines, so declarations inside functions are
+    included; top_level tells them apart.
+    """
+    found: Dict[str, List[list]] = {"var": [], "const": []}
+    for line_num, line in enumerate(text.split("\n"), 1):
+        stripped = line.strip()
+        for kind, pattern in (("var", VAR_PATTERN), ("const", CONST_PATTERN)):
+            match = pattern.match(stripped)
+            if match:
+                name, type_, value, comment = match.groups()
+                found[kind].append(
+                    [
+                        name,
+                        type_,
+                        parse_value(value),
+                        line_num,
+                        comment.strip() if comment else None,
+                        line == stripped,
+                    ]
+                )
+    return found
+
+
 class GameDataExtractor:
-    """Extract game data from GDScript files."""
+    """Extract game data from GDScript files.
+
+    Extraction results are cached per file in .cache/mechanics_extract.json,
+    keyed by the file's git blob id. An unchanged file (same size and mtime)
+    is not read at all, and a changed one is re-scanned only if its content
+    changed. The same entries serve constants_at(), which reads other
+    revisions straight from git objects. Call save_cache() to persist.
+    """
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, cache_path: Optional[Path] = None):
         self.repo_root = repo_root
         self.godot_root = repo_root / "godot"
+        self.cache_path = (
+            cache_path
+            if cache_path is not None
+            else repo_root / ".cache" / "mechanics_extract.json"
+        )
+        self.stats = {"reused": 0, "rehashed": 0, "scanned": 0}
+        self._cache = self._load_cache()
+        self._used = set()
+        self._dirty = False
+
+    def _load_cache(self) -> dict:
+        cached = tool_cache.read(self.cache_path, EXTRACT_CACHE_VERSION, __file__)
+        return {"files": cached.get("files", {}), "blobs": cached.get("blobs", {})}
+
+    def save_cache(self) -> None:
+        """Write the cache if anything changed, keeping only the blobs used this run or still on disk."""
+        if not self._dirty:
+            return
+        keep = self._used | {entry["blob"] for entry in self._cache["files"].values()}
+        tool_cache.write(
+            self.cache_path,
+            EXTRACT_CACHE_VERSION,
+            __file__,
+            {
+                "files": self._cache["files"],
+                "blobs": {oid: decls for oid, decls in self._cache["blobs"].items() if oid in keep},
+            },
+        )
+        self._dirty = False
+
+    def _blob_declarations(self, oid: str, raw: bytes) -> Dict[str, List[list]]:
+        self._used.add(oid)
+        if oid in self._cache["blobs"]:
+            return self._cache["blobs"][oid]
+        self.stats["scanned"] += 1
+        decls = scan_declarations(raw.decode("utf-8", errors="replace"))
+        self._cache["blobs"][oid] = decls
+        self._dirty = True
+        return decls
+
+    def declarations(self, file_path: Path) -> Dict[str, List[list]]:
+        """scan_declarations() of a working-tree file, from the cache when the file is unchanged."""
+        rel = file_path.relative_to(self.repo_root).as_posix()
+        entry = self._cache["files"].get(rel)
+        if entry is not None and entry["blob"] not in self._cache["blobs"]:
+            entry = None
+        record = None if entry is None else (entry["size"], entry["mtime_ns"], entry["checked_ns"])
+        stat, raw = tool_cache.read_if_changed(file_path, record)
+        if raw is None:
+            self.stats["reused"] += 1
+            self._used.add(entry["blob"])
+            return self._cache["blobs"][entry["blob"]]
+        oid = blob_id(raw)
+        if oid in self._cache["blobs"]:
+            self.stats["rehashed"] += 1
+        decls = self._blob_declarations(oid, raw)
+        self._cache["files"][rel] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "checked_ns": time.time_ns(),
+            "blob": oid,
+        }
+        self._dirty = True
+        return decls
+
+    def _git(self, *args: str, stdin: Optional[bytes] = None) -> bytes:
+        return subprocess.run(
+            ["git", *args], cwd=self.repo_root, input=stdin, capture_output=True, check=True
+        ).stdout
+
+    def constants_at(self, ref: str, prefix: str = "godot") -> Dict[str, Dict[str, Any]]:
+        """{rel path: {name: value}} of the top-level consts and vars of every .gd file at a git ref.
+
+        Reads git objects directly (ls-tree + one cat-file --batch), so nothing
+        is checked out; blobs already in the cache are not read at all.
+        """
+        listing = self._git("ls-tree", "-r", "-z", ref, "--", prefix)
+        blobs = {}
+        for record in listing.split(b"\0"):
+            if not record:
+                continue
+            meta, path = record.split(b"\t", 1)
+            mode, kind, oid = meta.decode().split()
+            if kind == "blob" and path.endswith(b".gd"):
+                blobs[path.decode("utf-8")] = oid
+        missing = sorted({oid for oid in blobs.values() if oid not in self._cache["blobs"]})
+        if missing:
+            out = self._git(
+                "cat-file", "--batch", stdin="".join(oid + "\n" for oid in missing).encode()
+            )
+            offset = 0
+            for oid in missing:
+                header_end = out.index(b"\n", offset)
+                size = int(out[offset:header_end].split()[2])
+                raw = out[header_end + 1 : header_end + 1 + size]
+                offset = header_end + 1 + size + 1
+                self._blob_declarations(oid, raw)
+        constants = {}
+        self._used.update(blobs.values())
+        for rel, oid in sorted(blobs.items()):
+            decls = self._cache["blobs"][oid]
+            values = {
+                name: value
+                for kind in ("const", "var")
+                for name, _type, value, _line, _comment, top in decls[kind]
+                if top
+            }
+            if values:
+                constants[rel] = values
+        return constants
 
     def extract_game_state_defaults(self) -> Dict[str, GameConstant]:
         """Extract default resource values from game_state.gd"""
@@ -58,38 +236,17 @@ class GameDataExtractor:
         if not game_state_file.exists():
             return constants
 
-        content = game_state_file.read_text(encoding="utf-8")
-        lines = content.split("\n")
-
-        # Parse resource definitions
-        resource_pattern = re.compile(r"^var\s+(\w+):\s*(\w+)\s*=\s*([^#]+)(?:#\s*(.+))?")
-
-        for line_num, line in enumerate(lines, 1):
-            match = resource_pattern.match(line.strip())
-            if match:
-                var_name, var_type, value, comment = match.groups()
-
-                # Clean up value
-                value = value.strip()
-
-                # Parse numeric values
-                parsed_value = value
-                try:
-                    if "." in value:
-                        parsed_value = float(value)
-                    elif value.isdigit():
-                        parsed_value = int(value)
-                except ValueError:
-                    pass
-
-                constants[var_name] = GameConstant(
-                    name=var_name,
-                    value=parsed_value,
-                    type=var_type,
-                    source_file="godot/scripts/core/game_state.gd",
-                    line_number=line_num,
-                    comment=comment.strip() if comment else None,
-                )
+        for var_name, var_type, value, line_num, comment, _top in self.declarations(
+            game_state_file
+        )["var"]:
+            constants[var_name] = GameConstant(
+                name=var_name,
+                value=value,
+                type=var_type,
+                source_file="godot/scripts/core/game_state.gd",
+                line_number=line_num,
+                comment=comment,
+            )
 
         return constants
 
@@ -111,45 +268,38 @@ class GameDataExtractor:
         if not file_path.exists():
             return constants
 
-        content = file_path.read_text(encoding="utf-8")
-        lines = content.split("\n")
-
-        const_pattern = re.compile(r"^const\s+(\w+):\s*(\w+)?\s*=\s*([^#]+)(?:#\s*(.+))?")
+        relative_path = file_path.relative_to(self.repo_root)
+        for const_name, const_type, value, line_num, comment, _top in self.declarations(file_path)[
+            "const"
+        ]:
+            if pattern and not re.search(pattern, const_name):
+                continue
 
-        for line_num, line in enumerate(lines, 1):
-            match = const_pattern.match(line.strip())
-            if match:
-                const_name, const_type, value, comment = match.groups()
-
-                if pattern and not re.search(pattern, const_name):
-                    continue
-
-                # Clean up value
-                value = value.strip()
-
-                # Parse numeric values
-                parsed_value = value
-                try:
-                    if "." in value:
-                        parsed_value = float(value)
-                    elif value.isdigit():
-                        parsed_value = int(value)
-                except ValueError:
-                    pass
-
-                relative_path = file_path.relative_to(self.repo_root)
-                constants[const_name] = GameConstant(
-                    name=const_name,
-                    value=parsed_value,
-                    type=const_type or "unknown",
-                    source_file=str(relative_path).replace("\\", "/"),
-                    line_number=line_num,
-                    comment=comment.strip() if comment else None,
-                )
+            constants[const_name] = GameConstant(
+                name=const_name,
+                value=value,
+                type=const_type or "unknown",
+                source_file=str(relative_path).replace("\\", "/"),
+                line_number=line_num,
+                comment=comment,
+            )
 
         return constants
 
 
+def diff_constants(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> List[tuple]:
+    """(file, name, old value, new value) for every added, removed or changed constant; None = absent."""
+    changes = []
+    for rel in sorted(set(old) | set(new)):
+        before, after = old.get(rel, {}), new.get(rel, {})
+        for name in sorted(set(before) | set(after)):
+            if before.get(name, None) != after.get(name, None) or (name in before) != (
+                name in after
+            ):
+                changes.append((rel, name, before.get(name), after.get(name)))
+    return changes
+
+
 class MechanicsDocGenerator:
     """Generate mechanics documentation with embedded game data."""
 
@@ -317,6 +467,7 @@ class MechanicsDocGenerator:
         mechanics = self.extract_all_data()
 
         # Save cache
+        self.extractor.save_cache()
         self.save_data_cache(mechanics)
         print(f"[OK] Saved data cache: {self.data_cache_file.relative_to(self.repo_root)}")
 
@@ -330,8 +481,13 @@ class MechanicsDocGenerator:
         """Check if docs are in sync with game code."""
         print("Checking documentation sync status...")
 
-        # Extract current data
+        # Extract current data (only changed files are re-scanned)
         current_mechanics = self.extract_all_data()
+        self.extractor.save_cache()
+        stats = self.extractor.stats
+        print(
+            f"Extraction: reused {stats['reused']}, re-hashed {stats['rehashed']}, scanned {stats['scanned']}"
+        )
 
         # Load cached data
         cached_data = self.load_data_cache()
@@ -375,6 +531,12 @@ def main():
     parser.add_argument(
         "--check", action="store_true", help="Check if docs are in sync (don't update)"
     )
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="List constants that changed between two git refs (nothing is checked out)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -389,6 +551,24 @@ def main():
 
     generator = MechanicsDocGenerator(repo_root, output_dir)
 
+    if args.diff:
+        old_ref, new_ref = args.diff
+        extractor = generator.extractor
+        try:
+            changes = diff_constants(
+                extractor.constants_at(old_ref), extractor.constants_at(new_ref)
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"ERROR: git {' '.join(e.cmd[1:])}: {e.stderr.decode(errors='replace').strip()}")
+            exit(2)
+        extractor.save_cache()
+        for rel, name, old, new in changes:
+            print(
+                f"{rel}: {name}: {'(absent)' if old is None else old} -> {'(absent)' if new is None else new}"
+            )
+        print(f"{len(changes)} constant(s) changed between {old_ref} and {new_ref}")
+        exit(0)
+
     if args.check:
         in_sync = generator.check_sync()
         exit(0 if in_sync else 1)
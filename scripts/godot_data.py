@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Shared loader for the godot/data JSON tree -- parsed once, reused from a cache.
+
+WHY THIS EXISTS. generate_action_taxonomy, audit_icons and the one-off tools
+each walked and re-parsed their slice of godot/data on every run (about 2 MB
+over 40 files). This module parses the whole tree into one DataPack and
+pickles it to .cache/godot_data.pickle (gitignored). The next process stats
+every file and reuses the parsed value when size and mtime match. If the stat changed it re-hashes the file, and re-parses only when the
+sha256 changed. A warm load is one unpickle plus a stat per file.
+
+The cache is dropped wholesale when this file changes (its sha256 is stored
+with it), so a change to the model never meets an old pickle. The stat
+rules and the pickle round-trip are tool_cache's, shared with search_index
+and generate_mechanics_docs. The pickle is only ever read from the repo's
+own gitignored .cache/ -- never point cache_path at a file someone else can
+write.
+
+Parsed values are shared between callers in a process: treat them as
+read-only (copy.deepcopy before editing).
+
+Usage (from a tool):
+    sys.path.insert(0, str(ROOT / "scripts"))
+    import godot_data
+    pack = godot_data.load()
+    mapping = pack.get("icon_mapping.json")
+    for f in pack.under("actions"): ...
+
+    python scripts/godot_data.py            # load, print what was reused / re-parsed
+    python scripts/godot_data.py --no-cache # cold parse, do not write the cache
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import tool_cache
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_ROOT = ROOT / "godot" / "data"
+CACHE_PATH = ROOT / ".cache" / "godot_data.pickle"
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DataFile:
+    """One parsed JSON file; data is None and error set when it does not parse."""
+
+    rel: str  # posix path relative to the pack root, e.g. "actions/core.json"
+    size: int
+    mtime_ns: int
+    sha256: str
+    parsed_ns: int
+    data: Any
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.rel.rsplit("/", 1)[-1]
+
+    @property
+    def stem(self) -> str:
+        return self.name.rsplit(".", 1)[0]
+
+
+class DataPack:
+    """Every *.json under a root, keyed by posix relative path, in sorted order."""
+
+    def __init__(self, root: Path, files: Dict[str, DataFile]):
+        self.root = Path(root)
+        self.files = dict(sorted(files.items()))
+        self.stats = {"reused": 0, "rehashed": 0, "parsed": 0}
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self.files
+
+    def file(self, rel: str) -> DataFile:
+        return self.files[rel]
+
+    def get(self, rel: str) -> Any:
+        """Parsed data of one file; KeyError if absent, ValueError if it is not valid JSON."""
+        entry = self.files[rel]
+        if entry.error is not None:
+            raise ValueError(f"{self.root / rel}: {entry.error}")
+        return entry.data
+
+    def under(self, directory: str, recursive: bool = False) -> List[DataFile]:
+        """Files in a directory (relative to the root), sorted by path."""
+        prefix = directory.strip("/") + "/" if directory.strip("/") else ""
+        return [
+            f
+            for rel, f in self.files.items()
+            if rel.startswith(prefix) and (recursive or "/" not in rel[len(prefix) :])
+        ]
+
+
+def _parse(path: Path, rel: str, stat: os.stat_result, raw: bytes, digest: str) -> DataFile:
+    try:
+        data, error = json.loads(raw.decode("utf-8")), None
+    except (UnicodeDecodeError, ValueError) as e:
+        data, error = None, str(e)
+    return DataFile(rel, stat.st_size, stat.st_mtime_ns, digest, time.time_ns(), data, error)
+
+
+def scan(root: Path, previous: Dict[str, DataFile]) -> DataPack:
+    """Build a pack for root, reusing previous entries whose files are unchanged."""
+    files: Dict[str, DataFile] = {}
+    stats = {"reused": 0, "rehashed": 0, "parsed": 0}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".json"):
+                continue
+            path = Path(dirpath) / filename
+            rel = path.relative_to(root).as_posix()
+            old = previous.get(rel)
+            record = None if old is None else (old.size, old.mtime_ns, old.parsed_ns)
+            stat, raw = tool_cache.read_if_changed(path, record)
+            if raw is None:
+                files[rel] = old
+                stats["reused"] += 1
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            if old is not None and old.sha256 == digest:
+                files[rel] = DataFile(
+                    rel, stat.st_size, stat.st_mtime_ns, digest, time.time_ns(), old.data, old.error
+                )
+                stats["rehashed"] += 1
+            else:
+                files[rel] = _parse(path, rel, stat, raw, digest)
+                stats["parsed"] += 1
+    pack = DataPack(root, files)
+    pack.stats = stats
+    return pack
+
+
+_LOADED: Dict[str, DataPack] = {}
+
+
+def load(
+    root: Path = DATA_ROOT, cache_path: Optional[Path] = CACHE_PATH, refresh: bool = False
+) -> DataPack:
+    """The pack for root (godot/data by default), memoised per process and cached on disk.
+
+    The default CACHE_PATH only ever holds godot/data; other roots (test
+    fixtures) are scanned fresh unless given their own cache_path.
+    cache_path=None disables the disk cache. refresh=True re-stats the files
+    even if this process already loaded them.
+    """
+    root = Path(root).resolve()
+    if not refresh and str(root) in _LOADED:
+        return _LOADED[str(root)]
+    persist = cache_path is not None and (
+        Path(cache_path) != CACHE_PATH or root == DATA_ROOT.resolve()
+    )
+    previous = _LOADED[str(root)].files if str(root) in _LOADED else {}
+    if persist and not previous:
+        previous = tool_cache.read(cache_path, CACHE_VERSION, __file__, root=str(root)).get(
+            "files", {}
+        )
+    pack = scan(root, previous)
+    if persist and (
+        pack.stats["parsed"] or pack.stats["rehashed"] or len(pack.files) != len(previous)
+    ):
+        tool_cache.write(
+            cache_path, CACHE_VERSION, __file__, {"root": str(root), "files": pack.files}
+        )
+    _LOADED[str(root)] = pack
+    return pack
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    started = time.perf_counter()
+    pack = load(cache_path=None if "--no-cache" in argv else CACHE_PATH)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    broken = [f.rel for f in pack.files.values() if f.error is not None]
+    print(
+        f"[godot_data] {len(pack.files)} files in {elapsed_ms:.0f} ms "
+        f"(reused {pack.stats['reused']}, re-hashed {pack.stats['rehashed']}, parsed {pack.stats['parsed']})"
+    )
+    for rel in broken:
+        print(f"[godot_data] NOT VALID JSON: {rel}: {pack.file(rel).error}")
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Historical-event impacts as a dense events x variables matrix, memory-mapped for balance queries.
+
+Layer: OBSERVE
+Invoked by: human
+
+WHY THIS EXISTS. Every record in godot/data/historical_events.json carries an
+`impacts` list of {variable, change, condition}. A balance question such as
+"what is the total cash swing of the 2022 funding_catastrophe events" used to
+mean an ad-hoc script that re-walked the 1.2 MB dict. This tool materialises
+the impacts once, with events/overrides/ applied exactly as the game applies
+them (compile_event_catalogue.load_overrides / apply_override). The result is
+a column per variable, plus a year vector and a category-index vector. It is
+written to .cache/impact_matrix.bin (gitignored) and read back through mmap,
+so a query touches only the columns it sums.
+
+The values are AUTHORED impacts (pre-mapping, pre-scale_factors); the game
+variables they become are in the compiled event catalogue. An impact with a
+`condition` lands in its own column, "<variable> if <condition>", so
+conditional swings never mix into the unconditional totals.
+
+BUNDLE LAYOUT (all little-endian):
+
+    b"PDIMPACT" | u32 header length | header JSON, padded to 8 bytes
+    years     int32[events]
+    category  uint16[events], padded to 8 bytes
+    matrix    float64[variables][events]   (column-major: one variable is contiguous)
+
+The header holds ids, variables, categories and the sha256 of every source
+file; load() rebuilds the bundle when any source changed.
+
+No NumPy: it is not a dependency of this repo, and at 1,194 x 10 the stdlib
+(mmap + memoryview.cast + itertools.compress) answers in well under a millisecond.
+
+Usage:
+    python scripts/impact_matrix.py build
+    python scripts/impact_matrix.py total cash --year 2022 --category funding_catastrophe
+    python scripts/impact_matrix.py by year cash
+    python scripts/impact_matrix.py what-if cash --scale 0.8 --negative   # scale every cash loss by 0.8
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+
+import compile_event_catalogue as cec
+
+ROOT = Path(__file__).resolve().parents[1]
+BUNDLE_PATH = ROOT / ".cache" / "impact_matrix.bin"
+MAGIC = b"PDIMPACT"
+FORMAT_VERSION = 1
+
+if sys.byteorder != "little":  # the bundle is little-endian and read by memoryview.cast
+    raise SystemExit("ERROR: impact_matrix.py assumes a little-endian host")
+
+
+def _pad8(n: int) -> int:
+    return (8 - n % 8) % 8
+
+
+def source_hashes(
+    events_path: Path = cec.EVENTS_PATH, overrides_dir: Path = cec.OVERRIDES_DIR
+) -> dict:
+    paths = [events_path] + sorted(overrides_dir.glob("*.json"))
+    return {cec._rel(p): hashlib.sha256(p.read_bytes()).hexdigest() for p in paths}
+
+
+def collect(events_path: Path = cec.EVENTS_PATH, overrides_dir: Path = cec.OVERRIDES_DIR) -> dict:
+    """Rows of (id, year, category, {column: change}) for every record the game keeps."""
+    overrides = cec.load_overrides(overrides_dir)
+    rows = []
+    for raw in cec.load_records(json.loads(events_path.read_text(encoding="utf-8"))):
+        source_id = str(raw.get("id", ""))
+        if source_id in overrides:
+            raw = cec.apply_override(raw, overrides[source_id])
+        if "id" not in raw or "title" not in raw:
+            continue  # _transform_event() drops these
+        changes = {}
+        for impact in raw.get("impacts") or []:
+            if not isinstance(impact, dict) or "variable" not in impact or "change" not in impact:
+                continue
+            column = impact["variable"]
+            if impact.get("condition") not in (None, ""):
+                column = f"{column} if {impact['condition']}"
+            changes[column] = changes.get(column, 0.0) + float(impact["change"])
+        year = int(raw["year"]) if "year" in raw else int(str(raw.get("date", "2017"))[:4] or 2017)
+        rows.append((str(raw["id"]), year, raw.get("category", "general"), changes))
+    return {"rows": rows, "sources": source_hashes(events_path, overrides_dir)}
+
+
+def build(
+    path: Path = BUNDLE_PATH,
+    events_path: Path = cec.EVENTS_PATH,
+    overrides_dir: Path = cec.OVERRIDES_DIR,
+) -> Path:
+    """Write the bundle for the current sources; returns its path."""
+    collected = collect(events_path, overrides_dir)
+    rows = collected["rows"]
+    variables = sorted({column for *_, changes in rows for column in changes})
+    categories = sorted({category for _id, _year, category, _changes in rows})
+    category_index = {name: i for i, name in enumerate(categories)}
+    header = json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "ids": [row[0] for row in rows],
+            "variables": variables,
+            "categories": categories,
+            "sources": collected["sources"],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    years = array("i", (row[1] for row in rows))
+    category = array("H", (category_index[row[2]] for row in rows))
+    matrix = array("d")
+    for variable in variables:
+        matrix.extend(row[3].get(variable, 0.0) for row in rows)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        head = MAGIC + struct.pack("<I", len(header)) + header
+        f.write(head + b"\0" * _pad8(len(head)))
+        f.write(years.tobytes())
+        f.write(category.tobytes() + b"\0" * _pad8(len(category) * 2))
+        f.write(matrix.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+class ImpactMatrix:
+    """Read-only view of a bundle: columns are memoryviews straight onto the mapped file."""
+
+    def __init__(self, path: Path = BUNDLE_PATH):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        if bytes(view[:8]) != MAGIC:
+            raise ValueError(f"{path}: not an impact matrix bundle")
+        (length,) = struct.unpack_from("<I", view, 8)
+        header = json.loads(bytes(view[12 : 12 + length]))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"{path}: bundle version {header.get('version')}, expected {FORMAT_VERSION}"
+            )
+        self.ids = header["ids"]
+        self.variables = header["variables"]
+        self.categories = header["categories"]
+        self.sources = header["sources"]
+        n = len(self.ids)
+        offset = 12 + length + _pad8(12 + length)
+        self.years = view[offset : offset + 4 * n].cast("i")
+        offset += 4 * n
+        self.category = view[offset : offset + 2 * n].cast("H")
+        offset += 2 * n + _pad8(2 * n)
+        self._matrix = view[offset : offset + 8 * n * len(self.variables)].cast("d")
+        self._column_index = {name: i for i, name in enumerate(self.variables)}
+        self._masks = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, variable: str) -> memoryview:
+        """The change of every event for one variable (zeros where it has none)."""
+        if variable not in self._column_index:
+            raise KeyError(f"no impacts on '{variable}' (have: {', '.join(self.variables)})")
+        n = len(self.ids)
+        start = self._column_index[variable] * n
+        return self._matrix[start : start + n]
+
+    def mask(self, year=None, category=None) -> bytes:
+        """One byte per event, 1 where it matches every given filter."""
+        key = (year, category)
+        if key not in self._masks:
+            category_id = self.categories.index(category) if category in self.categories else -1
+            self._masks[key] = bytes(
+                (year is None or y == year) and (category is None or c == category_id)
+                for y, c in zip(self.years, self.category)
+            )
+        return self._masks[key]
+
+    def total(self, variable: str, year=None, category=None) -> float:
+        column = self.column(variable)
+        if year is None and category is None:
+            return sum(column)
+        return sum(itertools.compress(column, self.mask(year, category)))
+
+    def totals(self, year=None, category=None) -> dict:
+        return {variable: self.total(variable, year, category) for variable in self.variables}
+
+    def by(self, key: str, variable: str) -> dict:
+        """Sum of one variable grouped by "year" or "category"."""
+        if key not in ("year", "category"):
+            raise ValueError("group by 'year' or 'category'")
+        groups = {}
+        labels = self.years if key == "year" else [self.categories[c] for c in self.category]
+        for label, change in zip(labels, self.column(variable)):
+            groups[label] = groups.get(label, 0.0) + change
+        return dict(sorted(groups.items()))
+
+    def what_if(
+        self, variable: str, scale: float, sign: int = 0, year=None, category=None
+    ) -> tuple:
+        """(before, after) total of variable if every change of the given sign (0 = all) is scaled."""
+        column = self.column(variable)
+        if year is not None or category is not None:
+            column = list(itertools.compress(column, self.mask(year, category)))
+        before = sum(column)
+        touched = sum(c for c in column if (sign == 0 or (c > 0) == (sign > 0)) and c)
+        return before, before - touched + touched * scale
+
+    def close(self) -> None:
+        for view in (self.years, self.category, self._matrix):
+            view.release()
+        self._map.close()
+
+
+def load(
+    path: Path = BUNDLE_PATH,
+    events_path: Path = cec.EVENTS_PATH,
+    overrides_dir: Path = cec.OVERRIDES_DIR,
+) -> ImpactMatrix:
+    """The bundle at path, rebuilt first if it is missing, unreadable or older than its sources."""
+    try:
+        matrix = ImpactMatrix(path)
+        if matrix.sources == source_hashes(events_path, overrides_dir):
+            return matrix
+        matrix.close()
+    except (OSError, ValueError):
+        pass
+    build(path, events_path, overrides_dir)
+    return ImpactMatrix(path)
+
+
+def _number(value: float) -> str:
+    return f"{value:+,.0f}" if float(value).is_integer() else f"{value:+,.2f}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Aggregate and what-if queries over historical-event impacts"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="(re)write the bundle")
+    for name in ("total", "what-if"):
+        query = sub.add_parser(name)
+        query.add_argument("variable", nargs="?" if name == "total" else None)
+        query.add_argument("--year", type=int)
+        query.add_argument("--category")
+        if name == "what-if":
+            query.add_argument("--scale", type=float, required=True)
+            direction = query.add_mutually_exclusive_group()
+            direction.add_argument("--negative", action="store_true", help="only scale losses")
+            direction.add_argument("--positive", action="store_true", help="only scale gains")
+    group = sub.add_parser("by")
+    group.add_argument("key", choices=["year", "category"])
+    group.add_argument("variable")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        started = time.perf_counter()
+        path = build()
+        matrix = ImpactMatrix(path)
+        print(
+            f"[impact_matrix] wrote {cec._rel(path)}: {len(matrix)} events x {len(matrix.variables)} variables "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        return 0
+
+    matrix = load()
+    try:
+        if args.command == "total":
+            variables = [args.variable] if args.variable else matrix.variables
+            for variable in variables:
+                print(
+                    f"{variable:<32} {_number(matrix.total(variable, args.year, args.category)):>12}"
+                )
+        elif args.command == "by":
+            for label, value in matrix.by(args.key, args.variable).items():
+                print(f"{label!s:<32} {_number(value):>12}")
+        else:
+            sign = -1 if args.negative else 1 if args.positive else 0
+            before, after = matrix.what_if(
+                args.variable, args.scale, sign, args.year, args.category
+            )
+            print(
+                f"{args.variable}: {_number(before)} -> {_number(after)} ({_number(after - before)})"
+            )
+    except KeyError as e:
+        print(f"ERROR: {e.args[0]}")
+        return 1
+    finally:
+        matrix.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
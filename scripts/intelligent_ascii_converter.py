@@ -20,6 +20,9 @@ import unicodedata
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import lint_engine  # noqa: E402  (shared single-walk file discovery)
+
 # Import our logging system
 try:
     from scripts.logging_system import LogCategory
@@ -517,28 +520,35 @@ class IntelligentASCIIConverter:
         """Process all relevant files in a directory."""
         results: Dict[str, List[str]] = {}
 
-        # File patterns to process
-        patterns = [
-            "*.md",
-            "*.txt",
-            "*.rst",
-            "*.py",
-            "*.json",
-            "*.yaml",
-            "*.yml",
-            "*.toml",
-            "*.cfg",
-            "*.ini",
-            "*.sh",
-            "*.bat",
-        ]
-
-        files_to_process: List[Path] = []
-        for pattern in patterns:
-            files_to_process.extend(directory.rglob(pattern))
+        # File types to process
+        suffixes = (
+            ".md",
+            ".txt",
+            ".rst",
+            ".py",
+            ".json",
+            ".yaml",
+            ".yml",
+            ".toml",
+            ".cfg",
+            ".ini",
+            ".sh",
+            ".bat",
+        )
 
-        # Exclude certain directories (kept for backwards compatibility, but .asciiignore is preferred)
-        exclude_dirs = {".git", "__pycache__", ".venv", "venv", "node_modules", ".pytest_cache"}
+        # Excluded directories are pruned from the walk (kept for backwards compatibility,
+        # but .asciiignore is preferred). One walk for every file type, instead of one
+        # rglob per pattern that each descended into .git.
+        exclude_dirs = {
+            ".git",
+            "__pycache__",
+            ".venv",
+            "venv",
+            "node_modules",
+            ".pytest_cache",
+            ".cache",
+        }
+        files_to_process = lint_engine.walk(directory, suffixes, prune=exclude_dirs)
 
         # SELF-EXEMPT: files whose non-ASCII is DATA, not prose -- the ASCII tooling's own
         # Unicode->ASCII mapping tables. Converting them corrupts their string literals
@@ -546,10 +556,6 @@ class IntelligentASCIIConverter:
         self_exempt_names = {"generate_dq_index.py", "intelligent_ascii_converter.py"}
 
         for file_path in files_to_process:
-            # Skip files in excluded directories (old method)
-            if any(excluded in file_path.parts for excluded in exclude_dirs):
-                continue
-
             # Never rewrite the ASCII tooling's own mapping-table files (see above).
             if file_path.name in self_exempt_names:
                 self.logger.debug(f"Skipping self-exempt tooling file: {file_path}")
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Single-pass lint engine: one walk, one read per file, every rule, results cached by content hash.
+
+Layer: PROVE
+Invoked by: human
+
+WHY THIS EXISTS. check_no_emoji walked godot/ four times (once per rule),
+check_scene_nav walked it again, and enforce_standards rglob'd the whole repo,
+.git included, once per file pattern. Each of them re-read the same files to
+run its own regexes. Here a check is a Rule: a set of file suffixes, a path
+filter and a check(rel, text) function returning findings. scan() walks the
+tree once, reads each file once and runs every rule that applies to it.
+Large batches go to a process pool.
+
+Results are cached per file in .cache/lint_engine.json under tool_cache's
+stat rules; a re-hashed file re-runs its rules only if the sha256 changed.
+Each rule's results are stored under a signature that hashes the source of
+the module defining it, so editing a rule re-runs that rule everywhere and
+nothing else.
+
+Every tool keeps its own report: a tool module exposes RULES and
+report(results) -> exit code, and `python scripts/lint_engine.py` runs all of
+them from one walk.
+
+Usage:
+    python scripts/lint_engine.py            # no-emoji + scene-nav + unicode report, one pass
+    python scripts/lint_engine.py --no-cache # ignore and do not write the cache
+"""
+
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import tool_cache
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_PATH = ROOT / ".cache" / "lint_engine.json"
+CACHE_VERSION = 1
+# Directories no rule ever wants to see.
+PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "node_modules",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".cache",
+    }
+)
+PARALLEL_MIN_FILES = 64  # below this a process pool costs more than it saves
+
+
+def _everywhere(rel: str) -> bool:
+    return True
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named check over files with one of `suffixes` that pass `include(rel)`.
+
+    check(rel, text) returns a list of findings, each a tuple of JSON scalars
+    (they go through the cache). rel is the posix path relative to the repo
+    root. Files that are not valid UTF-8 are skipped unless decode_errors is
+    "replace". check and include must be module-level functions so they can
+    be sent to worker processes.
+    """
+
+    name: str
+    suffixes: Tuple[str, ...]
+    check: Callable[[str, str], list]
+    include: Callable[[str], bool] = _everywhere
+    decode_errors: str = "strict"
+
+    def applies(self, rel: str) -> bool:
+        return rel.endswith(self.suffixes) and self.include(rel)
+
+
+_SIGNATURES: Dict[Rule, str] = {}
+
+
+def rule_signature(rule: Rule) -> str:
+    """name:sha of the module that defines the rule; changes whenever that module does."""
+    if rule not in _SIGNATURES:
+        module = sys.modules[rule.check.__module__]
+        source = Path(module.__file__).read_bytes()
+        _SIGNATURES[rule] = f"{rule.name}:{hashlib.sha256(source).hexdigest()[:16]}"
+    return _SIGNATURES[rule]
+
+
+def rel_of(path: Path) -> str:
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _walk(base: Path, suffixes: Tuple[str, ...], prune: frozenset):
+    """(path string, repo-relative posix path) of every matching file under base, sorted.
+
+    Builds the relative paths with string slicing: a Path.resolve() per file
+    cost more than the whole walk on the 10k-file tree.
+    """
+    base = str(Path(base).resolve())
+    base_rel = rel_of(Path(base))
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames[:] = sorted(d for d in dirnames if d not in prune)
+        sub = dirpath[len(base) + 1 :].replace(os.sep, "/")
+        prefix = "/".join(part for part in (base_rel, sub) if part)
+        for name in sorted(filenames):
+            if name.endswith(suffixes):
+                yield os.path.join(dirpath, name), f"{prefix}/{name}" if prefix else name
+
+
+def walk(base: Path, suffixes: Iterable[str], prune: Iterable[str] = PRUNE_DIRS) -> List[Path]:
+    """Every file under base ending in one of suffixes, sorted, in a single directory walk.
+
+    Paths are base joined with each file's path under it, so a relative base
+    yields relative paths and callers can relative_to() the base they passed.
+    """
+    resolved = len(str(Path(base).resolve())) + 1
+    return [
+        Path(base, path[resolved:]) for path, _rel in _walk(base, tuple(suffixes), frozenset(prune))
+    ]
+
+
+def _check_file(job):
+    """Worker: hash one file and run the rules whose results are not already known for that hash."""
+    path, rel, rules, known_sha = job
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if digest == known_sha:
+        return rel, digest, None
+    texts = {}
+    results = {}
+    for rule in rules:
+        if rule.decode_errors not in texts:
+            try:
+                texts[rule.decode_errors] = raw.decode("utf-8", errors=rule.decode_errors)
+            except UnicodeDecodeError:
+                texts[rule.decode_errors] = None
+        text = texts[rule.decode_errors]
+        findings = [] if text is None else rule.check(rel, text)
+        results[rule_signature(rule)] = [list(f) for f in findings]
+    return rel, digest, results
+
+
+def _load_cache(cache_path: Path) -> dict:
+    return tool_cache.read(cache_path, CACHE_VERSION, __file__).get("files", {})
+
+
+def _save_cache(cache_path: Path, files: dict) -> None:
+    tool_cache.write(cache_path, CACHE_VERSION, __file__, {"files": files})
+
+
+def scan(
+    rules: List[Rule],
+    paths: Optional[Iterable] = None,
+    base: Path = ROOT,
+    jobs: int = 0,
+    cache_path: Optional[Path] = CACHE_PATH,
+    stats: Optional[dict] = None,
+) -> Dict[str, List[tuple]]:
+    """Run rules over the given paths (or every file under base); findings per rule name, in path order.
+
+    jobs=1 keeps everything in-process; 0 means one worker per CPU once there
+    are PARALLEL_MIN_FILES files to check. cache_path=None disables the cache.
+    stats, if given, receives how many files were reused / re-hashed / checked.
+    """
+    suffixes = tuple(sorted({suffix for rule in rules for suffix in rule.suffixes}))
+    if paths is None:
+        files = list(_walk(base, suffixes, PRUNE_DIRS))
+    else:
+        files = sorted(
+            (str(p), rel_of(p)) for p in paths if str(p).endswith(suffixes) and Path(p).is_file()
+        )
+    cache = _load_cache(cache_path) if cache_path is not None else {}
+    counts = {"reused": 0, "rehashed": 0, "checked": 0}
+    dirty = False
+
+    order = []  # (rel, applicable rules)
+    todo = []
+    stat_of = {}
+    for path, rel in files:
+        applicable = [rule for rule in rules if rule.applies(rel)]
+        if not applicable:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        order.append((rel, applicable))
+        stat_of[rel] = stat
+        entry = cache.get(rel)
+        missing = [
+            r for r in applicable if entry is None or rule_signature(r) not in entry["results"]
+        ]
+        if (
+            entry is not None
+            and not missing
+            and tool_cache.is_unchanged(stat, entry["size"], entry["mtime_ns"], entry["checked_ns"])
+        ):
+            counts["reused"] += 1
+            continue
+        known_sha = entry["sha256"] if entry is not None and not missing else None
+        todo.append((path, rel, applicable, known_sha))
+
+    workers = min(jobs or os.cpu_count() or 1, len(todo))
+    if len(todo) >= PARALLEL_MIN_FILES and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_check_file, todo, chunksize=16))
+    else:
+        done = [_check_file(job) for job in todo]
+
+    for rel, digest, results in done:
+        stat = stat_of[rel]
+        entry = cache.get(rel)
+        if results is None:
+            counts["rehashed"] += 1
+            merged = entry["results"]
+        else:
+            counts["checked"] += 1
+            merged = (
+                dict(entry["results"]) if entry is not None and entry["sha256"] == digest else {}
+            )
+            names = {sig.split(":", 1)[0] for sig in results}
+            merged = {sig: f for sig, f in merged.items() if sig.split(":", 1)[0] not in names}
+            merged.update(results)
+        cache[rel] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "checked_ns": time.time_ns(),
+            "sha256": digest,
+            "results": merged,
+        }
+        dirty = True
+
+    if paths is None:  # a full walk: forget files under base that are gone
+        prefix = rel_of(base).rstrip("/") + "/" if rel_of(base) else ""
+        seen = {rel for _path, rel in files}
+        for rel in [
+            rel
+            for rel in cache
+            if rel.startswith(prefix) and rel.endswith(suffixes) and rel not in seen
+        ]:
+            del cache[rel]
+            dirty = True
+    if cache_path is not None and dirty:
+        _save_cache(cache_path, cache)
+    if stats is not None:
+        stats.update(counts)
+
+    findings: Dict[str, List[tuple]] = {rule.name: [] for rule in rules}
+    for rel, applicable in order:
+        for rule in applicable:
+            findings[rule.name].extend(
+                tuple(f) for f in cache[rel]["results"][rule_signature(rule)]
+            )
+    return findings
+
+
+def _tools():
+    """The tool modules whose RULES / report() the one-pass run combines, in report order."""
+    sys.path.insert(0, str(ROOT / "tools"))
+    import check_no_emoji
+    import check_scene_nav
+    import enforce_standards
+
+    return [check_no_emoji, check_scene_nav, enforce_standards]
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    tools = _tools()
+    started = time.perf_counter()
+    stats: dict = {}
+    findings = scan(
+        [rule for tool in tools for rule in tool.RULES],
+        cache_path=None if "--no-cache" in argv else CACHE_PATH,
+        stats=stats,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    status = 0
+    for tool in tools:
+        status |= tool.report({rule.name: findings[rule.name] for rule in tool.RULES})
+    print(
+        f"[lint_engine] one pass in {elapsed_ms:.0f} ms (reused {stats['reused']}, "
+        f"re-hashed {stats['rehashed']}, checked {stats['checked']})"
+    )
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
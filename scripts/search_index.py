@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Full-text and faceted search over the event, action and researcher catalogues.
+
+Layer: OBSERVE
+Invoked by: human
+
+WHY THIS EXISTS. "Which events touch cash in 2022?", "which actions cost
+attention?", "where does the word clawback appear?" were all answered by
+grepping JSON. This indexes every record of:
+
+    historical_events.json (with events/overrides/ applied, as the game does)
+    events/core_events.json, events/risk_events.json, events/conferences.json
+    actions/*.json
+    researchers/quirks.json
+
+into one document list. Each document gets an inverted index entry (token ->
+documents) and facets for kind, year, category, rarity and variable, all
+stored as int bitmaps. A query is an AND of bitmaps; a token that matches
+nothing exactly matches every indexed token it prefixes.
+
+Building is incremental. Files are read through the shared godot_data cache,
+and the assembled index is pickled to .cache/search_index.pickle (gitignored)
+together with the sha256 of every source. Only the sources whose hash
+changed are re-extracted; a change to this file drops the pickle (the
+round-trip is tool_cache's, shared with godot_data). Queries on a loaded
+index take tens of microseconds.
+
+Usage:
+    python scripts/search_index.py clawback
+    python scripts/search_index.py ftx --year 2022 --category funding_catastrophe
+    python scripts/search_index.py --kind action --variable attention
+    python scripts/search_index.py --facets category       # value counts for a facet
+
+From Python:
+    import search_index
+    index = search_index.load()
+    for doc in index.search("alignment tax", variable="doom"): ...
+"""
+
+import argparse
+import bisect
+import copy
+import re
+import sys
+import time
+from pathlib import Path
+
+import compile_event_catalogue as cec
+import godot_data
+import tool_cache
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_PATH = ROOT / ".cache" / "search_index.pickle"
+CACHE_VERSION = 1
+FACETS = ("kind", "year", "category", "rarity", "variable")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Dicts under these keys name game variables ("effects": {"money": ...}).
+VARIABLE_KEYS = ("effects", "costs", "gains")
+
+
+def tokens(text: str) -> list:
+    return TOKEN_RE.findall(text.lower())
+
+
+def _strings(value):
+    """Every string in a JSON value, keys starting with "_" (metadata) skipped."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if not str(key).startswith("_"):
+                yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def _variables(value) -> set:
+    found = set()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in VARIABLE_KEYS and isinstance(item, dict):
+                found.update(k for k in item if not k.startswith("_"))
+            elif key == "impacts" and isinstance(item, list):
+                found.update(i["variable"] for i in item if isinstance(i, dict) and "variable" in i)
+            found |= _variables(item)
+    elif isinstance(value, list):
+        for item in value:
+            found |= _variables(item)
+    return found
+
+
+def _doc(kind, record, rel, title_key="name", **facets) -> dict:
+    record_id = str(record.get("id", ""))
+    return {
+        "key": f"{kind}:{record_id}",
+        "kind": kind,
+        "id": record_id,
+        "title": str(record.get(title_key, record_id)),
+        "file": rel,
+        "year": facets.get("year"),
+        "category": facets.get("category"),
+        "rarity": facets.get("rarity"),
+        "variables": sorted(_variables(record)),
+        "tokens": sorted(set(tokens(record_id)) | {t for s in _strings(record) for t in tokens(s)}),
+    }
+
+
+def _historical(pack, rels):
+    events_rel, *override_rels = rels
+    overrides = {}
+    for rel in override_rels:
+        data = pack.get(rel)
+        if isinstance(data, dict):
+            overrides.update((k, v) for k, v in data.items() if not k.startswith("_"))
+    docs = []
+    for raw in cec.load_records(copy.deepcopy(pack.get(events_rel))):
+        source_id = str(raw.get("id", ""))
+        if source_id in overrides:
+            raw = cec.apply_override(raw, overrides[source_id])
+        if "id" not in raw or "title" not in raw:
+            continue
+        year = int(raw["year"]) if "year" in raw else None
+        docs.append(
+            _doc(
+                "historical",
+                raw,
+                events_rel,
+                "title",
+                year=year,
+                category=raw.get("category", "general"),
+                rarity=raw.get("rarity", "common"),
+            )
+        )
+    return docs
+
+
+def _core_events(pack, rels):
+    return [
+        _doc("event", e, rels[0], category=e.get("trigger_type"))
+        for e in pack.get(rels[0]).get("events", [])
+    ]
+
+
+def _risk_events(pack, rels):
+    docs = []
+    for pool, severities in pack.get(rels[0]).get("pools", {}).items():
+        for severity, events in severities.items():
+            docs.extend(
+                _doc("risk_event", e, rels[0], category=pool, rarity=severity) for e in events
+            )
+    return docs
+
+
+def _conferences(pack, rels):
+    return [_doc("conference", c, rels[0]) for c in pack.get(rels[0]).get("conferences", [])]
+
+
+def _actions(pack, rels):
+    docs = []
+    for rel in rels:
+        for action in pack.get(rel).get("actions", []) or []:
+            docs.append(_doc("action", action, rel, category=action.get("category")))
+    return docs
+
+
+def _quirks(pack, rels):
+    quirks = pack.get(rels[0]).get("quirks", {})
+    return [
+        _doc("quirk", dict(q, id=quirk_id), rels[0], category=q.get("valence"))
+        for quirk_id, q in quirks.items()
+        if not quirk_id.startswith("_")
+    ]
+
+
+def sources(pack) -> list:
+    """(name, [rel paths in the pack], extractor); a source re-extracts when any of its files change."""
+    overrides = [f.rel for f in pack.under("events/overrides")]
+    actions = [f.rel for f in pack.under("actions") if f.name != "risk_contributions.json"]
+    return [
+        ("historical", ["historical_events.json"] + overrides, _historical),
+        ("core_events", ["events/core_events.json"], _core_events),
+        ("risk_events", ["events/risk_events.json"], _risk_events),
+        ("conferences", ["events/conferences.json"], _conferences),
+        ("actions", actions, _actions),
+        ("quirks", ["researchers/quirks.json"], _quirks),
+    ]
+
+
+class SearchIndex:
+    """Documents plus int bitmaps: bit i of a bitmap is document i."""
+
+    def __init__(self, docs: list):
+        self.docs = docs
+        self.postings = {}
+        self.facets = {facet: {} for facet in FACETS}
+        for i, doc in enumerate(docs):
+            bit = 1 << i
+            for token in doc["tokens"]:
+                self.postings[token] = self.postings.get(token, 0) | bit
+            for facet in ("kind", "year", "category", "rarity"):
+                if doc[facet] is not None:
+                    self.facets[facet][doc[facet]] = self.facets[facet].get(doc[facet], 0) | bit
+            for variable in doc["variables"]:
+                self.facets["variable"][variable] = self.facets["variable"].get(variable, 0) | bit
+        self.vocabulary = sorted(self.postings)
+        self.all = (1 << len(docs)) - 1
+        self._prefixes = {}
+
+    def _token_bits(self, token: str) -> int:
+        if token in self.postings:
+            return self.postings[token]
+        if token not in self._prefixes:
+            bits = 0
+            i = bisect.bisect_left(self.vocabulary, token)
+            while i < len(self.vocabulary) and self.vocabulary[i].startswith(token):
+                bits |= self.postings[self.vocabulary[i]]
+                i += 1
+            self._prefixes[token] = bits
+        return self._prefixes[token]
+
+    def match(self, text: str = "", **facets) -> int:
+        """Bitmap of the documents containing every token of text and every given facet value."""
+        bits = self.all
+        for token in tokens(text):
+            bits &= self._token_bits(token)
+        for facet, value in facets.items():
+            if facet not in self.facets:
+                raise ValueError(f"unknown facet '{facet}' (have: {', '.join(FACETS)})")
+            if value is not None:
+                bits &= self.facets[facet].get(value, 0)
+        return bits
+
+    def search(self, text: str = "", limit: int = 0, **facets) -> list:
+        """Matching documents in index order (historical corpus order first)."""
+        bits = self.match(text, **facets)
+        found = []
+        while bits and (not limit or len(found) < limit):
+            low = bits & -bits
+            found.append(self.docs[low.bit_length() - 1])
+            bits ^= low
+        return found
+
+    def count(self, text: str = "", **facets) -> int:
+        return self.match(text, **facets).bit_count()
+
+    def facet_counts(self, facet: str, text: str = "", **facets) -> dict:
+        bits = self.match(text, **facets)
+        counts = {
+            value: (bits & value_bits).bit_count()
+            for value, value_bits in self.facets[facet].items()
+        }
+        return dict(
+            sorted(
+                ((v, n) for v, n in counts.items() if n), key=lambda item: (-item[1], str(item[0]))
+            )
+        )
+
+
+def load(
+    data_root: Path = godot_data.DATA_ROOT, cache_path=CACHE_PATH, stats: dict = None
+) -> SearchIndex:
+    """The index over data_root, re-extracting only the sources whose files changed.
+
+    As with godot_data.load, the default CACHE_PATH only ever holds godot/data;
+    other roots are indexed fresh unless given their own cache_path.
+    stats, if given, receives the names of the re-extracted sources.
+    """
+    root = Path(data_root).resolve()
+    pack = godot_data.load(root)
+    persist = cache_path is not None and (
+        Path(cache_path) != CACHE_PATH or root == godot_data.DATA_ROOT.resolve()
+    )
+    cached = tool_cache.read(cache_path, CACHE_VERSION, __file__, root=str(root)) if persist else {}
+    previous = cached.get("sources", {})
+    current = {}
+    rebuilt = []
+    for name, rels, extract in sources(pack):
+        digest = [(rel, pack.file(rel).sha256) for rel in rels if rel in pack]
+        if name in previous and previous[name]["digest"] == digest:
+            current[name] = previous[name]
+            continue
+        docs = (
+            extract(pack, [rel for rel in rels if rel in pack]) if rels and rels[0] in pack else []
+        )
+        current[name] = {"digest": digest, "docs": docs}
+        rebuilt.append(name)
+    if stats is not None:
+        stats["rebuilt"] = rebuilt
+    if not rebuilt and list(previous) == list(current) and "index" in cached:
+        return cached["index"]
+    index = SearchIndex([doc for source in current.values() for doc in source["docs"]])
+    if persist:
+        tool_cache.write(
+            cache_path,
+            CACHE_VERSION,
+            __file__,
+            {"root": str(root), "sources": current, "index": index},
+        )
+    return index
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Search the event, action and researcher catalogues"
+    )
+    parser.add_argument("text", nargs="*", help="words that must all appear (prefixes match)")
+    parser.add_argument(
+        "--kind", help="historical / event / risk_event / conference / action / quirk"
+    )
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--category")
+    parser.add_argument("--rarity")
+    parser.add_argument("--variable", help="an affected game variable, e.g. cash or doom")
+    parser.add_argument(
+        "--facets", choices=FACETS, help="print value counts for this facet instead"
+    )
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    stats: dict = {}
+    index = load(stats=stats)
+    text = " ".join(args.text)
+    filters = {
+        "kind": args.kind,
+        "year": args.year,
+        "category": args.category,
+        "rarity": args.rarity,
+        "variable": args.variable,
+    }
+    started = time.perf_counter()
+    if args.facets:
+        results = index.facet_counts(args.facets, text, **filters)
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        for value, count in results.items():
+            print(f"{count:>6}  {value}")
+    else:
+        total = index.count(text, **filters)
+        docs = index.search(text, limit=args.limit, **filters)
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        for doc in docs:
+            year = doc["year"] if doc["year"] is not None else ""
+            print(f"{doc['key']:<56} {year!s:<5} {doc['category'] or '':<32} {doc['title']}")
+        if total > len(docs):
+            print(f"... {total - len(docs)} more (--limit)")
+    rebuilt = ", ".join(stats["rebuilt"]) or "none"
+    print(
+        f"[search_index] {len(index.docs)} documents; query {elapsed_us:.0f} us; re-extracted: {rebuilt}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
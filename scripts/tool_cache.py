@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Shared plumbing for the scripts that cache per-file work under .cache/.
+
+WHY THIS EXISTS. godot_data, search_index and generate_mechanics_docs each
+memoise work per source file, and each had grown its own copy of the same
+three pieces: trust a file whose size and mtime match a record taken long
+enough after its last write, re-hash it otherwise; drop the whole cache when
+the tool's own source changes (its sha256 is stored with the payload); and
+write the payload to a temp file then os.replace it. One copy lives here so
+the invalidation rules cannot drift apart.
+
+What a tool keeps per file (which hash, what it derived) stays in the tool.
+This module only answers "can I trust this record without reading the file?"
+and round-trips the payload. The format follows the cache file's suffix:
+.json is JSON (sorted keys, diffable), anything else is a pickle. A pickle is
+only ever read from the repo's own gitignored .cache/ -- never point a cache
+path at a file someone else can write.
+
+Usage (from a tool):
+    import tool_cache
+    cached = tool_cache.read(CACHE_PATH, CACHE_VERSION, __file__, root=str(root))
+    stat, raw = tool_cache.read_if_changed(path, (old.size, old.mtime_ns, old.checked_ns))
+    if raw is None: ...reuse old...
+    tool_cache.write(CACHE_PATH, CACHE_VERSION, __file__, {"root": str(root), "files": files})
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+RACY_MTIME_NS = 2_000_000_000  # files modified this close to their record are re-read
+
+# what a truncated, foreign or stale-class pickle (or bad JSON) raises on load
+_READ_ERRORS = (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError)
+
+
+@functools.lru_cache(maxsize=None)
+def _digest(tool: str) -> str:
+    return hashlib.sha256(Path(tool).read_bytes()).hexdigest()
+
+
+def tool_digest(tool) -> str:
+    """sha256 of a tool's source file, memoised per process."""
+    return _digest(str(Path(tool).resolve()))
+
+
+def is_unchanged(stat: os.stat_result, size: int, mtime_ns: int, checked_ns: int) -> bool:
+    """Whether a record of (size, mtime_ns) taken at checked_ns still describes the file.
+
+    A record taken within RACY_MTIME_NS of the file's mtime is never trusted:
+    a second write in the same mtime tick would otherwise go unnoticed.
+    """
+    return (
+        stat.st_size == size
+        and stat.st_mtime_ns == mtime_ns
+        and checked_ns - mtime_ns > RACY_MTIME_NS
+    )
+
+
+def read_if_changed(
+    path, record: Optional[Tuple[int, int, int]] = None
+) -> Tuple[os.stat_result, Optional[bytes]]:
+    """(stat, raw) for a file: raw is None when record (size, mtime_ns, checked_ns)
+    can be trusted, else the file's bytes for the caller to re-hash."""
+    stat = os.stat(path)
+    if record is not None and is_unchanged(stat, *record):
+        return stat, None
+    with open(path, "rb") as f:
+        return stat, f.read()
+
+
+def _is_json(cache_path: Path) -> bool:
+    return cache_path.suffix == ".json"
+
+
+def read(cache_path, version: int, tool, **identity) -> Dict[str, Any]:
+    """The payload written by write(), or {} when missing, unreadable, from another
+    cache version or tool revision, or when any identity key does not match."""
+    cache_path = Path(cache_path)
+    try:
+        if _is_json(cache_path):
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        else:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+    except _READ_ERRORS:
+        return {}
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != version
+        or cached.get("tool") != tool_digest(tool)
+        or any(cached.get(key) != value for key, value in identity.items())
+    ):
+        return {}
+    return cached
+
+
+def write(cache_path, version: int, tool, payload: Dict[str, Any]) -> None:
+    """Atomically replace the cache with payload, stamped with version and the tool's digest."""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+    stamped = dict(payload, version=version, tool=tool_digest(tool))
+    if _is_json(cache_path):
+        tmp_path.write_text(json.dumps(stamped, sort_keys=True), encoding="utf-8")
+    else:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(stamped, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
@@ -5,9 +5,17 @@ Historical Data Validation Script
 Validates all historical timeline data before builds/releases.
 Ensures data integrity and game compatibility.
 
+Results are cached per file in .cache/validate_historical_data.json (through
+tool_cache), keyed by the file's sha256 and the sha256 of the schema it is
+checked against; a warm run over unchanged data does no parsing at all. Each
+schema's Draft7Validator is built once per process, and large batches of
+stale files are spread over a process pool.
+
 Usage:
     python scripts/validate_historical_data.py
     python scripts/validate_historical_data.py --verbose
+    python scripts/validate_historical_data.py --no-cache
+    python scripts/validate_historical_data.py --jobs 4
     python scripts/validate_historical_data.py --fix
 
 Exit codes:
@@ -16,12 +24,18 @@ Exit codes:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import tool_cache
+
 try:
     from jsonschema import Draft7Validator
 
@@ -43,6 +57,12 @@ class Colors:
 
 # Cache for loaded schemas
 _SCHEMA_CACHE: Dict[str, Dict] = {}
+# Compiled validators, one per schema per process
+_VALIDATOR_CACHE: Dict[str, "Draft7Validator"] = {}
+
+CACHE_PATH = Path(".cache/validate_historical_data.json")
+CACHE_VERSION = 1
+PARALLEL_MIN_FILES = 32  # fewer stale files than this are validated in-process
 
 
 def load_schema(schema_name: str) -> Optional[Dict]:
@@ -80,7 +100,9 @@ def validate_with_schema(data: Dict, schema_name: str, file_path: Path) -> List[
         return errors
 
     try:
-        validator = Draft7Validator(schema)
+        validator = _VALIDATOR_CACHE.get(schema_name)
+        if validator is None:
+            validator = _VALIDATOR_CACHE[schema_name] = Draft7Validator(schema)
         validation_errors = list(validator.iter_errors(data))
 
         for error in validation_errors:
@@ -315,89 +337,181 @@ def validate_organization_file(file_path: Path) -> List[str]:
     return errors
 
 
-def run_validation(verbose: bool = False) -> Tuple[int, int, List[str]]:
+# (section title, validator kind, directories); files are validated in this order
+SECTIONS = [
+    (
+        "timeline events",
+        "timeline",
+        [Path("shared/data/historical_timeline"), Path("godot/data/historical_timeline")],
+    ),
+    (
+        "researcher profiles",
+        "researcher",
+        [Path("shared/data/researchers"), Path("godot/data/researchers")],
+    ),
+    (
+        "organizations",
+        "organization",
+        [Path("shared/data/organizations"), Path("godot/data/organizations")],
+    ),
+]
+
+FILE_VALIDATORS = {
+    "timeline": validate_timeline_file,
+    "researcher": validate_researcher_file,
+    "organization": validate_organization_file,
+}
+
+# Schema each kind is checked against (None = hand-written checks only)
+KIND_SCHEMAS = {"timeline": None, "researcher": "researcher", "organization": "organization"}
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def schema_key(kind: str) -> str:
+    """What a cached result for this kind depends on besides the file itself"""
+    schema_name = KIND_SCHEMAS[kind]
+    if schema_name is None:
+        return "none"
+    if not HAS_JSONSCHEMA:
+        return "no-jsonschema"
+    schema_path = Path("shared/schemas") / f"{schema_name}.schema.json"
+    return file_sha256(schema_path) if schema_path.exists() else "missing"
+
+
+class ValidationCache:
+    """Per-file validation results, valid while (file, schema, script) hashes match"""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = tool_cache.read(self.path, CACHE_VERSION, __file__).get(
+            "files", {}
+        )
+        self.dirty = False
+
+    def lookup(self, path: Path, schema: str) -> Optional[List[str]]:
+        """Cached errors for an unchanged file, or None if it must be revalidated"""
+        entry = self.entries.get(path.as_posix())
+        if entry is None or entry["schema"] != schema:
+            return None
+        _stat, raw = tool_cache.read_if_changed(
+            path, (entry["size"], entry["mtime_ns"], entry["checked_ns"])
+        )
+        if raw is None:
+            return entry["errors"]
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            return None
+        self.store(path, schema, entry["sha256"], entry["errors"])  # touched, not changed
+        return entry["errors"]
+
+    def store(self, path: Path, schema: str, digest: str, errors: List[str]) -> None:
+        stat = path.stat()
+        self.entries[path.as_posix()] = {
+            "sha256": digest,
+            "schema": schema,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "checked_ns": time.time_ns(),
+            "errors": errors,
+        }
+        self.dirty = True
+
+    def prune(self, keep: List[Path]) -> None:
+        """Forget files that are no longer validated (deleted or moved)"""
+        live = {p.as_posix() for p in keep}
+        for name in [n for n in self.entries if n not in live]:
+            del self.entries[name]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        tool_cache.write(self.path, CACHE_VERSION, __file__, {"files": self.entries})
+        self.dirty = False
+
+
+def _validate_path(kind: str, path: Path) -> Tuple[str, List[str]]:
+    """Hash then validate one file (module level so a process pool can run it)"""
+    return file_sha256(path), FILE_VALIDATORS[kind](path)
+
+
+def collect_files() -> List[Tuple[str, str, Path]]:
+    """(section title, kind, path) for every file to validate, in report order"""
+    files = []
+    for title, kind, dirs in SECTIONS:
+        for data_dir in dirs:
+            if data_dir.exists():
+                files.extend((title, kind, path) for path in sorted(data_dir.glob("*.json")))
+    return files
+
+
+def run_validation(
+    verbose: bool = False,
+    use_cache: bool = True,
+    jobs: Optional[int] = None,
+    cache_path: Path = CACHE_PATH,
+) -> Tuple[int, int, List[str]]:
     """
-    Run all validation checks
+    Run all validation checks, revalidating only files whose cache key changed
 
     Returns:
         (total_files, files_with_errors, all_errors)
     """
+    files = collect_files()
+    cache = ValidationCache(cache_path) if use_cache else None
+    schemas = {kind: schema_key(kind) for kind in FILE_VALIDATORS}
+
+    results: Dict[Path, Optional[List[str]]] = {}  # report order
+    stale = []
+    for _, kind, path in files:
+        cached = cache.lookup(path, schemas[kind]) if cache else None
+        results[path] = cached
+        if cached is None:
+            stale.append((kind, path))
+
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    if workers > 1 and len(stale) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(
+                pool.map(_validate_path, [k for k, _ in stale], [p for _, p in stale], chunksize=8)
+            )
+    else:
+        outcomes = [_validate_path(kind, path) for kind, path in stale]
+    for (kind, path), (digest, errors) in zip(stale, outcomes):
+        results[path] = errors
+        if cache:
+            cache.store(path, schemas[kind], digest, errors)
+
+    if cache:
+        cache.prune([path for _, _, path in files])
+        cache.save()
+    if verbose and files:
+        print(f"  {len(files) - len(stale)} cached, {len(stale)} validated")
+
     all_errors = []
-    total_files = 0
     files_with_errors = 0
-
-    # Validate timeline events
-    print(f"{Colors.BLUE}Validating timeline events...{Colors.RESET}")
-    timeline_dirs = [
-        Path("shared/data/historical_timeline"),
-        Path("godot/data/historical_timeline"),
-    ]
-
-    for timeline_dir in timeline_dirs:
-        if not timeline_dir.exists():
-            if verbose:
-                print(f"  {Colors.YELLOW}Skipping {timeline_dir} (not found){Colors.RESET}")
-            continue
-
-        for year_file in sorted(timeline_dir.glob("*.json")):
-            total_files += 1
-            errors = validate_timeline_file(year_file)
-            if errors:
-                files_with_errors += 1
-                all_errors.extend(errors)
-                if verbose:
-                    print(
-                        f"  {Colors.RED}[X] {year_file.name}: {len(errors)} error(s){Colors.RESET}"
-                    )
-            else:
-                if verbose:
-                    print(f"  {Colors.GREEN}[OK] {year_file.name}{Colors.RESET}")
-
-    # Validate researchers
-    print(f"{Colors.BLUE}Validating researcher profiles...{Colors.RESET}")
-    researcher_dirs = [Path("shared/data/researchers"), Path("godot/data/researchers")]
-
-    for researcher_dir in researcher_dirs:
-        if not researcher_dir.exists():
-            if verbose:
-                print(f"  {Colors.YELLOW}Skipping {researcher_dir} (not found){Colors.RESET}")
-            continue
-
-        for file in sorted(researcher_dir.glob("*.json")):
-            total_files += 1
-            errors = validate_researcher_file(file)
-            if errors:
-                files_with_errors += 1
-                all_errors.extend(errors)
-                if verbose:
-                    print(f"  {Colors.RED}[X] {file.name}: {len(errors)} error(s){Colors.RESET}")
-            else:
-                if verbose:
-                    print(f"  {Colors.GREEN}[OK] {file.name}{Colors.RESET}")
-
-    # Validate organizations
-    print(f"{Colors.BLUE}Validating organizations...{Colors.RESET}")
-    org_dirs = [Path("shared/data/organizations"), Path("godot/data/organizations")]
-
-    for org_dir in org_dirs:
-        if not org_dir.exists():
-            if verbose:
-                print(f"  {Colors.YELLOW}Skipping {org_dir} (not found){Colors.RESET}")
-            continue
-
-        for file in sorted(org_dir.glob("*.json")):
-            total_files += 1
-            errors = validate_organization_file(file)
-            if errors:
-                files_with_errors += 1
-                all_errors.extend(errors)
-                if verbose:
-                    print(f"  {Colors.RED}[X] {file.name}: {len(errors)} error(s){Colors.RESET}")
-            else:
+    for title, _, dirs in SECTIONS:
+        print(f"{Colors.BLUE}Validating {title}...{Colors.RESET}")
+        for data_dir in dirs:
+            if not data_dir.exists():
                 if verbose:
-                    print(f"  {Colors.GREEN}[OK] {file.name}{Colors.RESET}")
-
-    return total_files, files_with_errors, all_errors
+                    print(f"  {Colors.YELLOW}Skipping {data_dir} (not found){Colors.RESET}")
+                continue
+            for path in [p for p in results if p.parent == data_dir]:
+                errors = results[path]
+                if errors:
+                    files_with_errors += 1
+                    all_errors.extend(errors)
+                    if verbose:
+                        print(
+                            f"  {Colors.RED}[X] {path.name}: {len(errors)} error(s){Colors.RESET}"
+                        )
+                elif verbose:
+                    print(f"  {Colors.GREEN}[OK] {path.name}{Colors.RESET}")
+
+    return len(files), files_with_errors, all_errors
 
 
 def main():
@@ -408,6 +522,12 @@ def main():
     parser.add_argument(
         "--fix", action="store_true", help="Attempt to fix common issues (future feature)"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help=f"Revalidate every file (ignore {CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Worker processes for stale files (default: CPUs)"
+    )
     args = parser.parse_args()
 
     print(f"{Colors.BOLD}=== P(Doom) Historical Data Validation ==={Colors.RESET}\n")
@@ -421,7 +541,9 @@ def main():
         )
     print()
 
-    total_files, files_with_errors, all_errors = run_validation(args.verbose)
+    total_files, files_with_errors, all_errors = run_validation(
+        args.verbose, use_cache=not args.no_cache, jobs=args.jobs
+    )
 
     print()
 
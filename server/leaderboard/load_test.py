@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Load test for the leaderboard service: POST throughput and latency.
+
+Starts a local score_service instance on an ephemeral port with a throwaway
+data dir (or targets --url), then drives it with concurrent keep-alive
+clients, each submitting unique entries across a handful of boards. Prints
+submits/second and latency percentiles, then checks that every board file
+on disk matches a fresh GET after compaction.
+
+Usage:
+    python server/leaderboard/load_test.py
+    python server/leaderboard/load_test.py --submits 20000 --clients 64 --boards 8 --seed 7
+    python server/leaderboard/load_test.py --url http://127.0.0.1:8081/score_api.php --token ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from score_service import (  # noqa: E402  (sibling module; sys.path just set)
+    BoardStore,
+    ScoreService,
+)
+
+TOKEN = "load-test-token"
+
+
+class Client:
+    """Minimal keep-alive HTTP/1.1 client over asyncio streams."""
+
+    def __init__(self, host: str, port: int, path: str):
+        self.host, self.port, self.path = host, port, path
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(
+        self, method: str, target: str, body: bytes = b"", headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Any]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        extra = "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+        self.writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: {self.host}\r\n{extra}"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ")[1])
+        length = 0
+        for line in head[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        payload = await self.reader.readexactly(length) if length else b""
+        return status, json.loads(payload) if payload else None
+
+    async def post(self, entry: Dict[str, Any], token: str) -> Tuple[int, Any]:
+        return await self.request(
+            "POST",
+            self.path,
+            json.dumps(entry).encode(),
+            {"X-PDoom-Token": token, "Content-Type": "application/json"},
+        )
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def run_load(
+    host: str,
+    port: int,
+    path: str,
+    token: str,
+    submits: int,
+    clients: int,
+    boards: int,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Fire `submits` POSTs from `clients` concurrent connections; return timing stats."""
+    rng = Random(seed)
+    entries = [
+        {
+            "seed": f"load-{i % boards}",
+            "version": "v-load",
+            "score": rng.randint(1, 500),
+            "doom_integral": rng.randint(0, 50_000),
+            "player_name": f"Lab {i}",
+            "entry_uuid": f"load-{seed}-{i}",
+        }
+        for i in range(submits)
+    ]
+    latencies: List[float] = []
+    errors = 0
+    queue = iter(entries)
+
+    async def worker() -> None:
+        nonlocal errors
+        client = Client(host, port, path)
+        try:
+            for entry in queue:
+                start = time.perf_counter()
+                status, body = await client.post(entry, token)
+                latencies.append(time.perf_counter() - start)
+                if status != 200 or not body.get("ok"):
+                    errors += 1
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "submits": submits,
+        "clients": clients,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "submits_per_s": submits / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def check_boards(service: ScoreService, host: str, port: int, path: str, boards: int) -> bool:
+    """After compaction, each board file must equal a top-100 GET."""
+    service.store.compact()
+    client = Client(host, port, path)
+    try:
+        for i in range(boards):
+            _, body = await client.request("GET", f"{path}?seed=load-{i}&version=v-load&limit=100")
+            on_disk = json.loads(
+                (service.store.data_dir / f"board_load-{i}__v-load.json").read_text()
+            )
+            if body["entries"] != on_disk:
+                return False
+    finally:
+        await client.close()
+    return True
+
+
+async def _main(args: argparse.Namespace) -> int:
+    if args.url:
+        url = urlsplit(args.url)
+        stats = await run_load(
+            url.hostname,
+            url.port or 80,
+            url.path or "/",
+            args.token,
+            args.submits,
+            args.clients,
+            args.boards,
+            args.seed,
+        )
+        consistent = None
+    else:
+        with tempfile.TemporaryDirectory(prefix="pdoom-score-load-") as data_dir:
+            service = ScoreService(BoardStore(Path(data_dir)), TOKEN)
+            port = await service.start("127.0.0.1", 0)
+            try:
+                stats = await run_load(
+                    "127.0.0.1",
+                    port,
+                    "/score_api.php",
+                    TOKEN,
+                    args.submits,
+                    args.clients,
+                    args.boards,
+                    args.seed,
+                )
+                consistent = await check_boards(
+                    service, "127.0.0.1", port, "/score_api.php", args.boards
+                )
+            finally:
+                await service.stop()
+
+    print(
+        f"{stats['submits']} submits from {stats['clients']} clients in {stats['elapsed_s']:.2f}s: "
+        f"{stats['submits_per_s']:.0f} submits/s, p50 {stats['p50_ms']:.2f} ms, "
+        f"p99 {stats['p99_ms']:.2f} ms, errors {stats['errors']}"
+    )
+    if consistent is not None:
+        print(f"board files match GET after compaction: {consistent}")
+    return 0 if stats["errors"] == 0 and consistent is not False else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the leaderboard service")
+    parser.add_argument("--submits", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument("--boards", type=int, default=4, help="distinct (seed, version) boards")
+    parser.add_argument(
+        "--url", default=None, help="target a running service instead of a local one"
+    )
+    parser.add_argument("--token", default=TOKEN, help="POST token when using --url")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for the generated entries; the same seed replays the same load",
+    )
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
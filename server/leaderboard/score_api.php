@@ -8,6 +8,10 @@
  *        -> { ok, seed, version, entries: [ top-n sorted ] }
  *   POST score_api.php   (JSON body, header X-PDoom-Token: <shared secret>)
  *        body = a score entry (see $ALLOWED_FIELDS); -> { ok, added, rank }
+ *   POST score_api.php?batch=1   (same header)
+ *        body = { entries: [ up to $MAX_BATCH score entries ] }
+ *        -> { ok, results: [ { ok, added, rank } or { ok: false, error } per entry ] }
+ *        Each board is locked and rewritten once per batch, not once per entry.
  *
  * Scoring order (ADR-0002): primary = score (turns survived) DESC,
  * tiebreak = doom_integral DESC. Boards are keyed by (seed, game_version).
@@ -26,6 +30,8 @@ $SHARED_TOKEN = getenv('PDOOM_SCORE_TOKEN') ?: 'CHANGE_ME_set_a_long_random_toke
 $DATA_DIR     = getenv('PDOOM_SCORE_DIR')   ?: (__DIR__ . '/data');
 $MAX_ENTRIES  = 100;    // per board
 $MAX_BODY     = 8192;   // bytes; reject anything larger
+$MAX_BATCH    = 50;     // entries per batch POST
+$MAX_BATCH_BODY = 65536; // bytes for a batch POST
 
 $ALLOWED_FIELDS = [
     'score', 'doom_integral', 'player_name', 'date', 'level_reached',
@@ -67,6 +73,63 @@ function cmp_entries($a, $b) {
     return (int)($b['doom_integral'] ?? 0) - (int)($a['doom_integral'] ?? 0);
 }
 
+// Whitelist + normalise one submitted entry; returns [seed, version, entry] or an error string
+function clean_submission($in) {
+    if (!is_array($in)) return 'bad entry';
+    $seed    = $in['seed']    ?? ($in['game_seed'] ?? 'default');
+    $version = $in['version'] ?? ($in['game_version'] ?? ($in['game_mode'] ?? 'none'));
+
+    $entry = [];
+    foreach ($GLOBALS['ALLOWED_FIELDS'] as $f) {
+        if (array_key_exists($f, $in)) $entry[$f] = $in[$f];
+    }
+    if (!isset($entry['score'])) return 'missing score';
+    $entry['score'] = (int)$entry['score'];
+    $entry['doom_integral'] = (int)($entry['doom_integral'] ?? 0);
+    $entry['player_name'] = substr((string)($entry['player_name'] ?? 'Unknown Lab'), 0, 40);
+    return [$seed, $version, $entry];
+}
+// Add entries to one board under a single flock; returns one result per entry (null on I/O failure)
+function submit_entries($path, $new_entries) {
+    $fp = fopen($path, 'c+');
+    if (!$fp) return null;
+    flock($fp, LOCK_EX);
+    $raw_existing = stream_get_contents($fp);
+    $entries = json_decode($raw_existing, true);
+    if (!is_array($entries)) $entries = [];
+
+    $results = [];
+    $changed = false;
+    foreach ($new_entries as $entry) {
+        // de-dupe by entry_uuid (idempotent re-submits)
+        $uuid = $entry['entry_uuid'] ?? '';
+        $duplicate = false;
+        if ($uuid !== '') {
+            foreach ($entries as $e) {
+                if (($e['entry_uuid'] ?? '') === $uuid) { $duplicate = true; break; }
+            }
+        }
+        if (!$duplicate) {
+            $entries[] = $entry;
+            $changed = true;
+        }
+        usort($entries, 'cmp_entries');
+        $entries = array_slice($entries, 0, $GLOBALS['MAX_ENTRIES']);
+        $rank = 0; foreach ($entries as $i => $e) { if (($e['entry_uuid'] ?? '') === $uuid) { $rank = $i + 1; break; } }
+        $results[] = $duplicate
+            ? ['ok' => true, 'added' => false, 'duplicate' => true, 'rank' => $rank]
+            : ['ok' => true, 'added' => ($rank > 0), 'rank' => $rank];
+    }
+
+    if ($changed) {
+        ftruncate($fp, 0); rewind($fp);
+        fwrite($fp, json_encode($entries));
+        fflush($fp);
+    }
+    flock($fp, LOCK_UN); fclose($fp);
+    return $results;
+}
+
 if ($_SERVER['REQUEST_METHOD'] === 'OPTIONS') { http_response_code(204); exit; }
 
 if (!is_dir($DATA_DIR)) { @mkdir($DATA_DIR, 0775, true); }
@@ -91,56 +154,48 @@ if ($_SERVER['REQUEST_METHOD'] === 'POST') {
     $tok = $_SERVER['HTTP_X_PDOOM_TOKEN'] ?? '';
     if (!hash_equals($SHARED_TOKEN, $tok)) fail(403, 'bad token');
 
-    $raw = file_get_contents('php://input', false, null, 0, $MAX_BODY + 1);
-    if (strlen($raw) > $MAX_BODY) fail(413, 'body too large');
+    $batch = isset($_GET['batch']);
+    $max_body = $batch ? $MAX_BATCH_BODY : $MAX_BODY;
+    $raw = file_get_contents('php://input', false, null, 0, $max_body + 1);
+    if (strlen($raw) > $max_body) fail(413, 'body too large');
     $in = json_decode($raw, true);
     if (!is_array($in)) fail(400, 'bad json');
 
-    $seed    = $in['seed']    ?? ($in['game_seed'] ?? 'default');
-    $version = $in['version'] ?? ($in['game_version'] ?? ($in['game_mode'] ?? 'none'));
-
-    // whitelist fields
-    $entry = [];
-    foreach ($GLOBALS['ALLOWED_FIELDS'] as $f) {
-        if (array_key_exists($f, $in)) $entry[$f] = $in[$f];
+    if (!$batch) {
+        $clean = clean_submission($in);
+        if (!is_array($clean)) fail(400, $clean);
+        [$seed, $version, $entry] = $clean;
+        $results = submit_entries(board_path($DATA_DIR, $seed, $version), [$entry]);
+        if ($results === null) fail(500, 'cannot open board');
+        echo json_encode($results[0]);
+        exit;
     }
-    if (!isset($entry['score'])) fail(400, 'missing score');
-    $entry['score'] = (int)$entry['score'];
-    $entry['doom_integral'] = (int)($entry['doom_integral'] ?? 0);
-    $entry['player_name'] = substr((string)($entry['player_name'] ?? 'Unknown Lab'), 0, 40);
 
-    $path = board_path($DATA_DIR, $seed, $version);
-    $fp = fopen($path, 'c+');
-    if (!$fp) fail(500, 'cannot open board');
-    flock($fp, LOCK_EX);
-    $raw_existing = stream_get_contents($fp);
-    $entries = json_decode($raw_existing, true);
-    if (!is_array($entries)) $entries = [];
-
-    // de-dupe by entry_uuid (idempotent re-submits)
-    $uuid = $entry['entry_uuid'] ?? '';
-    if ($uuid !== '') {
-        foreach ($entries as $e) {
-            if (($e['entry_uuid'] ?? '') === $uuid) {
-                usort($entries, 'cmp_entries');
-                $rank = 0; foreach ($entries as $i => $e2) { if (($e2['entry_uuid'] ?? '') === $uuid) { $rank = $i + 1; break; } }
-                flock($fp, LOCK_UN); fclose($fp);
-                echo json_encode(['ok' => true, 'added' => false, 'duplicate' => true, 'rank' => $rank]);
-                exit;
-            }
+    // ---- batch: group by board so each board file is locked and written once
+    $items = $in['entries'] ?? null;
+    if (!is_array($items) || $items !== array_values($items)) fail(400, 'missing entries');
+    if (count($items) > $MAX_BATCH) fail(413, 'too many entries');
+
+    $results = [];
+    $by_board = [];  // path => [ result index => entry ]
+    foreach ($items as $i => $item) {
+        $clean = clean_submission($item);
+        if (!is_array($clean)) { $results[$i] = ['ok' => false, 'error' => $clean]; continue; }
+        [$seed, $version, $entry] = $clean;
+        $by_board[board_path($DATA_DIR, $seed, $version)][$i] = $entry;
+    }
+    foreach ($by_board as $path => $board_entries) {
+        $board_results = submit_entries($path, array_values($board_entries));
+        $j = 0;
+        foreach ($board_entries as $i => $entry) {
+            $results[$i] = $board_results === null
+                ? ['ok' => false, 'error' => 'cannot open board']
+                : $board_results[$j];
+            $j++;
         }
     }
-
-    $entries[] = $entry;
-    usort($entries, 'cmp_entries');
-    $entries = array_slice($entries, 0, $GLOBALS['MAX_ENTRIES']);
-    $rank = 0; foreach ($entries as $i => $e) { if (($e['entry_uuid'] ?? '') === $uuid) { $rank = $i + 1; break; } }
-
-    ftruncate($fp, 0); rewind($fp);
-    fwrite($fp, json_encode($entries));
-    fflush($fp); flock($fp, LOCK_UN); fclose($fp);
-
-    echo json_encode(['ok' => true, 'added' => ($rank > 0), 'rank' => $rank]);
+    ksort($results);
+    echo json_encode(['ok' => true, 'results' => array_values($results)]);
     exit;
 }
 
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Read-through cache for leaderboard GETs -- ETags, 304s, pre-serialized top-N.
+
+Sits in front of score_api.php (or score_service.py) where nginx would, and
+is the local stand-in for putting a cache in nginx-score.conf:
+
+    client --> score_cache.py :8082 --> upstream :8081 (score_service / php-fpm)
+
+Every GET re-reads and re-encodes a board upstream even when nothing changed.
+Here each board (keyed like the server: board_<seed>__<version>.json) has a
+version that is bumped only when a POST through the cache actually changes
+it -- a result with "added": true. Duplicates and entries that miss the
+100-entry cap leave the version alone, so they do not invalidate anything.
+
+- GET responses are kept pre-serialized per (seed, version, limit), LRU
+  bounded, and reused while the board version is unchanged
+- ETag is "<epoch>-<board version>-<board>"; the epoch is per process, so a
+  restarted cache never confirms an ETag it did not issue
+- If-None-Match with the current ETag is answered 304 without touching the
+  upstream or the cache
+- POST, OPTIONS, percentile_of GETs (they change with every score, not
+  just top-N changes) and everything else pass straight through
+
+All writes must go through the cache: a POST sent to the upstream directly
+is not seen, and GETs keep serving the cached board until the next POST to
+that board via the cache.
+
+Usage:
+    python server/leaderboard/score_cache.py --upstream http://127.0.0.1:8081 --port 8082
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from score_service import (  # noqa: E402  (sibling module; sys.path just set)
+    CORS_HEADERS,
+    MAX_BATCH_BODY,
+    REASONS,
+    ScoreService,
+    _first,
+    board_filename,
+    is_batch,
+    php_int,
+)
+
+MAX_CACHED = 1024  # pre-serialized GET responses kept (LRU)
+UPSTREAM_CONNECTIONS = 8
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class LocalUpstream:
+    """In-process upstream: a ScoreService, serialized exactly as its HTTP server does."""
+
+    def __init__(self, service: ScoreService):
+        self.service = service
+        self.requests = 0
+
+    async def request(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, bytes]:
+        self.requests += 1
+        status, payload = self.service.handle(method, target, headers, body)
+        return status, (
+            b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode()
+        )
+
+
+class HttpUpstream:
+    """Upstream over HTTP/1.1 with a small pool of keep-alive connections."""
+
+    FORWARDED_HEADERS = ("x-pdoom-token", "content-type")
+
+    def __init__(self, host: str, port: int, connections: int = UPSTREAM_CONNECTIONS):
+        self.host, self.port = host, port
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(connections)
+        self.requests = 0
+
+    async def _exchange(
+        self,
+        conn: Tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        method: str,
+        target: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> Tuple[int, bytes, bool]:
+        reader, writer = conn
+        extra = "".join(f"{k}: {v}\r\n" for k, v in headers.items() if k in self.FORWARDED_HEADERS)
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: {self.host}\r\n{extra}"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ")[1])
+        length, keep_alive = 0, True
+        for line in head[1:]:
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "connection":
+                keep_alive = value.strip().lower() != "close"
+        payload = await reader.readexactly(length) if length else b""
+        return status, payload, keep_alive
+
+    async def request(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, bytes]:
+        self.requests += 1
+        async with self._slots:
+            # A pooled connection may have been closed by the upstream; retry once on a fresh one
+            for fresh in (False, True):
+                if self._idle and not fresh:
+                    conn = self._idle.pop()
+                else:
+                    conn = await asyncio.open_connection(self.host, self.port)
+                try:
+                    status, payload, keep_alive = await self._exchange(
+                        conn, method, target, headers, body
+                    )
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    conn[1].close()
+                    if fresh:
+                        raise
+                    continue
+                if keep_alive:
+                    self._idle.append(conn)
+                else:
+                    conn[1].close()
+                return status, payload
+        raise ConnectionError("upstream unavailable")  # not reached
+
+    async def close(self) -> None:
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class ScoreCache:
+    """Board-versioned GET cache over an upstream with the score_api.php contract."""
+
+    def __init__(self, upstream: Any, max_cached: int = MAX_CACHED):
+        self.upstream = upstream
+        self.max_cached = max_cached
+        self.epoch = os.urandom(4).hex()
+        self.versions: Dict[str, int] = {}
+        self._cache: "OrderedDict[Tuple[str, str, int], Tuple[int, bytes]]" = OrderedDict()
+        self.hits = self.misses = self.not_modified = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    def etag(self, board: str) -> str:
+        return f'"{self.epoch}-{self.versions.get(board, 0)}-{board}"'
+
+    def invalidate(self, board: str) -> None:
+        """Mark a board changed; cached responses for it go stale lazily."""
+        self.versions[board] = self.versions.get(board, 0) + 1
+
+    # -- request handling --
+    async def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Response:
+        url = urlsplit(target)
+        if (
+            method == "GET"
+            and url.path in ("/", "/score_api.php")
+            and "percentile_of" not in parse_qs(url.query)
+        ):
+            return await self._get(target, url.query, headers)
+        status, payload = await self.upstream.request(method, target, headers, body)
+        if method == "POST" and status == 200:
+            self._note_post(target, body, payload)
+        return status, {}, payload
+
+    async def _get(self, target: str, query: str, headers: Dict[str, str]) -> Response:
+        params = {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+        seed = params.get("seed", "default")
+        version = params.get("version", "none")
+        limit = max(1, min(100, php_int(params.get("limit", 20))))
+        board = board_filename(seed, version)
+        board_version = self.versions.get(board, 0)
+        etag = self.etag(board)
+        cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if etag in (t.strip() for t in headers.get("if-none-match", "").split(",")):
+            self.not_modified += 1
+            return 304, cache_headers, b""
+
+        key = (seed, version, limit)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == board_version:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return 200, cache_headers, cached[1]
+
+        self.misses += 1
+        status, payload = await self.upstream.request("GET", target, {}, b"")
+        if status != 200:
+            return status, {}, payload
+        # Stored under the version seen before the fetch: a POST landing meanwhile makes it stale
+        self._cache[key] = (board_version, payload)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return 200, cache_headers, payload
+
+    def _note_post(self, target: str, body: bytes, payload: bytes) -> None:
+        """Invalidate the boards a successful POST (or batch) actually changed."""
+        try:
+            request = json.loads(body)
+            response = json.loads(payload)
+        except ValueError:
+            return
+        if not isinstance(request, dict) or not isinstance(response, dict):
+            return
+        if is_batch(target):
+            items = request.get("entries")
+            results = response.get("results")
+            if not isinstance(items, list) or not isinstance(results, list):
+                return
+            pairs = zip(items, results)
+        else:
+            pairs = [(request, response)]
+        for item, result in pairs:
+            if isinstance(item, dict) and isinstance(result, dict) and result.get("added"):
+                self.invalidate(
+                    board_filename(
+                        _first(item, ("seed", "game_seed"), "default"),
+                        _first(item, ("version", "game_version", "game_mode"), "none"),
+                    )
+                )
+
+    # -- connection handling (same framing as score_service) --
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = php_int(headers.get("content-length", 0))
+                if length > MAX_BATCH_BODY:
+                    await self._respond(
+                        writer, 413, {}, b'{"ok":false,"error":"body too large"}', False
+                    )
+                    break
+                body = await reader.readexactly(length) if length > 0 else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                )
+                try:
+                    status, extra, payload = await self.handle(
+                        method.upper(), target, headers, body
+                    )
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    status, extra = 502, {}
+                    payload = json.dumps({"ok": False, "error": "upstream unavailable"}).encode()
+                await self._respond(writer, status, extra, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        extra: Dict[str, str],
+        body: bytes,
+        keep_alive: bool,
+    ) -> None:
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, 'Not Modified' if status == 304 else 'Bad Gateway')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"{CORS_HEADERS}"
+            + "".join(f"{name}: {value}\r\n" for name, value in extra.items())
+            + f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8082) -> int:
+        """Start listening; returns the bound port (pass port=0 for an ephemeral one)."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server:
+            self.server.close()
+            tasks = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+        if isinstance(self.upstream, HttpUpstream):
+            await self.upstream.close()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    url = urlsplit(args.upstream)
+    cache = ScoreCache(HttpUpstream(url.hostname, url.port or 80), args.max_cached)
+    port = await cache.start(args.host, args.port)
+    print(f"[score_cache] listening on http://{args.host}:{port}/score_api.php -> {args.upstream}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await cache.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="ETag / 304 read-through cache for leaderboard GETs"
+    )
+    parser.add_argument(
+        "--upstream", default="http://127.0.0.1:8081", help="score_service or php-fpm front"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument(
+        "--max-cached", type=int, default=MAX_CACHED, help="GET responses kept in memory"
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""Full score history per board -- append-only shards plus a quantile sketch.
+
+score_api.php (and score_service.py) keep only the top MAX_ENTRIES of a
+board; every other score is thrown away, and with it the distribution needed
+for "you beat 83% of players". This keeps every accepted score, in tiers:
+
+    hot   the capped top-N board (board_<seed>__<version>.json, unchanged)
+    warm  the open shard: history/<board>/shard_<n>.jsonl, append-only
+    cold  sealed shards, gzipped once they reach shard_entries lines
+    gone  with max_cold_shards set, the oldest cold shards are deleted; their
+          scores stay counted in the sketch, only the raw rows are dropped
+
+history/<board>/manifest.json holds the shard list and a QuantileSketch of
+every score ever recorded, so "percentile of score X" is a Fenwick-tree
+prefix sum over a fixed number of buckets -- it never reads a shard.
+
+A score is recorded once per entry_uuid across every retained shard: the
+board's uuids are kept as 64-bit hashes mapped to their shard, read from the
+shards on the first record() and forgotten when retention deletes the shard
+(a replay of an expired uuid is counted again).
+
+The manifest is rewritten on save() (score_service calls it on each log
+compaction), not per score. On load, open-shard lines past the manifest's
+open_entries are replayed into the sketch, so a crash loses nothing that
+reached the shard. A torn final line is cut off before appending again.
+
+Usage:
+    python server/leaderboard/score_history.py --data-dir ./data stats <seed> <version>
+    python server/leaderboard/score_history.py --data-dir ./data percentile <seed> <version> <score>
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+HISTORY_DIR = "history"
+MANIFEST_NAME = "manifest.json"
+SHARD_ENTRIES = 10_000  # lines per shard before it is sealed and gzipped
+
+SKETCH_EXACT = 1024  # scores below this get one bucket each (exact percentiles)
+SKETCH_GAMMA = 1.01  # above it, buckets grow geometrically: ~1% relative error
+SKETCH_MAX = 2**31  # larger scores share the last bucket
+
+
+class QuantileSketch:
+    """Fixed-bucket histogram of integer scores with Fenwick-tree prefix counts.
+
+    Scores 0..SKETCH_EXACT-1 are counted exactly; larger ones fall into
+    log-spaced buckets, negative ones into bucket 0. add(), rank_below() and
+    quantile() cost O(log buckets) regardless of how many scores were added.
+    """
+
+    def __init__(self, exact: int = SKETCH_EXACT, gamma: float = SKETCH_GAMMA):
+        self.exact = exact
+        self.gamma = gamma
+        self._log_gamma = math.log(gamma)
+        self.size = self.bucket(SKETCH_MAX) + 1
+        self._tree = [0] * (self.size + 1)
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+
+    def bucket(self, score: int) -> int:
+        if score < self.exact:
+            return max(0, score)
+        return self.exact + int(math.log(min(score, SKETCH_MAX) / self.exact) / self._log_gamma)
+
+    def bucket_floor(self, bucket: int) -> int:
+        """Smallest score that lands in this bucket."""
+        if bucket < self.exact:
+            return bucket
+        return math.ceil(self.exact * self.gamma ** (bucket - self.exact))
+
+    def add(self, score: int, count: int = 1) -> None:
+        self._add_bucket(self.bucket(score), count)
+
+    def _add_bucket(self, bucket: int, count: int) -> None:
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += count
+        i = bucket + 1
+        while i <= self.size:
+            self._tree[i] += count
+            i += i & -i
+
+    def _prefix(self, bucket: int) -> int:
+        """Scores in buckets [0, bucket)."""
+        i, total = bucket, 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def rank_below(self, score: int) -> float:
+        """Number of recorded scores strictly lower than score (half of a shared log bucket)."""
+        if score <= 0:
+            return 0.0
+        bucket = self.bucket(score)
+        below = float(self._prefix(bucket))
+        if bucket >= self.exact and score > self.bucket_floor(bucket):
+            below += self.counts.get(bucket, 0) / 2
+        return below
+
+    def percentile(self, score: int) -> float:
+        """Percent of recorded scores strictly lower than score (0.0 when empty)."""
+        return 100.0 * self.rank_below(score) / self.total if self.total else 0.0
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Lowest score with at least q of the recorded scores at or below it (bucket floor)."""
+        if not self.total:
+            return None
+        target = max(1, math.ceil(q * self.total))
+        position, step = 0, 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self._tree[nxt] < target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return self.bucket_floor(position)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "exact": self.exact,
+            "gamma": self.gamma,
+            "total": self.total,
+            "counts": {str(b): c for b, c in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data.get("exact", SKETCH_EXACT), data.get("gamma", SKETCH_GAMMA))
+        for bucket, count in data.get("counts", {}).items():
+            sketch._add_bucket(int(bucket), count)
+        return sketch
+
+
+def _score(entry: Dict[str, Any]) -> int:
+    score = entry.get("score", 0)
+    return score if isinstance(score, int) else 0
+
+
+def _uuid(entry: Dict[str, Any]) -> Optional[int]:
+    """64-bit hash of the entry's entry_uuid, or None when it has none."""
+    uuid = entry.get("entry_uuid")
+    if not isinstance(uuid, (str, int, float)) or uuid == "":
+        return None
+    return int.from_bytes(hashlib.blake2b(json.dumps(uuid).encode(), digest_size=8).digest(), "big")
+
+
+def _shard_index(name: str) -> int:
+    return int(name.split("_", 1)[1].split(".", 1)[0])
+
+
+class BoardHistory:
+    """Every recorded entry of one board: manifest, sealed shards and the open shard."""
+
+    def __init__(
+        self, path: Path, shard_entries: int = SHARD_ENTRIES, max_cold_shards: Optional[int] = None
+    ):
+        self.path = Path(path)
+        self.shard_entries = shard_entries
+        self.max_cold_shards = max_cold_shards
+        self.shards: List[Dict[str, Any]] = []  # sealed: {name, entries, min_score, max_score}
+        self.dropped = 0  # entries whose cold shard was deleted by retention
+        self.open_index = 0
+        self.open_entries = 0
+        self.sketch = QuantileSketch()
+        self._uuids: Optional[Dict[int, int]] = (
+            None  # uuid hash -> shard index, built on first record()
+        )
+        self._file = None
+        self.dirty = False
+        self._load()
+
+    @property
+    def open_path(self) -> Path:
+        return self.path / f"shard_{self.open_index:05d}.jsonl"
+
+    def _load(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        try:
+            manifest = json.loads((self.path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = {}
+        self.shards = manifest.get("shards", [])
+        self.dropped = manifest.get("dropped", 0)
+        self.open_index = manifest.get("open_index", 0)
+        recorded = manifest.get("open_entries", 0)
+        if "sketch" in manifest:
+            self.sketch = QuantileSketch.from_dict(manifest["sketch"])
+        # A crash between gzipping a shard and deleting its plain file leaves the plain copy
+        for shard in self.shards:
+            (self.path / shard["name"]).with_suffix("").unlink(missing_ok=True)
+
+        try:
+            raw = self.open_path.read_bytes()
+        except OSError:
+            raw = b""
+        complete = raw[: raw.rfind(b"\n") + 1]
+        if len(complete) != len(raw):
+            with open(self.open_path, "r+b") as f:  # cut a torn final line
+                f.truncate(len(complete))
+        for number, line in enumerate(complete.splitlines()):
+            if number >= recorded:
+                self.sketch.add(_score(json.loads(line)))  # appended after the last manifest save
+                self.dirty = True
+            self.open_entries = number + 1
+
+    def _known_uuids(self) -> Dict[int, int]:
+        if self._uuids is None:
+            self._uuids = {}
+            for index, entry in self._indexed_entries():
+                uuid = _uuid(entry)
+                if uuid is not None:
+                    self._uuids[uuid] = index
+        return self._uuids
+
+    def record(self, entry: Dict[str, Any]) -> bool:
+        """Append an entry; False if its entry_uuid is already in a retained shard."""
+        uuid = _uuid(entry)
+        if uuid is not None:
+            known = self._known_uuids()
+            if uuid in known:
+                return False
+            known[uuid] = self.open_index
+        if self._file is None:
+            self._file = open(self.open_path, "a", encoding="utf-8")
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.sketch.add(_score(entry))
+        self.open_entries += 1
+        self.dirty = True
+        if self.open_entries >= self.shard_entries:
+            self._seal()
+        return True
+
+    def _seal(self) -> None:
+        """Gzip the full open shard, start the next one, apply cold-shard retention."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        plain = self.open_path
+        scores = [_score(json.loads(line)) for line in plain.read_bytes().splitlines()]
+        sealed = plain.with_name(plain.name + ".gz")
+        tmp_path = sealed.with_name(sealed.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(plain.read_bytes()))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, sealed)
+        self.shards.append(
+            {
+                "name": sealed.name,
+                "entries": len(scores),
+                "min_score": min(scores),
+                "max_score": max(scores),
+            }
+        )
+        self.open_index += 1
+        self.open_entries = 0
+        expired = []
+        if self.max_cold_shards is not None:
+            while len(self.shards) > self.max_cold_shards:
+                expired.append(self.shards.pop(0))
+                self.dropped += expired[-1]["entries"]
+        if expired and self._uuids is not None:
+            oldest = _shard_index(self.shards[0]["name"]) if self.shards else self.open_index
+            self._uuids = {uuid: index for uuid, index in self._uuids.items() if index >= oldest}
+        self.save()
+        plain.unlink()
+        for shard in expired:
+            (self.path / shard["name"]).unlink(missing_ok=True)
+
+    def save(self) -> None:
+        """Write the manifest (sketch included) atomically."""
+        manifest = {
+            "version": 1,
+            "shards": self.shards,
+            "dropped": self.dropped,
+            "open_index": self.open_index,
+            "open_entries": self.open_entries,
+            "sketch": self.sketch.to_dict(),
+        }
+        path = self.path / MANIFEST_NAME
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Every retained entry, oldest first (reads the shards)."""
+        for _index, entry in self._indexed_entries():
+            yield entry
+
+    def _indexed_entries(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for shard in self.shards:
+            index = _shard_index(shard["name"])
+            with gzip.open(self.path / shard["name"], "rt", encoding="utf-8") as f:
+                for line in f:
+                    yield index, json.loads(line)
+        if self.open_path.exists():
+            with open(self.open_path, encoding="utf-8") as f:
+                for line in f:
+                    yield self.open_index, json.loads(line)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.dirty:
+            self.save()
+
+
+class ScoreHistory:
+    """BoardHistory for every board under data_dir/history, keyed by board filename."""
+
+    def __init__(
+        self,
+        data_dir: Path,
+        shard_entries: int = SHARD_ENTRIES,
+        max_cold_shards: Optional[int] = None,
+    ):
+        self.root = Path(data_dir) / HISTORY_DIR
+        self.shard_entries = shard_entries
+        self.max_cold_shards = max_cold_shards
+        self._boards: Dict[str, BoardHistory] = {}
+
+    def board(self, filename: str, create: bool = True) -> Optional[BoardHistory]:
+        history = self._boards.get(filename)
+        if history is None:
+            path = self.root / Path(filename).stem
+            if not create and not path.is_dir():
+                return None  # don't create directories for arbitrary GET seeds
+            history = BoardHistory(path, self.shard_entries, self.max_cold_shards)
+            self._boards[filename] = history
+        return history
+
+    def record(self, filename: str, entry: Dict[str, Any]) -> bool:
+        return self.board(filename).record(entry)
+
+    def percentile(self, filename: str, score: int) -> Tuple[float, int]:
+        """(percent of recorded scores below score, scores recorded) for a board."""
+        history = self.board(filename, create=False)
+        if history is None:
+            return 0.0, 0
+        return round(history.sketch.percentile(score), 1), history.sketch.total
+
+    def save(self) -> int:
+        """Save the manifests of boards recorded to since the last save; returns how many."""
+        dirty = [history for history in self._boards.values() if history.dirty]
+        for history in dirty:
+            history.save()
+        return len(dirty)
+
+    def close(self) -> None:
+        for history in self._boards.values():
+            history.close()
+
+
+def main() -> int:
+    from score_service import (  # sibling; it imports this module, so not at top level
+        DATA_DIR,
+        board_filename,
+    )
+
+    parser = argparse.ArgumentParser(description="Inspect the full score history of a leaderboard")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="board directory (PDOOM_SCORE_DIR)")
+    parser.add_argument("command", choices=["stats", "percentile"])
+    parser.add_argument("seed")
+    parser.add_argument("version")
+    parser.add_argument("score", nargs="?", type=int)
+    args = parser.parse_args()
+
+    history = ScoreHistory(Path(args.data_dir)).board(
+        board_filename(args.seed, args.version), create=False
+    )
+    if history is None:
+        print("no history for this board")
+        return 1
+    sketch = history.sketch
+    if args.command == "percentile":
+        if args.score is None:
+            parser.error("percentile needs a score")
+        print(
+            f"{sketch.percentile(args.score):.1f}% of {sketch.total} scores are below {args.score}"
+        )
+        return 0
+    print(
+        json.dumps(
+            {
+                "scores": sketch.total,
+                "retained": sketch.total - history.dropped,
+                "cold_shards": len(history.shards),
+                "open_entries": history.open_entries,
+                "p50": sketch.quantile(0.5),
+                "p90": sketch.quantile(0.9),
+                "p99": sketch.quantile(0.99),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
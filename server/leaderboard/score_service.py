@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""P(Doom)1 leaderboard service -- stdlib asyncio drop-in for score_api.php.
+
+Speaks the same contract as score_api.php (see README.md):
+
+    GET  /score_api.php?seed=<seed>&version=<ver>&limit=<n>
+         -> { ok, seed, version, entries: [ top-n sorted ] }
+    POST /score_api.php   (JSON body, header X-PDoom-Token: <shared secret>)
+         -> { ok, added, rank }            (or { ok, added: false, duplicate, rank })
+    POST /score_api.php?batch=1   body { entries: [ up to 50 POST bodies ] }
+         -> { ok, results: [ one POST result (or { ok: false, error }) per entry ] }
+    GET  /score_api.php?seed=<seed>&version=<ver>&percentile_of=<score>   (--history only)
+         -> { ok, seed, version, score, percentile, total }
+
+Same field whitelist, same entry_uuid idempotency, same ADR-0002 order
+(score DESC, doom_integral DESC, earlier submission first on a full tie), same
+per-board cap and the same board_<seed>__<version>.json files.
+
+What differs is the cost per request. The PHP script re-reads, re-sorts and
+rewrites a whole board under flock on every POST and re-parses it on every
+GET. Here each board lives in memory as a sorted list with a uuid index:
+insert and rank are a bisect, GET is a slice. Every accepted POST is appended
+to one log file (score_log.jsonl); a periodic compaction folds changed
+boards back into their board_*.json files (atomic replace) and truncates the
+log, so the website can keep reading the board files directly.
+
+With --history every accepted score (not just the top MAX_ENTRIES) is also
+kept in score_history.py shards, POST results gain a "percentile" (percent of
+the board's recorded scores below this one), and percentile_of answers from
+the history's quantile sketch without reading any shard.
+
+Usage:
+    python server/leaderboard/score_service.py --port 8081 --data-dir ./data
+    PDOOM_SCORE_TOKEN=... PDOOM_SCORE_DIR=... python server/leaderboard/score_service.py
+
+Load test: server/leaderboard/load_test.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import hmac
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from score_history import SHARD_ENTRIES, ScoreHistory
+
+# ---- config (mirrors score_api.php) -----------------------------------------
+SHARED_TOKEN = os.environ.get("PDOOM_SCORE_TOKEN") or "CHANGE_ME_set_a_long_random_token"
+DATA_DIR = os.environ.get("PDOOM_SCORE_DIR") or str(Path(__file__).resolve().parent / "data")
+MAX_ENTRIES = 100  # per board
+MAX_BODY = 8192  # bytes; reject anything larger
+MAX_BATCH = 50  # entries per batch POST
+MAX_BATCH_BODY = 65536  # bytes for a batch POST
+
+ALLOWED_FIELDS = (
+    "score",
+    "doom_integral",
+    "player_name",
+    "date",
+    "level_reached",
+    "game_mode",
+    "duration_seconds",
+    "entry_uuid",
+    "baseline_score",
+    "baseline_doom_integral",
+)
+
+LOG_NAME = "score_log.jsonl"
+COMPACT_INTERVAL_S = 5.0  # fold the log into board files at most this often
+COMPACT_MAX_LOG_LINES = 50_000  # ...or sooner once the log gets this long
+
+CORS_HEADERS = (
+    "Access-Control-Allow-Origin: *\r\n"
+    "Access-Control-Allow-Headers: X-PDoom-Token, Content-Type\r\n"
+    "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+)
+REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+_LEADING_NUMBER = re.compile(r"\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?")
+
+
+# ---- helpers -----------------------------------------------------------------
+def safe_key(value: Any) -> str:
+    """Same filename fragment as PHP safe_key(): 64 chars, [A-Za-z0-9._-] only."""
+    return _UNSAFE.sub("_", str(value)[:64])
+
+
+def board_filename(seed: Any, version: Any) -> str:
+    seed = safe_key(seed if seed != "" else "default")
+    version = safe_key(version if version != "" else "none")
+    return f"board_{seed}__{version}.json"
+
+
+def php_int(value: Any) -> int:
+    """PHP (int) cast semantics for the values a JSON body can carry."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        match = _LEADING_NUMBER.match(value)
+        return int(float(match.group(0))) if match else 0
+    return 0
+
+
+def sort_key(entry: Dict[str, Any]) -> Tuple[int, int]:
+    """ADR-0002 order as an ascending key: score DESC, then doom_integral DESC."""
+    return (-php_int(entry.get("score", 0)), -php_int(entry.get("doom_integral", 0)))
+
+
+def entry_uuid(entry: Dict[str, Any]) -> Any:
+    """The entry's uuid for de-duplication, or "" when it has none usable."""
+    uuid = entry.get("entry_uuid")
+    return uuid if isinstance(uuid, (str, int, float)) and uuid != "" else ""
+
+
+def clean_entry(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Whitelist and normalise a POST body exactly as score_api.php does."""
+    entry = {field: body[field] for field in ALLOWED_FIELDS if field in body}
+    if "score" not in entry or entry["score"] is None:
+        raise ValueError("missing score")
+    entry["score"] = php_int(entry["score"])
+    entry["doom_integral"] = php_int(entry.get("doom_integral"))
+    name = entry.get("player_name")
+    entry["player_name"] = str("Unknown Lab" if name is None else name)[:40]
+    return entry
+
+
+# ---- ranked board --------------------------------------------------------------
+class RankedBoard:
+    """One (seed, version) board kept sorted in ADR-0002 order.
+
+    Entries are stored alongside (score_key, doom_key, seq) keys; seq is the
+    arrival order, so full ties keep submission order like PHP's stable usort.
+    """
+
+    def __init__(
+        self, entries: Optional[List[Dict[str, Any]]] = None, max_entries: int = MAX_ENTRIES
+    ):
+        self.max_entries = max_entries
+        self._keys: List[Tuple[int, int, int]] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._by_uuid: Dict[str, Tuple[int, int, int]] = {}
+        self._seq = 0
+        for entry in sorted(entries or [], key=sort_key):
+            self.insert(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def top(self, limit: int) -> List[Dict[str, Any]]:
+        return self._entries[:limit]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return list(self._entries)
+
+    def rank_of_uuid(self, uuid: Any) -> int:
+        """1-based rank of the entry with this uuid, or 0 if it is not on the board."""
+        key = self._by_uuid.get(uuid)
+        if key is None:
+            return 0
+        return bisect.bisect_left(self._keys, key) + 1
+
+    def insert(self, entry: Dict[str, Any]) -> int:
+        """Insert an entry and return its 1-based rank, or 0 if it fell off the cap."""
+        key = sort_key(entry) + (self._seq,)
+        self._seq += 1
+        index = bisect.bisect_right(self._keys, key)
+        if index >= self.max_entries:
+            return 0
+        self._keys.insert(index, key)
+        self._entries.insert(index, entry)
+        uuid = entry_uuid(entry)
+        if uuid != "":
+            self._by_uuid.setdefault(uuid, key)
+        if len(self._entries) > self.max_entries:
+            dropped_key = self._keys.pop()
+            dropped_uuid = entry_uuid(self._entries.pop())
+            if dropped_uuid != "" and self._by_uuid.get(dropped_uuid) == dropped_key:
+                del self._by_uuid[dropped_uuid]
+        return index + 1
+
+    def contains(self, entry: Dict[str, Any]) -> bool:
+        """Whether an identical entry is already on the board (linear; replay only)."""
+        return entry in self._entries
+
+
+# ---- storage -----------------------------------------------------------------
+def load_board(path: Path) -> List[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [e for e in data if isinstance(e, dict)] if isinstance(data, list) else []
+
+
+class BoardStore:
+    """Every board in DATA_DIR, held in memory, with an append-only write log.
+
+    Accepted submissions are appended to score_log.jsonl as
+    {"board": <filename>, "entry": {...}}. compact() rewrites only the boards
+    changed since the last compaction (atomic replace, same JSON shape the PHP
+    script writes) and then truncates the log. On start-up the log is replayed
+    over the board files; entries a crashed compaction already wrote are
+    recognised (by entry_uuid, or as an identical entry) and not added twice.
+
+    With a ScoreHistory, every non-duplicate submission -- including ones
+    that miss the cap -- is recorded there too; its manifests are saved on
+    compaction.
+    """
+
+    def __init__(
+        self, data_dir: Path, max_entries: int = MAX_ENTRIES, history: Optional[ScoreHistory] = None
+    ):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.history = history
+        self.log_path = self.data_dir / LOG_NAME
+        self.log_lines = 0
+        self._boards: Dict[str, RankedBoard] = {}
+        self._dirty: set = set()
+        self._replay()
+        self._log = open(self.log_path, "a", encoding="utf-8")
+
+    def _load(self, filename: str, create: bool) -> Optional[RankedBoard]:
+        board = self._boards.get(filename)
+        if board is None:
+            path = self.data_dir / filename
+            if not create and not path.is_file():
+                return None  # don't cache empty boards for arbitrary GET seeds
+            board = RankedBoard(load_board(path), self.max_entries)
+            self._boards[filename] = board
+        return board
+
+    def _apply(self, filename: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        board = self._load(filename, create=True)
+        uuid = entry_uuid(entry)
+        if uuid != "":
+            rank = board.rank_of_uuid(uuid)
+            if rank:
+                return {"ok": True, "added": False, "duplicate": True, "rank": rank}
+        rank = board.insert(entry)
+        return {"ok": True, "added": rank > 0, "rank": rank}
+
+    def _replay(self) -> None:
+        try:
+            lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+                filename, entry = record["board"], record["entry"]
+            except (ValueError, KeyError, TypeError):
+                continue  # torn final line from a crash mid-write
+            board = self._load(filename, create=True)
+            if entry_uuid(entry) == "" and board.contains(entry):
+                continue
+            if self._apply(filename, entry)["added"]:
+                self._dirty.add(filename)
+            self.log_lines += 1
+
+    def top(self, seed: Any, version: Any, limit: int) -> List[Dict[str, Any]]:
+        board = self._load(board_filename(seed, version), create=False)
+        return board.top(limit) if board else []
+
+    def submit(self, seed: Any, version: Any, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a cleaned entry; returns the same result body score_api.php would."""
+        filename = board_filename(seed, version)
+        result = self._apply(filename, entry)
+        if self.history is not None and not result.get("duplicate"):
+            if self.history.record(filename, entry):
+                result["percentile"] = self.history.percentile(filename, entry["score"])[0]
+            else:
+                result["duplicate"] = True  # a replay of a score that has fallen off the board
+        if result["added"]:
+            self._log.write(
+                json.dumps({"board": filename, "entry": entry}, separators=(",", ":")) + "\n"
+            )
+            self._log.flush()
+            self.log_lines += 1
+            self._dirty.add(filename)
+        return result
+
+    def compact(self) -> int:
+        """Write changed boards to their JSON files and truncate the log. Returns boards written."""
+        written = 0
+        for filename in sorted(self._dirty):
+            path = self.data_dir / filename
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._boards[filename].entries(), f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            written += 1
+        self._dirty.clear()
+        if self.history is not None:
+            self.history.save()
+        self._log.truncate(0)
+        self._log.seek(0)
+        self.log_lines = 0
+        return written
+
+    def close(self) -> None:
+        if self._log.closed:
+            return
+        self.compact()
+        self._log.close()
+        if self.history is not None:
+            self.history.close()
+
+    def percentile(self, seed: Any, version: Any, score: int) -> Tuple[float, int]:
+        """(percent of the board's recorded scores below score, scores recorded)."""
+        return self.history.percentile(board_filename(seed, version), score)
+
+
+# ---- HTTP --------------------------------------------------------------------
+def is_batch(target: str) -> bool:
+    """PHP isset($_GET['batch'])."""
+    return "batch" in parse_qs(urlsplit(target).query, keep_blank_values=True)
+
+
+def max_body(target: str) -> int:
+    return MAX_BATCH_BODY if is_batch(target) else MAX_BODY
+
+
+def _first(body: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    """PHP `$a ?? $b ?? default` over body keys."""
+    for key in keys:
+        if body.get(key) is not None:
+            return body[key]
+    return default
+
+
+class ScoreService:
+    """HTTP front end for a BoardStore with periodic background compaction."""
+
+    def __init__(
+        self,
+        store: BoardStore,
+        token: str = SHARED_TOKEN,
+        compact_interval: float = COMPACT_INTERVAL_S,
+        compact_max_log_lines: int = COMPACT_MAX_LOG_LINES,
+    ):
+        self.store = store
+        self.token = token
+        self.compact_interval = compact_interval
+        self.compact_max_log_lines = compact_max_log_lines
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._compactor: Optional[asyncio.Task] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    # -- request handling (no I/O; directly testable) --
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        url = urlsplit(target)
+        if url.path not in ("/", "/score_api.php"):
+            return 404, {"ok": False, "error": "not found"}
+        if method == "OPTIONS":
+            return 204, None
+        if method == "GET":
+            params = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+            seed = params.get("seed", "default")
+            version = params.get("version", "none")
+            if "percentile_of" in params:
+                if self.store.history is None:
+                    return 404, {"ok": False, "error": "history disabled"}
+                score = php_int(params["percentile_of"])
+                percentile, total = self.store.percentile(seed, version, score)
+                return 200, {
+                    "ok": True,
+                    "seed": seed,
+                    "version": version,
+                    "score": score,
+                    "percentile": percentile,
+                    "total": total,
+                }
+            limit = max(1, min(100, php_int(params.get("limit", 20))))
+            return 200, {
+                "ok": True,
+                "seed": seed,
+                "version": version,
+                "entries": self.store.top(seed, version, limit),
+            }
+        if method == "POST":
+            if not hmac.compare_digest(
+                self.token.encode(), headers.get("x-pdoom-token", "").encode()
+            ):
+                return 403, {"ok": False, "error": "bad token"}
+            if len(body) > max_body(target):
+                return 413, {"ok": False, "error": "body too large"}
+            try:
+                data = json.loads(body)
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                return 400, {"ok": False, "error": "bad json"}
+            if is_batch(target):
+                items = data.get("entries")
+                if not isinstance(items, list):
+                    return 400, {"ok": False, "error": "missing entries"}
+                if len(items) > MAX_BATCH:
+                    return 413, {"ok": False, "error": "too many entries"}
+                status, result = 200, {
+                    "ok": True,
+                    "results": [self._submit(item) for item in items],
+                }
+            else:
+                result = self._submit(data)
+                status = 200 if result["ok"] else 400
+            if self.store.log_lines >= self.compact_max_log_lines:
+                self.store.compact()
+            return status, result
+        return 405, {"ok": False, "error": "method not allowed"}
+
+    def _submit(self, data: Any) -> Dict[str, Any]:
+        """Validate and store one POST body; returns its result or { ok: false, error }."""
+        if not isinstance(data, dict):
+            return {"ok": False, "error": "bad entry"}
+        try:
+            entry = clean_entry(data)
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        seed = _first(data, ("seed", "game_seed"), "default")
+        version = _first(data, ("version", "game_version", "game_mode"), "none")
+        return self.store.submit(seed, version, entry)
+
+    # -- connection handling --
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+
+                length = php_int(headers.get("content-length", 0))
+                if length > max_body(target):
+                    # Don't read an oversized body; answer and drop the connection
+                    await self._respond(
+                        writer, 413, {"ok": False, "error": "body too large"}, False
+                    )
+                    break
+                body = await reader.readexactly(length) if length > 0 else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                )
+                status, payload = self.handle(method.upper(), target, headers, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Optional[Dict[str, Any]],
+        keep_alive: bool,
+    ) -> None:
+        body = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"{CORS_HEADERS}"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _compact_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.compact_interval)
+            if self.store.log_lines:
+                self.store.compact()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8081) -> int:
+        """Start listening; returns the bound port (pass port=0 for an ephemeral one)."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        self._compactor = asyncio.create_task(self._compact_periodically())
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._compactor:
+            self._compactor.cancel()
+        if self.server:
+            self.server.close()
+            # Close idle keep-alive connections and let their handlers see EOF
+            tasks = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+        self.store.close()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    history = ScoreHistory(Path(args.data_dir), args.shard_entries) if args.history else None
+    service = ScoreService(
+        BoardStore(Path(args.data_dir), history=history), args.token, args.compact_interval
+    )
+    port = await service.start(args.host, args.port)
+    print(
+        f"[score_service] listening on http://{args.host}:{port}/score_api.php (data: {args.data_dir})"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="P(Doom)1 leaderboard service (score_api.php contract)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--data-dir", default=DATA_DIR, help="board directory (PDOOM_SCORE_DIR)")
+    parser.add_argument(
+        "--token", default=SHARED_TOKEN, help="POST shared secret (PDOOM_SCORE_TOKEN)"
+    )
+    parser.add_argument(
+        "--compact-interval",
+        type=float,
+        default=COMPACT_INTERVAL_S,
+        help="seconds between folds of the write log into board files",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="keep every score in history/ shards and answer percentile_of",
+    )
+    parser.add_argument(
+        "--shard-entries",
+        type=int,
+        default=SHARD_ENTRIES,
+        help="scores per history shard before it is gzipped",
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
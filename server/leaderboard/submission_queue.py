@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Offline score-submission queue -- reference client for score_api.php.
+
+The game should not POST each score the moment a run ends: at a
+friends-and-family session dozens of players finish together, and a shared
+PHP host would take one request (and one board lock) per score. Instead each
+finished run is appended to a local spool and the queue is flushed in batches
+of up to MAX_BATCH entries via POST score_api.php?batch=1.
+
+Spool format (one JSON object per line, append-only, fsynced):
+
+    {"op": "add", "entry": {... POST body, always with entry_uuid ...}}
+    {"op": "done", "entry_uuid": "...", "result": {... server result ...}}
+    {"op": "rejected", "entry_uuid": "...", "error": "..."}
+
+An entry is pending until a done/rejected line follows its add line. A torn
+final line (crash mid-append) is ignored. Once enough entries are settled the
+spool is rewritten with only the pending adds (atomic replace).
+
+Delivery rules:
+- every entry carries an entry_uuid, so re-sending after a lost response is
+  safe: the server answers duplicate instead of adding it twice
+- network errors, 429 and 5xx back off exponentially, with jitter from a
+  per-queue unseeded Random so clients that fail together do not retry
+  together; nothing is dropped
+- 403 (score_api.php's bad token) is permanent: flush stops, reports it as
+  "fatal", and contacts the server no more until the queue is rebuilt with a
+  working token; the entries stay in the spool
+- 413 halves the batch size; per-entry validation errors are recorded as
+  rejected and not retried
+- a server without the batch endpoint (any other 4xx on a batch) is sent
+  single-entry POSTs from then on
+
+This is the reference for the Godot client (godot/data/leaderboard_config.json
+holds the same base_url + token); it is stdlib-only.
+
+Usage:
+    python server/leaderboard/submission_queue.py --spool scores.spool --url http://127.0.0.1:8081/score_api.php --token ... flush
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_BATCH = 50  # matches score_api.php $MAX_BATCH
+BASE_DELAY_S = 2.0
+MAX_DELAY_S = 300.0
+COMPACT_SETTLED = 200  # rewrite the spool once this many settled entries pile up
+TRANSIENT_STATUSES = (429,)  # plus every 5xx and network errors
+FATAL_STATUSES = (403,)  # bad token: retrying cannot help
+
+# (url, body, headers) -> (status, parsed JSON body or None); raises OSError on network failure
+Transport = Callable[[str, bytes, Dict[str, str]], Tuple[int, Any]]
+
+
+def urllib_transport(
+    url: str, body: bytes, headers: Dict[str, str], timeout: float = 10.0
+) -> Tuple[int, Any]:
+    """POST with urllib; HTTP error statuses are returned, not raised."""
+    request = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, raw = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, raw = e.code, e.read()
+    try:
+        return status, json.loads(raw) if raw else None
+    except ValueError:
+        return status, None
+
+
+class SubmissionQueue:
+    """Durable spool of pending score submissions with batched, backed-off upload."""
+
+    def __init__(
+        self,
+        spool_path: Path,
+        url: str,
+        token: str,
+        batch_size: int = MAX_BATCH,
+        transport: Transport = urllib_transport,
+        base_delay: float = BASE_DELAY_S,
+        max_delay: float = MAX_DELAY_S,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[Random] = None,
+    ):
+        self.spool_path = Path(spool_path)
+        self.url = url
+        self.token = token
+        self.batch_size = max(1, min(batch_size, MAX_BATCH))
+        self.transport = transport
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.rng = (
+            rng if rng is not None else Random()
+        )  # rng= is for tests; clients must not share a seed
+
+        self.batch_supported = True
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.fatal: Optional[str] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}  # insertion-ordered: oldest first
+        self._settled: set = set()
+        self._load()
+
+    # -- spool --
+    def _load(self) -> None:
+        try:
+            lines = self.spool_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+                if record["op"] == "add":
+                    uid = record["entry"]["entry_uuid"]
+                    if uid not in self._settled:
+                        self._pending.setdefault(uid, record["entry"])
+                else:
+                    self._settled.add(record["entry_uuid"])
+                    self._pending.pop(record["entry_uuid"], None)
+            except (ValueError, KeyError, TypeError):
+                continue  # torn final line from a crash mid-append
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spool_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self) -> None:
+        """Rewrite the spool with only the pending entries."""
+        tmp_path = self.spool_path.with_name(self.spool_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self._pending.values():
+                f.write(json.dumps({"op": "add", "entry": entry}, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.spool_path)
+        self._settled.clear()
+
+    # -- queue --
+    def enqueue(self, entry: Dict[str, Any]) -> str:
+        """Spool a POST body (seed, version, score, ...); returns its entry_uuid.
+
+        An entry whose entry_uuid is already queued or settled is not spooled again.
+        """
+        entry = dict(entry)
+        uid = entry.get("entry_uuid") or str(uuid.uuid4())
+        entry["entry_uuid"] = uid
+        if uid not in self._pending and uid not in self._settled:
+            self._append([{"op": "add", "entry": entry}])
+            self._pending[uid] = entry
+        return uid
+
+    def pending(self) -> List[Dict[str, Any]]:
+        return list(self._pending.values())
+
+    def retry_in(self) -> float:
+        """Seconds until the next flush may contact the server (0 when not backing off)."""
+        return max(0.0, self.next_attempt - self.clock())
+
+    def _settle(self, outcomes: List[Tuple[str, Dict[str, Any]]], report: Dict[str, Any]) -> None:
+        records = []
+        for uid, result in outcomes:
+            if result.get("ok"):
+                records.append({"op": "done", "entry_uuid": uid, "result": result})
+                report["duplicates" if result.get("duplicate") else "sent"] += 1
+            else:
+                records.append(
+                    {"op": "rejected", "entry_uuid": uid, "error": result.get("error", "rejected")}
+                )
+                report["rejected"] += 1
+        self._append(records)
+        for uid, _ in outcomes:
+            self._pending.pop(uid, None)
+            self._settled.add(uid)
+        if len(self._settled) >= COMPACT_SETTLED:
+            self.compact()
+
+    def _back_off(self, report: Dict[str, Any], reason: str) -> None:
+        self.failures += 1
+        delay = min(self.max_delay, self.base_delay * 2 ** (self.failures - 1))
+        self.next_attempt = self.clock() + delay * (0.5 + self.rng.random() / 2)
+        report["error"] = reason
+
+    def _post(self, body: Dict[str, Any], batch: bool) -> Tuple[int, Any]:
+        url = (self.url + ("&" if "?" in self.url else "?") + "batch=1") if batch else self.url
+        headers = {"Content-Type": "application/json", "X-PDoom-Token": self.token}
+        return self.transport(url, json.dumps(body, separators=(",", ":")).encode("utf-8"), headers)
+
+    def flush(self, max_requests: Optional[int] = None) -> Dict[str, Any]:
+        """Send pending entries until the queue is empty, the server fails, or max_requests is hit.
+
+        Returns counts of sent / duplicates / rejected entries, requests made,
+        entries remaining and, after a failure, the error and retry_in seconds.
+        A permanent failure (bad token) is also reported as "fatal".
+        """
+        report: Dict[str, Any] = {"sent": 0, "duplicates": 0, "rejected": 0, "requests": 0}
+        if self.fatal is not None:
+            report["error"] = report["fatal"] = self.fatal
+        while (
+            self.fatal is None
+            and self._pending
+            and self.retry_in() == 0
+            and (max_requests is None or report["requests"] < max_requests)
+        ):
+            chunk = list(self._pending.values())[: self.batch_size if self.batch_supported else 1]
+            report["requests"] += 1
+            try:
+                if self.batch_supported:
+                    status, payload = self._post({"entries": chunk}, batch=True)
+                else:
+                    status, payload = self._post(chunk[0], batch=False)
+            except OSError as e:
+                self._back_off(report, f"network: {e}")
+                break
+
+            if status in FATAL_STATUSES:
+                error = payload.get("error") if isinstance(payload, dict) else None
+                self.fatal = f"HTTP {status}" + (f": {error}" if error else "")
+                report["error"] = report["fatal"] = self.fatal
+                break
+            if status in TRANSIENT_STATUSES or status >= 500:
+                self._back_off(report, f"HTTP {status}")
+                break
+            self.failures = 0
+
+            if self.batch_supported:
+                results = payload.get("results") if isinstance(payload, dict) else None
+                if status == 200 and isinstance(results, list) and len(results) == len(chunk):
+                    self._settle(
+                        [
+                            (e["entry_uuid"], r if isinstance(r, dict) else {})
+                            for e, r in zip(chunk, results)
+                        ],
+                        report,
+                    )
+                elif status == 413 and self.batch_size > 1:
+                    self.batch_size = max(1, self.batch_size // 2)
+                else:
+                    self.batch_supported = (
+                        False  # pre-batch server: fall back to one POST per entry
+                    )
+            elif status == 200 and isinstance(payload, dict):
+                self._settle([(chunk[0]["entry_uuid"], payload)], report)
+            else:
+                error = payload.get("error") if isinstance(payload, dict) else None
+                self._settle(
+                    [(chunk[0]["entry_uuid"], {"ok": False, "error": error or f"HTTP {status}"})],
+                    report,
+                )
+
+        report["remaining"] = len(self._pending)
+        if "error" in report and self.fatal is None:
+            report["retry_in"] = self.retry_in()
+        return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Inspect or flush an offline score-submission spool"
+    )
+    parser.add_argument("--spool", type=Path, required=True)
+    parser.add_argument("--url", default="http://127.0.0.1:8081/score_api.php")
+    parser.add_argument("--token", default=os.environ.get("PDOOM_SCORE_TOKEN", ""))
+    parser.add_argument("command", choices=["status", "flush"])
+    args = parser.parse_args()
+
+    queue = SubmissionQueue(args.spool, args.url, args.token)
+    if args.command == "status":
+        print(f"{len(queue.pending())} pending submission(s) in {args.spool}")
+        return 0
+    report = queue.flush()
+    print(json.dumps(report))
+    return 0 if report["remaining"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
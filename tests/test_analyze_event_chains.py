@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/analyze_event_chains.py (event-chain reachability).
+
+What these lock down:
+
+- Analytic earliest turn and reach probability through a chain, and when a
+  chain and the event's own random roll compete; Monte-Carlo agrees.
+- A chain landing past the observed run band is flagged late, an excluded
+  trigger strands what it unlocks, and a cycle is an error, not a crash.
+- The process-pool Monte-Carlo path tallies exactly what the serial one does.
+- The real extensions load, and RUN_BAND still matches rarity_curves.json.
+
+Run: python -m unittest tests.test_analyze_event_chains -v
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import analyze_event_chains as aec  # noqa: E402
+
+CURVES = REPO_ROOT / "godot" / "data" / "events" / "balancing" / "rarity_curves.json"
+
+
+def exact(event_id, turn):
+    return {"id": event_id, "trigger_type": "turn_exact", "trigger_turn": turn}
+
+
+def rolled(event_id, start, probability):
+    return {
+        "id": event_id,
+        "trigger_type": "random",
+        "eligibility_start": start,
+        "probability": probability,
+    }
+
+
+CATALOGUE = SimpleNamespace(
+    events=[exact("hist_ftx", 10), rolled("hist_late", 20, 0.1), exact("hist_cat", 7)]
+)
+
+
+class TestEventGraph(unittest.TestCase):
+    def analyze(self, chains=(), triggers=None, excluded=(), seeds=2000):
+        return aec.analyze(
+            aec.EventGraph(CATALOGUE, chains, triggers, excluded), seeds=seeds, jobs=1
+        )
+
+    def test_chain_reach_matches_monte_carlo(self):
+        report = self.analyze(
+            [
+                {
+                    "trigger_event": "ftx",
+                    "unlocks": ["clawback"],
+                    "delay_turns": 5,
+                    "probability": 0.5,
+                },
+                {"trigger_event": "cat", "unlocks": ["hist_late"], "delay_turns": 3},
+            ]
+        )
+        self.assertEqual(report["errors"], [])
+        self.assertEqual(len(report["warnings"]), 1)  # clawback is extension-only
+        clawback, late = report["events"]["clawback"], report["events"]["hist_late"]
+        self.assertEqual((clawback["earliest_turn"], clawback["p_by_horizon"]), (15, 0.5))
+        self.assertAlmostEqual(clawback["mc_by_horizon"], 0.5, delta=0.05)
+        self.assertEqual(
+            (clawback["mc_earliest_turn"], late["earliest_turn"], late["p_by_band_end"]),
+            (15, 10, 1.0),
+        )
+        self.assertEqual(report["involved"], ["hist_ftx", "hist_cat", "hist_late", "clawback"])
+        self.assertEqual([c["earliest_turn"] for c in report["chains"]], [15, 10])
+
+    def test_late_excluded_and_cycle(self):
+        report = self.analyze(
+            [{"trigger_event": "ftx", "unlocks": ["epilogue"], "delay_turns": 250}]
+        )
+        self.assertEqual(
+            (report["late"], report["events"]["epilogue"]["earliest_turn"]), (["epilogue"], 260)
+        )
+        self.assertGreaterEqual(report["horizon"], 260)
+
+        report = self.analyze(
+            [{"trigger_event": "ftx", "unlocks": ["epilogue"]}], excluded=["ftx"], seeds=50
+        )
+        self.assertEqual(report["unreachable"], ["epilogue"])
+        self.assertTrue(report["events"]["hist_ftx"]["excluded"])
+
+        report = self.analyze(
+            [{"trigger_event": "a", "unlocks": ["b"]}, {"trigger_event": "b", "unlocks": ["a"]}],
+            seeds=50,
+        )
+        self.assertIn("cycle through a, b", report["errors"][0])
+
+    def test_trigger_rules_are_conditional_rolls(self):
+        report = self.analyze(
+            triggers={
+                "breakthrough": {"min_turn": 50, "requires": {"research": 100}, "probability": 1.0}
+            },
+            seeds=0,
+        )
+        row = report["events"]["breakthrough"]
+        self.assertEqual(
+            (row["earliest_turn"], row["p_by_band_end"], row["conditional"]), (50, 1.0, True)
+        )
+
+    def test_process_pool_matches_serial(self):
+        graph = aec.EventGraph(
+            CATALOGUE, [{"trigger_event": "late", "unlocks": ["x"], "probability": 0.3}]
+        )
+        serial = aec.monte_carlo(graph, 2000, jobs=1)
+        with mock.patch.object(aec, "PARALLEL_MIN_SEEDS", 10):
+            self.assertEqual(aec.monte_carlo(graph, 2000, jobs=2), serial)
+
+
+class TestRealExtensions(unittest.TestCase):
+    def test_real_extensions_load(self):
+        report = aec.analyze(aec.load_graph(), seeds=10)
+        self.assertEqual((report["errors"], report["unreachable"], report["late"]), ([], [], []))
+
+    def test_run_band_matches_rarity_curves(self):
+        note = json.loads(CURVES.read_text(encoding="utf-8"))["_retime_2026_08"]
+        self.assertIn("deaths turn %d-%d" % aec.RUN_BAND, note)
+
+
+if __name__ == "__main__":
+    unittest.main()
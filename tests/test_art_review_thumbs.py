@@ -0,0 +1,176 @@
+"""Tests for the art-review thumbnail path: tools/art_review/thumb_cache.py and
+the /thumb + /img endpoints of tools/art_review/serve_review.py.
+
+What these lock down:
+
+- Thumbnail keys change with the master's mtime/size and the width, and
+  requested widths snap to a bounded set.
+- The disk cache evicts least-recently-served files first once over its cap.
+- /thumb answers with a strong ETag, immutable caching only when the URL pins
+  the current file, 304 on If-None-Match, and the sandbox still applies.
+- With Pillow installed, a large master renders once to a smaller thumbnail.
+
+Run: python -m unittest tests.test_art_review_thumbs -v
+"""
+
+import importlib.util
+import os
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+import zlib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ART_REVIEW = REPO_ROOT / "tools" / "art_review"
+sys.path.insert(0, str(ART_REVIEW))
+
+import thumb_cache  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("serve_review", ART_REVIEW / "serve_review.py")
+serve_review = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(serve_review)
+
+
+def tiny_png(width=2, height=2):
+    """A valid RGBA PNG built with the stdlib."""
+
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    rows = b"".join(b"\0" + b"\x80\x40\x20\xff" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+class TestThumbCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snap_width(self):
+        self.assertEqual(thumb_cache.snap_width("200"), 256)
+        self.assertEqual(thumb_cache.snap_width(384), 384)
+        self.assertEqual(thumb_cache.snap_width("junk"), thumb_cache.WIDTH_STEP)
+        self.assertEqual(thumb_cache.snap_width(10**6), thumb_cache.MAX_WIDTH)
+
+    def test_key_tracks_file_and_width(self):
+        master = self.dir / "a.png"
+        master.write_bytes(tiny_png())
+        st = os.stat(master)
+        key = thumb_cache.thumb_key(master, st, 256, "webp")
+        self.assertEqual(key, thumb_cache.thumb_key(master, os.stat(master), 256, "webp"))
+        self.assertNotEqual(key, thumb_cache.thumb_key(master, st, 384, "webp"))
+        os.utime(master, ns=(st.st_mtime_ns + 10**9, st.st_mtime_ns + 10**9))
+        self.assertNotEqual(key, thumb_cache.thumb_key(master, os.stat(master), 256, "webp"))
+
+    def test_lru_eviction(self):
+        cache_dir = self.dir / "thumbs"
+        cache_dir.mkdir()
+        for i, name in enumerate(["old.webp", "mid.webp", "new.webp"]):
+            path = cache_dir / name
+            path.write_bytes(b"x" * 100)
+            os.utime(path, ns=(10**18 + i, 10**18 + i))
+        cache = thumb_cache.ThumbCache(cache_dir, max_bytes=250)
+        self.assertEqual(cache.total_bytes, 300)
+        cache._touch("old.webp", cache_dir / "old.webp")  # served again: now most recent
+        cache._evict()
+        self.assertEqual(sorted(p.name for p in cache_dir.iterdir()), ["new.webp", "old.webp"])
+        self.assertEqual(cache.total_bytes, 200)
+
+    @unittest.skipUnless(thumb_cache.Image is not None, "Pillow not installed")
+    def test_render_once(self):
+        master = self.dir / "big.png"
+        thumb_cache.Image.new("RGBA", (800, 400), (200, 100, 50, 255)).save(master)
+        cache = thumb_cache.ThumbCache(self.dir / "thumbs", workers=1)
+        self.addCleanup(cache.close)
+        path, etag, _ctype = cache.thumbnail(master, 256)
+        with thumb_cache.Image.open(path) as im:
+            self.assertEqual(im.size, (256, 128))
+        mtime = path.stat().st_mtime_ns
+        self.assertEqual(cache.thumbnail(master, 256)[1], etag)
+        self.assertGreaterEqual(path.stat().st_mtime_ns, mtime)
+        self.assertIsNone(cache.thumbnail(master, 1024))  # no upscaling: serve the original
+
+
+class TestThumbEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        (root / "art_source" / "batch").mkdir(parents=True)
+        (root / "art_source" / "batch" / "desk.png").write_bytes(tiny_png())
+        (root / "secret.txt").write_text("no", encoding="utf-8")
+        self.rel = "art_source/batch/desk.png"
+        thumbs = thumb_cache.ThumbCache(root / "thumbs", workers=1)
+        self.httpd = serve_review.ReviewServer(("127.0.0.1", 0), root, thumbs, sweep_s=0)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.version = serve_review.asset_version(self.httpd.art_root, self.rel)
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmp.cleanup()
+
+    def get(self, path, headers=None):
+        try:
+            with urllib.request.urlopen(
+                urllib.request.Request(self.base + path, headers=headers or {})
+            ) as r:
+                return r.status, r.headers, r.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def test_thumb_caching_headers(self):
+        status, headers, body = self.get(f"/thumb?p={self.rel}&w=384&v={self.version}")
+        self.assertEqual(status, 200)
+        self.assertTrue(body)
+        self.assertEqual(headers["Cache-Control"], serve_review.IMMUTABLE)
+        etag = headers["ETag"]
+        self.assertTrue(etag.startswith('"') and not etag.startswith("W/"))
+
+        status, headers, body = self.get(
+            f"/thumb?p={self.rel}&w=384&v={self.version}", {"If-None-Match": etag}
+        )
+        self.assertEqual((status, body), (304, b""))
+
+        status, headers, _body = self.get(f"/thumb?p={self.rel}&w=384&v=stale")
+        self.assertEqual((status, headers["Cache-Control"]), (200, "no-cache"))
+
+    def test_img_revalidates_and_sandbox_holds(self):
+        status, headers, _body = self.get(f"/img?p={self.rel}")
+        self.assertEqual((status, headers["Cache-Control"]), (200, "no-cache"))
+        status, _headers, _body = self.get(f"/img?p={self.rel}", {"If-None-Match": headers["ETag"]})
+        self.assertEqual(status, 304)
+        self.assertEqual(self.get("/thumb?p=../../etc/passwd.png&w=64")[0], 403)
+        self.assertEqual(self.get("/thumb?p=secret.txt&w=64")[0], 404)
+
+    def test_grid_uses_versioned_thumbs(self):
+        cell = {
+            "asset_id": "px:batch/desk",
+            "label": "desk",
+            "img": self.rel,
+            "meta": "",
+            "base": "desk",
+            "v": self.version,
+        }
+        html = serve_review.render_cell(cell)
+        self.assertIn(f"/thumb?p={self.rel}&amp;w=384&amp;v={self.version}", html)
+        self.assertIn(f'data-full="/img?p={self.rel}"', html)
+
+
+if __name__ == "__main__":
+    unittest.main()
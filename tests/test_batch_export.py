@@ -0,0 +1,218 @@
+"""
+Tests for the incremental weekly batch exporter and its HTTP stand-in.
+
+Covers content-addressed output (unchanged batches keep their object),
+watermarks (only changed boards are re-read), rows that meet the
+leaderboards_v1 schema without leaking player names, analytics from the
+session archive, and ETag / If-None-Match handling on the batch endpoints.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+from src.scores.batch_export import BatchExporter, make_server, week_start
+from src.scores.leaderboard_catalog import config_hash
+from src.scores.local_store import LocalLeaderboard, ScoreEntry
+from src.scores.session_archive import SessionArchive
+
+
+def _session(seed, started, score):
+    return {
+        "seed": seed,
+        "game_version": "v0.9.1",
+        "economic_model": "Bootstrap_v0.4.1",
+        "start_time": started,
+        "final_score": score,
+        "final_doom": 50,
+        "duration_minutes": 2.0,
+    }
+
+
+class TestBatchExport(unittest.TestCase):
+    """Test incremental batch export."""
+
+    def setUp(self):
+        """Create two boards spanning two weeks and a few sessions."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.leaderboard_dir = Path(self.temp_dir) / "leaderboards"
+        self.output_dir = Path(self.temp_dir) / "export"
+        self.leaderboard_dir.mkdir()
+
+        alpha_hash = config_hash("Bootstrap_v0.4.1", "v0.9.1")  # matches the alpha sessions below
+        self.board_a = LocalLeaderboard(
+            self.leaderboard_dir / f"leaderboard_alpha_{alpha_hash}.json"
+        )
+        self.board_a.add_score(
+            ScoreEntry(score=10, player_name="Ada", date=datetime(2025, 9, 29, 12))
+        )
+        self.board_a.add_score(
+            ScoreEntry(score=30, player_name="Bo", date=datetime(2025, 10, 7, 9))
+        )
+        self.board_b = LocalLeaderboard(self.leaderboard_dir / "leaderboard_beta_bbbb.json")
+        self.board_b.add_score(
+            ScoreEntry(score=20, player_name="Cy", date=datetime(2025, 10, 1, 8))
+        )
+
+        sessions_dir = self.leaderboard_dir / "sessions"
+        sessions_dir.mkdir()
+        for i, (seed, started, score) in enumerate(
+            [
+                ("alpha", "2025-09-29T12:00:00", 10),
+                ("alpha", "2025-10-07T09:00:00", 30),
+                ("beta", "2025-10-01T08:00:00", 20),
+            ]
+        ):
+            (sessions_dir / f"session_{seed}_{i}.json").write_text(
+                json.dumps(_session(seed, started, score)), encoding="utf-8"
+            )
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _batch(self, exporter, batch_id):
+        return exporter.get_object(exporter.index["batches"][batch_id]["object"])
+
+    def test_week_start(self):
+        """Batches are keyed by the Monday of the ISO week."""
+        self.assertEqual(week_start("2025-10-05T23:59:00").isoformat(), "2025-09-29")
+        self.assertEqual(week_start(datetime(2025, 10, 6)).isoformat(), "2025-10-06")
+
+    def test_export_builds_ranked_weekly_batches(self):
+        """Entries from every board are merged and ranked per week."""
+        exporter = BatchExporter(self.leaderboard_dir, self.output_dir)
+        report = exporter.export()
+
+        self.assertEqual(len(report["boards_read"]), 2)
+        self.assertEqual(
+            sorted(exporter.index["batches"]),
+            [
+                "analytics_2025-09-29",
+                "analytics_2025-10-06",
+                "leaderboards_2025-09-29",
+                "leaderboards_2025-10-06",
+            ],
+        )
+        batch = self._batch(exporter, "leaderboards_2025-09-29")
+        self.assertEqual(
+            [(row["rank"], row["seed"], row["score"]) for row in batch["data"]],
+            [(1, "beta", 20), (2, "alpha", 10)],
+        )
+        self.assertEqual(batch["batch_metadata"]["record_count"], 2)
+        self.assertTrue(batch["data"][0]["player_id"].startswith("player_"))
+        self.assertEqual([row["game_version"] for row in batch["data"]], ["unknown", "v0.9.1"])
+
+        analytics = self._batch(exporter, "analytics_2025-09-29")["data"]
+        self.assertEqual(
+            [(row["seed"], row["sessions"], row["final_score_mean"]) for row in analytics],
+            [("alpha", 1, 10.0), ("beta", 1, 20.0)],
+        )
+
+    def test_only_changed_boards_and_batches_are_rewritten(self):
+        """A second export is a no-op; a new score touches one board and one week."""
+        BatchExporter(self.leaderboard_dir, self.output_dir).export()
+
+        exporter = BatchExporter(self.leaderboard_dir, self.output_dir)
+        report = exporter.export()
+        self.assertEqual(
+            report,
+            {
+                "boards_read": [],
+                "session_sources_read": [],
+                "changed_batches": [],
+                "objects_written": 0,
+            },
+        )
+
+        self.board_b.add_score(ScoreEntry(score=5, player_name="Di", date=datetime(2025, 10, 8)))
+        unchanged = dict(exporter.index["batches"]["leaderboards_2025-09-29"])
+        report = BatchExporter(self.leaderboard_dir, self.output_dir).export()
+        self.assertEqual(report["boards_read"], ["leaderboard_beta_bbbb.json"])
+        self.assertEqual(report["changed_batches"], ["leaderboards_2025-10-06"])
+
+        exporter = BatchExporter(self.leaderboard_dir, self.output_dir)
+        self.assertEqual(exporter.index["batches"]["leaderboards_2025-09-29"], unchanged)
+        self.assertEqual(
+            [row["score"] for row in self._batch(exporter, "leaderboards_2025-10-06")["data"]],
+            [30, 5],
+        )
+
+    def test_rows_meet_schema_without_leaking_names(self):
+        """Rows carry every required leaderboards_v1 field; names are salted and opt-in."""
+        exporter = BatchExporter(self.leaderboard_dir, self.output_dir)
+        exporter.export()
+        rows = self._batch(exporter, "leaderboards_2025-09-29")["data"]
+        for row in rows:
+            self.assertTrue({"rank", "player_id", "score", "game_version"} <= set(row))
+            self.assertNotIn("username", row)
+        ids = {row["player_id"] for row in rows}
+        other = BatchExporter(self.leaderboard_dir, Path(self.temp_dir) / "other")
+        other.export()
+        other_rows = self._batch(other, "leaderboards_2025-09-29")["data"]
+        self.assertTrue(
+            ids.isdisjoint(row["player_id"] for row in other_rows)
+        )  # each export has its own salt
+
+        opted_in = BatchExporter(self.leaderboard_dir, self.output_dir, include_usernames=True)
+        self.assertEqual(len(opted_in.export()["boards_read"]), 2)
+        rows = self._batch(opted_in, "leaderboards_2025-09-29")["data"]
+        self.assertEqual([row["username"] for row in rows], ["Cy", "Ada"])
+        self.assertEqual({row["player_id"] for row in rows}, ids)  # same salt, same ids
+
+    def test_session_compaction_keeps_analytics_objects(self):
+        """Compacting sessions re-reads them but produces identical batches."""
+        BatchExporter(self.leaderboard_dir, self.output_dir).export()
+        SessionArchive(self.leaderboard_dir / "sessions").compact()
+
+        report = BatchExporter(self.leaderboard_dir, self.output_dir).export()
+        self.assertTrue(report["session_sources_read"])
+        self.assertEqual(report["changed_batches"], [])
+        self.assertEqual(report["objects_written"], 0)
+
+    def test_http_stand_in_serves_etags(self):
+        """Batch endpoints send ETags and answer If-None-Match with 304."""
+        BatchExporter(self.leaderboard_dir, self.output_dir).export()
+        server = make_server(self.output_dir, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        try:
+            with urllib.request.urlopen(f"{base}/batches") as response:
+                listing = json.loads(response.read())["batches"]
+            etag = listing["leaderboards_2025-10-06"]["etag"]
+
+            with urllib.request.urlopen(f"{base}/batches/leaderboards/2025-10-06") as response:
+                self.assertEqual(response.headers["ETag"], f'"{etag}"')
+                self.assertEqual(json.loads(response.read())["batch_metadata"]["record_count"], 1)
+
+            request = urllib.request.Request(
+                f"{base}/batches/leaderboards/2025-10-06", headers={"If-None-Match": f'"{etag}"'}
+            )
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(request)
+            self.assertEqual(cm.exception.code, 304)
+
+            with urllib.request.urlopen(
+                f"{base}/batches/leaderboards_2025-10-06/status"
+            ) as response:
+                self.assertEqual(json.loads(response.read())["etag"], etag)
+            with urllib.request.urlopen(f"{base}/objects/{etag}") as response:
+                self.assertIn("immutable", response.headers["Cache-Control"])
+
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(f"{base}/batches/leaderboards/1999-01-04")
+            self.assertEqual(cm.exception.code, 404)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
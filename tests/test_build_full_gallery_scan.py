@@ -0,0 +1,152 @@
+"""Tests for the cached disk walk in tools/art_review/build_full_gallery.py.
+
+What these lock down:
+
+- A scan through a saved manifest returns exactly what a cold scan returns
+  (ids, files, batch order, sidecar facets), skipping non-candidate dirs.
+- A warm rebuild re-lists no directory and re-parses no sidecar; adding an
+  image re-lists only its directory, and a sidecar rewritten in place is
+  re-hashed and re-parsed.
+- An image rewritten in place (directory mtime untouched) moves its batch by
+  its new mtime, even though the directory listing is reused.
+- Facets are cached by sidecar content, so an identical prompt in a new cell
+  is not parsed again.
+
+Run: python -m unittest tests.test_build_full_gallery_scan -v
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "tools" / "art_review"))
+
+import build_full_gallery as bfg  # noqa: E402
+
+PROMPT = (
+    "COHERENT DIRECTION -- MUNICIPAL RECORD: flat civic ink, RENDERING: gouache wash, "
+    "PALETTE: ledger green and rust, SUBJECT: a filing cabinet at dusk"
+)
+
+
+class TestScanManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.gen = self.root / "art_generated"
+        self.src = self.root / "art_source"
+        self.night = self.gen / "art_night_x" / "s01"
+        self.write(self.gen / "game_icons" / "v1" / "icon_doom_512.png")
+        self.write(self.gen / "game_icons" / "v1" / "icon_doom_v2_256.png")
+        self.write(self.night / "s01_f01_v1_1536.png")
+        self.write(
+            self.night / "s01_f01_v1_1536.meta.json", json.dumps({"prompt": PROMPT, "model": "m1"})
+        )
+        self.write(self.src / "pixellab_x" / "desk.png")
+        self.write(self.src / "audiodump" / "frames_1" / "f0001.png")  # not a candidate
+        self.manifest_path = self.root / "scan.json"
+        patcher = mock.patch.multiple(bfg, ART_GEN=self.gen, ART_SRC=self.src)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.age()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, text="png"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def age(self):
+        """Push every mtime back past the racy window, so the manifest may trust it."""
+        for dirpath, _dirs, files in os.walk(self.root):
+            for p in [dirpath] + [os.path.join(dirpath, f) for f in files]:
+                past = os.stat(p).st_mtime_ns - 60 * 1_000_000_000
+                os.utime(p, ns=(past, past))
+
+    def scan(self, manifest=None):
+        batches = bfg.scan({}, manifest)
+        if manifest is not None:
+            manifest.save()
+        return [
+            (
+                b["title"],
+                [(g.id, [str(p) for p, _ in g.files], g.facets, g.meta_rel) for g in b["assets"]],
+            )
+            for b in batches
+        ]
+
+    def manifest(self):
+        return bfg.ScanManifest(self.manifest_path)
+
+    def test_warm_scan_matches_cold(self):
+        cold = self.scan()
+        first = self.manifest()
+        self.assertEqual(self.scan(first), cold)
+        self.assertEqual(first.stats["facets_parsed"], 1)
+        ids = [a[0] for _title, assets in cold for a in assets]
+        self.assertIn("gen:game_icons:icon_doom:v2", ids)
+        self.assertIn("px:pixellab_x/desk.png", ids)
+        self.assertFalse([i for i in ids if "audiodump" in i])
+        night = next(a for _title, assets in cold for a in assets if "s01_f01" in a[0])
+        self.assertEqual(night[2]["direction"], "Municipal Record")
+        self.assertEqual(night[2]["model"], "m1")
+
+        warm = self.manifest()
+        self.assertEqual(self.scan(warm), cold)
+        self.assertEqual(warm.stats["dirs_listed"], 0)
+        self.assertEqual((warm.stats["sidecars_hashed"], warm.stats["facets_parsed"]), (0, 0))
+
+    def test_changes_are_picked_up(self):
+        self.scan(self.manifest())
+        self.write(self.src / "pixellab_x" / "chair.png")
+        side = self.night / "s01_f01_v1_1536.meta.json"
+        dir_mtime = os.stat(self.night).st_mtime_ns
+        self.write(side, json.dumps({"prompt": PROMPT.replace("MUNICIPAL RECORD", "NIGHT SHIFT")}))
+        os.utime(self.night, ns=(dir_mtime, dir_mtime))  # rewritten in place: directory untouched
+
+        manifest = self.manifest()
+        result = self.scan(manifest)
+        self.assertEqual(result, self.scan())
+        self.assertEqual(manifest.stats["dirs_listed"], 1)  # only pixellab_x changed its listing
+        self.assertEqual(
+            (manifest.stats["sidecars_hashed"], manifest.stats["facets_parsed"]), (1, 1)
+        )
+        ids = [a[0] for _title, assets in result for a in assets]
+        self.assertIn("px:pixellab_x/chair.png", ids)
+        night = next(a for _title, assets in result for a in assets if "s01_f01" in a[0])
+        self.assertEqual(night[2]["direction"], "Night Shift")
+
+    def test_image_rewritten_in_place_reorders_batches(self):
+        self.scan(self.manifest())
+        icon = self.gen / "game_icons" / "v1" / "icon_doom_512.png"
+        dir_mtime = os.stat(icon.parent).st_mtime_ns
+        self.write(icon, "png, redrawn")
+        os.utime(icon.parent, ns=(dir_mtime, dir_mtime))
+
+        manifest = self.manifest()
+        result = self.scan(manifest)
+        self.assertEqual(manifest.stats["dirs_listed"], 0)
+        self.assertEqual(result, self.scan())
+        self.assertEqual(result[0][0], "art_generated/game_icons")
+
+    def test_facets_cached_by_content(self):
+        self.scan(self.manifest())
+        self.write(self.night / "s01_f02_v1_1536.png")
+        self.write(
+            self.night / "s01_f02_v1_1536.meta.json", json.dumps({"prompt": PROMPT, "model": "m1"})
+        )
+        manifest = self.manifest()
+        self.scan(manifest)
+        self.assertEqual(
+            (manifest.stats["sidecars_hashed"], manifest.stats["facets_parsed"]), (1, 0)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
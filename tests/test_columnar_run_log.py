@@ -0,0 +1,202 @@
+"""
+Tests for the columnar run log used by GameRunLogger and VerboseLogger.
+
+Covers one record batch per turn, the running checksum (also read mid-turn),
+column reads across batches, sealed logs refusing further appends, and that
+the loggers keep only the current turn in memory.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services.columnar_log import (
+    ColumnarRunWriter,
+    iter_batches,
+    read_table,
+    read_trailer,
+    verify_run_log,
+)
+from src.services.game_run_logger import GameRunLogger, LoggingLevel
+from src.services.verbose_logging import LogLevel, VerboseLogger
+
+
+class TestColumnarRunWriter(unittest.TestCase):
+    """Test the streaming columnar writer."""
+
+    def setUp(self):
+        """Set up a temporary log path."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "run.runlog.jsonl"
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_one_batch_per_turn(self):
+        """Rows for the same turn share a batch; a new turn starts another."""
+        writer = ColumnarRunWriter(self.path)
+        writer.append("actions", {"turn": 1, "name": "hire"})
+        writer.append("actions", {"turn": 1, "name": "research"})
+        writer.append("changes", {"turn": 1, "resource": "money"})
+        writer.append("actions", {"turn": 2, "name": "fundraise"})
+        writer.close()
+
+        batches = list(iter_batches(self.path))
+        self.assertEqual([b["turn"] for b in batches], [1, 2])
+        self.assertEqual(batches[0]["rows"], {"actions": 2, "changes": 1})
+        self.assertEqual(batches[0]["columns"]["actions"]["name"], ["hire", "research"])
+
+    def test_read_table_pads_missing_columns(self):
+        """Columns that appear in only some batches are padded with None."""
+        writer = ColumnarRunWriter(self.path)
+        writer.append("actions", {"turn": 1, "name": "hire"})
+        writer.append("actions", {"turn": 2, "name": "spend", "cost": 5})
+        writer.close()
+
+        table = read_table(self.path, "actions")
+        self.assertEqual(table["name"], ["hire", "spend"])
+        self.assertEqual(table["cost"], [None, 5])
+        self.assertEqual(read_table(self.path, "actions", ["cost"]), {"cost": [None, 5]})
+
+    def test_running_checksum_verifies(self):
+        """The trailer checksum matches a recomputation and detects tampering."""
+        writer = ColumnarRunWriter(self.path)
+        for turn in range(5):
+            writer.append("actions", {"turn": turn, "value": turn * 10})
+        checksum = writer.close()
+
+        self.assertEqual(read_trailer(self.path)["checksum"], checksum)
+        self.assertTrue(verify_run_log(self.path))
+
+        lines = self.path.read_bytes().splitlines(keepends=True)
+        lines[0] = lines[0].replace(b'"value":[0]', b'"value":[1]')
+        self.path.write_bytes(b"".join(lines))
+        self.assertFalse(verify_run_log(self.path))
+
+    def test_checksum_without_file(self):
+        """A path-less writer keeps the same checksum as a file-backed one."""
+        memory_only = ColumnarRunWriter()
+        on_disk = ColumnarRunWriter(self.path)
+        for writer in (memory_only, on_disk):
+            writer.append("rng", {"turn": 3, "result": 0.5})
+            writer.close()
+        self.assertEqual(memory_only.checksum, on_disk.checksum)
+
+    def test_append_after_close_rejected(self):
+        """A closed run log cannot be appended to."""
+        writer = ColumnarRunWriter(self.path)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.append("actions", {"turn": 1})
+
+    def test_sealed_file_not_reopened(self):
+        """A new writer on a closed run log refuses to append after its trailer."""
+        writer = ColumnarRunWriter(self.path)
+        writer.append("actions", {"turn": 1})
+        writer.close()
+        sealed = self.path.read_bytes()
+
+        reopened = ColumnarRunWriter(self.path)
+        reopened.append("actions", {"turn": 2})
+        with self.assertRaises(ValueError):
+            reopened.flush()
+        self.assertEqual(self.path.read_bytes(), sealed)
+        self.assertTrue(verify_run_log(self.path))
+
+    def test_mid_turn_checksum_does_not_flush(self):
+        """Reading the checksum mid-turn keeps the turn in one batch."""
+        writer = ColumnarRunWriter(self.path)
+        writer.append("actions", {"turn": 1, "name": "hire"})
+        writer.append("actions", {"turn": 2, "name": "research"})
+        mid_turn = writer.checksum
+        self.assertEqual(writer.batch_count, 1)
+        writer.append("actions", {"turn": 2, "name": "fundraise"})
+        self.assertNotEqual(writer.checksum, mid_turn)
+        checksum = writer.close()
+
+        self.assertEqual(
+            [b["rows"] for b in iter_batches(self.path)], [{"actions": 1}, {"actions": 2}]
+        )
+        self.assertEqual(read_trailer(self.path)["checksum"], checksum)
+        self.assertTrue(verify_run_log(self.path))
+
+
+class TestLoggerStreaming(unittest.TestCase):
+    """Test that both loggers stream rows instead of accumulating them."""
+
+    def setUp(self):
+        """Run inside a temporary working directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore working directory and clean up."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_game_run_logger_streams_actions(self):
+        """GameRunLogger writes actions to the run log and references it on finalize."""
+        logger = GameRunLogger(LoggingLevel.STANDARD)
+        for turn in range(1, 4):
+            logger.log_action("hire", 1, "ok", turn=turn)
+            logger.log_state_change("money", 100, 90, "hire", turn=turn)
+
+        self.assertNotIn("actions", logger.run_data)
+        self.assertEqual(logger.get_data_summary()["data_points"]["actions"], 3)
+
+        summary_path = logger.finalize_session("victory")
+        with open(summary_path, encoding="utf-8") as f:
+            session_info = json.load(f)["session_info"]
+
+        run_log = Path("game_logs") / session_info["run_log"]
+        self.assertTrue(verify_run_log(run_log))
+        self.assertEqual(len(list(iter_batches(run_log))), 3)
+        self.assertEqual(read_table(run_log, "state_changes", ["delta"]), {"delta": [-10] * 3})
+
+        # Rows logged after finalize never land behind the trailer
+        logger.log_action("hire", 1, "ok", turn=4)
+        logger.flush_turn()
+        self.assertTrue(verify_run_log(run_log))
+        self.assertEqual(len(list(iter_batches(run_log))), 3)
+
+    def test_verbose_logger_bounded_buffers(self):
+        """VerboseLogger keeps only the current turn and still exports everything."""
+        logger = VerboseLogger("seed", LogLevel.STANDARD, enable_human_readable=False)
+        for turn in range(10):
+            logger.log_action(turn, "research", 10, 1, {"ok": True})
+            logger.log_resource_change(turn, "money", 100, 90, "research")
+
+        self.assertEqual(len(logger.actions_log), 1)
+        summary = logger.get_game_summary()
+        logger.log_action(9, "fundraise", 0, 1, {"ok": True})  # same turn as the summary
+        self.assertNotEqual(logger.get_game_summary()["log_checksum"], summary["log_checksum"])
+        summary = logger.get_game_summary()
+        self.assertEqual(summary["total_actions"], 11)
+        self.assertEqual(summary["total_turns"], 9)
+        self.assertEqual(
+            summary["resource_summary"]["money"], {"total_change": -100, "transactions": 10}
+        )
+
+        with open(logger.export_json_logs(), encoding="utf-8") as f:
+            exported = json.load(f)
+        self.assertEqual(len(exported["actions"]), 11)
+        self.assertEqual(exported["resource_changes"][3]["turn"], 3)
+
+        logger.close()
+        self.assertEqual(read_trailer(logger.run_log.path)["checksum"], summary["log_checksum"])
+        self.assertEqual([b["turn"] for b in iter_batches(logger.run_log.path)], list(range(10)))
+
+        # Like GameRunLogger, rows logged after close are dropped rather than raising
+        logger.log_action(10, "research", 10, 1, {"ok": True})
+        logger.log_resource_change(10, "money", 90, 80, "research")
+        self.assertEqual(logger.get_game_summary()["total_actions"], 11)
+        self.assertTrue(verify_run_log(logger.run_log.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/compile_event_catalogue.py (the precompiled event catalogue).
+
+What these lock down:
+
+- The compiled timing matches the GDScript retime test: the LEGENDARY_TURNS,
+  RARE_ELIGIBILITY and COMMON_TURNS tables are read out of
+  godot/tests/unit/test_event_retime.gd itself, so the two cannot drift apart.
+- The committed catalogue is not stale against its sources.
+- Override semantics on a fixture: later file wins, dictionaries merge one
+  level, `id` renames, `_` keys are metadata; the timescale dial rescales.
+- Effects are pre-mapped (mapping, then the ResourceAccessor fallback, then
+  scale factors) and unmapped ADR-0015 intermediaries are dropped, as in
+  _calculate_base_effects().
+- Per-turn candidates: exact events only on their turn, random events from
+  their min_turn on, always in corpus (RNG) order.
+
+Run: python -m unittest tests.test_compile_event_catalogue -v
+"""
+
+import json
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import compile_event_catalogue as cec  # noqa: E402
+
+RETIME_TEST = REPO_ROOT / "godot" / "tests" / "unit" / "test_event_retime.gd"
+
+
+def gd_table(name):
+    block = re.search(
+        name + r" := \{(.*?)\n\}", RETIME_TEST.read_text(encoding="utf-8"), re.S
+    ).group(1)
+    return {k: int(v) for k, v in re.findall(r'"(hist_[^"]+)":\s*(\d+)', block)}
+
+
+class TestRealCatalogue(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.catalogue = cec.EventCatalogue(cec.compile_catalogue())
+
+    def test_timing_matches_gdscript_retime_test(self):
+        by_id = self.catalogue.by_id
+        for table, field in (
+            ("LEGENDARY_TURNS", "trigger_turn"),
+            ("RARE_ELIGIBILITY", "eligibility_start"),
+            ("COMMON_TURNS", "trigger_turn"),
+        ):
+            expected = gd_table(table)
+            self.assertTrue(expected, table)
+            self.assertEqual({k: by_id[k][field] for k in expected}, expected, table)
+
+    def test_committed_catalogue_is_fresh(self):
+        self.assertEqual(cec.main(["--check"]), 0, "run python scripts/compile_event_catalogue.py")
+
+    def test_candidates_cover_every_event_in_corpus_order(self):
+        ftx = self.catalogue.events.index(
+            self.catalogue.by_id["hist_ftx_future_fund_collapse_2022"]
+        )
+        self.assertIn(ftx, self.catalogue.candidate_indices(67))
+        self.assertNotIn(ftx, self.catalogue.candidate_indices(66))
+        late = self.catalogue.candidate_indices(self.catalogue.horizon + 50)
+        self.assertEqual(list(late), sorted(late))
+        random_events = [
+            i for i, e in enumerate(self.catalogue.events) if e["trigger_type"] == "random"
+        ]
+        self.assertEqual(list(late), random_events)
+
+
+class TestFixtureCatalogue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.events = root / "historical_events.json"
+        self.overrides = root / "overrides"
+        self.overrides.mkdir()
+        self.curves = root / "rarity_curves.json"
+        self.mapping = root / "variable_mapping.json"
+        self.write(
+            self.events,
+            {
+                "_description": "metadata",
+                "a_2020": {
+                    "title": "A",
+                    "year": 2020,
+                    "rarity": "legendary",
+                    "category": "policy",
+                    "impacts": [
+                        {"variable": "cash", "change": -5},
+                        {"variable": "funding", "change": 2},
+                        {"variable": "global_alarm", "change": 9},
+                    ],
+                },
+                "arxiv_b": {
+                    "title": "B",
+                    "year": 2018,
+                    "rarity": "rare",
+                    "category": "research",
+                    "meta": {"x": 1, "y": 2},
+                },
+                "c": {"title": "C", "year": 2015},
+                "untitled": {"year": 2020},
+            },
+        )
+        self.write(
+            self.overrides / "a.json",
+            {"arxiv_b": {"id": "b_promoted", "meta": {"y": 3}}, "c": {"rarity": "legendary"}},
+        )
+        self.write(self.overrides / "b.json", {"c": {"_reason": "wins", "year": 2019}})
+        self.write(
+            self.curves,
+            {
+                "common": {
+                    "base_probability": 0.12,
+                    "min_turn": 10,
+                    "cooldown_turns": 8,
+                    "trigger_mode": "random_after_eligible",
+                },
+                "rare": {
+                    "base_probability": 0.06,
+                    "min_turn": 20,
+                    "cooldown_turns": 15,
+                    "eligibility_window_turns": 6,
+                    "trigger_mode": "probabilistic_window",
+                },
+                "legendary": {
+                    "base_probability": 1.0,
+                    "min_turn": 1,
+                    "cooldown_turns": 0,
+                    "trigger_mode": "deterministic",
+                },
+                "timescale": "month_per_turn",
+                "timescales": {
+                    "month_per_turn": {
+                        "turns_per_year": 12,
+                        "legendary_month_offset": 6,
+                        "rare_spread_turns": 3,
+                        "rare_eligibility_window_turns": 6,
+                    },
+                    "week_per_turn": {
+                        "turns_per_year": 52,
+                        "legendary_month_offset": 26,
+                        "rare_spread_turns": 13,
+                        "rare_eligibility_window_turns": 26,
+                    },
+                },
+                "year_trigger": {
+                    "turns_per_year": 12,
+                    "base_year": 2017,
+                    "legendary_month_offset": 6,
+                    "rare_spread_turns": 3,
+                },
+            },
+        )
+        self.write(
+            self.mapping,
+            {
+                "mapping": {"cash": "money"},
+                "scale_factors": {"money": 1000},
+                "default_effects": {"common": {"research": 5}, "rare": {"research": 10}},
+            },
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @staticmethod
+    def write(path, data):
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def compile(self):
+        raw = cec.compile_catalogue(self.events, self.overrides, self.curves, self.mapping)
+        return raw, cec.EventCatalogue(json.loads(cec.render(raw)))
+
+    def test_overrides_timing_and_effects(self):
+        raw, catalogue = self.compile()
+        self.assertEqual(
+            [e["id"] for e in catalogue.events], ["hist_a_2020", "hist_b_promoted", "hist_c"]
+        )
+        a, b, c = catalogue.events
+        self.assertEqual((a["trigger_type"], a["trigger_turn"]), ("turn_exact", 43))
+        self.assertEqual(
+            a["effects"], {"money": -3000}
+        )  # cash mapped, funding via fallback, global_alarm dropped
+        self.assertEqual(
+            (b["source_id"], b["channel"], b["effects"]), ("arxiv_b", "", {"research": 10})
+        )
+        self.assertEqual((b["eligibility_start"], b["eligibility_end"]), (13, 19))
+        self.assertEqual(
+            (c["rarity"], c["year"], c["trigger_type"], c["significance"]),
+            ("common", 2019, "random", 5),
+        )
+        self.assertEqual(c["eligibility_start"], 25)  # b.json replaced a.json's entry for c
+        self.assertEqual(len(raw["sources"]), 5)
+
+    def test_week_dial_rescales(self):
+        curves = json.loads(self.curves.read_text())
+        curves["timescale"] = "week_per_turn"
+        self.write(self.curves, curves)
+        _, catalogue = self.compile()
+        self.assertEqual(catalogue.by_id["hist_a_2020"]["trigger_turn"], 3 * 52 + 1 + 26)
+        self.assertEqual(catalogue.by_id["hist_b_promoted"]["eligibility_start"], 53 + 13 - 13)
+
+    def test_candidates_by_turn(self):
+        _, catalogue = self.compile()
+        self.assertEqual(catalogue.candidate_indices(12), ())
+        self.assertEqual(catalogue.candidate_indices(13), (1,))
+        self.assertEqual(catalogue.candidate_indices(43), (0, 1, 2))
+        self.assertEqual(catalogue.candidate_indices(44), (1, 2))
+        self.assertEqual(catalogue.candidate_indices(10_000), (1, 2))
+        with self.assertRaises(ValueError):
+            cec.EventCatalogue({"format": "something-else"})
+
+
+if __name__ == "__main__":
+    unittest.main()
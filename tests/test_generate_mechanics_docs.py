@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Unit tests for the extraction cache and ref diff in scripts/generate_mechanics_docs.py.
+
+What these lock down:
+
+- Cached extraction returns the same constants as a cold scan, and an
+  unchanged file is not re-scanned on the next run.
+- Editing one .gd file re-scans only that file.
+- constants_at() reads other revisions from git objects and diff_constants()
+  reports added, removed and changed constants between two refs.
+
+Run: python -m unittest tests.test_generate_mechanics_docs -v
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import generate_mechanics_docs as gmd  # noqa: E402
+
+GAME_STATE = """extends Node
+
+var money: float = 245000.0  # starting cash
+var reputation: float = 50.0
+const MAX_DOOM: int = 100
+
+func reset():
+\tvar scratch: int = 3
+"""
+
+
+class TestMechanicsExtraction(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.cache = self.root / "cache.json"
+        self.core = self.root / "godot" / "scripts" / "core"
+        self.core.mkdir(parents=True)
+        self.write("game_state.gd", GAME_STATE)
+        self.write("doom.gd", "const DOOM_RATE: float = 1.5\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text, age_s=60):
+        path = self.core / name
+        path.write_text(text, encoding="utf-8")
+        past = path.stat().st_mtime_ns - age_s * 1_000_000_000
+        os.utime(path, ns=(past, past))  # old enough to trust size + mtime
+
+    def git(self, *args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=self.root,
+            check=True,
+            capture_output=True,
+        )
+
+    def extract(self):
+        extractor = gmd.GameDataExtractor(self.root, cache_path=self.cache)
+        defaults = extractor.extract_game_state_defaults()
+        consts = extractor.extract_constants(self.core / "doom.gd", "DOOM")
+        extractor.save_cache()
+        return extractor, defaults, consts
+
+    def test_cache_reuse(self):
+        cold, defaults, consts = self.extract()
+        self.assertEqual(cold.stats["scanned"], 2)
+        self.assertEqual(defaults["money"].value, 245000.0)
+        self.assertEqual(defaults["money"].comment, "starting cash")
+        self.assertEqual(defaults["money"].line_number, 3)
+        self.assertIn("scratch", defaults)  # stripped-line matching, as before the cache
+        self.assertEqual(consts["DOOM_RATE"].source_file, "godot/scripts/core/doom.gd")
+
+        warm, warm_defaults, warm_consts = self.extract()
+        self.assertEqual(warm.stats, {"reused": 2, "rehashed": 0, "scanned": 0})
+        self.assertEqual(warm_defaults, defaults)
+        self.assertEqual(warm_consts, consts)
+
+        self.write("doom.gd", "const DOOM_RATE: float = 2.5\n")
+        edited, _defaults, consts = self.extract()
+        self.assertEqual(edited.stats, {"reused": 1, "rehashed": 0, "scanned": 1})
+        self.assertEqual(consts["DOOM_RATE"].value, 2.5)
+
+    def test_diff_between_refs(self):
+        self.git("init", "-q")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "one")
+        self.write(
+            "game_state.gd",
+            GAME_STATE.replace("50.0", "60.0").replace("const MAX_DOOM: int = 100\n", ""),
+        )
+        self.write("doom.gd", "const DOOM_RATE: float = 1.5\nconst DOOM_CAP: int = 90\n")
+        self.git("commit", "-q", "-am", "two")
+
+        extractor = gmd.GameDataExtractor(self.root, cache_path=self.cache)
+        changes = gmd.diff_constants(
+            extractor.constants_at("HEAD~1"), extractor.constants_at("HEAD")
+        )
+        self.assertEqual(
+            changes,
+            [
+                ("godot/scripts/core/doom.gd", "DOOM_CAP", None, 90),
+                ("godot/scripts/core/game_state.gd", "MAX_DOOM", 100, None),
+                ("godot/scripts/core/game_state.gd", "reputation", 50.0, 60.0),
+            ],
+        )
+        self.assertEqual(extractor.stats["scanned"], 4)
+        extractor.save_cache()
+        again = gmd.GameDataExtractor(self.root, cache_path=self.cache)
+        self.assertEqual(
+            gmd.diff_constants(again.constants_at("HEAD~1"), again.constants_at("HEAD")), changes
+        )
+        self.assertEqual(again.stats["scanned"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/godot_data.py (the shared, cached godot/data loader).
+
+What these lock down:
+
+- A cold load parses every *.json; a warm load in a fresh process (the
+  per-process memo cleared) reuses every entry from the pickle.
+- Editing a file re-parses exactly that file; touching it without a change
+  only re-hashes it; added and deleted files show up / disappear.
+- A cache written by another version of the loader is ignored.
+- A file that is not valid JSON is recorded, and get() refuses it.
+- The real godot/data tree loads without a single parse error.
+
+Run: python -m unittest tests.test_godot_data -v
+"""
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import godot_data  # noqa: E402
+
+
+class TestDataPackCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "data"
+        (self.root / "actions").mkdir(parents=True)
+        self.cache = Path(self.tmp.name) / "cache" / "pack.pickle"
+        self.write("icon_mapping.json", {"actions": {"hire": "hire_64.png"}})
+        self.write("actions/core.json", {"actions": [{"id": "hire"}]})
+        self.write("actions/risk.json", {"table": []})
+        self.age_all()
+
+    def tearDown(self):
+        godot_data._LOADED.pop(str(self.root.resolve()), None)
+        self.tmp.cleanup()
+
+    def write(self, rel, data):
+        (self.root / rel).write_text(json.dumps(data), encoding="utf-8")
+
+    def age(self, rel, seconds=60):
+        path = self.root / rel
+        mtime = path.stat().st_mtime_ns - seconds * 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+    def age_all(self):
+        for path in self.root.rglob("*.json"):
+            self.age(path.relative_to(self.root).as_posix())
+
+    def load(self):
+        godot_data._LOADED.pop(str(self.root.resolve()), None)  # a new process
+        return godot_data.load(self.root, cache_path=self.cache)
+
+    def test_warm_load_reuses_and_edits_reparse(self):
+        cold = self.load()
+        self.assertEqual(cold.stats, {"reused": 0, "rehashed": 0, "parsed": 3})
+        self.assertEqual(
+            [f.rel for f in cold.under("actions")], ["actions/core.json", "actions/risk.json"]
+        )
+        self.assertEqual([f.rel for f in cold.under("", recursive=True)], list(cold.files))
+        self.assertEqual(cold.get("icon_mapping.json")["actions"]["hire"], "hire_64.png")
+
+        warm = self.load()
+        self.assertEqual(warm.stats, {"reused": 3, "rehashed": 0, "parsed": 0})
+        self.assertEqual(warm.get("actions/core.json"), cold.get("actions/core.json"))
+
+        self.write("actions/core.json", {"actions": [{"id": "hire"}, {"id": "fire"}]})
+        self.age("actions/core.json")
+        edited = self.load()
+        self.assertEqual(edited.stats, {"reused": 2, "rehashed": 0, "parsed": 1})
+        self.assertEqual(len(edited.get("actions/core.json")["actions"]), 2)
+
+        self.age("actions/risk.json", seconds=30)  # touched, same bytes
+        self.assertEqual(self.load().stats, {"reused": 2, "rehashed": 1, "parsed": 0})
+
+        (self.root / "actions" / "risk.json").unlink()
+        self.write("actions/new.json", {"actions": []})
+        self.age("actions/new.json")
+        changed = self.load()
+        self.assertEqual(
+            list(changed.files), ["actions/core.json", "actions/new.json", "icon_mapping.json"]
+        )
+        self.assertEqual(changed.stats["parsed"], 1)
+
+    def test_cache_from_other_loader_version_is_ignored(self):
+        self.load()
+        payload = pickle.loads(self.cache.read_bytes())
+        payload["tool"] = "0" * 64
+        self.cache.write_bytes(pickle.dumps(payload))
+        self.assertEqual(self.load().stats["parsed"], 3)
+        self.assertEqual(self.load().stats["reused"], 3)
+
+    def test_invalid_json_is_recorded(self):
+        (self.root / "broken.json").write_text('{"a": ', encoding="utf-8")
+        pack = self.load()
+        self.assertIsNotNone(pack.file("broken.json").error)
+        with self.assertRaises(ValueError):
+            pack.get("broken.json")
+
+
+class TestRealData(unittest.TestCase):
+    def test_godot_data_parses(self):
+        pack = godot_data.load(cache_path=None, refresh=True)
+        self.assertIn("icon_mapping.json", pack)
+        self.assertEqual([f.rel for f in pack.files.values() if f.error], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
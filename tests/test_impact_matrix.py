@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/impact_matrix.py (the memory-mapped impact matrix).
+
+What these lock down:
+
+- Overrides are applied before the matrix is built, records the game drops
+  are left out, and conditional impacts get their own column.
+- Totals, year / category filters, group-by and what-if answer from the
+  mapped bundle.
+- load() rebuilds the bundle when a source file changes.
+
+Run: python -m unittest tests.test_impact_matrix -v
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import impact_matrix as im  # noqa: E402
+
+
+def impact(variable, change, condition=None):
+    return {"variable": variable, "change": change, "condition": condition}
+
+
+class TestImpactMatrix(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.events = root / "historical_events.json"
+        self.overrides = root / "overrides"
+        self.overrides.mkdir()
+        self.bundle = root / "impact_matrix.bin"
+        self.events.write_text(
+            json.dumps(
+                {
+                    "_description": "metadata",
+                    "ftx": {
+                        "title": "FTX",
+                        "year": 2022,
+                        "category": "funding_catastrophe",
+                        "impacts": [impact("cash", -80), impact("stress", 50)],
+                    },
+                    "ousting": {
+                        "title": "Ousting",
+                        "year": 2023,
+                        "category": "organizational_crisis",
+                        "impacts": [impact("cash", -20), impact("cash", 5, "has_board")],
+                    },
+                    "grant": {
+                        "title": "Grant",
+                        "year": 2022,
+                        "category": "funding_catastrophe",
+                        "impacts": [impact("cash", 30)],
+                    },
+                    "untitled": {"year": 2022, "impacts": [impact("cash", -999)]},
+                }
+            ),
+            encoding="utf-8",
+        )
+        (self.overrides / "a.json").write_text(
+            json.dumps({"grant": {"year": 2021}}), encoding="utf-8"
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self):
+        matrix = im.load(self.bundle, self.events, self.overrides)
+        self.addCleanup(matrix.close)
+        return matrix
+
+    def test_queries(self):
+        matrix = self.load()
+        self.assertEqual(matrix.ids, ["ftx", "ousting", "grant"])
+        self.assertEqual(matrix.variables, ["cash", "cash if has_board", "stress"])
+        self.assertEqual(list(matrix.column("cash")), [-80.0, -20.0, 30.0])
+        self.assertEqual(matrix.total("cash", year=2022, category="funding_catastrophe"), -80.0)
+        self.assertEqual(matrix.total("cash", category="nobody"), 0)
+        self.assertEqual(matrix.by("year", "cash"), {2021: 30.0, 2022: -80.0, 2023: -20.0})
+        self.assertEqual(
+            matrix.totals(year=2023), {"cash": -20.0, "cash if has_board": 5.0, "stress": 0}
+        )
+        self.assertEqual(matrix.what_if("cash", 0.8, sign=-1), (-70.0, -50.0))
+        self.assertEqual(matrix.what_if("cash", 2, year=2021), (30.0, 60.0))
+        with self.assertRaises(KeyError):
+            matrix.column("doom")
+
+    def test_rebuilds_when_sources_change(self):
+        self.load()
+        (self.overrides / "b.json").write_text(
+            json.dumps({"ftx": {"impacts": [impact("cash", -10)]}}), encoding="utf-8"
+        )
+        matrix = self.load()
+        self.assertEqual(list(matrix.column("cash")), [-10.0, -20.0, 30.0])
+        self.assertEqual(len(matrix.sources), 3)
+
+
+class TestRealData(unittest.TestCase):
+    def test_real_catalogue_builds(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            matrix = im.load(Path(tmp) / "bundle.bin")
+            try:
+                self.assertEqual(len(matrix), len(im.cec.EventCatalogue.load().events))
+                self.assertIn("vibey_doom", matrix.variables)
+            finally:
+                matrix.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
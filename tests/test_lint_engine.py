@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/lint_engine.py (one-pass, hash-cached file linting).
+
+What these lock down:
+
+- One scan runs every applicable rule, findings come back per rule in path
+  order, and files outside a rule's suffixes / include filter are skipped.
+- A warm scan re-runs nothing and returns the same findings; an edited file
+  is re-checked alone, a touched file is only re-hashed, a deleted file is
+  forgotten.
+- Invalid UTF-8 is skipped by strict rules and linted by "replace" rules.
+- The process-pool path returns what the in-process path does.
+- The rules moved onto the engine (no-emoji, scene-nav) still flag what they
+  flagged before.
+- walk() returns paths under the base the caller passed, so the ASCII
+  converter's default relative directory works and its ignore list applies.
+
+Run: python -m unittest tests.test_lint_engine -v
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import check_no_emoji  # noqa: E402
+import check_scene_nav  # noqa: E402
+import lint_engine  # noqa: E402
+
+CALLS = []
+
+
+def todo_lines(rel, text):
+    CALLS.append(("todo", Path(rel).name))
+    return [(Path(rel).name, n) for n, line in enumerate(text.splitlines(), 1) if "TODO" in line]
+
+
+def long_files(rel, text):
+    CALLS.append(("long", Path(rel).name))
+    return [(Path(rel).name, len(text))] if len(text) > 20 else []
+
+
+def _not_vendored(rel):
+    return "/vendor/" not in rel
+
+
+RULES = [
+    lint_engine.Rule("todo", (".gd", ".py"), todo_lines, _not_vendored),
+    lint_engine.Rule("long", (".gd",), long_files),
+    lint_engine.Rule("todo-raw", (".bin",), todo_lines, decode_errors="replace"),
+]
+
+
+class TestScan(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name) / "tree"
+        (self.base / "vendor").mkdir(parents=True)
+        (self.base / ".git").mkdir()
+        self.cache = Path(self.tmp.name) / "cache.json"
+        self.write("a.gd", "# TODO one\nvar x = 1  # TODO two\n")
+        self.write("b.py", "print('ok')\n")
+        self.write("vendor/c.gd", "# TODO vendored\n")
+        self.write(".git/d.py", "# TODO never walked\n")
+        self.write("notes.md", "TODO not a linted type\n")
+        (self.base / "e.bin").write_bytes(b"\xff TODO\n")
+        for path in self.base.rglob("*.*"):
+            self.age(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel, text):
+        (self.base / rel).write_text(text, encoding="utf-8")
+
+    @staticmethod
+    def age(path, seconds=60):
+        mtime = path.stat().st_mtime_ns - seconds * 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+    def scan(self, **kwargs):
+        CALLS.clear()
+        stats = {}
+        kwargs.setdefault("jobs", 1)
+        kwargs.setdefault("cache_path", self.cache)
+        findings = lint_engine.scan(RULES, base=self.base, stats=stats, **kwargs)
+        return findings, stats
+
+    def test_one_pass_then_cached(self):
+        cold, stats = self.scan()
+        self.assertEqual(
+            cold,
+            {
+                "todo": [("a.gd", 1), ("a.gd", 2)],
+                "long": [("a.gd", 33)],
+                "todo-raw": [("e.bin", 1)],
+            },
+        )
+        self.assertEqual(
+            sorted(CALLS),
+            sorted(
+                [
+                    ("todo", "a.gd"),
+                    ("long", "a.gd"),
+                    ("todo", "b.py"),
+                    ("long", "c.gd"),
+                    ("todo", "e.bin"),
+                ]
+            ),
+        )
+        self.assertEqual(stats, {"reused": 0, "rehashed": 0, "checked": 4})
+
+        warm, stats = self.scan()
+        self.assertEqual(
+            (warm, CALLS, stats), (cold, [], {"reused": 4, "rehashed": 0, "checked": 0})
+        )
+
+        self.write("b.py", "# TODO new\n")
+        self.age(self.base / "b.py")
+        self.age(self.base / "a.gd", seconds=30)  # touched, same bytes
+        edited, stats = self.scan()
+        self.assertEqual(CALLS, [("todo", "b.py")])
+        self.assertEqual(stats, {"reused": 2, "rehashed": 1, "checked": 1})
+        self.assertEqual(edited["todo"], [("a.gd", 1), ("a.gd", 2), ("b.py", 1)])
+
+        (self.base / "a.gd").unlink()
+        self.assertEqual(self.scan()[0]["todo"], [("b.py", 1)])
+        self.assertEqual(len(lint_engine._load_cache(self.cache)), 3)
+
+    def test_explicit_paths_and_no_cache(self):
+        findings, _ = self.scan(paths=[self.base / "a.gd", self.base / "notes.md"], cache_path=None)
+        self.assertEqual(findings["todo"], [("a.gd", 1), ("a.gd", 2)])
+        self.assertFalse(self.cache.exists())
+
+    def test_process_pool_matches_in_process(self):
+        for i in range(12):
+            self.write(f"gen_{i:02d}.gd", "# TODO\n" * i)
+        serial, _ = self.scan(cache_path=None)
+        with mock.patch.object(lint_engine, "PARALLEL_MIN_FILES", 4):
+            pooled, stats = self.scan(cache_path=None, jobs=2)
+        self.assertEqual((pooled, stats["checked"]), (serial, 16))
+
+
+class TestToolRules(unittest.TestCase):
+    def test_no_emoji_rules(self):
+        self.assertEqual(
+            check_no_emoji.ascii_violations("x.gd", "ok\na \u2014 b"), [("x.gd", 2, 3, 0x2014)]
+        )
+        scene = 'glyph = "\u2192"\ntext = "Go \u2192\nnext \u2014 line"\nicon = "\u2605"\n'
+        self.assertEqual(
+            [v[1:3] for v in check_no_emoji.emoji_violations("s.tscn", scene)], [(4, 9)]
+        )
+        self.assertEqual(
+            [v[1:3] for v in check_no_emoji.tscn_authored_violations("s.tscn", scene)],
+            [(2, 12), (3, 6)],
+        )
+        rules = {rule.name: rule for rule in check_no_emoji.RULES}
+        self.assertFalse(rules["no-emoji/ascii-gd"].applies("godot/addons/gut/x.gd"))
+        self.assertTrue(rules["no-emoji/ascii-json"].applies("godot/data/actions/core.json"))
+
+    def test_scene_nav_rule(self):
+        source = (
+            '"""Docs:\nnever call .change_scene_to_file() here\n"""\nget_tree().reload_current_scene()\n'
+            "get_tree().change_scene_to_file(p)  # scene-nav-allow\n"
+        )
+        self.assertEqual(
+            check_scene_nav.scan_text("godot/x.gd", source),
+            [("godot/x.gd", 4, "get_tree().reload_current_scene()")],
+        )
+        self.assertFalse(check_scene_nav.RULES[0].applies(check_scene_nav.SANCTIONED))
+
+
+class TestWalk(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        (self.base / "docs").mkdir()
+        (self.base / "archive").mkdir()
+        (self.base / "docs" / "a.md").write_text("caf\u00e9 \u2014 ok\n", encoding="utf-8")
+        (self.base / "archive" / "old.md").write_text("old \u2014 notes\n", encoding="utf-8")
+        (self.base / "b.md").write_text("plain\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_relative_base_gives_relative_paths(self):
+        cwd = os.getcwd()
+        os.chdir(self.base)
+        try:
+            paths = lint_engine.walk(Path("."), (".md",))
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(paths, [Path("b.md"), Path("archive/old.md"), Path("docs/a.md")])
+        self.assertEqual(
+            lint_engine.walk(self.base / "docs", (".md",)), [self.base / "docs" / "a.md"]
+        )
+
+    def test_ascii_converter_default_directory(self):
+        result = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "intelligent_ascii_converter.py")],
+            cwd=self.base,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+        self.assertIn("docs/a.md", result.stdout)
+        self.assertIn(
+            "Skipping ignored file: archive/old.md", result.stdout
+        )  # .asciiignore: archive/**
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,7 @@ Performance Target: 1000+ game simulations per minute
 """
 
 import unittest
+from unittest import mock
 import sys
 import os
 import time
@@ -82,7 +83,41 @@ class TestProgrammaticControllerInitialization(unittest.TestCase):
         self.assertTrue(controller.headless)
         self.assertIsNotNone(controller.game_state)
         # Should initialize without pygame window or visual elements
-    
+        self.assertTrue(controller.game_state.headless)
+
+    def test_headless_game_state_profile(self):
+        """Test that headless GameState skips audio and UI managers, nothing else."""
+        game_state = GameState("headless-profile-001", headless=True)
+        full = GameState("headless-profile-001")
+
+        self.assertFalse(game_state.sound_manager.audio_available)
+        self.assertEqual(game_state.tutorial_enabled, full.tutorial_enabled)
+        self.assertEqual(game_state.employee_blobs, full.employee_blobs)
+        # UI managers are only built on first use
+        for name in ('input_manager', 'ui_transition_manager', 'overlay_manager', 'employee_blob_manager'):
+            self.assertNotIn(name, vars(game_state))
+
+    def test_headless_construction_never_builds_deferred_managers(self):
+        """Test that GameState(seed, headless=True) never reaches a deferred manager factory."""
+        names = ('input_manager', 'ui_transition_manager', 'overlay_manager', 'employee_blob_manager')
+        factories = {name: mock.Mock(name=name) for name in names}
+        with mock.patch.multiple(GameState, **{name: type(GameState.__dict__[name])(factories[name])
+                                               for name in names}):
+            game_state = GameState("headless-profile-003", headless=True)
+            touched = [name for name in names if factories[name].called]
+            self.assertEqual(touched, [])
+            # The deferred attributes are still there, and built on first use
+            self.assertIs(game_state.overlay_manager, factories['overlay_manager'].return_value)
+            factories['overlay_manager'].assert_called_once_with(game_state)
+
+    def test_headless_matches_full_profile_resources(self):
+        """Test that the headless profile starts from the same game state."""
+        headless = GameState("headless-profile-002", headless=True)
+        full = GameState("headless-profile-002")
+
+        for attr in ('money', 'staff', 'reputation', 'doom', 'action_points', 'lab_name'):
+            self.assertEqual(getattr(headless, attr), getattr(full, attr))
+
     def test_config_override(self):
         """Test initialization with configuration overrides."""
         config = {"test_mode": True, "verbose": False}
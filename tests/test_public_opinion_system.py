@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch
 from src.core.game_state import GameState
 from src.features.public_opinion import (
     PublicOpinion, MediaStory, MediaStoryType, OpinionCategory, 
-    OpinionModifier, create_media_story_from_action
+    OpinionModifier, create_media_story_from_action, HISTORY_LENGTH
 )
 from src.features.media_system import MediaSystem
 
@@ -166,6 +166,58 @@ class TestPublicOpinion(unittest.TestCase):
         self.assertEqual(len(restored_opinion.active_stories), 1)
         self.assertEqual(restored_opinion.active_stories[0].headline, 'Test Story')
 
+    def test_history_is_bounded_ring_buffer(self):
+        '''Test that history keeps only the most recent HISTORY_LENGTH values.'''
+        for turn in range(HISTORY_LENGTH * 3):
+            self.opinion.media_attention = float(turn)
+            self.opinion._record_history()
+
+        history = self.opinion.opinion_history['media_attention']
+        self.assertEqual(len(history), HISTORY_LENGTH)
+        self.assertEqual(history[-1], float(HISTORY_LENGTH * 3 - 1))
+        self.assertEqual(history[0], float(HISTORY_LENGTH * 2))
+
+        # Serialized history stays a plain list
+        self.assertEqual(len(self.opinion.to_dict()['opinion_history']['media_attention']), HISTORY_LENGTH)
+
+    def test_modifiers_expire_in_duration_order(self):
+        '''Test that overlapping modifiers apply together and expire independently.'''
+        self.opinion.add_modifier(OpinionModifier(OpinionCategory.TRUST_IN_PLAYER, 4.0, duration=3))
+        self.opinion.add_modifier(OpinionModifier(OpinionCategory.TRUST_IN_PLAYER, 2.0, duration=1))
+        self.opinion.decay_rate = 0.0
+
+        self.opinion.update_turn(1)
+        self.assertEqual(self.opinion.trust_in_player, 56.0)
+        self.assertEqual(len(self.opinion.active_modifiers), 1)
+
+        self.opinion.update_turn(2)
+        self.opinion.update_turn(3)
+        self.assertEqual(self.opinion.trust_in_player, 64.0)
+        self.assertEqual(len(self.opinion.active_modifiers), 0)
+
+        self.opinion.update_turn(4)
+        self.assertEqual(self.opinion.trust_in_player, 64.0)
+
+    def test_safety_story_pauses_awareness_decay(self):
+        '''Test that awareness only fades once safety stories have expired.'''
+        story = MediaStory(
+            headline='Safety Concern Raised',
+            story_type=MediaStoryType.SAFETY_CONCERN,
+            sentiment_impact={OpinionCategory.AI_SAFETY_AWARENESS: 10.0},
+            duration=2,
+            attention_level=10.0,
+            created_turn=1
+        )
+        self.opinion.add_media_story(story)
+        awareness = self.opinion.ai_safety_awareness
+
+        self.opinion.update_turn(2)
+        self.assertEqual(self.opinion.ai_safety_awareness, awareness)
+
+        self.opinion.update_turn(3)
+        self.assertEqual(len(self.opinion.active_stories), 0)
+        self.assertLess(self.opinion.ai_safety_awareness, awareness)
+
 
 class TestMediaStory(unittest.TestCase):
     '''Test the MediaStory class.'''
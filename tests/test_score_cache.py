@@ -0,0 +1,133 @@
+"""Unit tests for server/leaderboard/score_cache.py (ETag read-through cache).
+
+GETs are served from pre-serialized responses until a POST through the
+cache actually changes that board; duplicates and capped-out entries do not
+invalidate, If-None-Match with the current ETag is a 304, and the HTTP
+front end proxies to a real score_service over keep-alive connections.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "server" / "leaderboard"))
+
+import load_test  # noqa: E402  (deliberate late import; sys.path just set)
+from score_cache import HttpUpstream, LocalUpstream, ScoreCache  # noqa: E402
+from score_service import BoardStore, ScoreService  # noqa: E402
+
+TOKEN = "test-token"
+AUTH = {"x-pdoom-token": TOKEN}
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestScoreCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = BoardStore(Path(self.tmp.name), max_entries=3)
+        self.upstream = LocalUpstream(ScoreService(self.store, TOKEN))
+        self.cache = ScoreCache(self.upstream)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def get(self, query, headers=None):
+        return run(self.cache.handle("GET", f"/score_api.php?{query}", headers or {}, b""))
+
+    def post(self, body, target="/score_api.php"):
+        return run(self.cache.handle("POST", target, AUTH, json.dumps(body).encode()))
+
+    def test_get_is_served_from_cache_until_board_changes(self):
+        self.post({"seed": "s", "score": 5, "entry_uuid": "a"})
+        status, headers, body = self.get("seed=s&limit=10")
+        self.assertEqual(json.loads(body)["entries"][0]["score"], 5)
+        before = self.upstream.requests
+
+        self.assertEqual(self.get("seed=s&limit=10")[2], body)
+        self.assertEqual(self.upstream.requests, before)  # hit, no upstream GET
+        self.get("seed=s&limit=20")
+        self.assertEqual(self.upstream.requests, before + 1)  # each limit cached separately
+
+        # Duplicate and a POST to another board do not invalidate
+        self.post({"seed": "s", "score": 9, "entry_uuid": "a"})
+        self.post({"seed": "other", "score": 1})
+        requests = self.upstream.requests
+        self.assertEqual(self.get("seed=s&limit=10")[1]["ETag"], headers["ETag"])
+        self.assertEqual(self.upstream.requests, requests)
+
+        self.post({"seed": "s", "score": 7})
+        status, new_headers, new_body = self.get("seed=s&limit=10")
+        self.assertNotEqual(new_headers["ETag"], headers["ETag"])
+        self.assertEqual([e["score"] for e in json.loads(new_body)["entries"]], [7, 5])
+
+    def test_if_none_match_returns_304(self):
+        self.post({"seed": "s", "score": 5})
+        etag = self.get("seed=s")[1]["ETag"]
+        requests = self.upstream.requests
+        status, headers, body = self.get("seed=s&limit=5", {"if-none-match": etag})
+        self.assertEqual((status, body), (304, b""))
+        self.assertEqual(self.upstream.requests, requests)
+
+        self.post({"seed": "s", "score": 6})
+        self.assertEqual(self.get("seed=s", {"if-none-match": etag})[0], 200)
+        self.assertNotEqual(
+            ScoreCache(self.upstream).etag("board_s__none.json"), etag
+        )  # per-process epoch
+
+    def test_only_changing_posts_invalidate(self):
+        for score in (10, 9, 8):
+            self.post({"seed": "s", "score": score})
+        etag = self.get("seed=s")[1]["ETag"]
+        self.post({"seed": "s", "score": 1})  # misses the 3-entry cap
+        self.post({"seed": "s", "player_name": "x"})  # rejected
+        self.assertEqual(self.get("seed=s")[1]["ETag"], etag)
+
+        status, _, body = self.post(
+            {"entries": [{"seed": "s", "score": 2}, {"seed": "t", "score": 4}]},
+            "/score_api.php?batch=1",
+        )
+        self.assertEqual([r["added"] for r in json.loads(body)["results"]], [False, True])
+        self.assertEqual(self.get("seed=s")[1]["ETag"], etag)
+        self.assertEqual(self.cache.versions, {"board_s__none.json": 3, "board_t__none.json": 1})
+
+    def test_cached_responses_are_lru_bounded(self):
+        cache = ScoreCache(self.upstream, max_cached=2)
+        for seed in ("a", "b", "a", "c"):
+            run(cache.handle("GET", f"/?seed={seed}", {}, b""))
+        self.assertEqual(list(cache._cache), [("a", "none", 20), ("c", "none", 20)])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_http_proxy_round_trip(self):
+        async def scenario():
+            service = ScoreService(self.store, TOKEN)
+            upstream_port = await service.start("127.0.0.1", 0)
+            cache = ScoreCache(HttpUpstream("127.0.0.1", upstream_port))
+            port = await cache.start("127.0.0.1", 0)
+            client = load_test.Client("127.0.0.1", port, "/score_api.php")
+            try:
+                await client.post({"seed": "h", "score": 3}, TOKEN)
+                first = await client.request("GET", "/score_api.php?seed=h")
+                second = await client.request("GET", "/score_api.php?seed=h")
+                stats = (cache.hits, cache.misses, cache.upstream.requests)
+            finally:
+                await client.close()
+                await cache.stop()
+                await service.stop()
+            return first, second, stats
+
+        first, second, stats = run(scenario())
+        self.assertEqual(first, second)
+        self.assertEqual(first[1]["entries"][0]["score"], 3)
+        self.assertEqual(stats, (1, 1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""Unit tests for server/leaderboard/score_history.py (full score history).
+
+The quantile sketch is exact below SKETCH_EXACT and within ~1% above it;
+shards roll over and are gzipped, a crash before the manifest save loses
+nothing, retention drops raw rows but keeps them counted, an entry_uuid is
+recorded once across every retained shard, and score_service with a history
+answers percentile_of for entries that missed the top-N cap.
+"""
+
+import gzip
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "server" / "leaderboard"))
+
+from score_history import (  # noqa: E402  (sys.path just set)
+    BoardHistory,
+    QuantileSketch,
+    ScoreHistory,
+)
+from score_service import BoardStore, ScoreService  # noqa: E402
+
+TOKEN = "test-token"
+AUTH = {"x-pdoom-token": TOKEN}
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_exact_range_percentiles_and_quantiles(self):
+        sketch = QuantileSketch()
+        for score in range(1, 101):
+            sketch.add(score)
+        self.assertEqual(sketch.percentile(1), 0.0)
+        self.assertEqual(sketch.percentile(84), 83.0)
+        self.assertEqual(sketch.percentile(500), 100.0)
+        self.assertEqual((sketch.quantile(0.5), sketch.quantile(0.99)), (50, 99))
+
+    def test_large_scores_within_relative_error_and_round_trip(self):
+        rng = random.Random(7)
+        scores = sorted(rng.randint(1, 10**7) for _ in range(5000))
+        sketch = QuantileSketch()
+        for score in scores:
+            sketch.add(score)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = scores[int(q * len(scores)) - 1]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1.0, delta=0.02)
+        probe = scores[2500]
+        self.assertAlmostEqual(sketch.percentile(probe), 50.0, delta=1.0)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        self.assertEqual((restored.total, restored.counts), (sketch.total, sketch.counts))
+        self.assertEqual(restored.percentile(probe), sketch.percentile(probe))
+
+
+class TestBoardHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "board_s__v"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shards_seal_gzip_and_retention(self):
+        history = BoardHistory(self.path, shard_entries=4, max_cold_shards=2)
+        for score in range(13):
+            history.record({"score": score, "entry_uuid": f"u{score}"})
+        history.close()
+
+        self.assertEqual(
+            [s["name"] for s in history.shards], ["shard_00001.jsonl.gz", "shard_00002.jsonl.gz"]
+        )
+        self.assertFalse((self.path / "shard_00000.jsonl.gz").exists())
+        self.assertEqual(
+            sorted(p.name for p in self.path.iterdir()),
+            ["manifest.json", "shard_00001.jsonl.gz", "shard_00002.jsonl.gz", "shard_00003.jsonl"],
+        )
+        with gzip.open(self.path / "shard_00001.jsonl.gz", "rt") as f:
+            self.assertEqual([json.loads(line)["score"] for line in f], [4, 5, 6, 7])
+
+        reopened = BoardHistory(self.path, shard_entries=4, max_cold_shards=2)
+        self.assertEqual((reopened.sketch.total, reopened.dropped), (13, 4))
+        self.assertEqual([e["score"] for e in reopened.entries()], list(range(4, 13)))
+        self.assertEqual(reopened.sketch.percentile(2), 100 * 2 / 13)  # dropped rows still counted
+
+    def test_uuid_in_a_sealed_shard_is_not_recorded_again(self):
+        history = BoardHistory(self.path, shard_entries=2, max_cold_shards=1)
+        for uuid in ("a", "b", "c"):
+            self.assertTrue(history.record({"score": 1, "entry_uuid": uuid}))
+        self.assertFalse(
+            history.record({"score": 1, "entry_uuid": "a"})
+        )  # "a" is in sealed shard 0
+        history.close()
+
+        reopened = BoardHistory(self.path, shard_entries=2, max_cold_shards=1)
+        self.assertFalse(reopened.record({"score": 1, "entry_uuid": "b"}))
+        self.assertTrue(
+            reopened.record({"score": 1, "entry_uuid": "d"})
+        )  # seals shard 1, expires shard 0
+        self.assertTrue(
+            reopened.record({"score": 1, "entry_uuid": "a"})
+        )  # expired rows are forgotten
+        self.assertFalse(reopened.record({"score": 1, "entry_uuid": "c"}))
+        self.assertEqual(reopened.sketch.total, 5)
+        reopened.close()
+
+    def test_crash_before_manifest_save_replays_open_shard(self):
+        history = BoardHistory(self.path)
+        history.record({"score": 5, "entry_uuid": "a"})
+        history.save()
+        history.record({"score": 9, "entry_uuid": "b"})
+        history._file.close()  # crash: no save()
+        with open(history.open_path, "a") as f:
+            f.write('{"score": 1')  # torn append
+
+        reopened = BoardHistory(self.path)
+        self.assertEqual((reopened.sketch.total, reopened.open_entries), (2, 2))
+        self.assertFalse(reopened.record({"score": 9, "entry_uuid": "b"}))
+        self.assertTrue(reopened.record({"score": 3}))
+        reopened.close()
+        self.assertEqual([e["score"] for e in BoardHistory(self.path).entries()], [5, 9, 3])
+
+
+class TestServiceHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = Path(self.tmp.name)
+        self.store = BoardStore(self.data, max_entries=3, history=ScoreHistory(self.data))
+        self.service = ScoreService(self.store, TOKEN)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def post(self, body):
+        return self.service.handle("POST", "/score_api.php", AUTH, json.dumps(body).encode())[1]
+
+    def test_percentiles_cover_entries_below_the_cap(self):
+        for score in range(10, 0, -1):
+            result = self.post({"seed": "s", "score": score, "entry_uuid": f"u{score}"})
+        self.assertEqual((result["added"], result["percentile"]), (False, 0.0))
+        self.assertEqual(
+            self.post({"seed": "s", "score": 10, "entry_uuid": "u10"})["duplicate"], True
+        )
+        replay = self.post({"seed": "s", "score": 1, "entry_uuid": "u1"})  # fell off the top 3
+        self.assertEqual((replay["added"], replay["duplicate"]), (False, True))
+        self.assertNotIn("percentile", replay)
+
+        status, body = self.service.handle("GET", "/score_api.php?seed=s&percentile_of=8", {}, b"")
+        self.assertEqual((status, body["percentile"], body["total"]), (200, 70.0, 10))
+        self.assertEqual(
+            len(self.service.handle("GET", "/score_api.php?seed=s", {}, b"")[1]["entries"]), 3
+        )
+        self.assertEqual(
+            self.service.handle("GET", "/?seed=nobody&percentile_of=1", {}, b"")[1]["total"], 0
+        )
+        self.assertFalse((self.data / "history" / "board_nobody__none").exists())
+
+        self.store.close()
+        restarted = BoardStore(self.data, max_entries=3, history=ScoreHistory(self.data))
+        self.assertEqual(restarted.percentile("s", "none", 8), (70.0, 10))
+        restarted.close()
+
+    def test_percentile_of_needs_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = BoardStore(Path(tmp))
+            status, body = ScoreService(store, TOKEN).handle(
+                "GET", "/?seed=s&percentile_of=1", {}, b""
+            )
+            store.close()
+        self.assertEqual((status, body["error"]), (404, "history disabled"))
+
+
+if __name__ == "__main__":
+    unittest.main()
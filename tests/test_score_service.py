@@ -0,0 +1,189 @@
+"""Unit tests for server/leaderboard/score_service.py (the score_api.php drop-in).
+
+The service must keep score_api.php's contract: same whitelist, entry_uuid
+idempotency, ADR-0002 order (score DESC, doom_integral DESC, submission order
+on a full tie), the 100-entry cap, and board_<seed>__<version>.json files the
+website can read. These tests pin that contract, the ?batch=1 multi-entry POST, and the write log: accepted
+POSTs survive a restart before compaction, and compaction never double-adds.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "server" / "leaderboard"))
+
+import load_test  # noqa: E402  (deliberate late import; sys.path just set)
+from score_service import LOG_NAME, BoardStore, RankedBoard, ScoreService  # noqa: E402
+
+TOKEN = "test-token"
+
+
+def post(service, body, token=TOKEN):
+    raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return service.handle("POST", "/score_api.php", {"x-pdoom-token": token}, raw)
+
+
+def get(service, query):
+    return service.handle("GET", f"/score_api.php?{query}", {}, b"")
+
+
+class TestRankedBoard(unittest.TestCase):
+    def test_adr_0002_order_and_ties(self):
+        board = RankedBoard()
+        board.insert({"score": 10, "doom_integral": 5, "player_name": "a"})
+        board.insert({"score": 12, "doom_integral": 1, "player_name": "b"})
+        board.insert({"score": 10, "doom_integral": 9, "player_name": "c"})
+        board.insert({"score": 10, "doom_integral": 5, "player_name": "d"})
+        self.assertEqual([e["player_name"] for e in board.entries()], ["b", "c", "a", "d"])
+
+    def test_cap_drops_lowest_and_reports_rank_zero(self):
+        board = RankedBoard(max_entries=3)
+        for i, score in enumerate([5, 6, 7]):
+            board.insert({"score": score, "entry_uuid": f"u{i}"})
+        self.assertEqual(board.insert({"score": 1, "entry_uuid": "low"}), 0)
+        self.assertEqual(board.insert({"score": 9, "entry_uuid": "high"}), 1)
+        self.assertEqual(len(board), 3)
+        self.assertEqual(board.rank_of_uuid("u0"), 0)  # pushed off the board
+        self.assertEqual(board.rank_of_uuid("u2"), 2)
+
+
+class TestScoreServiceContract(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.store = BoardStore(self.data_dir)
+        self.service = ScoreService(self.store, TOKEN)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_post_validation(self):
+        self.assertEqual(post(self.service, {"score": 1}, token="wrong")[0], 403)
+        self.assertEqual(post(self.service, b"{not json")[0], 400)
+        self.assertEqual(
+            post(self.service, {"player_name": "x"}), (400, {"ok": False, "error": "missing score"})
+        )
+        self.assertEqual(post(self.service, b"x" * 9000)[0], 413)
+        self.assertEqual(self.service.handle("DELETE", "/score_api.php", {}, b"")[0], 405)
+
+    def test_whitelist_and_php_casts(self):
+        status, body = post(
+            self.service,
+            {"seed": "s", "version": "v", "score": "42", "player_name": "L" * 50, "is_admin": True},
+        )
+        self.assertEqual((status, body), (200, {"ok": True, "added": True, "rank": 1}))
+        entry = get(self.service, "seed=s&version=v")[1]["entries"][0]
+        self.assertEqual(entry, {"score": 42, "doom_integral": 0, "player_name": "L" * 40})
+
+    def test_entry_uuid_idempotent(self):
+        post(self.service, {"seed": "s", "score": 50, "entry_uuid": "top"})
+        post(self.service, {"seed": "s", "score": 10, "entry_uuid": "abc"})
+        status, body = post(self.service, {"seed": "s", "score": 99, "entry_uuid": "abc"})
+        self.assertEqual(body, {"ok": True, "added": False, "duplicate": True, "rank": 2})
+        self.assertEqual(len(get(self.service, "seed=s")[1]["entries"]), 2)
+
+    def test_get_defaults_and_limit(self):
+        for score in range(30):
+            post(self.service, {"seed": "default", "version": "none", "score": score})
+        status, body = get(self.service, "limit=0")
+        self.assertEqual(len(body["entries"]), 1)
+        self.assertEqual(body["entries"][0]["score"], 29)
+        self.assertEqual(len(get(self.service, "")[1]["entries"]), 20)
+        self.assertEqual(get(self.service, "seed=unknown")[1]["entries"], [])
+
+    def test_batch_post(self):
+        batch = {
+            "entries": [
+                {"seed": "s", "score": 5, "entry_uuid": "a"},
+                {"seed": "t", "score": 9},
+                {"seed": "s", "player_name": "no score"},
+                "not an entry",
+                {"seed": "s", "score": 7, "entry_uuid": "a"},
+            ]
+        }
+        raw = json.dumps(batch).encode()
+        status, body = self.service.handle(
+            "POST", "/score_api.php?batch=1", {"x-pdoom-token": TOKEN}, raw
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            body["results"],
+            [
+                {"ok": True, "added": True, "rank": 1},
+                {"ok": True, "added": True, "rank": 1},
+                {"ok": False, "error": "missing score"},
+                {"ok": False, "error": "bad entry"},
+                {"ok": True, "added": False, "duplicate": True, "rank": 1},
+            ],
+        )
+        self.assertEqual([e["score"] for e in get(self.service, "seed=s")[1]["entries"]], [5])
+
+        too_many = json.dumps({"entries": [{"score": 1}] * 51}).encode()
+        self.assertEqual(
+            self.service.handle(
+                "POST", "/score_api.php?batch=1", {"x-pdoom-token": TOKEN}, too_many
+            )[0],
+            413,
+        )
+        self.assertEqual(
+            self.service.handle(
+                "POST", "/score_api.php?batch=1", {"x-pdoom-token": TOKEN}, b'{"score": 1}'
+            )[0],
+            400,
+        )
+
+    def test_log_replay_and_compaction(self):
+        post(self.service, {"seed": "s", "version": "v", "score": 7, "entry_uuid": "a"})
+        post(self.service, {"seed": "s", "version": "v", "score": 3})
+        self.assertFalse((self.data_dir / "board_s__v.json").exists())
+
+        # Restart before compaction: the log alone restores the board
+        restarted = BoardStore(self.data_dir)
+        self.assertEqual([e["score"] for e in restarted.top("s", "v", 10)], [7, 3])
+
+        # Board written but log not yet truncated (crash mid-compaction): no double add
+        log_before = (self.data_dir / LOG_NAME).read_text()
+        self.assertEqual(len(log_before.splitlines()), 2)
+        restarted.compact()
+        (self.data_dir / LOG_NAME).write_text(log_before)
+        again = BoardStore(self.data_dir)
+        self.assertEqual([e["score"] for e in again.top("s", "v", 10)], [7, 3])
+
+        again.compact()
+        self.assertEqual((self.data_dir / LOG_NAME).read_text(), "")
+        on_disk = json.loads((self.data_dir / "board_s__v.json").read_text())
+        self.assertEqual([e["score"] for e in on_disk], [7, 3])
+        restarted.close()
+        again.close()
+
+
+class TestScoreServiceHttp(unittest.TestCase):
+    def test_load_round_trip(self):
+        async def scenario():
+            with tempfile.TemporaryDirectory() as data_dir:
+                service = ScoreService(BoardStore(Path(data_dir)), TOKEN)
+                port = await service.start("127.0.0.1", 0)
+                try:
+                    stats = await load_test.run_load(
+                        "127.0.0.1", port, "/score_api.php", TOKEN, submits=300, clients=8, boards=3
+                    )
+                    consistent = await load_test.check_boards(
+                        service, "127.0.0.1", port, "/score_api.php", boards=3
+                    )
+                finally:
+                    await service.stop()
+            return stats, consistent
+
+        stats, consistent = asyncio.run(scenario())
+        self.assertEqual(stats["errors"], 0)
+        self.assertTrue(consistent)
+
+
+if __name__ == "__main__":
+    unittest.main()
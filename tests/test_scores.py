@@ -2,11 +2,14 @@
 Tests for scoring functionality.
 '''
 
+import os
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 
 from src.scores.local_store import ScoreEntry, LocalLeaderboard
+from src.scores.leaderboard_catalog import LeaderboardCatalog
 from src.scores.remote_store_stub import RemoteLeaderboard, RemoteStoreManager
 
 
@@ -404,6 +407,201 @@ class TestLocalLeaderboard:
             assert not_removed is False
 
 
+class TestLeaderboardJournal:
+    '''Test cases for LocalLeaderboard indexes and journaled saves.'''
+    
+    def test_add_appends_journal_not_snapshot(self):
+        '''Test adding a score appends one journal line and leaves the snapshot alone.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            leaderboard = LocalLeaderboard(leaderboard_file)
+            snapshot = leaderboard_file.read_text(encoding='utf-8')
+            
+            for score in [300, 100, 200]:
+                leaderboard.add_score(ScoreEntry(score=score, player_name=f'Player{score}'))
+            
+            assert leaderboard_file.read_text(encoding='utf-8') == snapshot
+            assert len(leaderboard.journal_file.read_text(encoding='utf-8').splitlines()) == 3
+            
+            # A fresh instance replays the journal over the snapshot
+            reloaded = LocalLeaderboard(leaderboard_file)
+            assert [e.score for e in reloaded.entries] == [300, 200, 100]
+    
+    def test_legacy_single_quoted_board_is_read_not_replaced(self):
+        '''Test a board saved as single-quoted pseudo-JSON loads and is left as is.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            legacy = repr({'version': '1.0.0', 'entries': [
+                ScoreEntry(score=11, player_name="Bob's Lab").to_dict()]})
+            leaderboard_file.write_text(legacy, encoding='utf-8')
+            
+            leaderboard = LocalLeaderboard(leaderboard_file)
+            assert [(e.score, e.player_name) for e in leaderboard.entries] == [(11, "Bob's Lab")]
+            assert leaderboard_file.read_text(encoding='utf-8') == legacy
+    
+    def test_compaction_folds_journal(self):
+        '''Test the journal is folded into the snapshot once it reaches the threshold.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            leaderboard = LocalLeaderboard(leaderboard_file, max_entries=5)
+            leaderboard.JOURNAL_COMPACT_THRESHOLD = 4
+            
+            for score in range(10):
+                leaderboard.add_score(ScoreEntry(score=score, player_name='P'))
+            leaderboard.remove_entry(leaderboard.entries[0].entry_uuid)
+            leaderboard.compact()
+            
+            assert not leaderboard.journal_file.exists()
+            reloaded = LocalLeaderboard(leaderboard_file, max_entries=5)
+            assert [e.score for e in reloaded.entries] == [8, 7, 6, 5]
+    
+    def test_secondary_indexes_follow_truncation_and_removal(self):
+        '''Test mode and player indexes stay consistent as entries drop off.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            leaderboard = LocalLeaderboard(leaderboard_file, max_entries=3)
+            
+            leaderboard.add_score(ScoreEntry(score=100, player_name='Low', game_mode='hard'))
+            leaderboard.add_score(ScoreEntry(score=500, player_name='A', game_mode='normal'))
+            leaderboard.add_score(ScoreEntry(score=400, player_name='A', game_mode='hard'))
+            was_added, rank = leaderboard.add_score(ScoreEntry(score=300, player_name='B'))
+            
+            assert (was_added, rank) == (True, 3)
+            assert leaderboard.get_player_best('Low') is None
+            assert [e.score for e in leaderboard.get_top_scores(game_mode='hard')] == [400]
+            assert leaderboard.get_player_best('A', game_mode='hard').score == 400
+            assert leaderboard.get_rank(450, game_mode='hard') == 1
+            
+            assert leaderboard.add_score(ScoreEntry(score=50, player_name='C')) == (False, 0)
+            assert leaderboard.remove_entry(leaderboard.get_player_best('A').entry_uuid) is True
+            assert leaderboard.get_player_best('A').score == 400
+            assert leaderboard.get_statistics()['average_score'] == 350
+    
+    def test_equal_scores_keep_arrival_order(self):
+        '''Test a new score ranks after existing equal scores.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            leaderboard = LocalLeaderboard(leaderboard_file)
+            
+            first = ScoreEntry(score=100, player_name='First')
+            leaderboard.add_score(first)
+            _, rank = leaderboard.add_score(ScoreEntry(score=100, player_name='Second'))
+            
+            assert rank == 2
+            assert leaderboard.entries[0] is first
+    
+    def test_duplicate_uuid_is_not_added_or_journaled(self):
+        '''Test re-adding an entry reports its existing rank and writes no journal line.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            leaderboard_file = Path(temp_dir) / 'test_leaderboard.json'
+            leaderboard = LocalLeaderboard(leaderboard_file)
+            leaderboard.add_score(ScoreEntry(score=300, player_name='Top'))
+            entry = ScoreEntry(score=200, player_name='Retry', entry_uuid='retry-uuid')
+            assert leaderboard.add_score(entry) == (True, 2)
+            journal = leaderboard.journal_file.read_text(encoding='utf-8')
+            
+            retried = ScoreEntry(score=200, player_name='Retry', entry_uuid='retry-uuid')
+            assert leaderboard.add_score(retried) == (False, 2)
+            assert leaderboard.journal_file.read_text(encoding='utf-8') == journal
+            assert len(leaderboard.entries) == 2
+            assert len(LocalLeaderboard(leaderboard_file).entries) == 2
+
+
+class TestLeaderboardCatalog:
+    '''Test cases for the catalog that summarizes seed leaderboards.'''
+    
+    def test_boards_record_changes(self):
+        '''Test every add and removal updates the board's catalog summary.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog = LeaderboardCatalog(Path(temp_dir))
+            leaderboard = LocalLeaderboard(Path(temp_dir) / 'leaderboard_weekly-1_abc123.json',
+                                           catalog=catalog)
+            for score in [40, 90]:
+                leaderboard.add_score(ScoreEntry(score=score))
+            
+            # The first change is written at once, the second waits for the interval
+            assert LeaderboardCatalog(Path(temp_dir)).summaries()['weekly-1']['entry_count'] == 1
+            catalog.flush()
+            summary = LeaderboardCatalog(Path(temp_dir)).summaries()['weekly-1']
+            assert summary['entry_count'] == 2
+            assert summary['top_score'] == 90
+            assert summary['config_hash'] == 'abc123'
+            
+            leaderboard.remove_entry(leaderboard.entries[0].entry_uuid)
+            assert catalog.summaries()['weekly-1']['top_score'] == 40
+    
+    def test_refresh_loads_only_changed_boards(self):
+        '''Test refresh reloads boards changed elsewhere and drops deleted ones.'''
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            boards = [LocalLeaderboard(base_path / f'leaderboard_seed{i}_cfg{i}.json') for i in range(3)]
+            for i, board in enumerate(boards):
+                board.add_score(ScoreEntry(score=10 * (i + 1)))
+            
+            catalog = LeaderboardCatalog(base_path)
+            assert catalog.refresh()
+            assert not catalog.refresh()
+            
+            # Changed outside the catalog: a journal append and a deleted board
+            boards[0].add_score(ScoreEntry(score=99))
+            boards[2].leaderboard_file.unlink()
+            boards[2].journal_file.unlink()
+            
+            loaded = []
+            original_record = catalog.record
+            catalog.record = lambda board, save=True: (loaded.append(board.leaderboard_file.name),
+                                                       original_record(board, save))
+            assert catalog.refresh()
+            assert loaded == ['leaderboard_seed0_cfg0.json']
+            
+            summaries = catalog.summaries()
+            assert sorted(summaries) == ['seed0', 'seed1']
+            assert summaries['seed0']['top_score'] == 99
+            assert summaries['seed1']['entry_count'] == 1
+    
+    def test_listing_rescans_only_when_the_directory_changes(self):
+        '''Test get_all_leaderboards skips the per-board stats while no board file came or went.'''
+        from src.scores.enhanced_leaderboard import EnhancedLeaderboardManager
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            LocalLeaderboard(base_path / 'leaderboard_one_aa11.json').add_score(ScoreEntry(score=5))
+            manager = EnhancedLeaderboardManager(base_path)
+            assert sorted(manager.get_all_leaderboards()) == ['one']
+            past = time.time_ns() - 60 * 10**9
+            os.utime(base_path, ns=(past, past))  # settled: outside the racy window
+            manager.catalog.refresh()
+            
+            refreshes = []
+            original_refresh = manager.catalog.refresh
+            manager.catalog.refresh = lambda: refreshes.append(1) or original_refresh()
+            assert sorted(manager.get_all_leaderboards()) == ['one']
+            assert refreshes == []
+            
+            LocalLeaderboard(base_path / 'leaderboard_two_bb22.json').add_score(ScoreEntry(score=9))
+            assert sorted(manager.get_all_leaderboards()) == ['one', 'two']
+            assert refreshes == [1]
+    
+    def test_manager_lists_boards_from_catalog(self):
+        '''Test get_all_leaderboards keeps its format and ignores catalog files.'''
+        from src.scores.enhanced_leaderboard import EnhancedLeaderboardManager
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            LocalLeaderboard(base_path / 'leaderboard_my_seed_ff00.json').add_score(ScoreEntry(score=7))
+            
+            manager = EnhancedLeaderboardManager(base_path)
+            assert manager.get_all_leaderboards() == {
+                'my_seed': {
+                    'config_hash': 'ff00',
+                    'entry_count': 1,
+                    'top_score': 7,
+                    'file_path': str(base_path / 'leaderboard_my_seed_ff00.json')
+                }
+            }
+            assert (base_path / LeaderboardCatalog.CATALOG_FILENAME).exists()
+
+
 class TestRemoteLeaderboard:
     '''Test cases for RemoteLeaderboard stub.'''
     
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/search_index.py (full-text + faceted catalogue search).
+
+What these lock down:
+
+- Historical events are indexed with overrides applied; events, risk events,
+  actions and quirks are indexed with their facets.
+- Queries AND their tokens and facets; an unknown token matches as a prefix.
+- load() re-extracts only the sources whose files changed.
+- The real godot/data tree indexes without errors.
+
+Run: python -m unittest tests.test_search_index -v
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import godot_data  # noqa: E402
+import search_index  # noqa: E402
+
+
+def write(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "data"
+        self.cache = Path(self.tmp.name) / "search_index.pickle"
+        write(
+            self.root / "historical_events.json",
+            {
+                "_description": "metadata",
+                "ftx_collapse": {
+                    "title": "FTX Future Fund Collapse",
+                    "year": 2022,
+                    "category": "funding_catastrophe",
+                    "rarity": "rare",
+                    "description": "Grants clawed back",
+                    "impacts": [{"variable": "cash", "change": -80}],
+                },
+                "board_ousting": {
+                    "title": "Board Ousting",
+                    "year": 2023,
+                    "category": "organizational_crisis",
+                    "impacts": [{"variable": "stress", "change": 40}],
+                },
+            },
+        )
+        write(self.root / "events" / "overrides" / "a.json", {"board_ousting": {"year": 2024}})
+        write(
+            self.root / "events" / "core_events.json",
+            {
+                "events": [
+                    {
+                        "id": "funding_crisis",
+                        "name": "Funding Crisis",
+                        "trigger_type": "threshold",
+                        "options": [
+                            {"text": "Take the loan", "effects": {"money": 50000, "doom": 2}}
+                        ],
+                    },
+                ]
+            },
+        )
+        write(
+            self.root / "events" / "risk_events.json",
+            {
+                "pools": {
+                    "capability_overhang": {
+                        "minor": [
+                            {
+                                "id": "risk_tax",
+                                "name": "Alignment Tax Debate",
+                                "effects": {"doom": 1},
+                            },
+                        ]
+                    }
+                }
+            },
+        )
+        write(
+            self.root / "actions" / "core.json",
+            {
+                "actions": [
+                    {
+                        "id": "safety_research",
+                        "name": "Safety Research",
+                        "category": "research",
+                        "costs": {"money": 1000, "attention": 1},
+                    },
+                ]
+            },
+        )
+        write(
+            self.root / "actions" / "risk_contributions.json",
+            {"contributions": {"safety_research": 1}},
+        )
+        write(
+            self.root / "researchers" / "quirks.json",
+            {
+                "quirks": {
+                    "night_owl": {
+                        "name": "Night Owl",
+                        "valence": "positive",
+                        "effects": {"stress": -1},
+                    },
+                }
+            },
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self, stats=None):
+        godot_data.load(self.root, cache_path=None, refresh=True)
+        return search_index.load(self.root, self.cache, stats)
+
+    def keys(self, docs):
+        return [doc["key"] for doc in docs]
+
+    def test_documents_and_facets(self):
+        index = self.load()
+        self.assertEqual(
+            self.keys(index.docs),
+            [
+                "historical:ftx_collapse",
+                "historical:board_ousting",
+                "event:funding_crisis",
+                "risk_event:risk_tax",
+                "action:safety_research",
+                "quirk:night_owl",
+            ],
+        )
+        self.assertEqual(self.keys(index.search(year=2024)), ["historical:board_ousting"])
+        self.assertEqual(
+            self.keys(index.search(variable="money")),
+            ["event:funding_crisis", "action:safety_research"],
+        )
+        self.assertEqual(
+            self.keys(index.search(rarity="minor", category="capability_overhang")),
+            ["risk_event:risk_tax"],
+        )
+        self.assertEqual(index.facet_counts("kind")["historical"], 2)
+        self.assertEqual(index.facet_counts("variable", kind="quirk"), {"stress": 1})
+        with self.assertRaises(ValueError):
+            index.search(colour="red")
+
+    def test_text_queries(self):
+        index = self.load()
+        self.assertEqual(self.keys(index.search("clawed")), ["historical:ftx_collapse"])
+        self.assertEqual(self.keys(index.search("loan")), ["event:funding_crisis"])
+        self.assertEqual(
+            self.keys(index.search("fund")), ["historical:ftx_collapse"]
+        )  # exact beats prefix
+        self.assertEqual(
+            self.keys(index.search("fun")), ["historical:ftx_collapse", "event:funding_crisis"]
+        )
+        self.assertEqual(self.keys(index.search("fun", kind="event")), ["event:funding_crisis"])
+        self.assertEqual(index.count("safety research"), 1)
+        self.assertEqual(index.search("nothing matches"), [])
+        self.assertEqual(len(index.search(limit=2)), 2)
+
+    def test_incremental_rebuild(self):
+        stats = {}
+        self.load(stats)
+        self.assertEqual(len(stats["rebuilt"]), 6)
+        self.load(stats)
+        self.assertEqual(stats["rebuilt"], [])
+        write(
+            self.root / "actions" / "extra.json",
+            {"actions": [{"id": "lobby", "name": "Lobby Congress"}]},
+        )
+        index = self.load(stats)
+        self.assertEqual(stats["rebuilt"], ["actions"])
+        self.assertEqual(self.keys(index.search("congress")), ["action:lobby"])
+
+
+class TestRealData(unittest.TestCase):
+    def test_godot_data_indexes(self):
+        index = search_index.load(cache_path=None)
+        kinds = index.facet_counts("kind")
+        for kind in ("historical", "event", "action", "quirk"):
+            self.assertGreater(kinds.get(kind, 0), 0, kind)
+        for doc in index.docs:
+            self.assertTrue(doc["id"] and doc["title"] and doc["tokens"], doc["key"])
+
+
+if __name__ == "__main__":
+    unittest.main()
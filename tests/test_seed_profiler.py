@@ -0,0 +1,104 @@
+"""
+Tests for the challenge seed profiler.
+
+Covers degenerate-seed detection, the (seed, version) profile cache and a
+short inline profiling run with the reference policies.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.testing.seed_profiler import POLICIES, SeedProfiler, detect_degenerate, play_game
+
+try:
+    import src.core.game_state  # noqa: F401
+
+    GAME_STATE_IMPORTABLE = True
+except (ImportError, SyntaxError):  # the archive's PEP 701 f-strings need Python 3.12
+    GAME_STATE_IMPORTABLE = False
+NEEDS_GAME_STATE = unittest.skipUnless(GAME_STATE_IMPORTABLE, "src.core.game_state not importable")
+
+
+def _run(policy, score, game_over):
+    return {
+        "policy": policy,
+        "run": 0,
+        "score": score,
+        "game_over": game_over,
+        "doom": 0,
+        "stalled": False,
+    }
+
+
+def _fake_runs(tasks):
+    return [dict(_run(policy, 7, True), seed=seed, run=run) for seed, policy, run, _ in tasks]
+
+
+class TestSeedProfiler(unittest.TestCase):
+    """Test seed profiling and caching."""
+
+    def setUp(self):
+        """Run inside a temporary directory with its own profile cache."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.cache_path = Path(self.temp_dir) / "seed_profiles.json"
+
+    def tearDown(self):
+        """Restore working directory and clean up."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_detect_degenerate(self):
+        """Turn-1 losses and idle survivals to the cap are flagged."""
+        self.assertEqual(detect_degenerate([_run("safety", 1, True)], 50), ["turn1_game_over"])
+        self.assertEqual(detect_degenerate([_run("idle", 50, False)], 50), ["trivial_win"])
+        self.assertEqual(
+            detect_degenerate([_run("idle", 12, True), _run("growth", 50, False)], 50), []
+        )
+
+    def test_profile_is_cached_by_seed_and_version(self):
+        """A second profile of the same seed plays no games."""
+        profiler = SeedProfiler(self.cache_path, max_turns=20, random_runs=2, workers=0)
+
+        with patch.object(SeedProfiler, "_play", side_effect=_fake_runs) as play:
+            first = profiler.profile("weekly-seed")
+            again = SeedProfiler(self.cache_path, max_turns=20, random_runs=2, workers=0)
+            second = again.profile("weekly-seed")
+            self.assertEqual(play.call_count, 1)
+            self.assertEqual(second, first)
+            self.assertEqual(len(first.runs), len(POLICIES) + 1)
+
+            # A different turn cap is a different profile
+            SeedProfiler(self.cache_path, max_turns=30, random_runs=2, workers=0).profile(
+                "weekly-seed"
+            )
+            self.assertEqual(play.call_count, 2)
+
+    @NEEDS_GAME_STATE
+    def test_inline_profile_runs_policies(self):
+        """Profiling plays every policy on the seed and summarises the scores."""
+        profiler = SeedProfiler(self.cache_path, max_turns=3, random_runs=2, workers=0)
+        profile = profiler.profile("profiler-test-seed")
+
+        self.assertEqual({run["policy"] for run in profile.runs}, set(POLICIES))
+        summary = profile.summary()
+        self.assertLessEqual(summary["max"], 3)
+        self.assertEqual(set(summary["by_policy"]), set(POLICIES))
+        self.assertTrue(self.cache_path.exists())
+
+    @NEEDS_GAME_STATE
+    def test_play_game_is_deterministic(self):
+        """The same seed, policy and run give the same outcome."""
+        self.assertEqual(
+            play_game("profiler-test-seed", "random", 1, max_turns=3),
+            play_game("profiler-test-seed", "random", 1, max_turns=3),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
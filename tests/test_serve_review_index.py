@@ -0,0 +1,150 @@
+"""Tests for the incremental asset index in tools/art_review/serve_review.py.
+
+What these lock down:
+
+- AssetIndex.sections() matches a fresh scan after files are added, removed
+  and rewritten, and an untouched tree refreshes without a version bump.
+- A PNG rewritten in place (directory mtime unchanged) is picked up by the
+  files=True sweep, and only its section re-renders.
+- The page, /api/index and /api/section are served from the cached index.
+
+Run: python -m unittest tests.test_serve_review_index -v
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ART_REVIEW = REPO_ROOT / "tools" / "art_review"
+
+_spec = importlib.util.spec_from_file_location("serve_review", ART_REVIEW / "serve_review.py")
+serve_review = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(serve_review)
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.icons = self.root / "art_generated" / "game_icons" / "v1"
+        self.props = self.root / "art_source" / "pixellab_x" / "props"
+        self.icons.mkdir(parents=True)
+        self.props.mkdir(parents=True)
+        self.write(self.icons / "icon_doom_512.png")
+        self.write(self.icons / "icon_doom_v2_512.png")
+        self.write(self.props / "desk.png")
+        self.write(self.props / "desk_north.png")  # rotation sheet: not a review image
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, data=b"png", age_s=60):
+        path.write_bytes(data)
+        past = path.stat().st_mtime_ns - age_s * 1_000_000_000
+        os.utime(path, ns=(past, past))
+
+    def age_dirs(self):
+        """Push every directory mtime back so the next change is visible."""
+        for dirpath, _dirs, _files in os.walk(self.root):
+            past = os.stat(dirpath).st_mtime_ns - 120 * 1_000_000_000
+            os.utime(dirpath, ns=(past, past))
+
+    def assert_matches_fresh(self, index):
+        self.assertEqual(
+            [{k: v for k, v in s.items() if k != "_gen"} for s in index.sections()],
+            [{k: v for k, v in s.items() if k != "_gen"} for s in serve_review.scan_all(self.root)],
+        )
+
+    def test_incremental_refresh(self):
+        self.age_dirs()
+        index = serve_review.AssetIndex(self.root)
+        ids = [c["asset_id"] for s in index.sections() for c in s["cells"]]
+        self.assertEqual(
+            ids,
+            [
+                "gen:game_icons:icon_doom:v1",
+                "gen:game_icons:icon_doom:v2",
+                "px:pixellab_x/props/desk",
+            ],
+        )
+        version = index.version
+        self.assertFalse(index.refresh())
+        self.assertEqual(index.version, version)
+
+        self.write(self.props / "chair.png")
+        (self.root / "art_source" / "pixellab_y").mkdir()
+        self.write(self.root / "art_source" / "pixellab_y" / "cat.png")
+        (self.icons / "icon_doom_v2_512.png").unlink()
+        self.assertTrue(index.refresh())
+        self.assertGreater(index.version, version)
+        self.assert_matches_fresh(index)
+
+        shutil.rmtree(self.root / "art_source" / "pixellab_x")
+        self.assertTrue(index.refresh())
+        self.assert_matches_fresh(index)
+
+    def test_in_place_rewrite_needs_file_sweep(self):
+        self.age_dirs()
+        index = serve_review.AssetIndex(self.root)
+        px = next(s for s in index.sections() if s["id"].startswith("px-"))
+        gen = next(s for s in index.sections() if s["id"].startswith("gen-"))
+        px_html = index.section_html(px)
+        gen_html = index.section_html(gen)
+
+        dir_mtime = os.stat(self.props).st_mtime_ns
+        self.write(self.props / "desk.png", b"a bigger png", age_s=30)
+        os.utime(self.props, ns=(dir_mtime, dir_mtime))  # rewritten in place: directory untouched
+        self.assertFalse(index.refresh())
+        self.assertTrue(index.refresh(files=True))
+        self.assert_matches_fresh(index)
+        px = next(s for s in index.sections() if s["id"].startswith("px-"))
+        gen = next(s for s in index.sections() if s["id"].startswith("gen-"))
+        self.assertIs(index.section_html(gen), gen_html)  # untouched section: cached fragment
+        self.assertNotEqual(index.section_html(px), px_html)
+        self.assertIn(px["cells"][0]["v"], index.section_html(px))
+
+
+class TestIndexEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        (root / "art_source" / "batch").mkdir(parents=True)
+        (root / "art_source" / "batch" / "desk.png").write_bytes(b"png")
+        self.httpd = serve_review.ReviewServer(("127.0.0.1", 0), root, sweep_s=0)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmp.cleanup()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.base + path) as r:
+            return r.read()
+
+    def test_api_and_page(self):
+        payload = json.loads(self.get("/api/index"))
+        self.assertEqual([s["id"] for s in payload["sections"]], ["px-batch"])
+        self.assertEqual(payload["sections"][0]["cells"][0]["asset_id"], "px:batch/desk")
+        section = json.loads(self.get("/api/section?id=px-batch"))
+        self.assertEqual(section["version"], payload["version"])
+        self.assertIn('data-asset="px:batch/desk"', section["html"])
+
+        page = self.get("/").decode("utf-8")
+        self.assertIn(section["html"], page)
+        self.assertIn("var SEED={", page)
+        shell = self.httpd.shell()
+        self.get("/")
+        self.assertIs(self.httpd.shell(), shell)  # unchanged index: same cached shell
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Tests for the journaled verdict store in tools/art_review/serve_review.py.
+
+What these lock down:
+
+- apply() merges in memory and appends one journal line; review_state.json is
+  only rewritten by compaction, in its usual sorted / indented format.
+- A store that dies without compacting is replayed on the next startup,
+  including dropped entries, and a torn last line is ignored.
+- A write to review_state.json by another tool is picked up by the seed and
+  /api/state, and survives compaction with the journal re-applied on top.
+- The HTTP POST / GET /api/state round trip goes through the store.
+
+Run: python -m unittest tests.test_serve_review_store -v
+"""
+
+import importlib.util
+import json
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ART_REVIEW = REPO_ROOT / "tools" / "art_review"
+
+_spec = importlib.util.spec_from_file_location("serve_review", ART_REVIEW / "serve_review.py")
+serve_review = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(serve_review)
+
+
+class TestVerdictStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.tmp.name) / "review_state.json"
+        self.state_path.write_text(
+            json.dumps(
+                {
+                    "gen:a": {"verdict": "maybe", "note": "", "tags": [], "updated_at": "t0"},
+                    "gen:b": {"verdict": "keep", "note": "ok", "tags": [], "updated_at": "t0"},
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.journal = self.state_path.with_suffix(".journal")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def store(self):
+        return serve_review.VerdictStore(self.state_path, background=False)
+
+    def on_disk(self):
+        return json.loads(self.state_path.read_text(encoding="utf-8"))
+
+    def test_apply_journals_then_compacts(self):
+        store = self.store()
+        self.assertEqual(
+            store.state["gen:a"]["verdict"], "iterate"
+        )  # legacy verdict migrated on load
+        before = self.state_path.read_text(encoding="utf-8")
+        self.assertEqual(
+            store.apply({"asset_id": "gen:c", "verdict": "discard", "note": "off-brief"})[0], 200
+        )
+        self.assertEqual(store.apply({"verdict": "keep"})[0], 400)
+        self.assertEqual(self.state_path.read_text(encoding="utf-8"), before)
+        lines = self.journal.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["entry"]["verdict"], "discard")
+
+        store.close()
+        self.assertEqual(self.journal.read_text(encoding="utf-8"), "")
+        text = self.state_path.read_text(encoding="utf-8")
+        self.assertEqual(text, json.dumps(json.loads(text), indent=2, sort_keys=True))
+        self.assertEqual(self.on_disk()["gen:c"]["note"], "off-brief")
+        self.assertEqual(self.on_disk()["gen:a"]["verdict"], "iterate")
+
+    def test_replay_after_crash(self):
+        crashed = self.store()
+        crashed.apply({"asset_id": "gen:c", "verdict": "keep"})
+        crashed.apply({"asset_id": "gen:b", "verdict": None, "note": ""})  # no signal left: dropped
+        crashed._journal.write('{"asset_id": "gen:d", "ent')  # torn mid-append
+        crashed._journal.flush()
+        # no close(): the process died here
+
+        store = self.store()
+        self.assertEqual(store.replayed, 2)
+        self.assertEqual(store.state["gen:c"]["verdict"], "keep")
+        self.assertNotIn("gen:b", store.state)
+        self.assertNotIn("gen:d", store.state)
+        self.assertEqual(set(self.on_disk()), {"gen:a", "gen:c"})  # replay is compacted at once
+        self.assertEqual(self.journal.read_text(encoding="utf-8"), "")
+        store.close()
+
+    def test_external_write_survives_compaction(self):
+        store = self.store()
+        store.apply({"asset_id": "gen:c", "verdict": "keep"})
+        merged = self.on_disk()  # what merge_gallery_export.py does while the server runs
+        merged["gen:z"] = {"verdict": "discard", "note": "merged", "tags": [], "updated_at": "t1"}
+        merged["gen:b"]["note"] = "edited outside"
+        self.state_path.write_text(json.dumps(merged), encoding="utf-8")
+
+        self.assertEqual(json.loads(store.seed())["gen:z"]["note"], "merged")
+        self.assertEqual(
+            json.loads(store.dumps())["gen:c"]["verdict"], "keep"
+        )  # journal re-applied
+        store.close()
+        on_disk = self.on_disk()
+        self.assertEqual(set(on_disk), {"gen:a", "gen:b", "gen:c", "gen:z"})
+        self.assertEqual(on_disk["gen:b"]["note"], "edited outside")
+        self.assertEqual(on_disk["gen:c"]["verdict"], "keep")
+
+    def test_external_write_before_compaction_is_merged(self):
+        store = self.store()
+        store.apply({"asset_id": "gen:c", "verdict": "keep"})
+        merged = self.on_disk()
+        merged["gen:z"] = {"verdict": "keep", "note": "", "tags": [], "updated_at": "t1"}
+        self.state_path.write_text(json.dumps(merged), encoding="utf-8")
+        store.compact()  # no seed() in between: compaction alone must notice the write
+        self.assertEqual(set(self.on_disk()), {"gen:a", "gen:b", "gen:c", "gen:z"})
+        store.close()
+
+    def test_seed_tracks_revision(self):
+        store = self.store()
+        seed = store.seed()
+        self.assertIs(store.seed(), seed)
+        store.apply({"asset_id": "gen:e", "tags": "a, b, a"})
+        self.assertEqual(json.loads(store.seed())["gen:e"]["tags"], ["a", "b"])
+        store.close()
+
+
+class TestStateEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.state_path = root / "review_state.json"
+        self.store = serve_review.VerdictStore(self.state_path, background=False)
+        self.httpd = serve_review.ReviewServer(("127.0.0.1", 0), root, sweep_s=0, store=self.store)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmp.cleanup()
+
+    def test_post_then_get(self):
+        body = json.dumps({"asset_id": "px:batch/desk", "verdict": "keep"}).encode()
+        req = urllib.request.Request(self.base + "/api/state", data=body, method="POST")
+        with urllib.request.urlopen(req) as r:
+            self.assertEqual(json.loads(r.read())["entry"]["verdict"], "keep")
+        with urllib.request.urlopen(self.base + "/api/state") as r:
+            self.assertEqual(json.loads(r.read())["px:batch/desk"]["verdict"], "keep")
+        self.httpd.server_close()  # shutdown compacts
+        self.assertEqual(
+            json.loads(self.state_path.read_text(encoding="utf-8"))["px:batch/desk"]["verdict"],
+            "keep",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Tests for the session metadata archive.
+
+Covers the tolerant reader for legacy single-quoted session files,
+compaction into partition segments, query results before and after
+compaction, segment pruning and recovery from compactions interrupted
+before and after the manifest update.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.scores.session_archive import SessionArchive, percentile
+from src.scores.session_text import parse_session_text
+
+
+def _session(seed, version, score, doom, model="Bootstrap_v0.4.1"):
+    return {
+        "seed": seed,
+        "game_version": version,
+        "economic_model": model,
+        "final_score": score,
+        "final_doom": doom,
+        "player_name": "Anonymous",
+    }
+
+
+class TestSessionArchive(unittest.TestCase):
+    """Test session compaction and queries."""
+
+    def setUp(self):
+        """Create a sessions directory with JSON and legacy session files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sessions_dir = Path(self.temp_dir)
+        sessions = [
+            _session("202540", "v0.9.1", 11, 100),
+            _session("202540", "v0.9.1", 4, 80),
+            _session("202540", "v0.9.0", 8, 100),
+            _session("weekly", "v0.9.1", 20, 40),
+        ]
+        for i, session in enumerate(sessions):
+            path = self.sessions_dir / f'session_{session["seed"]}_cfg_{i}.json'
+            if i % 2:
+                # Legacy files are Python dict literals
+                path.write_text(repr(session), encoding="utf-8")
+            else:
+                path.write_text(json.dumps(session, indent=2), encoding="utf-8")
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parse_legacy_and_mixed_literals(self):
+        """Single-quoted records parse, including JSON literals and quotes in strings."""
+        self.assertEqual(
+            parse_session_text("{'lab_name': \"Bob's Lab\", 'won': true, 'x': null}"),
+            {"lab_name": "Bob's Lab", "won": True, "x": None},
+        )
+        self.assertEqual(parse_session_text('{"seed": "a"}'), {"seed": "a"})
+        self.assertIsNone(parse_session_text("{'seed': "))
+        self.assertIsNone(parse_session_text("[1, 2]"))
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate between neighbouring values."""
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertEqual(percentile([5], 90), 5)
+        self.assertIsNone(percentile([], 50))
+
+    def test_compaction_preserves_query_results(self):
+        """Compacting folds every file into segments and answers the same queries."""
+        archive = SessionArchive(self.sessions_dir)
+        query = dict(where={"seed": "202540"}, group_by=["game_version"], metrics=["final_doom"])
+        before = archive.query(**query)
+
+        report = archive.compact()
+        self.assertEqual(report["compacted"], 4)
+        self.assertEqual(len(report["partitions"]), 3)
+        self.assertEqual(list(self.sessions_dir.glob("session_*.json")), [])
+
+        after = SessionArchive(self.sessions_dir).query(**query)
+        self.assertEqual(after, before)
+        self.assertEqual(
+            after[1],
+            {
+                "game_version": "v0.9.1",
+                "count": 2,
+                "final_doom_mean": 90.0,
+                "final_doom_min": 80,
+                "final_doom_max": 100,
+                "final_doom_p50": 90.0,
+                "final_doom_p90": 98.0,
+            },
+        )
+
+        # New sessions land in the existing partition segment
+        (self.sessions_dir / "session_202540_cfg_9.json").write_text(
+            json.dumps(_session("202540", "v0.9.1", 1, 10)), encoding="utf-8"
+        )
+        archive.compact()
+        self.assertEqual(len(archive.manifest["segments"]), 3)
+        self.assertEqual(
+            archive.query(where={"game_version": "v0.9.1", "final_doom": ("<", 50)}, metrics=[])[0][
+                "count"
+            ],
+            2,
+        )
+
+    def test_predicates_prune_segments(self):
+        """Partition and column-range filters skip segments without reading them."""
+        archive = SessionArchive(self.sessions_dir)
+        archive.compact()
+
+        with patch.object(
+            SessionArchive, "_read_segment", side_effect=SessionArchive._read_segment, autospec=True
+        ) as read:
+            rows = list(archive.select({"seed": "202540", "game_version": "v0.9.1"}))
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(read.call_count, 1)
+
+            read.reset_mock()
+            self.assertEqual(
+                list(archive.select({"final_score": (">", 15)}, ["seed"])), [{"seed": "weekly"}]
+            )
+            self.assertEqual(read.call_count, 1)
+
+    def test_interrupted_compaction_does_not_double_count(self):
+        """Files absorbed before a crash are deleted, not compacted again."""
+        archive = SessionArchive(self.sessions_dir)
+        with patch.object(
+            SessionArchive,
+            "_finish_deletes",
+            autospec=True,
+            side_effect=[None, RuntimeError("crash")],
+        ):
+            with self.assertRaises(RuntimeError):
+                archive.compact()
+        self.assertEqual(len(list(self.sessions_dir.glob("session_*.json"))), 4)
+
+        restarted = SessionArchive(self.sessions_dir)
+        self.assertEqual(restarted.query(metrics=[])[0]["count"], 4)
+        self.assertEqual(restarted.compact()["compacted"], 0)
+        self.assertEqual(list(self.sessions_dir.glob("session_*.json")), [])
+        self.assertEqual(restarted.query(metrics=[])[0]["count"], 4)
+
+    def test_crash_before_manifest_update_does_not_double_count(self):
+        """Segment rows written before the manifest commit are not counted twice."""
+        archive = SessionArchive(self.sessions_dir)
+        archive.compact()
+        (self.sessions_dir / "session_weekly_cfg_9.json").write_text(
+            json.dumps(_session("weekly", "v0.9.1", 30, 20)), encoding="utf-8"
+        )
+
+        write_json = SessionArchive._write_json
+
+        def crash_on_manifest(path, data):
+            if path.name == SessionArchive.MANIFEST_FILENAME:
+                raise RuntimeError("crash")
+            write_json(path, data)
+
+        with patch.object(SessionArchive, "_write_json", side_effect=crash_on_manifest):
+            with self.assertRaises(RuntimeError):
+                SessionArchive(self.sessions_dir).compact()
+
+        restarted = SessionArchive(self.sessions_dir)
+        weekly = dict(where={"seed": "weekly"}, metrics=[])
+        self.assertEqual(restarted.query(**weekly)[0]["count"], 2)
+        self.assertEqual(restarted.compact()["compacted"], 1)
+        self.assertEqual(restarted.query(**weekly)[0]["count"], 2)
+        segment = restarted._read_segment(
+            restarted.segment_name(("weekly", "v0.9.1", "Bootstrap_v0.4.1"))
+        )
+        self.assertEqual(segment["rows"], 2)
+        self.assertEqual(segment["columns"]["final_score"], [20, 30])
+
+    def test_unreadable_files_are_left_in_place(self):
+        """Corrupt session files are reported and kept for inspection."""
+        broken = self.sessions_dir / "session_broken_cfg_x.json"
+        broken.write_text("{'seed': 'broken',", encoding="utf-8")
+        report = SessionArchive(self.sessions_dir).compact()
+        self.assertEqual(report["unreadable"], [broken.name])
+        self.assertTrue(broken.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+"""Unit tests for server/leaderboard/submission_queue.py (offline score spool).
+
+The queue is exercised against score_service.ScoreService, the in-process
+stand-in for score_api.php: batches land on the boards once each, a flaky
+transport backs off without losing entries, a restart resumes from the
+spool, a bad token stops the queue instead of backing off forever, and a
+pre-batch server is fed single-entry POSTs.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from random import Random
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "server" / "leaderboard"))
+
+from score_service import (  # noqa: E402  (deliberate late import; sys.path just set)
+    BoardStore,
+    ScoreService,
+)
+from submission_queue import SubmissionQueue  # noqa: E402
+
+TOKEN = "test-token"
+URL = "http://scores.test/score_api.php"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ServiceTransport:
+    """Routes queue POSTs to ScoreService.handle; can fail or hide the batch endpoint."""
+
+    def __init__(self, service, supports_batch=True):
+        self.service = service
+        self.supports_batch = supports_batch
+        self.fail_next = []  # statuses (or OSError instances) to return before succeeding
+        self.requests = []
+
+    def __call__(self, url, body, headers):
+        self.requests.append((url, json.loads(body)))
+        if self.fail_next:
+            failure = self.fail_next.pop(0)
+            if isinstance(failure, OSError):
+                raise failure
+            return failure, {"ok": False, "error": "unavailable"}
+        target = url.replace("http://scores.test", "")
+        if not self.supports_batch:
+            target = target.split("?")[0]
+        return self.service.handle("POST", target, {k.lower(): v for k, v in headers.items()}, body)
+
+
+class MaxJitter(Random):
+    """Always draws the top of the jitter range, so delays are exact."""
+
+    def random(self):
+        return 1.0
+
+
+def _score(i, seed="party"):
+    return {"seed": seed, "version": "v0.11.0", "score": i, "player_name": f"Lab {i}"}
+
+
+class TestSubmissionQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.store = BoardStore(self.root / "data")
+        self.service = ScoreService(self.store, TOKEN)
+        self.transport = ServiceTransport(self.service)
+        self.clock = FakeClock()
+        self.spool = self.root / "scores.spool"
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def make_queue(self, **kwargs):
+        return SubmissionQueue(
+            self.spool,
+            URL,
+            TOKEN,
+            transport=self.transport,
+            clock=self.clock,
+            rng=MaxJitter(),
+            **kwargs,
+        )
+
+    def board(self, seed="party"):
+        return self.service.handle(
+            "GET", f"/score_api.php?seed={seed}&version=v0.11.0&limit=100", {}, b""
+        )[1]["entries"]
+
+    def test_batches_many_scores_into_few_requests(self):
+        queue = self.make_queue(batch_size=20)
+        for i in range(45):
+            queue.enqueue(_score(i, seed=f"party{i % 3}"))
+        report = queue.flush()
+        self.assertEqual(
+            report, {"sent": 45, "duplicates": 0, "rejected": 0, "requests": 3, "remaining": 0}
+        )
+        self.assertTrue(all(url.endswith("?batch=1") for url, _ in self.transport.requests))
+        self.assertEqual(sum(len(self.board(f"party{i}")) for i in range(3)), 45)
+
+    def test_backoff_keeps_entries_and_resumes_after_restart(self):
+        queue = self.make_queue()
+        uid = queue.enqueue(_score(7))
+        self.transport.fail_next = [503, OSError("connection refused")]
+
+        report = queue.flush()
+        self.assertEqual(
+            (report["error"], report["retry_in"], report["remaining"]), ("HTTP 503", 2.0, 1)
+        )
+        self.assertEqual(queue.flush()["requests"], 0)  # still backing off
+        self.clock.now = 2.0
+        self.assertEqual(queue.flush()["retry_in"], 4.0)  # second failure doubles the delay
+
+        # Restart: the spool still holds the entry; the response to the first try was lost
+        self.clock.now = 10.0
+        self.service.handle(
+            "POST",
+            "/score_api.php",
+            {"x-pdoom-token": TOKEN},
+            json.dumps(dict(_score(7), entry_uuid=uid)).encode(),
+        )
+        restarted = self.make_queue()
+        self.assertEqual([e["entry_uuid"] for e in restarted.pending()], [uid])
+        self.assertEqual(restarted.flush()["duplicates"], 1)
+        self.assertEqual(len(self.board()), 1)
+        self.assertEqual(self.make_queue().pending(), [])
+
+    def test_jitter_is_per_client(self):
+        def retry_in(name, rng=None):
+            queue = SubmissionQueue(
+                self.root / name, URL, TOKEN, transport=self.transport, clock=self.clock, rng=rng
+            )
+            queue.enqueue(_score(1))
+            self.transport.fail_next = [503]
+            return queue.flush()["retry_in"]
+
+        first = retry_in("a.spool", Random(7))
+        self.assertEqual(retry_in("b.spool", Random(7)), first)  # an injected rng is used as given
+        self.assertTrue(1.0 <= first <= 2.0)
+        # Default clients fail together but do not retry in lockstep
+        self.assertEqual(len({retry_in(f"d{i}.spool") for i in range(4)}), 4)
+
+    def test_bad_token_is_fatal(self):
+        queue = SubmissionQueue(
+            self.spool,
+            URL,
+            "wrong-token",
+            transport=self.transport,
+            clock=self.clock,
+            rng=MaxJitter(),
+        )
+        uid = queue.enqueue(_score(3))
+        report = queue.flush()
+        self.assertEqual((report["fatal"], report["remaining"]), ("HTTP 403: bad token", 1))
+        self.assertNotIn("retry_in", report)
+        self.assertEqual(
+            queue.flush(),
+            {
+                "sent": 0,
+                "duplicates": 0,
+                "rejected": 0,
+                "requests": 0,
+                "error": "HTTP 403: bad token",
+                "fatal": "HTTP 403: bad token",
+                "remaining": 1,
+            },
+        )
+        self.assertEqual(len(self.transport.requests), 1)  # no retries against a bad token
+        self.assertEqual([e["entry_uuid"] for e in self.make_queue().pending()], [uid])
+        self.assertEqual(self.make_queue().flush()["sent"], 1)  # a fixed token delivers it
+
+    def test_rejections_dedup_and_compaction(self):
+        queue = self.make_queue()
+        uid = queue.enqueue(_score(1))
+        self.assertEqual(queue.enqueue(dict(_score(1), entry_uuid=uid)), uid)
+        queue.enqueue({"seed": "party", "player_name": "no score"})
+        report = queue.flush()
+        self.assertEqual((report["sent"], report["rejected"], report["remaining"]), (1, 1, 0))
+
+        queue.compact()
+        self.assertEqual(self.spool.read_text(), "")
+        self.spool.write_text(self.spool.read_text() + '{"op": "add", "entry": {"sc')  # torn append
+        self.assertEqual(self.make_queue().pending(), [])
+
+    def test_falls_back_to_single_posts_on_pre_batch_server(self):
+        self.transport.supports_batch = False
+        queue = self.make_queue()
+        for i in range(3):
+            queue.enqueue(_score(i))
+        report = queue.flush()
+        self.assertEqual((report["sent"], report["remaining"]), (3, 0))
+        self.assertFalse(queue.batch_supported)
+        self.assertEqual(len(self.board()), 3)
+
+    def test_http_round_trip(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            port = asyncio.run_coroutine_threadsafe(
+                self.service.start("127.0.0.1", 0), loop
+            ).result(5)
+            queue = SubmissionQueue(self.spool, f"http://127.0.0.1:{port}/score_api.php", TOKEN)
+            for i in range(5):
+                queue.enqueue(_score(i))
+            self.assertEqual(queue.flush()["sent"], 5)
+            self.assertEqual(len(self.board()), 5)
+        finally:
+            asyncio.run_coroutine_threadsafe(self.service.stop(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
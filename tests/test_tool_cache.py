@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Unit tests for scripts/tool_cache.py (the cache plumbing shared by the scripts).
+
+What these lock down:
+
+- A record is trusted only when size and mtime match and it was taken more
+  than RACY_MTIME_NS after the file's last write; otherwise the bytes come back.
+- read() returns what write() stored, as a pickle or (for .json) as JSON.
+- A payload from another cache version, another tool revision or another
+  identity (e.g. root) reads as empty, and so does a truncated file.
+
+Run: python -m unittest tests.test_tool_cache -v
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import tool_cache  # noqa: E402
+
+
+class TestReadIfChanged(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "a.txt"
+        self.path.write_text("abc", encoding="utf-8")
+        mtime = self.path.stat().st_mtime_ns - 60 * 10**9
+        os.utime(self.path, ns=(mtime, mtime))
+        self.stat = self.path.stat()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_trusted_record_skips_the_read(self):
+        record = (
+            self.stat.st_size,
+            self.stat.st_mtime_ns,
+            self.stat.st_mtime_ns + tool_cache.RACY_MTIME_NS + 1,
+        )
+        stat, raw = tool_cache.read_if_changed(self.path, record)
+        self.assertIsNone(raw)
+        self.assertEqual(stat.st_mtime_ns, self.stat.st_mtime_ns)
+
+    def test_racy_or_stale_record_reads_the_file(self):
+        size, mtime = self.stat.st_size, self.stat.st_mtime_ns
+        for record in [
+            None,
+            (size, mtime, mtime + 1),
+            (size + 1, mtime, mtime + 10**12),
+            (size, mtime - 1, mtime + 10**12),
+        ]:
+            self.assertEqual(tool_cache.read_if_changed(self.path, record)[1], b"abc")
+
+
+class TestRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name) / "cache"
+        self.tool = REPO_ROOT / "scripts" / "godot_data.py"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pickle_and_json(self):
+        for name in ["x.pickle", "x.json"]:
+            path = self.dir / name
+            tool_cache.write(path, 3, self.tool, {"root": "/r", "files": {"a": [1, 2]}})
+            cached = tool_cache.read(path, 3, self.tool, root="/r")
+            self.assertEqual(cached["files"], {"a": [1, 2]})
+            self.assertEqual(cached["tool"], tool_cache.tool_digest(self.tool))
+        self.assertEqual(
+            json.loads((self.dir / "x.json").read_text(encoding="utf-8"))["version"], 3
+        )
+        self.assertEqual(
+            sorted(p.name for p in self.dir.iterdir()), ["x.json", "x.pickle"]
+        )  # no temp files left
+
+    def test_mismatches_read_empty(self):
+        path = self.dir / "x.pickle"
+        tool_cache.write(path, 3, self.tool, {"root": "/r"})
+        self.assertEqual(tool_cache.read(path, 4, self.tool, root="/r"), {})
+        self.assertEqual(
+            tool_cache.read(path, 3, REPO_ROOT / "scripts" / "search_index.py", root="/r"), {}
+        )
+        self.assertEqual(tool_cache.read(path, 3, self.tool, root="/other"), {})
+        self.assertEqual(tool_cache.read(self.dir / "missing.pickle", 3, self.tool), {})
+        path.write_bytes(path.read_bytes()[:10])
+        self.assertEqual(tool_cache.read(path, 3, self.tool, root="/r"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
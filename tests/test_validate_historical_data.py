@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Unit tests for the result cache in scripts/validate_historical_data.py.
+
+What these lock down:
+
+- A warm run over unchanged files validates nothing, yet reports the same
+  errors as the cold run (failing files stay failing from the cache).
+- Editing a file revalidates exactly that file; touching it without a change
+  only re-hashes it; deleted files are pruned from the cache.
+- A cache written by a different version of the script is ignored.
+- The process-pool path returns the same results as the in-process path.
+
+Run: python -m unittest tests.test_validate_historical_data -v
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import validate_historical_data as vhd  # noqa: E402
+
+GOOD_EVENT = {
+    "event_id": "e1",
+    "trigger_date": "2017-06-01",
+    "type": "paper_publication",
+    "name": "E1",
+    "description": "d",
+    "game_effect": {},
+    "historical_fact": "f",
+    "source": "https://example.org",
+}
+
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.timeline = Path("godot/data/historical_timeline")
+        self.timeline.mkdir(parents=True)
+        for year in (2017, 2018):
+            self.write(year, [GOOD_EVENT])
+        self.write(2019, [dict(GOOD_EVENT, type="rumour")])
+        self.calls = []
+        real = vhd.FILE_VALIDATORS["timeline"]
+
+        def counting(path):
+            self.calls.append(path.name)
+            return real(path)
+
+        patcher = mock.patch.dict(vhd.FILE_VALIDATORS, {"timeline": counting})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write(self, year, events):
+        data = {"year": year, "default_timeline_events": events}
+        (self.timeline / f"{year}.json").write_text(json.dumps(data), encoding="utf-8")
+
+    def run_validation(self, **kwargs):
+        self.calls = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            return vhd.run_validation(jobs=1, **kwargs)
+
+    def test_warm_run_reuses_results_and_edits_revalidate(self):
+        cold = self.run_validation()
+        self.assertEqual(self.calls, ["2017.json", "2018.json", "2019.json"])
+        self.assertEqual(cold[:2], (3, 1))
+
+        self.assertEqual(self.run_validation(), cold)
+        self.assertEqual(self.calls, [])
+
+        self.write(2018, [dict(GOOD_EVENT, source="ftp://nowhere")])
+        total, failing, errors = self.run_validation()
+        self.assertEqual((self.calls, total, failing), (["2018.json"], 3, 2))
+
+        path = self.timeline / "2017.json"
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+        self.run_validation()
+        self.assertEqual(self.calls, [])  # touched, same content: re-hashed only
+
+        path.unlink()
+        self.assertEqual(self.run_validation()[0], 2)
+        cache = json.loads(vhd.CACHE_PATH.read_text())
+        self.assertEqual(
+            sorted(cache["files"]),
+            [
+                "godot/data/historical_timeline/2018.json",
+                "godot/data/historical_timeline/2019.json",
+            ],
+        )
+
+    def test_cache_from_other_script_version_and_no_cache(self):
+        self.run_validation()
+        cache = json.loads(vhd.CACHE_PATH.read_text())
+        cache["tool"] = "0" * 64
+        vhd.CACHE_PATH.write_text(json.dumps(cache))
+        self.run_validation()
+        self.assertEqual(len(self.calls), 3)
+        self.run_validation(use_cache=False)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_process_pool_matches_in_process(self):
+        serial = self.run_validation(use_cache=False)
+        with (
+            mock.patch.object(vhd, "PARALLEL_MIN_FILES", 2),
+            mock.patch.dict(vhd.FILE_VALIDATORS, {"timeline": vhd.validate_timeline_file}),
+        ):
+            with contextlib.redirect_stdout(io.StringIO()):
+                pooled = vhd.run_validation(use_cache=False, jobs=2)
+        self.assertEqual(pooled, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,8 +63,10 @@ the record panel shows the parsed clauses.
 
 Coverage: every image file (png/jpg/jpeg/webp) under art_generated/ and
 art_source/, grouped into batches by top-level directory, newest batch first.
-Read-only on assets -- this script writes exactly one file, the HTML output.
-review_state.json is read, never written.
+Read-only on assets -- this script writes the HTML output and its scan
+manifest (.cache/full_gallery_scan.json, a disposable cache of directory
+listings and parsed sidecars; --rescan ignores it). review_state.json is read,
+never written.
 
 Statefulness (the honest file:// story):
   - The page keeps verdicts/notes in browser localStorage, so they survive
@@ -95,12 +97,13 @@ asset_id compatibility with apply_review.py / review_state.json:
       filename kept verbatim.
 
 Usage:
-    python tools/art_review/build_full_gallery.py [--open] [--art-root DIR]
+    python tools/art_review/build_full_gallery.py [--open] [--art-root DIR] [--rescan]
 Output:
     <art-root>/art_generated/full_gallery.html   (gitignored; open via file://)
 """
 
 import argparse
+import hashlib
 import html
 import json
 import os
@@ -111,6 +114,7 @@ import sys
 import tempfile
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Sibling module (this script runs from tools/art_review/, which is
@@ -119,6 +123,9 @@ from pathlib import Path
 import apply_review
 
 REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "scripts"))
+import tool_cache  # noqa: E402  (stat trust rules and atomic write for the scan manifest)
+
 # ART_GEN / ART_SRC / OUT are rebound by main() when --art-root is given. Agents
 # work in git worktrees, and art_generated/ is gitignored, so a worktree sees
 # ~500 legacy tracked PNGs and none of tonight's 652 -- the file-locality trap
@@ -175,15 +182,208 @@ def _is_skipped(rel_parts):
     return False
 
 
-def iter_images(root):
-    if not root.is_dir():
-        return
-    for p in sorted(root.rglob("*")):
-        if not (p.is_file() and p.suffix.lower() in IMAGE_EXTS):
-            continue
-        if _is_skipped(p.relative_to(root).parts[:-1]):
-            continue
-        yield p
+def iter_images(root, manifest):
+    """Yield (path, posix relpath under root, mtime) for every image under root,
+    in sorted-path order, skipping non-candidate directories."""
+    for rel, mtime in manifest.images(root):
+        yield root / rel, rel, mtime
+
+
+def _rel(p, root):
+    """p relative to root as a posix string. Path.relative_to re-derives root's
+    parents on every call, and at ~15k calls a build it cost more than the walk."""
+    s, r = os.fspath(p), os.fspath(root).rstrip(os.sep)
+    if not s.startswith(r + os.sep):
+        raise ValueError(f"{p} is not under {root}")
+    return s[len(r) + 1 :].replace(os.sep, "/")
+
+
+# --------------------------------------------------------------------------
+# Scan manifest -- what the last build saw, so a rebuild only re-reads changes
+# --------------------------------------------------------------------------
+# An art night adds 600+ images, and every rebuild used to rglob both roots,
+# stat every file and re-parse every sidecar: ~1.7s of a ~4s build on 5k files,
+# growing with each run. The manifest (.cache/, gitignored) keeps, per directory,
+# its mtime and its listing (subdirs, image names, sidecar names). A directory
+# whose mtime is unchanged is not re-listed -- adding, removing or renaming an
+# entry always bumps it. Rewriting a file in place does not, so image mtimes
+# (which order the batches) are not part of the listing: every image is
+# re-stat'ed on the pool each build, which is cheap next to a scandir. Sidecars are keyed by content: a stat
+# match reuses the recorded sha256, and facets are cached per sha256, so the
+# prompt regexes run once per distinct prompt ever seen. Both checks follow
+# tool_cache's stat rules, and the whole manifest is dropped when this script
+# changes, since the facet parse and the walk rules live here.
+MANIFEST = REPO / ".cache" / "full_gallery_scan.json"
+MANIFEST_VERSION = 3
+SIDECAR_SUFFIX = ".meta.json"
+SCAN_WORKERS = 8
+
+
+def _under(path, roots):
+    return any(path == r or path.startswith(r + os.sep) for r in roots)
+
+
+class ScanManifest:
+    """Directory listings and sidecar facets from previous builds.
+
+    path=None keeps it in memory only (a cold walk every time, nothing written).
+    Directories are listed level by level with os.scandir on a thread pool;
+    stat and scandir release the GIL, so a warm walk of ~650 directories is one
+    parallel round of stats per level."""
+
+    def __init__(self, path=MANIFEST, workers=SCAN_WORKERS, fresh=False):
+        self.path = Path(path) if path else None
+        self.workers = workers
+        self.stats = {
+            "dirs_reused": 0,
+            "dirs_listed": 0,
+            "sidecars_reused": 0,
+            "sidecars_hashed": 0,
+            "facets_parsed": 0,
+        }
+        self._dirs, self._sidecars, self._facets = {}, {}, {}
+        if self.path is not None and not fresh:
+            self._load()
+        self._roots = []
+        self._seen_dirs, self._seen_sidecars, self._seen_facets = {}, {}, {}
+        self._sidecar_names = {}  # dir -> set of sidecar names, for this build
+
+    def _load(self):
+        raw = tool_cache.read(self.path, MANIFEST_VERSION, __file__)
+        self._dirs = raw.get("dirs") or {}
+        self._sidecars = raw.get("sidecars") or {}
+        self._facets = raw.get("facets") or {}
+
+    def _visit(self, d):
+        """(dir, listing record or None if unreadable, reused?, [(image name, mtime)])
+        -- pool worker."""
+        try:
+            st = os.stat(d)
+        except OSError:
+            return d, None, False, []
+        rec = self._dirs.get(d)
+        if rec and tool_cache.is_unchanged(st, rec["size"], rec["mtime_ns"], rec["checked_ns"]):
+            images = []
+            for name in rec["images"]:
+                try:
+                    images.append((name, os.stat(os.path.join(d, name)).st_mtime))
+                except OSError:
+                    continue  # removed since the listing; the next build re-lists
+            return d, rec, True, images
+        checked = time.time_ns()
+        dirs, images, sidecars = [], [], []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        # like rglob: no descent through symlinked dirs, but
+                        # symlinked files count
+                        if e.is_dir(follow_symlinks=False):
+                            dirs.append(e.name)
+                        elif e.is_file():
+                            if e.name.endswith(SIDECAR_SUFFIX):
+                                sidecars.append(e.name)
+                            elif os.path.splitext(e.name)[1].lower() in IMAGE_EXTS:
+                                images.append((e.name, e.stat().st_mtime))
+                    except OSError:
+                        continue
+        except OSError:
+            return d, None, False, []
+        return (
+            d,
+            {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "checked_ns": checked,
+                "dirs": sorted(dirs),
+                "images": [name for name, _ in images],
+                "sidecars": sidecars,
+            },
+            False,
+            images,
+        )
+
+    def images(self, root):
+        """[(posix relpath, mtime)] for every image under root, sorted the way
+        sorted(Path) would order them (part by part)."""
+        root = os.fspath(root).rstrip(os.sep)
+        if not os.path.isdir(root):
+            return []
+        self._roots.append(root)
+        out = []
+        frontier = [root]
+        with ThreadPoolExecutor(self.workers) as pool:
+            while frontier:
+                nxt = []
+                for d, rec, reused, images in pool.map(self._visit, frontier):
+                    if rec is None:
+                        continue
+                    self.stats["dirs_reused" if reused else "dirs_listed"] += 1
+                    self._seen_dirs[d] = rec
+                    self._sidecar_names[d] = set(rec["sidecars"])
+                    prefix = d[len(root) + 1 :].replace(os.sep, "/")
+                    prefix = prefix + "/" if prefix else ""
+                    out.extend((prefix + name, mtime) for name, mtime in images)
+                    nxt.extend(os.path.join(d, n) for n in rec["dirs"] if not _is_skipped((n,)))
+                frontier = nxt
+        out.sort(key=lambda t: t[0].split("/"))
+        return out
+
+    def has_sidecar(self, side):
+        d, name = os.path.split(os.fspath(side))
+        return name in self._sidecar_names.get(d, ())
+
+    def facets(self, side):
+        """Facets parsed from one sidecar, or None when it cannot be read as JSON."""
+        key = os.fspath(side)
+        rec = self._sidecars.get(key)
+        checked = time.time_ns()
+        try:
+            st, data = tool_cache.read_if_changed(
+                key, (rec[1], rec[0], rec[3]) if rec and rec[2] in self._facets else None
+            )
+        except OSError:
+            return None
+        if data is None:
+            digest, checked = rec[2], rec[3]
+            self.stats["sidecars_reused"] += 1
+        else:
+            digest = hashlib.sha256(data).hexdigest()
+            self.stats["sidecars_hashed"] += 1
+        self._seen_sidecars[key] = [st.st_mtime_ns, st.st_size, digest, checked]
+        if digest not in self._facets:
+            try:
+                self._facets[digest] = facets_from_meta(json.loads(data.decode("utf-8")))
+            except ValueError:
+                self._facets[digest] = None
+            self.stats["facets_parsed"] += 1
+        self._seen_facets[digest] = self._facets[digest]
+        return self._facets[digest]
+
+    def save(self):
+        """Write what this build saw. Entries under roots it did not walk (another
+        --art-root) are kept; entries under walked roots that were not seen again
+        are dropped, so the file tracks the disk instead of growing."""
+        if self.path is None:
+            return
+        if not (
+            self.stats["dirs_listed"]
+            or self.stats["sidecars_hashed"]
+            or len(self._seen_dirs) != len(self._dirs)
+            or len(self._seen_sidecars) != len(self._sidecars)
+        ):
+            return  # nothing changed on disk: skip the rewrite
+        dirs = {d: r for d, r in self._dirs.items() if not _under(d, self._roots)}
+        dirs.update(self._seen_dirs)
+        sidecars = {k: r for k, r in self._sidecars.items() if not _under(k, self._roots)}
+        sidecars.update(self._seen_sidecars)
+        facets = {r[2]: self._facets[r[2]] for r in sidecars.values() if r[2] in self._facets}
+        tool_cache.write(
+            self.path,
+            MANIFEST_VERSION,
+            __file__,
+            {"dirs": dirs, "sidecars": sidecars, "facets": facets},
+        )
 
 
 # --------------------------------------------------------------------------
@@ -244,29 +444,30 @@ def facets_from_meta(meta):
     return {k: v for k, v in out.items() if v}
 
 
-def read_meta_for(paths, cache):
+def read_meta_for(paths, cache, manifest):
     """Find and parse the sidecar for an asset group. One read per cell.
 
     Sidecars are per-FILE (s01_f01_v1_1536.meta.json) but every size of one cell
-    carries the same prompt, so the parse is cached on the sidecar path.
+    carries the same prompt, so the parse is cached on the sidecar path (and,
+    across builds, on the sidecar's content in the scan manifest). Existence is
+    answered from the walk's directory listing, not a stat per image.
     """
     for p in paths:
-        side = p.with_name(p.stem + ".meta.json")
-        if not side.is_file():
+        side = p.with_name(p.stem + SIDECAR_SUFFIX)
+        if not manifest.has_sidecar(side):
             continue
         key = str(side)
         if key in cache:
             return cache[key]
-        try:
-            meta = json.loads(side.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+        facets = manifest.facets(side)
+        if facets is None:
             cache[key] = ({}, "")
             return cache[key]
         try:
-            rel = side.relative_to(REPO).as_posix()
+            rel = _rel(side, REPO)
         except ValueError:
             rel = side.name
-        rec = (facets_from_meta(meta), rel)
+        rec = (facets, rel)
         cache[key] = rec
         return rec
     return ({}, "")
@@ -285,37 +486,32 @@ class AssetGroup:
         self.meta_rel = ""
 
 
-def scan(state):
-    """Return list of batches: {title, mtime, assets:[AssetGroup]}."""
+def scan(state, manifest=None):
+    """Return list of batches: {title, mtime, assets:[AssetGroup]}.
+
+    manifest is the ScanManifest to walk with; the default is an in-memory one,
+    i.e. a full cold walk."""
+    if manifest is None:
+        manifest = ScanManifest(None)
     batches = []
 
-    def batch_for(files, title):
+    def batch_for(files, mtimes, title):
         if not files:
             return None
-        mtime = max(p.stat().st_mtime for p, _ in files)
-        return {"title": title, "mtime": mtime, "files": files}
-
-    # ---- art_generated: batch per top-level dir ----
-    gen_top = {}
-    for p in iter_images(ART_GEN):
-        rel = p.relative_to(ART_GEN)
-        top = rel.parts[0] if len(rel.parts) > 1 else "(root)"
-        gen_top.setdefault(top, []).append((p, "gen"))
-    for top, files in gen_top.items():
-        b = batch_for(files, f"art_generated/{top}")
-        if b:
-            batches.append(b)
-
-    # ---- art_source: batch per top-level dir ----
-    src_top = {}
-    for p in iter_images(ART_SRC):
-        rel = p.relative_to(ART_SRC)
-        top = rel.parts[0] if len(rel.parts) > 1 else "(root)"
-        src_top.setdefault(top, []).append((p, "px"))
-    for top, files in src_top.items():
-        b = batch_for(files, f"art_source/{top}")
-        if b:
-            batches.append(b)
+        return {"title": title, "mtime": max(mtimes), "files": files}
+
+    # ---- art_generated / art_source: batch per top-level dir ----
+    for root, kind, label in ((ART_GEN, "gen", "art_generated"), (ART_SRC, "px", "art_source")):
+        tops = {}
+        for p, rel, mtime in iter_images(root, manifest):
+            top = rel.split("/", 1)[0] if "/" in rel else "(root)"
+            files, mtimes = tops.setdefault(top, ([], []))
+            files.append((p, kind))
+            mtimes.append(mtime)
+        for top, (files, mtimes) in tops.items():
+            b = batch_for(files, mtimes, f"{label}/{top}")
+            if b:
+                batches.append(b)
 
     batches.sort(key=lambda b: b["mtime"], reverse=True)
 
@@ -341,7 +537,7 @@ def scan(state):
             else:
                 g.thumb = g.files[0][0]
                 g.full = g.files[-1][0]
-            g.facets, g.meta_rel = read_meta_for([p for p, _ in g.files], meta_cache)
+            g.facets, g.meta_rel = read_meta_for([p for p, _ in g.files], meta_cache, manifest)
             assets.append(g)
         b["assets"] = assets
         del b["files"]
@@ -351,12 +547,13 @@ def scan(state):
 def classify(p, kind, state):
     """Return (canonical asset_id, display name, size_or_None) for one file."""
     if kind == "gen":
-        rel = p.relative_to(ART_GEN)
+        rel = _rel(p, ART_GEN)
+        parts = rel.split("/")
         # canonical gen id only for <category>/v1/<file>.png with a size stem
-        if len(rel.parts) == 3 and rel.parts[1] == "v1" and p.suffix.lower() == ".png":
+        if len(parts) == 3 and parts[1] == "v1" and p.suffix.lower() == ".png":
             m = GEN_STEM.match(p.stem)
             if m and int(m.group("size")) in KNOWN_SIZES:
-                cat = rel.parts[0]
+                cat = parts[0]
                 base = m.group("base")
                 var = m.group("var") or "v1"
                 return (
@@ -364,11 +561,11 @@ def classify(p, kind, state):
                     f"{base} {var}" if m.group("var") else base,
                     int(m.group("size")),
                 )
-        return (f"file:art_generated/{rel.as_posix()}", p.name, None)
+        return (f"file:art_generated/{rel}", p.name, None)
 
     # px: reuse the existing state key spelling if one exists (600 legacy keys
     # are extension-less); otherwise use the resolvable with-extension form.
-    rel = p.relative_to(ART_SRC).as_posix()
+    rel = _rel(p, ART_SRC)
     sans = rel[: -len(p.suffix)]
     for candidate in (f"px:{sans}", f"px:{rel}"):
         if candidate in state:
@@ -490,11 +687,9 @@ def build_page(batches, state):
 def href_of(p):
     """Path relative to the output file (which lives in art_generated/)."""
     try:
-        rel = p.relative_to(ART_GEN)
-        return html.escape(rel.as_posix(), quote=True)
+        return html.escape(_rel(p, ART_GEN), quote=True)
     except ValueError:
-        rel = p.relative_to(ART_SRC)
-        return html.escape("../art_source/" + rel.as_posix(), quote=True)
+        return html.escape("../art_source/" + _rel(p, ART_SRC), quote=True)
 
 
 def preflight_mapping(batches):
@@ -713,6 +908,13 @@ def main():
         "keep verdicts WILL be stranded until the map rules on them; the "
         "default is to refuse so the map gets its one-line entry first).",
     )
+    ap.add_argument(
+        "--rescan",
+        action="store_true",
+        help="ignore the scan manifest (.cache/full_gallery_scan.json) and "
+        "re-list every directory and re-read every sidecar; the manifest is "
+        "rewritten from the result",
+    )
     args = ap.parse_args()
 
     if args.art_root:
@@ -726,7 +928,14 @@ def main():
 
     t0 = time.time()
     state = load_state()
-    batches = scan(state)
+    manifest = ScanManifest(fresh=args.rescan)
+    batches = scan(state, manifest)
+    manifest.save()
+    st = manifest.stats
+    print(
+        f"[*] scan: {st['dirs_listed']} dirs listed, {st['dirs_reused']} unchanged; "
+        f"{st['sidecars_hashed']} sidecars read, {st['facets_parsed']} prompts parsed"
+    )
 
     unmapped = preflight_mapping(batches)
     if unmapped:
@@ -10,6 +10,9 @@ field and optional comma-separated TAGS. Every edit AUTO-PERSISTS to a real file
 on disk -- tools/art_review/review_state.json -- via a POST endpoint, so a review
 survives across sittings, can be revised over many sessions, and is a clean input
 for promote/regenerate tooling. (No browser localStorage: too fragile for multi-session.)
+While the server runs, edits land in memory plus an append-only journal
+(review_state.journal, replayed on startup after a crash) and are folded back into
+review_state.json a few seconds after triage pauses, and on exit -- see VerdictStore.
 
 Verdict model (v2):
   * keep    -- accept it (green).
@@ -22,11 +25,24 @@ Verdict model (v2):
 "iterate" transparently on load.
 
 Nothing is embedded or copied: PNGs stream live from disk through /img?p=<relpath>,
-so the big gitignored art_generated/ tree is never duplicated or committed.
+so the big gitignored art_generated/ tree is never duplicated or committed. The
+grid shows /thumb?p=<relpath>&w=<px>&v=<mtime-size> instead: a downscaled WebP/PNG
+rendered once in a worker pool and kept in a size-capped disk cache (see
+thumb_cache.py; needs Pillow, else the original is served). Thumbnails carry a
+strong ETag and, since the URL pins the master's mtime+size, immutable caching --
+a reload costs no image bytes at all. The lightbox still opens the full /img.
+
+The library is indexed once at startup (AssetIndex) and kept current from
+directory mtimes: a page load stats each directory, re-lists only the ones that
+changed, and re-renders only their sections; the page itself is cached per
+index version. A background sweep re-stats the PNGs every few seconds to catch
+files rewritten in place. /api/index (sections + cells as JSON) and
+/api/section?id= (one section's rendered HTML) expose the same cache.
 
 Run (stdlib only -- no Flask/deps):
     python tools/art_review/serve_review.py                  # http://127.0.0.1:8777
     python tools/art_review/serve_review.py --port 9000
+    python tools/art_review/serve_review.py --thumb-width 512 --thumb-cache-mb 1024
     python tools/art_review/serve_review.py --art-root <dir> # when the art lives elsewhere
         # e.g. running from a git worktree while art_generated/ is in the main checkout:
         # python tools/art_review/serve_review.py --art-root /path/to/main/checkout
@@ -53,15 +69,30 @@ import json
 import os
 import pathlib
 import re
+import sys
 import threading
+import time
 import webbrowser
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, quote, urlparse
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+import thumb_cache  # noqa: E402
+
 HERE = pathlib.Path(__file__).resolve().parent
 REPO = HERE.parents[1]
 STATE_PATH = HERE / "review_state.json"
+# grid thumbnails: cells are <=190px wide x 180px tall, so 384 covers 2x displays
+THUMB_WIDTH = 384
+IMMUTABLE = "public, max-age=31536000, immutable"
+# seconds between background re-stats of every indexed PNG (catches in-place rewrites)
+SWEEP_S = 5.0
+# verdict journal: fsync cadence, and when to fold it back into review_state.json
+FSYNC_S = 0.5
+COMPACT_IDLE_S = 3.0
+COMPACT_MAX_AGE_S = 30.0
+COMPACT_MAX_ENTRIES = 500
 
 # generated file names: "<id>[_vN]_<size>.png"; strip _<size>, then optional _vN
 _SIZE_RE = re.compile(r"^(.+?)_(\d+)\.png$")
@@ -140,115 +171,256 @@ def pick_size(sizes):
 
 
 # ------------------------------------------------------------------ scanning
-def scan_generated(art_root):
-    """Group art_generated/<cat>/v1/*.png into (base_id, variant) units, one
-    representative size each. Returns a list of section dicts."""
-    base = art_root / "art_generated"
-    if not base.is_dir():
-        return []
-    cats = list(_GEN_CATS)
-    known = {c for c, _ in cats}
-    for extra in sorted(
-        p.name for p in base.iterdir() if p.is_dir() and p.name not in known and p.name != "logs"
-    ):
-        cats.append((extra, extra.replace("_", " ").title()))
-
-    sections = []
-    for cat, title in cats:
-        d = base / cat / "v1"
-        if not d.is_dir():
+def _gen_section(cat, title, files):
+    """One art_generated/<cat>/v1 listing ({filename: version}) -> section dict,
+    grouping files into (base_id, variant) units with one representative size."""
+    units = {}  # (base_id, variant) -> {size: filename}
+    for f in sorted(files):
+        if not f.endswith(".png"):
             continue
-        units = {}  # (base_id, variant) -> {size: filename}
-        for f in sorted(os.listdir(d)):
-            if not f.endswith(".png"):
-                continue
-            m = _SIZE_RE.match(f)
-            if not m:
-                continue
-            stem, size = m.group(1), m.group(2)
-            vm = _VAR_RE.match(stem)
-            base_id, var = (vm.group(1), "v" + vm.group(2)) if vm else (stem, "v1")
-            units.setdefault((base_id, var), {})[size] = f
-        if not units:
+        m = _SIZE_RE.match(f)
+        if not m:
             continue
-        cells = []
-        for base_id, var in sorted(units):
-            sizes = units[(base_id, var)]
-            size = pick_size(sizes)
-            rel = f"art_generated/{cat}/v1/{sizes[size]}"
-            cells.append(
-                {
-                    "asset_id": f"gen:{cat}:{base_id}:{var}",
-                    "label": f"{base_id}  {var}",
-                    "img": rel,
-                    "meta": f"{size}px",
-                    "base": base_id,
-                }
-            )
-        sections.append(
+        stem, size = m.group(1), m.group(2)
+        vm = _VAR_RE.match(stem)
+        base_id, var = (vm.group(1), "v" + vm.group(2)) if vm else (stem, "v1")
+        units.setdefault((base_id, var), {})[size] = f
+    if not units:
+        return None
+    cells = []
+    for base_id, var in sorted(units):
+        sizes = units[(base_id, var)]
+        size = pick_size(sizes)
+        cells.append(
             {
-                "id": "gen-" + slug(cat),
-                "group": GROUP_GEN,
-                "title": title,
-                "home": _GEN_HOME.get(cat, ""),
-                "cells": cells,
+                "asset_id": f"gen:{cat}:{base_id}:{var}",
+                "label": f"{base_id}  {var}",
+                "img": f"art_generated/{cat}/v1/{sizes[size]}",
+                "meta": f"{size}px",
+                "base": base_id,
+                "v": files[sizes[size]],
             }
         )
-    return sections
+    return {
+        "id": "gen-" + slug(cat),
+        "group": GROUP_GEN,
+        "title": title,
+        "home": _GEN_HOME.get(cat, ""),
+        "cells": cells,
+    }
 
 
-def scan_pixellab(art_root):
-    """Walk art_source/**; every leaf dir holding review PNGs becomes a section."""
-    base = art_root / "art_source"
-    if not base.is_dir():
-        return []
-    sections = []
-    for dp, _dn, fn in os.walk(base):
-        pngs = [f for f in sorted(fn) if f.endswith(".png") and not _ROT_RE.search(f[:-4])]
-        if not pngs:
-            continue
-        dpath = pathlib.Path(dp)
-        rel_under_src = dpath.relative_to(base).as_posix()  # e.g. pixellab_2026-07-16/style_matrix
-        cells = []
-        for f in pngs:
-            stem = f[:-4]
-            rel = f"art_source/{rel_under_src}/{f}"
-            cells.append(
-                {
-                    "asset_id": f"px:{rel_under_src}/{stem}",
-                    "label": stem,
-                    "img": rel,
-                    "meta": "",
-                    "base": stem,
-                }
-            )
-        parts = rel_under_src.split("/")
-        title = " / ".join(parts[-2:]) if len(parts) > 1 else rel_under_src
-        sections.append(
-            {
-                "id": "px-" + slug(rel_under_src),
-                "group": GROUP_PX,
-                "title": title,
-                "home": _px_home(rel_under_src),
-                "cells": cells,
-            }
-        )
-    sections.sort(key=lambda s: s["id"])
-    return sections
+def _px_section(rel_under_src, files):
+    """One art_source/<rel> listing -> section dict, or None without review PNGs."""
+    pngs = [f for f in sorted(files) if f.endswith(".png") and not _ROT_RE.search(f[:-4])]
+    if not pngs:
+        return None
+    cells = [
+        {
+            "asset_id": f"px:{rel_under_src}/{f[:-4]}",
+            "label": f[:-4],
+            "img": f"art_source/{rel_under_src}/{f}",
+            "meta": "",
+            "base": f[:-4],
+            "v": files[f],
+        }
+        for f in pngs
+    ]
+    parts = rel_under_src.split("/")
+    title = " / ".join(parts[-2:]) if len(parts) > 1 else rel_under_src
+    return {
+        "id": "px-" + slug(rel_under_src),
+        "group": GROUP_PX,
+        "title": title,
+        "home": _px_home(rel_under_src),
+        "cells": cells,
+    }
 
 
-def scan_all(art_root):
-    return scan_generated(art_root) + scan_pixellab(art_root)
+class AssetIndex:
+    """In-process index of art_generated/ and art_source/, kept current without
+    rescanning the trees.
+
+    Every directory is remembered with its mtime, its subdirectories and the
+    version (mtime-size) of each .png in it. refresh() stats each known
+    directory and re-lists only those whose mtime moved: adding, removing or
+    renaming a file bumps its directory's mtime, so the steady-state cost of a
+    page load is one stat per directory. A PNG rewritten in place does not
+    touch its directory; refresh(files=True) -- run by the server's background
+    sweep -- also re-stats files to catch those.
+
+    `version` increments whenever any listing changes. Sections and their
+    rendered HTML are rebuilt only for changed directories; the server caches
+    whole pages per version.
+    """
+
+    def __init__(self, art_root):
+        self.art_root = pathlib.Path(art_root)
+        self.version = 0
+        self._lock = threading.RLock()
+        self._dirs = (
+            {}
+        )  # path str -> {"mtime": ns, "subdirs": [names], "files": {png: version}, "gen": n}
+        self._sections = None
+        self._section_html = {}  # (section id, thumb_width) -> (gen, html)
+        with self._lock:
+            for base in ("art_generated", "art_source"):
+                path = self.art_root / base
+                if path.is_dir():
+                    self._scan_dir(str(path))
+            self.version = 1
+
+    def _scan_dir(self, path):
+        """(Re)list one directory and, recursively, any subdirectory not yet known."""
+        subdirs, files = [], {}
+        try:
+            st = os.stat(path)
+            entries = list(os.scandir(path))
+        except OSError:
+            self._drop(path)
+            return
+        for e in entries:
+            try:
+                if e.is_dir():
+                    if not e.is_symlink():  # os.walk semantics: do not descend links
+                        subdirs.append(e.name)
+                elif e.name.endswith(".png"):
+                    fst = e.stat()
+                    files[e.name] = f"{fst.st_mtime_ns:x}-{fst.st_size:x}"
+            except OSError:
+                continue
+        subdirs.sort()
+        old = self._dirs.get(path)
+        if old is not None:
+            for gone in set(old["subdirs"]) - set(subdirs):
+                self._drop(os.path.join(path, gone))
+        self._dirs[path] = {
+            "mtime": st.st_mtime_ns,
+            "subdirs": subdirs,
+            "files": files,
+            "gen": self.version + 1,
+        }
+        for name in subdirs:
+            child = os.path.join(path, name)
+            if child not in self._dirs:
+                self._scan_dir(child)
+
+    def _drop(self, path):
+        entry = self._dirs.pop(path, None)
+        if entry is not None:
+            for name in entry["subdirs"]:
+                self._drop(os.path.join(path, name))
+
+    def _restat_files(self, path, entry):
+        files = {}
+        for name in entry["files"]:
+            try:
+                fst = os.stat(os.path.join(path, name))
+            except OSError:
+                return False
+            files[name] = f"{fst.st_mtime_ns:x}-{fst.st_size:x}"
+        return files == entry["files"]
+
+    def refresh(self, files=False):
+        """Bring the index up to date; returns True when anything changed."""
+        with self._lock:
+            changed = False
+            for base in ("art_generated", "art_source"):
+                path = str(self.art_root / base)
+                if path not in self._dirs and os.path.isdir(path):
+                    self._scan_dir(path)
+                    changed = True
+            for path in list(self._dirs):
+                entry = self._dirs.get(path)
+                if entry is None:  # dropped with a parent during this pass
+                    continue
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    self._drop(path)
+                    changed = True
+                    continue
+                if mtime != entry["mtime"] or (files and not self._restat_files(path, entry)):
+                    old_files = entry["files"]
+                    self._scan_dir(path)
+                    new = self._dirs.get(path)
+                    if (
+                        new is None
+                        or new["files"] != old_files
+                        or new["subdirs"] != entry["subdirs"]
+                    ):
+                        changed = True
+                    elif new is not None:
+                        new["gen"] = entry["gen"]  # touched but identical: keep cached HTML
+            if changed:
+                self.version += 1
+                self._sections = None
+            return changed
+
+    def _files(self, path):
+        entry = self._dirs.get(str(path))
+        return (entry["files"], entry["gen"]) if entry is not None else ({}, 0)
+
+    def sections(self):
+        """Section dicts in page order (generated categories, then pixellab dirs);
+        each carries "_gen", the generation of the directory it came from."""
+        with self._lock:
+            if self._sections is not None:
+                return self._sections
+            out = []
+            base = self.art_root / "art_generated"
+            base_entry = self._dirs.get(str(base))
+            if base_entry is not None:
+                cats = list(_GEN_CATS)
+                known = {c for c, _ in cats}
+                cats += [
+                    (extra, extra.replace("_", " ").title())
+                    for extra in base_entry["subdirs"]
+                    if extra not in known and extra != "logs"
+                ]
+                for cat, title in cats:
+                    files, gen = self._files(base / cat / "v1")
+                    section = _gen_section(cat, title, files)
+                    if section is not None:
+                        section["_gen"] = gen
+                        out.append(section)
+            src = self.art_root / "art_source"
+            prefix = str(src)
+            px = []
+            for path, entry in self._dirs.items():
+                if path == prefix or path.startswith(prefix + os.sep):
+                    rel = pathlib.Path(path).relative_to(src).as_posix()
+                    section = _px_section(rel, entry["files"])
+                    if section is not None:
+                        section["_gen"] = entry["gen"]
+                        px.append(section)
+            px.sort(key=lambda s: s["id"])
+            self._sections = out + px
+            return self._sections
+
+    def section_html(self, section, thumb_width=THUMB_WIDTH):
+        """render_section(), memoised until the section's directory changes."""
+        key = (section["id"], thumb_width)
+        with self._lock:
+            cached = self._section_html.get(key)
+            if cached is not None and cached[0] == section["_gen"]:
+                return cached[1]
+        html_ = render_section(section, thumb_width)
+        with self._lock:
+            self._section_html[key] = (section["_gen"], html_)
+        return html_
 
 
-# ------------------------------------------------------------------ state I/O
-_LOCK = threading.Lock()
+def scan_all(art_root):
+    return AssetIndex(art_root).sections()
 
 
-def load_state():
-    if STATE_PATH.is_file():
+# ------------------------------------------------------------------ state I/O
+def load_state(path=None):
+    path = STATE_PATH if path is None else path
+    if path.is_file():
         try:
-            state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+            state = json.loads(path.read_text(encoding="utf-8"))
         except (ValueError, OSError):
             return {}
         return _migrate_state(state)
@@ -267,10 +439,14 @@ def _migrate_state(state):
     return state
 
 
-def save_state(state):
-    tmp = STATE_PATH.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
-    tmp.replace(STATE_PATH)
+def save_state(state, path=None):
+    path = STATE_PATH if path is None else path
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps(state, indent=2, sort_keys=True))
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(path)
 
 
 def normalize_tags(raw):
@@ -288,41 +464,223 @@ def normalize_tags(raw):
     return out
 
 
-def apply_patch(patch):
-    """Merge one {asset_id, verdict?, note?, tags?} patch into the state file.
-    Returns (status, response_dict)."""
-    asset_id = patch.get("asset_id")
-    if not asset_id or not isinstance(asset_id, str):
-        return 400, {"ok": False, "error": "missing asset_id"}
-    with _LOCK:
-        state = load_state()
-        entry = state.get(asset_id, {})
-        entry.setdefault("verdict", None)
-        entry.setdefault("note", "")
-        entry.setdefault("tags", [])
-        if "verdict" in patch:
-            v = patch["verdict"]
-            entry["verdict"] = v if v in VALID_VERDICTS else None
-        if "note" in patch:
-            entry["note"] = "" if patch["note"] is None else str(patch["note"])
-        if "tags" in patch:
-            entry["tags"] = normalize_tags(patch["tags"]) or []
-        entry["updated_at"] = now_iso()
-        # drop an entry that carries no signal, to keep the file clean
-        if not entry["verdict"] and not entry["note"].strip() and not entry["tags"]:
-            state.pop(asset_id, None)
-            saved = None
-        else:
-            state[asset_id] = entry
-            saved = entry
-        save_state(state)
-    return 200, {"ok": True, "asset_id": asset_id, "entry": saved}
+def merge_patch(state, patch):
+    """Merge one {asset_id, verdict?, note?, tags?} patch into a state dict in
+    place. Returns (asset_id, saved entry or None when it was dropped)."""
+    asset_id = patch["asset_id"]
+    entry = dict(state.get(asset_id, {}))
+    entry.setdefault("verdict", None)
+    entry.setdefault("note", "")
+    entry.setdefault("tags", [])
+    if "verdict" in patch:
+        v = patch["verdict"]
+        entry["verdict"] = v if v in VALID_VERDICTS else None
+    if "note" in patch:
+        entry["note"] = "" if patch["note"] is None else str(patch["note"])
+    if "tags" in patch:
+        entry["tags"] = normalize_tags(patch["tags"]) or []
+    entry["updated_at"] = now_iso()
+    # drop an entry that carries no signal, to keep the file clean
+    if not entry["verdict"] and not entry["note"].strip() and not entry["tags"]:
+        state.pop(asset_id, None)
+        return asset_id, None
+    state[asset_id] = entry
+    return asset_id, entry
+
+
+class VerdictStore:
+    """review_state.json held in memory, made durable through an append-only journal.
+
+    A POST used to re-read, re-migrate and rewrite the whole (~0.5 MB, sorted,
+    indented) state file. Now apply() merges into memory and appends ONE line
+    -- {"asset_id", "entry"}, the entry's final value, null = dropped -- to
+    review_state.journal, flushed to the OS at once (a killed server loses
+    nothing). A background thread fsyncs the journal every FSYNC_S seconds and
+    compacts: it rewrites review_state.json in its usual format (what
+    apply_review.py reads) and empties the journal once triage pauses for
+    COMPACT_IDLE_S, once the oldest pending line is COMPACT_MAX_AGE_S old, or
+    once COMPACT_MAX_ENTRIES lines pile up; close() compacts too.
+
+    Startup replays any journal left by a crash. Lines carry final values, so
+    replaying one that a compaction already folded in is harmless, and a torn
+    last line (crash mid-write) is dropped.
+
+    review_state.json has other writers (merge_gallery_export.py). Before each
+    compaction and before serving the state, the file is re-stat'ed; if its
+    mtime or size moved, it is reloaded and the un-compacted journal lines are
+    re-applied on top, so an external merge is neither overwritten nor hidden.
+    """
+
+    def __init__(self, state_path=None, journal_path=None, background=True):
+        self.state_path = STATE_PATH if state_path is None else pathlib.Path(state_path)
+        self.journal_path = (
+            self.state_path.with_suffix(".journal")
+            if journal_path is None
+            else pathlib.Path(journal_path)
+        )
+        self._lock = threading.Lock()
+        self._journal = None  # opened on the first write: a read-only session leaves no file
+        self._pending = 0
+        self._first_pending = self._last_write = 0.0
+        self._unsynced = False
+        self.revision = 0
+        self._seed = (None, b"{}")
+        self._state_stamp = self._stamp()
+        self.state = load_state(self.state_path)
+        self.replayed = self._replay()
+        if self.replayed:
+            self.compact()
+        self._stop = threading.Event()
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _stamp(self):
+        try:
+            st = os.stat(self.state_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _replay(self):
+        """Apply the journal on top of self.state; returns the number of lines applied."""
+        try:
+            lines = self.journal_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return 0
+        count = 0
+        for line in lines:
+            try:
+                rec = json.loads(line)
+                asset_id, entry = rec["asset_id"], rec["entry"]
+            except (ValueError, KeyError, TypeError):
+                break  # torn tail from a crash mid-append
+            if entry is None:
+                self.state.pop(asset_id, None)
+            else:
+                self.state[asset_id] = entry
+            count += 1
+        if count:
+            self._pending = count
+            _migrate_state(self.state)
+        return count
+
+    def _reload_if_changed(self):
+        """Pick up an external write to review_state.json (call with the lock held)."""
+        stamp = self._stamp()
+        if stamp == self._state_stamp:
+            return False
+        self._state_stamp = stamp
+        self.state = load_state(self.state_path)
+        self._replay()
+        self.revision += 1
+        return True
+
+    def apply(self, patch):
+        """Merge one patch; returns (status, response_dict) for the POST."""
+        asset_id = patch.get("asset_id")
+        if not asset_id or not isinstance(asset_id, str):
+            return 400, {"ok": False, "error": "missing asset_id"}
+        with self._lock:
+            asset_id, saved = merge_patch(self.state, patch)
+            if self._journal is None:
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(json.dumps({"asset_id": asset_id, "entry": saved}) + "\n")
+            self._journal.flush()
+            now = time.monotonic()
+            if not self._pending:
+                self._first_pending = now
+            self._pending += 1
+            self._last_write = now
+            self._unsynced = True
+            self.revision += 1
+        return 200, {"ok": True, "asset_id": asset_id, "entry": saved}
+
+    def dumps(self, **kw):
+        with self._lock:
+            self._reload_if_changed()
+            return json.dumps(self.state, **kw)
+
+    def seed(self):
+        """json.dumps(state) as bytes for the page, re-serialised only after a change."""
+        with self._lock:
+            self._reload_if_changed()
+            if self._seed[0] != self.revision:
+                self._seed = (self.revision, json.dumps(self.state).encode("utf-8"))
+            return self._seed[1]
+
+    def sync(self):
+        with self._lock:
+            if self._unsynced and self._journal is not None:
+                os.fsync(self._journal.fileno())
+                self._unsynced = False
+
+    def compact(self):
+        """Fold the journal into review_state.json, then empty it."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._reload_if_changed()
+            save_state(self.state, self.state_path)
+            self._state_stamp = self._stamp()
+            if self._journal is not None:
+                self._journal.seek(0)
+                self._journal.truncate()
+                os.fsync(self._journal.fileno())
+            else:
+                self.journal_path.write_text("", encoding="utf-8")
+            self._pending = 0
+            self._unsynced = False
+
+    def _due(self):
+        if not self._pending:
+            return False
+        now = time.monotonic()
+        return (
+            now - self._last_write >= COMPACT_IDLE_S
+            or now - self._first_pending >= COMPACT_MAX_AGE_S
+            or self._pending >= COMPACT_MAX_ENTRIES
+        )
+
+    def _run(self):
+        while not self._stop.wait(FSYNC_S):
+            try:
+                self.sync()
+                if self._due():
+                    self.compact()
+            except OSError as e:  # keep journaling; the next tick retries
+                print(f"verdict store: {e}")
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.compact()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
 
 
 # ------------------------------------------------------------------ rendering
-def render_cell(c, in_set=False):
+def asset_version(art_root, rel):
+    """mtime_ns-size of an image: pinned into the thumb URL so the browser may
+    cache it forever -- a regenerated master gets a new URL. (The index records
+    the same string per file as cell["v"].)"""
+    try:
+        st = os.stat(art_root / rel)
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def render_cell(c, in_set=False, thumb_width=THUMB_WIDTH):
     aid = esc(c["asset_id"])
-    src = "/img?p=" + quote(c["img"], safe="/")
+    full = "/img?p=" + quote(c["img"], safe="/")
+    src = full
+    if c.get("v"):
+        src = f"/thumb?p={quote(c['img'], safe='/')}&w={thumb_width}&v={c['v']}"
     meta = f'<span class="meta">{esc(c["meta"])}</span>' if c["meta"] else ""
     # winner button only appears for cells that are part of a comparison set:
     # pick this variant -> it becomes keep, the rest of the set -> discard.
@@ -334,7 +692,7 @@ def render_cell(c, in_set=False):
     )
     return f"""
       <div class="cell" data-asset="{aid}" data-base="{esc(c.get('base',''))}">
-        <div class="stage"><img loading="lazy" src="{esc(src)}" alt="{esc(c['label'])}"></div>
+        <div class="stage"><img loading="lazy" decoding="async" src="{esc(src)}" data-full="{esc(full)}" alt="{esc(c['label'])}"></div>
         <div class="cap"><span class="lbl">{esc(c['label'])}</span>{meta}</div>
         <div class="idline">{aid}</div>
         {win}
@@ -361,11 +719,11 @@ def _group_cells(cells):
     return groups
 
 
-def render_section(s):
+def render_section(s, thumb_width=THUMB_WIDTH):
     parts = []
     for base, members in _group_cells(s["cells"]):
         if len(members) > 1:
-            inner = "".join(render_cell(c, in_set=True) for c in members)
+            inner = "".join(render_cell(c, True, thumb_width) for c in members)
             ids = ",".join(m["asset_id"] for m in members)
             parts.append(
                 f'<div class="setframe" data-set-base="{esc(base)}" '
@@ -382,7 +740,7 @@ def render_section(s):
                 f'<div class="grid setgrid">{inner}</div></div>'
             )
         else:
-            parts.append(render_cell(members[0]))
+            parts.append(render_cell(members[0], False, thumb_width))
     body = "".join(parts)
     home = f'<p class="sechome">{esc(s.get("home", ""))}</p>' if s.get("home") else ""
     return f"""
@@ -407,34 +765,94 @@ def render_nav(sections):
     return "".join(out)
 
 
-def render_page(art_root):
-    sections = scan_all(art_root)
+def render_shell(index, thumb_width=THUMB_WIDTH):
+    """The page around the state seed: (head, tail) bytes. Section HTML comes
+    from the index's per-directory cache, so only changed sections re-render."""
+    sections = index.sections()
     total = sum(len(s["cells"]) for s in sections)
     gen_total = sum(len(s["cells"]) for s in sections if s["group"] == GROUP_GEN)
-    body = "".join(render_section(s) for s in sections)
+    body = "".join(index.section_html(s, thumb_width) for s in sections)
     nav = render_nav(sections)
-    state = load_state()
     subtitle = (
         f"{total} assets across {len(sections)} sections "
         f"({gen_total} generated + {total - gen_total} pixellab). "
         f"Verdicts, notes and tags auto-save to review_state.json on every edit."
     )
-    return (
+    page = (
         _TEMPLATE.replace("{{SUBTITLE}}", esc(subtitle))
         .replace("{{NAV}}", nav)
         .replace("{{BODY}}", body)
-        .replace("{{SEED}}", json.dumps(state))
     )
+    head, tail = page.split("{{SEED}}", 1)
+    return head.encode("utf-8"), tail.encode("utf-8")
+
+
+def render_page(art_root, thumb_width=THUMB_WIDTH):
+    head, tail = render_shell(AssetIndex(art_root), thumb_width)
+    return (head + json.dumps(load_state()).encode("utf-8") + tail).decode("utf-8")
+
+
+def index_json(index):
+    """The /api/index payload: every section with its cells, plus the version."""
+    sections = [{k: v for k, v in s.items() if k != "_gen"} for s in index.sections()]
+    return {"version": index.version, "sections": sections}
 
 
 # ------------------------------------------------------------------ HTTP
 class ReviewServer(ThreadingHTTPServer):
     daemon_threads = True
 
-    def __init__(self, addr, art_root):
+    def __init__(
+        self, addr, art_root, thumbs=None, thumb_width=THUMB_WIDTH, sweep_s=SWEEP_S, store=None
+    ):
         self.art_root = art_root.resolve()
+        self.store = store if store is not None else VerdictStore()
+        self.thumbs = thumbs if thumbs is not None else thumb_cache.ThumbCache()
+        self.thumb_width = thumb_cache.snap_width(thumb_width)
+        self.index = AssetIndex(self.art_root)
+        self._cache_lock = threading.Lock()
+        self._shell = (None, None)  # (index version, (head, tail))
+        self._index_json = (None, None)  # (index version, bytes)
+        self._stop = threading.Event()
+        if sweep_s:
+            threading.Thread(target=self._sweep, args=(sweep_s,), daemon=True).start()
         super().__init__(addr, ReviewHandler)
 
+    def _sweep(self, every):
+        """Background catch-up for PNGs rewritten in place (their directory mtime
+        does not move); the request path only stats directories."""
+        while not self._stop.wait(every):
+            try:
+                self.index.refresh(files=True)
+            except Exception as e:  # keep sweeping; a vanished dir mid-walk is routine
+                print(f"index sweep: {e}")
+
+    def shell(self):
+        self.index.refresh()
+        with self._cache_lock:
+            version, shell = self._shell
+            if version != self.index.version:
+                version = self.index.version
+                shell = render_shell(self.index, self.thumb_width)
+                self._shell = (version, shell)
+            return shell
+
+    def index_payload(self):
+        self.index.refresh()
+        with self._cache_lock:
+            version, body = self._index_json
+            if version != self.index.version:
+                version = self.index.version
+                body = json.dumps(index_json(self.index)).encode("utf-8")
+                self._index_json = (version, body)
+            return body
+
+    def server_close(self):
+        self._stop.set()
+        super().server_close()
+        self.thumbs.close()
+        self.store.close()
+
 
 class ReviewHandler(BaseHTTPRequestHandler):
     server_version = "PdoomArtReview/1.0"
@@ -442,13 +860,15 @@ class ReviewHandler(BaseHTTPRequestHandler):
     def log_message(self, fmt, *args):  # quieter console
         pass
 
-    def _send(self, code, body, ctype="application/json; charset=utf-8", extra=None):
+    def _send(
+        self, code, body, ctype="application/json; charset=utf-8", extra=None, cache="no-store"
+    ):
         if isinstance(body, str):
             body = body.encode("utf-8")
         self.send_response(code)
         self.send_header("Content-Type", ctype)
         self.send_header("Content-Length", str(len(body)))
-        self.send_header("Cache-Control", "no-store")
+        self.send_header("Cache-Control", cache)
         for k, v in (extra or {}).items():
             self.send_header(k, v)
         self.end_headers()
@@ -458,11 +878,19 @@ class ReviewHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         u = urlparse(self.path)
         if u.path == "/":
-            self._send(200, render_page(self.server.art_root), "text/html; charset=utf-8")
+            head, tail = self.server.shell()
+            self._send(200, head + self.server.store.seed() + tail, "text/html; charset=utf-8")
         elif u.path == "/img":
             self._serve_img(parse_qs(u.query).get("p", [""])[0])
+        elif u.path == "/thumb":
+            q = parse_qs(u.query)
+            self._serve_thumb(q.get("p", [""])[0], q.get("w", [""])[0], q.get("v", [""])[0])
         elif u.path == "/api/state":
-            self._send(200, json.dumps(load_state(), indent=2, sort_keys=True))
+            self._send(200, self.server.store.dumps(indent=2, sort_keys=True))
+        elif u.path == "/api/index":
+            self._send(200, self.server.index_payload())
+        elif u.path == "/api/section":
+            self._serve_section(parse_qs(u.query).get("id", [""])[0])
         elif u.path == "/favicon.ico":
             self._send(204, b"", "image/x-icon")
         else:
@@ -479,11 +907,25 @@ class ReviewHandler(BaseHTTPRequestHandler):
         except (ValueError, TypeError):
             self._send(400, json.dumps({"ok": False, "error": "bad json"}))
             return
-        code, resp = apply_patch(patch)
+        code, resp = self.server.store.apply(patch)
         self._send(code, json.dumps(resp))
 
-    def _serve_img(self, rel):
-        # sandbox: resolve under art_root, must stay inside it, must be a .png
+    def _serve_section(self, section_id):
+        """One section's rendered HTML (the same cached fragment the page uses)."""
+        index = self.server.index
+        index.refresh()
+        for s in index.sections():
+            if s["id"] == section_id:
+                html_ = index.section_html(s, self.server.thumb_width)
+                self._send(
+                    200, json.dumps({"id": section_id, "version": index.version, "html": html_})
+                )
+                return
+        self._send(404, json.dumps({"ok": False, "error": "no such section"}))
+
+    def _resolve_png(self, rel):
+        """Sandbox: resolve under art_root, must stay inside it, must be a .png.
+        Returns the path, or None after sending the error."""
         root = self.server.art_root
         rel = rel.lstrip("/")
         target = (root / rel).resolve()
@@ -491,11 +933,50 @@ class ReviewHandler(BaseHTTPRequestHandler):
             target.relative_to(root)
         except ValueError:
             self._send(403, json.dumps({"ok": False, "error": "forbidden"}))
-            return
+            return None
         if target.suffix.lower() != ".png" or not target.is_file():
             self._send(404, json.dumps({"ok": False, "error": "no image"}))
+            return None
+        return target
+
+    def _send_cached(self, body_path, etag, ctype, cache):
+        """200 with a strong ETag, or 304 when the browser already holds it."""
+        if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache)
+            self.end_headers()
+            return
+        self._send(200, body_path.read_bytes(), ctype, {"ETag": etag}, cache=cache)
+
+    def _serve_img(self, rel):
+        target = self._resolve_png(rel)
+        if target is None:
             return
-        self._send(200, target.read_bytes(), "image/png")
+        st = target.stat()
+        # full-size masters change in place, so revalidate (cheap 304) rather than pin
+        self._send_cached(target, f'"{st.st_mtime_ns:x}-{st.st_size:x}"', "image/png", "no-cache")
+
+    def _serve_thumb(self, rel, width, version):
+        target = self._resolve_png(rel)
+        if target is None:
+            return
+        current = asset_version(self.server.art_root, rel.lstrip("/"))
+        # immutable only when the URL pins the file as it is now
+        cache = IMMUTABLE if version == current else "no-cache"
+        try:
+            thumb = self.server.thumbs.thumbnail(target, thumb_cache.snap_width(width))
+        except Exception as e:  # a bad master must not take the grid down
+            print(f"thumb failed for {rel}: {e}")
+            thumb = None
+        if thumb is not None:
+            path, etag, ctype = thumb
+            try:
+                self._send_cached(path, etag, ctype, cache)
+                return
+            except OSError:  # evicted between render and read
+                pass
+        self._send_cached(target, f'"{current}"', "image/png", cache)
 
 
 # ------------------------------------------------------------------ template
@@ -779,7 +1260,7 @@ _TEMPLATE = r"""<!doctype html><html lang="en"><head><meta charset="utf-8">
     var win=cell.querySelector('.winbtn');
     if(win)win.addEventListener('click',function(){focusOn(cell,false);pickWinner(cell);});
     var img=cell.querySelector('.stage img');
-    if(img)img.addEventListener('click',function(){openLightbox(img.src,cell.getAttribute('data-asset'));});
+    if(img)img.addEventListener('click',function(){openLightbox(img.getAttribute('data-full')||img.src,cell.getAttribute('data-asset'));});
     if(note)note.addEventListener('input',function(e){debounce(id,{note:e.target.value});});
     if(tags)tags.addEventListener('input',function(e){debounce(id,{tags:parseTags(e.target.value)});});
     cell.addEventListener('mousedown',function(){focusOn(cell,false);});
@@ -922,16 +1403,37 @@ def main():
         "point at the main checkout when running from a worktree).",
     )
     ap.add_argument("--no-browser", action="store_true", help="do not auto-open a browser")
+    ap.add_argument(
+        "--thumb-width", type=int, default=THUMB_WIDTH, help="grid thumbnail width in px"
+    )
+    ap.add_argument(
+        "--thumb-cache-mb",
+        type=int,
+        default=thumb_cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="size cap of the on-disk thumbnail cache (least recently served evicted first)",
+    )
     args = ap.parse_args()
 
     art_root = pathlib.Path(args.art_root).resolve()
-    httpd = ReviewServer((args.host, args.port), art_root)
+    thumbs = thumb_cache.ThumbCache(max_bytes=args.thumb_cache_mb * 1024 * 1024)
+    httpd = ReviewServer((args.host, args.port), art_root, thumbs, args.thumb_width)
     url = f"http://{args.host}:{args.port}/"
-    sections = scan_all(art_root)
+    sections = httpd.index.sections()
     total = sum(len(s["cells"]) for s in sections)
     gen = sum(len(s["cells"]) for s in sections if s["group"] == GROUP_GEN)
     print(f"art root : {art_root}")
     print(f"state    : {STATE_PATH}")
+    if httpd.store.replayed:
+        print(
+            f"journal  : replayed {httpd.store.replayed} unsaved edit(s) from {httpd.store.journal_path.name}"
+        )
+    if thumbs.available:
+        print(
+            f"thumbs   : {thumbs.format[0]} @ {httpd.thumb_width}px in {thumbs.cache_dir} "
+            f"({thumbs.total_bytes // (1024 * 1024)} / {args.thumb_cache_mb} MB)"
+        )
+    else:
+        print("thumbs   : Pillow not installed -- serving full-size images")
     print(
         f"assets   : {total} cells in {len(sections)} sections ({gen} generated, {total - gen} pixellab)"
     )
@@ -945,6 +1447,8 @@ def main():
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\nstopped.")
+    finally:
+        httpd.server_close()
 
 
 if __name__ == "__main__":
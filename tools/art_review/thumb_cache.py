@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Downscaled thumbnails for the art-review server, rendered once and kept on disk.
+
+serve_review.py used to answer every grid image with the full-resolution
+master (1024-1536 px, several MB each from the ~1.1 GB art_generated/ tree),
+so a 600-cell page pulled gigabytes on every load. Its /thumb endpoint asks
+this module instead:
+
+  * A thumbnail is keyed by (absolute path, mtime_ns, size, width, format).
+    The sha256 of that key is both the cache file name (content-addressed:
+    a regenerated master gets a new key, never a stale hit) and the strong
+    ETag the server sends.
+  * Missing thumbnails render in a process pool (Pillow decode/resize is
+    CPU-bound). Concurrent requests for the same key share one render.
+  * The cache lives in <repo>/.cache/art_review_thumbs (gitignored). It is
+    capped at max_bytes and evicts least-recently-served files first; a hit
+    touches the file's mtime so the order survives restarts.
+  * WebP when Pillow can write it, PNG otherwise. Without Pillow at all, or
+    when the master is already no wider than the request, the original PNG
+    is served (thumbnail() returns None) -- the page still works, just heavier.
+
+Stdlib + optional Pillow, like the rest of tools/art_review.
+"""
+
+import hashlib
+import os
+import pathlib
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, features
+except ImportError:  # thumbnails are an optimisation, not a dependency
+    Image = None
+
+HERE = pathlib.Path(__file__).resolve().parent
+REPO = HERE.parents[1]
+CACHE_DIR = REPO / ".cache" / "art_review_thumbs"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# requested widths snap up to a multiple of this (bounded), so a client cannot
+# fill the cache with one thumbnail per pixel width
+WIDTH_STEP = 64
+MAX_WIDTH = 1024
+# eviction trims to this fraction of the cap, so it does not run on every miss
+EVICT_TO = 0.9
+
+
+def snap_width(w):
+    try:
+        w = int(w)
+    except (TypeError, ValueError):
+        w = 0
+    w = -(-max(w, 1) // WIDTH_STEP) * WIDTH_STEP
+    return min(w, MAX_WIDTH)
+
+
+def thumb_format():
+    """("webp"|"png", content type) the cache writes; None without Pillow."""
+    if Image is None:
+        return None
+    if features.check("webp"):
+        return "webp", "image/webp"
+    return "png", "image/png"
+
+
+def thumb_key(target, stat, width, fmt):
+    ident = f"{target}\0{stat.st_mtime_ns}\0{stat.st_size}\0{width}\0{fmt}"
+    return hashlib.sha256(ident.encode("utf-8")).hexdigest()
+
+
+def render(src, dst, width, fmt):
+    """Worker: write a width-px-wide thumbnail of src to dst. False if src is
+    already no wider than width (the original is the thumbnail)."""
+    with Image.open(src) as im:
+        if im.width <= width:
+            return False
+        height = max(1, round(im.height * width / im.width))
+        im = im.convert("RGBA") if im.mode not in ("RGB", "RGBA") else im
+        small = im.resize((width, height), Image.LANCZOS)
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    if fmt == "webp":
+        small.save(tmp, "WEBP", quality=85, method=4)
+    else:
+        small.save(tmp, "PNG", optimize=True)
+    os.replace(tmp, dst)
+    return True
+
+
+class ThumbCache:
+    """Disk cache of thumbnails with an LRU size cap; safe to share between
+    request threads."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, workers=None):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.format = thumb_format()
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pending = {}  # key -> Future
+        self._originals = set()  # keys whose master needs no downscale
+        self._entries = {}  # filename -> [size, last_used_ns]
+        self._total = 0
+        if self.cache_dir.is_dir():
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    self._entries[entry.name] = [st.st_size, st.st_mtime_ns]
+                    self._total += st.st_size
+
+    @property
+    def available(self):
+        return self.format is not None
+
+    def thumbnail(self, target, width):
+        """(path, etag, content type) of target's thumbnail at width, rendering
+        it if needed; None when the original should be served instead."""
+        if not self.available:
+            return None
+        fmt, ctype = self.format
+        stat = os.stat(target)
+        key = thumb_key(target, stat, width, fmt)
+        name = f"{key}.{fmt}"
+        path = self.cache_dir / name
+        with self._lock:
+            if key in self._originals:
+                return None
+            if name in self._entries and path.is_file():
+                self._touch(name, path)
+                return path, f'"{key}"', ctype
+            future = self._pending.get(key)
+            if future is None:
+                if self._pool is None:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                future = self._pool.submit(render, str(target), str(path), width, fmt)
+                self._pending[key] = future
+        try:
+            rendered = future.result()
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        with self._lock:
+            if not rendered:
+                self._originals.add(key)
+                return None
+            if name not in self._entries:
+                size = path.stat().st_size
+                self._entries[name] = [size, 0]
+                self._total += size
+            self._touch(name, path)
+            self._evict()
+        return path, f'"{key}"', ctype
+
+    def _touch(self, name, path):
+        now = max(self._entries[name][1] + 1, time.time_ns())
+        self._entries[name][1] = now
+        try:
+            os.utime(path, ns=(now, now))
+        except OSError:
+            pass
+
+    def _evict(self):
+        if self._total <= self.max_bytes:
+            return
+        budget = self.max_bytes * EVICT_TO
+        for name, (size, _used) in sorted(self._entries.items(), key=lambda kv: kv[1][1]):
+            if self._total <= budget:
+                break
+            try:
+                os.remove(self.cache_dir / name)
+            except OSError:
+                pass
+            del self._entries[name]
+            self._total -= size
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
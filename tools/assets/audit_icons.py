@@ -13,6 +13,7 @@ Usage:
 """
 
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
 
@@ -22,6 +23,9 @@ GODOT_ROOT = PROJECT_ROOT / "godot"
 ICONS_DIR = GODOT_ROOT / "assets" / "icons"
 MAPPING_FILE = GODOT_ROOT / "data" / "icon_mapping.json"
 
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+import godot_data  # noqa: E402  (shared, cached godot/data loader)
+
 
 def scan_icon_files() -> dict[str, list[str]]:
     """Scan all icon files organized by category/folder."""
@@ -37,9 +41,8 @@ def scan_icon_files() -> dict[str, list[str]]:
 
 
 def load_icon_mapping() -> dict:
-    """Load the icon_mapping.json file."""
-    with open(MAPPING_FILE, "r") as f:
-        return json.load(f)
+    """Load the icon_mapping.json file (via the shared godot/data cache)."""
+    return godot_data.load(MAPPING_FILE.parent).get(MAPPING_FILE.name)
 
 
 def extract_used_icons(mapping: dict) -> set[str]:
@@ -35,8 +35,11 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 GODOT_ROOT = REPO_ROOT / "godot"
 
-# The ONE file allowed to call the raw engine navigation API.
-SANCTIONED = (GODOT_ROOT / "autoload" / "scene_transition.gd").resolve()
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import lint_engine  # noqa: E402  (one-pass, hash-cached file scanning)
+
+# The ONE file allowed to call the raw engine navigation API (repo-relative).
+SANCTIONED = "godot/autoload/scene_transition.gd"
 
 BANNED = ("change_scene_to_file", "change_scene_to_packed", "reload_current_scene")
 # Match an actual METHOD CALL (.name( ), not prose that merely names the method. This alone
@@ -53,14 +56,9 @@ def _code_part(line: str) -> str:
     return line if hashpos == -1 else line[:hashpos]
 
 
-def scan_file(path: Path) -> list[tuple[int, str]]:
-    if path.resolve() == SANCTIONED:
-        return []
-    try:
-        text = path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return []
-    hits: list[tuple[int, str]] = []
+def scan_text(rel: str, text: str) -> list[tuple[str, int, str]]:
+    """(rel, line, snippet) for every direct navigation call in one file's text."""
+    hits: list[tuple[str, int, str]] = []
     in_docstring = (
         False  # inside a """...""" / '''...''' block (GDScript docstrings are string literals)
     )
@@ -77,24 +75,19 @@ def scan_file(path: Path) -> list[tuple[int, str]]:
         if ALLOW_MARKER in raw:
             continue
         if BANNED_RE.search(_code_part(raw)):
-            hits.append((i, raw.strip()))
+            hits.append((rel, i, raw.strip()))
     return hits
 
 
-def iter_targets(argv: list[str]) -> list[Path]:
-    if argv:
-        return [Path(a) for a in argv if a.endswith(".gd")]
-    return sorted(GODOT_ROOT.rglob("*.gd"))
+def _game_script(rel: str) -> bool:
+    return rel.startswith("godot/") and rel != SANCTIONED
 
 
-def main(argv: list[str]) -> int:
-    violations: list[tuple[Path, int, str]] = []
-    for path in iter_targets(argv):
-        if not path.exists():
-            continue
-        for lineno, snippet in scan_file(path):
-            violations.append((path, lineno, snippet))
+RULES = [lint_engine.Rule("scene-nav", (".gd",), scan_text, _game_script, decode_errors="replace")]
+
 
+def report(results: dict) -> int:
+    violations = results["scene-nav"]
     if not violations:
         return 0
 
@@ -103,11 +96,7 @@ def main(argv: list[str]) -> int:
     print("       (SceneTransition always defers the swap -- see")
     print("        godot/autoload/scene_transition.gd and docs/LEADERBOARD_CRASH_DIAGNOSIS.md)")
     print()
-    for path, lineno, snippet in violations:
-        try:
-            rel = path.resolve().relative_to(REPO_ROOT)
-        except ValueError:
-            rel = path
+    for rel, lineno, snippet in violations:
         print(f"  {rel}:{lineno}: {snippet}")
     print()
     print(
@@ -116,5 +105,10 @@ def main(argv: list[str]) -> int:
     return 1
 
 
+def main(argv: list[str]) -> int:
+    # No arguments: the whole godot/ tree (CI). Arguments: just those files (pre-commit).
+    return report(lint_engine.scan(RULES, paths=argv or None, base=GODOT_ROOT))
+
+
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:]))